@@ -6,6 +6,9 @@ Main-S2: 센서 데이터에서 이상 패턴을 감지하고 결과를 저장
 Usage:
     python scripts/detect_patterns.py
     python scripts/detect_patterns.py --validate
+    python scripts/detect_patterns.py --incremental   # 워터마크 이후 샘플만 감지 후 병합
+    python scripts/detect_patterns.py --spectral      # STFT 대역 에너지 진동 감지 포함
+    python scripts/detect_patterns.py --workers 8 --files data/sensor/raw/*.parquet --axis Fz Fx
 """
 
 import sys
@@ -19,7 +22,11 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 import pandas as pd
+from src.sensor.data_loader import DataLoader
+from src.sensor.detection_checkpoint import DetectionCheckpoint
+from src.sensor.parallel_detection import ParallelPatternDetector
 from src.sensor.pattern_detector import PatternDetector, DetectedPattern
+from src.sensor.patterns import save_patterns
 from src.sensor.sensor_store import SensorStore
 
 
@@ -143,7 +150,7 @@ def print_detection_summary(patterns: list[DetectedPattern]):
     # 패턴 유형별 집계
     by_type = {}
     for p in patterns:
-        by_type.setdefault(p.pattern_type, []).append(p)
+        by_type.setdefault(p.pattern_type.value, []).append(p)
 
     print(f"\n총 감지된 패턴: {len(patterns)}개")
     print("-" * 40)
@@ -192,41 +199,80 @@ def print_validation_results(results: dict):
             print(f"  ... 외 {len(results['false_positives']) - 10}건")
 
 
-def main():
-    parser = argparse.ArgumentParser(description="센서 데이터 패턴 감지")
-    parser.add_argument("--validate", action="store_true",
-                       help="S1 예상 이벤트와 비교 검증")
-    parser.add_argument("--output", type=str, default=None,
-                       help="결과 저장 경로 (기본: data/sensor/processed/detected_patterns.json)")
-    args = parser.parse_args()
-
-    print("=" * 60)
-    print("Main-S2: 배치 패턴 감지")
-    print("=" * 60)
+def run_detection(args, output_path: Path):
+    """단일 프로세스 감지 (전체 또는 증분)
 
-    # 1. 센서 데이터 로드
+    Returns:
+        (패턴 목록, 체크포인트 또는 None)
+    """
+    # 1. 센서 데이터 로드 (SensorStore 생성 시 한 번만 로드)
     print("\n[1/4] 센서 데이터 로드...")
-    store = SensorStore()
-
     try:
-        store.load_data()
+        store = SensorStore()
     except Exception as e:
         print(f"Error: 센서 데이터 로드 실패 - {e}")
         sys.exit(1)
 
+    # 2. 패턴 감지 실행
+    if args.incremental:
+        # 전체 구간 조회 없이 워터마크 이후 샘플만 처리
+        print("\n[2/4] 증분 패턴 감지 실행...")
+        detector = PatternDetector(store)
+        checkpoint = DetectionCheckpoint(output_path.parent / "detection_checkpoint.json")
+
+        existing = []
+        if output_path.exists():
+            with open(output_path, "r", encoding="utf-8") as f:
+                existing = [DetectedPattern.from_dict(p) for p in json.load(f)]
+
+        new_patterns = []
+        for axis in args.axis:
+            print(f"  - {axis} 워터마크: {checkpoint.watermark(axis) or '없음 (전체 처리)'}")
+            new_patterns.extend(detector.detect_incremental(checkpoint, axis=axis))
+        patterns = detector.merge_patterns(existing, new_patterns)
+        print(f"  - 새로 감지된 패턴: {len(new_patterns)}개 (누적 {len(patterns)}개)")
+        return patterns, checkpoint
+
     df = store.get_data()
     print(f"  - 로드된 레코드: {len(df):,}개")
     print(f"  - 기간: {df['timestamp'].min()} ~ {df['timestamp'].max()}")
 
-    # 2. 패턴 감지 실행
     print("\n[2/4] 패턴 감지 실행...")
-    detector = PatternDetector()
+    detector = PatternDetector(store)
 
-    patterns = detector.detect(df)
+    if len(args.axis) == 1:
+        patterns = detector.detect(axis=args.axis[0])
+    else:
+        patterns = detector.detect_axes(args.axis)
+    if args.spectral:
+        spectral = detector.detect_spectral_vibration()
+        print(f"  - 스펙트럼 진동 패턴: {len(spectral)}개")
+        patterns.extend(spectral)
     print(f"  - 감지된 패턴: {len(patterns)}개")
+    return patterns, None
 
-    # 3. 결과 저장
-    print("\n[3/4] 결과 저장...")
+
+def main():
+    parser = argparse.ArgumentParser(description="센서 데이터 패턴 감지")
+    parser.add_argument("--validate", action="store_true",
+                       help="S1 예상 이벤트와 비교 검증")
+    parser.add_argument("--output", type=str, default=None,
+                       help="결과 저장 경로 (기본: data/sensor/processed/detected_patterns.json)")
+    parser.add_argument("--incremental", action="store_true",
+                       help="체크포인트 워터마크 이후 샘플만 감지하고 기존 결과에 병합")
+    parser.add_argument("--axis", type=str, nargs="+", default=["Fz"],
+                       help="분석할 축 (여러 개 가능, 기본: Fz)")
+    parser.add_argument("--workers", type=int, default=0,
+                       help="병렬 감지 작업자 프로세스 수 (2 이상이면 파일×축×감지기 병렬)")
+    parser.add_argument("--files", type=str, nargs="+", default=None,
+                       help="병렬 감지 대상 parquet 파일 (기본: DataLoader.DEFAULT_PATH)")
+    parser.add_argument("--spectral", action="store_true",
+                       help="STFT 대역 에너지 기반 진동 감지 추가 (설정: vibration.spectral)")
+    args = parser.parse_args()
+    if args.incremental and args.workers > 1:
+        parser.error("--incremental과 --workers는 함께 사용할 수 없습니다")
+    if args.spectral and (args.incremental or args.workers > 1):
+        parser.error("--spectral은 전체 감지(단일 프로세스)에서만 사용할 수 있습니다")
 
     output_path = args.output
     if output_path is None:
@@ -234,11 +280,30 @@ def main():
     else:
         output_path = Path(output_path)
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    print("=" * 60)
+    print("Main-S2: 배치 패턴 감지")
+    print("=" * 60)
+
+    if args.workers > 1:
+        # 병렬 모드: 파일은 작업자용 공유 메모리로 직접 로드
+        files = [Path(f) for f in (args.files or [DataLoader.DEFAULT_PATH])]
+        print(f"\n[1/4] 병렬 감지 대상: {len(files)}개 파일, 축 {', '.join(args.axis)}")
+
+        print(f"\n[2/4] 병렬 패턴 감지 실행 (작업자 {args.workers})...")
+        patterns = ParallelPatternDetector(max_workers=args.workers).detect(files, axes=args.axis)
+        checkpoint = None
+        print(f"  - 감지된 패턴: {len(patterns)}개")
+    else:
+        patterns, checkpoint = run_detection(args, output_path)
+
+    # 3. 결과 저장
+    print("\n[3/4] 결과 저장...")
 
-    patterns_data = [p.to_dict() for p in patterns]
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(patterns_data, f, ensure_ascii=False, indent=2, default=str)
+    # 패턴을 먼저 저장하고 체크포인트를 갱신 → 중간에 중단되어도 재실행 시 병합으로 중복 제거
+    save_patterns(patterns, output_path)
+    if checkpoint is not None:
+        checkpoint.save()
+        print(f"  - 체크포인트: {checkpoint.path}")
 
     print(f"  - 저장 완료: {output_path}")
 
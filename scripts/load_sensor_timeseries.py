@@ -0,0 +1,63 @@
+"""
+센서 시계열 DB 적재 스크립트
+
+parquet 센서 데이터와 감지 패턴을 data/sensor_timeseries.db에 적재합니다.
+같은 타임스탬프/패턴 ID는 교체되므로 여러 번 실행해도 안전합니다.
+
+Usage:
+    python scripts/load_sensor_timeseries.py
+    python scripts/load_sensor_timeseries.py --parquet data/sensor/raw/axia80_week_02.parquet
+"""
+
+import sys
+import json
+import argparse
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.sensor.data_loader import DataLoader
+from src.sensor.patterns import DetectedPattern
+from src.sensor.timeseries_db import SensorTimeSeriesDB
+
+
+def main():
+    parser = argparse.ArgumentParser(description="센서 시계열 DB 적재")
+    parser.add_argument("--parquet", type=str, default=None,
+                        help="적재할 parquet 파일 (기본: DataLoader.DEFAULT_PATH)")
+    parser.add_argument("--patterns", type=str,
+                        default=str(project_root / "data" / "sensor" / "processed" / "detected_patterns.json"),
+                        help="감지 패턴 JSON 파일")
+    parser.add_argument("--db", type=str, default=None,
+                        help="DB 파일 경로 (기본: data/sensor_timeseries.db)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("센서 시계열 DB 적재")
+    print("=" * 60)
+
+    db = SensorTimeSeriesDB(Path(args.db) if args.db else None)
+
+    parquet_path = Path(args.parquet) if args.parquet else DataLoader.DEFAULT_PATH
+    df = DataLoader.load(parquet_path, use_cache=False)
+    started = time.perf_counter()
+    rows = db.append(df)
+    print(f"\n샘플 적재: {rows}건 ({time.perf_counter() - started:.1f}s) ← {parquet_path}")
+
+    patterns_path = Path(args.patterns)
+    if patterns_path.exists():
+        with open(patterns_path, "r", encoding="utf-8") as f:
+            patterns = [DetectedPattern.from_dict(p) for p in json.load(f)]
+        print(f"이벤트 적재: {db.insert_events(patterns)}건 ← {patterns_path}")
+
+    time_range = db.time_range()
+    if time_range:
+        print(f"\nDB 범위: {time_range[0]} ~ {time_range[1]} ({db.count()}건)")
+    print(f"DB 경로: {db.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.config import get_settings
+from src.config_reload import get_config_watcher
 from src.rag import QueryClassifier, ResponseGenerator, HybridRetriever
 from src.ontology import OntologyEngine
 
@@ -84,10 +85,11 @@ def get_classifier() -> QueryClassifier:
 
 
 def get_engine() -> OntologyEngine:
-    """OntologyEngine 싱글톤"""
+    """OntologyEngine 싱글톤 (규칙/임계값 파일은 설정 감시로 핫 리로드)"""
     global _engine
     if _engine is None:
         _engine = OntologyEngine()
+        get_config_watcher().register(_engine.rule_engine)
     return _engine
 
 
@@ -152,9 +154,13 @@ async def startup():
     except Exception as e:
         logger.error(f"Component initialization failed: {e}")
 
+    # 규칙/임계값 파일 감시 (변경 시 재시작 없이 새 버전 적용)
+    get_config_watcher().start()
+
 
 @app.on_event("shutdown")
 async def shutdown():
     """앱 종료 시 정리"""
     logger.info("UR5e Ontology RAG API Shutting down...")
+    get_config_watcher().stop(timeout=5)
     get_evidence_store().clear()
@@ -152,8 +152,11 @@ async def chat(
                 fx_vals = [safe_float(r.get("Fx")) for r in readings if "Fx" in r]
                 fy_vals = [safe_float(r.get("Fy")) for r in readings if "Fy" in r]
                 fz_avg = sum(fz_vals)/len(fz_vals) if fz_vals else 0.0
-                fz_max = max(fz_vals) if fz_vals else 0.0
-                fz_min = min(fz_vals) if fz_vals else 0.0
+                # 버킷 min/max가 있으면 사용 (샘플 사이 피크 보존)
+                fz_max_vals = [safe_float(r.get("Fz_max", r.get("Fz"))) for r in readings if "Fz" in r]
+                fz_min_vals = [safe_float(r.get("Fz_min", r.get("Fz"))) for r in readings if "Fz" in r]
+                fz_max = max(fz_max_vals) if fz_max_vals else 0.0
+                fz_min = min(fz_min_vals) if fz_min_vals else 0.0
                 fz_last = fz_vals[-1] if fz_vals else 0.0
                 # 기타 축/센서도 필요시 추가
                 return {
@@ -9,6 +9,7 @@ from typing import Optional, List
 from fastapi import APIRouter, Query, HTTPException
 from pydantic import BaseModel
 
+from src.config_reload import get_config_watcher
 from src.ontology import OntologyEngine
 
 logger = logging.getLogger(__name__)
@@ -22,6 +23,7 @@ def get_ontology_engine() -> OntologyEngine:
     global _ontology_engine
     if _ontology_engine is None:
         _ontology_engine = OntologyEngine()
+        get_config_watcher().register(_ontology_engine.rule_engine)
     return _ontology_engine
 
 router = APIRouter(prefix="/api/ontology", tags=["ontology"])
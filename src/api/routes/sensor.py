@@ -10,6 +10,7 @@ import logging
 from pathlib import Path
 from typing import Optional, List, Dict
 
+import numpy as np
 import pandas as pd
 from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
@@ -26,7 +27,12 @@ from src.api.schemas import (
     PredictionsResponse,
     IntegratedStreamData,
 )
+from src.config_reload import get_config_watcher
 from src.ontology import OntologyEngine, load_ontology
+from src.sensor.data_loader import DataLoader
+from src.sensor.downsample_pyramid import DownsamplePyramid
+from src.sensor.downsampling import downsample_indices
+from src.sensor.pattern_repository import PatternRepository, get_pattern_repository
 from src.simulation.correlation_engine import get_correlation_engine, reset_correlation_engine
 from src.simulation.scenario_sequencer import ScenarioType, get_scenario_sequencer
 
@@ -42,9 +48,15 @@ SENSOR_DATA_DIR = _PROJECT_ROOT / "data" / "sensor"
 SENSOR_THRESHOLD_CRITICAL = 300  # N 이상: 위험 상태
 SENSOR_THRESHOLD_WARNING = 100   # N 이상: 경고 상태
 
+# 센서 데이터 경로 (DataLoader 기본 경로를 프로젝트 루트 기준으로)
+SENSOR_PARQUET_PATH = _PROJECT_ROOT / DataLoader.DEFAULT_PATH
+
+# 라우트에서 사용하는 컬럼 (나머지 컨텍스트 문자열 컬럼은 로드하지 않음)
+SENSOR_COLUMNS = ["timestamp", *DataLoader.SENSOR_AXES, "status", "task_mode"]
+
 # 센서 데이터 캐시
 _sensor_df: Optional[pd.DataFrame] = None
-_patterns_data: Optional[List[Dict]] = None
+_sensor_pyramid: Optional[DownsamplePyramid] = None
 _events_data: Optional[List[Dict]] = None
 
 # SSE 스트리밍 커서
@@ -59,6 +71,7 @@ def get_ontology_engine() -> OntologyEngine:
     global _ontology_engine
     if _ontology_engine is None:
         _ontology_engine = OntologyEngine()
+        get_config_watcher().register(_ontology_engine.rule_engine)
     return _ontology_engine
 
 
@@ -66,12 +79,13 @@ def load_sensor_data() -> pd.DataFrame:
     """센서 데이터 로드 (캐싱)"""
     global _sensor_df
     if _sensor_df is None:
-        parquet_path = SENSOR_DATA_DIR / "raw" / "axia80_week_01.parquet"
+        parquet_path = SENSOR_PARQUET_PATH
         logger.info(f"Attempting to load sensor data from: {parquet_path}")
         logger.info(f"Path exists: {parquet_path.exists()}")
         if parquet_path.exists():
             try:
-                _sensor_df = pd.read_parquet(parquet_path)
+                # DataLoader 컬럼 캐시 공유 (memory-mapped, 필요한 컬럼만)
+                _sensor_df = DataLoader.load(parquet_path, columns=SENSOR_COLUMNS)
             except Exception as e:
                 logger.warning(f"Failed to read sensor parquet: {parquet_path} ({e})")
                 _sensor_df = pd.DataFrame()
@@ -90,18 +104,29 @@ def load_sensor_data() -> pd.DataFrame:
     return _sensor_df
 
 
+def load_sensor_pyramid() -> Optional[DownsamplePyramid]:
+    """다운샘플 피라미드 로드 (parquet 옆 .pyramid.npz, 없거나 오래되면 재구축)"""
+    global _sensor_pyramid
+    if _sensor_pyramid is None:
+        df = load_sensor_data()
+        if df.empty:
+            return None
+        try:
+            _sensor_pyramid = DownsamplePyramid.load_or_build(SENSOR_PARQUET_PATH, df)
+        except Exception as e:
+            logger.warning(f"Failed to prepare sensor pyramid: {e}")
+            _sensor_pyramid = DownsamplePyramid.build(df)
+    return _sensor_pyramid
+
+
+def load_pattern_repository() -> PatternRepository:
+    """패턴 저장소 (PatternDetector/OntologyEngine과 공유, 파일 변경 시 재색인)"""
+    return get_pattern_repository(SENSOR_DATA_DIR / "processed" / "detected_patterns.json")
+
+
 def load_patterns() -> List[Dict]:
-    """패턴 데이터 로드"""
-    global _patterns_data
-    if _patterns_data is None:
-        patterns_path = SENSOR_DATA_DIR / "processed" / "detected_patterns.json"
-        if patterns_path.exists():
-            with open(patterns_path, 'r', encoding='utf-8') as f:
-                _patterns_data = json.load(f)
-            logger.info(f"Loaded patterns: {len(_patterns_data)} patterns")
-        else:
-            _patterns_data = []
-    return _patterns_data
+    """패턴 데이터 로드 (파일 순서)"""
+    return load_pattern_repository().records
 
 
 def load_events() -> List[Dict]:
@@ -179,55 +204,62 @@ async def get_sensor_readings(
 async def get_sensor_readings_range(
     hours: int = Query(default=1, ge=1, le=168, description="조회할 시간 범위 (최대 168시간=7일)"),
     samples: int = Query(default=200, ge=10, le=500, description="반환할 샘플 수"),
+    mode: str = Query(
+        default="pyramid",
+        pattern="^(pyramid|uniform|lttb|minmax)$",
+        description="다운샘플링 모드 (pyramid/uniform/lttb/minmax)",
+    ),
+    axis: str = Query(
+        default="Fz",
+        pattern="^(Fx|Fy|Fz|Tx|Ty|Tz)$",
+        description="lttb/minmax 기준 축",
+    ),
 ):
     """
-    시간 범위 기반 센서 데이터 조회 (샘플링)
+    시간 범위 기반 센서 데이터 조회 (다운샘플링)
 
-    7일치 데이터를 효율적으로 조회하기 위해 샘플링합니다.
+    7일치 데이터를 효율적으로 조회하기 위해 다운샘플링합니다.
     - hours: 최근 N시간 데이터 조회
-    - samples: 반환할 데이터 포인트 수 (균등 샘플링)
+    - samples: 최대 데이터 포인트 수
+    - mode:
+        - pyramid (기본): 사전 집계 피라미드에서 요청 수를 만족하는 가장 거친 레벨 제공.
+          축 값은 버킷 평균이며 {axis}_min / {axis}_max로 버킷 최소/최대값 포함.
+          양 끝 버킷은 구간 안 샘플만으로 집계하며, edges_clipped가 False면
+          버킷 전체(구간 밖 샘플 포함) 값입니다
+        - uniform: 원본 샘플 균등 샘플링
+        - lttb: Largest-Triangle-Three-Buckets (axis 기준 형태 보존)
+        - minmax: 버킷별 최소/최대 포락선 (axis 기준 스파이크 보존)
     """
     try:
-        df = load_sensor_data()
+        if mode != "pyramid":
+            return _sampled_readings_range(hours, samples, mode, axis)
 
-        if df.empty:
-            return {"readings": [], "total": 0, "time_range": {"start": "", "end": ""}}
+        pyramid = load_sensor_pyramid()
+        bounds = pyramid.time_range_ns() if pyramid is not None else None
 
-        total = len(df)
-        # 1초당 1샘플 기준, hours 시간에 해당하는 레코드 수
-        records_needed = hours * 3600
-        records_needed = min(records_needed, total)
-
-        # 최근 N시간 데이터 선택
-        subset = df.iloc[-records_needed:].copy()
+        if bounds is None:
+            return {"readings": [], "total": 0, "time_range": {"start": "", "end": ""}}
 
-        # 균등 샘플링
-        if len(subset) > samples:
-            indices = [int(i * len(subset) / samples) for i in range(samples)]
-            subset = subset.iloc[indices]
+        # 최근 N시간 (마지막 샘플 기준)
+        end_ns = bounds[1]
+        start_ns = max(bounds[0], end_ns - (hours * 3600 - 1) * 1_000_000_000)
+        result = pyramid.query(start_ns, end_ns, samples)
 
-        readings = []
-        for _, row in subset.iterrows():
-            readings.append({
-                "timestamp": str(row['timestamp']),
-                "Fx": float(row['Fx']) if pd.notna(row['Fx']) else 0.0,
-                "Fy": float(row['Fy']) if pd.notna(row['Fy']) else 0.0,
-                "Fz": float(row['Fz']) if pd.notna(row['Fz']) else 0.0,
-                "Tx": float(row['Tx']) if pd.notna(row['Tx']) else 0.0,
-                "Ty": float(row['Ty']) if pd.notna(row['Ty']) else 0.0,
-                "Tz": float(row['Tz']) if pd.notna(row['Tz']) else 0.0,
-            })
+        readings = _pyramid_readings(result)
 
         time_range = {
-            "start": str(subset['timestamp'].min()) if not subset.empty else "",
-            "end": str(subset['timestamp'].max()) if not subset.empty else "",
+            "start": readings[0]["timestamp"] if readings else "",
+            "end": readings[-1]["timestamp"] if readings else "",
         }
 
         return {
             "readings": readings,
-            "total": records_needed,
+            "total": result["total"],
             "sampled": len(readings),
             "hours": hours,
+            "resolution_s": result["resolution_s"],
+            "edges_clipped": result["edges_clipped"],
+            "mode": mode,
             "time_range": time_range,
         }
 
@@ -236,21 +268,91 @@ async def get_sensor_readings_range(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _sampled_readings_range(hours: int, samples: int, mode: str, axis: str) -> Dict:
+    """원본 샘플 기반 다운샘플링 (uniform/lttb/minmax)"""
+    df = load_sensor_data()
+
+    if df.empty:
+        return {"readings": [], "total": 0, "time_range": {"start": "", "end": ""}}
+
+    # 1초당 1샘플 기준, hours 시간에 해당하는 레코드 수
+    records_needed = min(hours * 3600, len(df))
+    subset = df.iloc[-records_needed:]
+
+    ts_ns = subset["timestamp"].to_numpy(dtype="datetime64[ns]").view("int64")
+    indices = downsample_indices(
+        subset[axis].to_numpy(dtype="float64"),
+        samples,
+        mode=mode,
+        x=(ts_ns - ts_ns[0]).astype("float64"),
+    )
+    sampled = subset.iloc[indices]
+
+    columns = {"timestamp": sampled["timestamp"].astype(str).tolist()}
+    for name in DataLoader.SENSOR_AXES:
+        columns[name] = np.nan_to_num(sampled[name].to_numpy(dtype="float64"), nan=0.0).tolist()
+    keys = list(columns)
+    readings = [dict(zip(keys, row)) for row in zip(*columns.values())]
+
+    return {
+        "readings": readings,
+        "total": records_needed,
+        "sampled": len(readings),
+        "hours": hours,
+        "mode": mode,
+        "time_range": {
+            "start": readings[0]["timestamp"] if readings else "",
+            "end": readings[-1]["timestamp"] if readings else "",
+        },
+    }
+
+
+def _pyramid_readings(result: Dict) -> List[Dict]:
+    """피라미드 조회 결과 → readings 목록 (컬럼 단위 변환)"""
+    columns = {
+        "timestamp": pd.to_datetime(result["bucket_ns"]).astype(str).tolist(),
+    }
+    for axis in DataLoader.SENSOR_AXES:
+        if f"{axis}_mean" not in result:
+            continue
+        for key, field in ((axis, "mean"), (f"{axis}_min", "min"), (f"{axis}_max", "max")):
+            values = np.nan_to_num(result[f"{axis}_{field}"], nan=0.0)
+            columns[key] = values.tolist()
+
+    keys = list(columns)
+    return [dict(zip(keys, row)) for row in zip(*columns.values())]
+
+
 @router.get("/patterns", response_model=PatternsResponse)
 async def get_sensor_patterns(
     limit: int = Query(default=10, ge=1, le=100, description="반환할 패턴 수"),
+    pattern_type: Optional[str] = Query(default=None, description="패턴 타입 필터 (collision/overload/drift/vibration)"),
+    start: Optional[str] = Query(default=None, description="시작 시각 (ISO 8601, 포함)"),
+    end: Optional[str] = Query(default=None, description="종료 시각 (ISO 8601, 포함)"),
 ):
     """
     감지된 패턴 목록 조회
 
     충돌, 과부하, 드리프트 등 감지된 패턴 목록을 반환합니다.
     프론트엔드 HistoryView에서 패턴 테이블로 사용합니다.
+    필터 유무와 관계없이 조건(없으면 전체)에 맞는 가장 최근 limit개 패턴을
+    시간순으로 반환합니다 (저장소 색인 이진 탐색).
     """
     try:
-        patterns_raw = load_patterns()
+        bounds = [start, end]
+        for i, value in enumerate(bounds):
+            if value is not None:
+                try:
+                    bounds[i] = pd.Timestamp(value)
+                except ValueError:
+                    raise HTTPException(status_code=400, detail=f"유효하지 않은 시각: {value}")
+
+        repository = load_pattern_repository()
+        patterns_raw = repository.find(pattern_type, bounds[0], bounds[1], limit=limit)
+        total = len(repository.select(pattern_type, bounds[0], bounds[1]))
 
         patterns = []
-        for p in patterns_raw[:limit]:
+        for p in patterns_raw:
             patterns.append(PatternInfo(
                 id=p.get('pattern_id', p.get('id', '')),
                 type=p.get('pattern_type', p.get('type', '')),
@@ -262,9 +364,11 @@ async def get_sensor_patterns(
 
         return PatternsResponse(
             patterns=patterns,
-            total=len(patterns_raw),
+            total=total,
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Patterns error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
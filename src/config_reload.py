@@ -0,0 +1,257 @@
+"""
+설정 핫 리로드
+
+설정 파일을 (mtime, 크기) 폴링으로 감시하고, 바뀌면 요청 경로 밖(감시 스레드)에서
+읽기 → 검증 → 컴파일한 뒤 버전이 붙은 스냅샷을 참조 교체 한 번으로 적용합니다.
+
+- 스냅샷은 교체 단위이며 적용 후 바꾸지 않습니다 (대상별 지연 캐시 제외).
+- 요청 진입점은 pinned()로 스레드별 스냅샷을 고정하므로, 처리 중인 요청은
+  교체 후에도 시작할 때의 버전으로 끝까지 실행됩니다.
+- 새 설정이 검증/컴파일에 실패하면 기존 버전을 유지하고, 파일이 다시 바뀔 때까지
+  같은 내용으로 재시도하지 않습니다.
+
+사용 예시:
+    from src.config_reload import get_config_watcher
+
+    watcher = get_config_watcher()
+    watcher.register(rule_engine)
+    watcher.start()
+"""
+
+import functools
+import logging
+import os
+import threading
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (mtime_ns, 크기), 파일이 없으면 None
+FileSignature = Optional[Tuple[int, int]]
+
+
+def file_signature(path: Path) -> FileSignature:
+    """파일 변경 감지용 시그니처 (mtime_ns, 크기) (파일이 없으면 None)"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """버전이 붙은 설정 스냅샷
+
+    Attributes:
+        version: 설정 버전 (최초 1, 리로드마다 1 증가)
+        data: 검증/컴파일된 설정 (대상별 형식)
+        sources: 설정 파일별 시그니처 (파일 기반이 아니면 빈 튜플)
+        loaded_at: 적용 시각
+    """
+
+    version: int
+    data: Any
+    sources: Tuple[FileSignature, ...] = ()
+    loaded_at: datetime = field(default_factory=datetime.now)
+
+
+class HotReloadable:
+    """핫 리로드 가능한 설정을 가진 객체 (mixin)
+
+    하위 클래스는 _config_paths()와 _build_config()를 구현하고
+    __init__에서 _init_config()를 호출합니다.
+    """
+
+    def _config_paths(self) -> Sequence[Path]:
+        """감시할 설정 파일 경로 (비어 있으면 리로드하지 않음)"""
+        return ()
+
+    def _build_config(self) -> Any:
+        """설정 파일을 읽어 검증/컴파일 (실패 시 예외)"""
+        raise NotImplementedError
+
+    def _init_config(self, load: Optional[Callable[[], Any]] = None) -> None:
+        """최초 스냅샷(버전 1) 생성
+
+        Args:
+            load: 최초 설정 로더 (기본: _build_config, 예외는 그대로 전파)
+        """
+        self._reload_lock = threading.Lock()
+        self._pins = threading.local()
+        # 읽기 전에 시그니처를 기록 → 읽는 도중 바뀐 파일은 다음 리로드에서 반영
+        sources = self._config_sources()
+        data = (load or self._build_config)()
+        self._failed_sources: Optional[Tuple[FileSignature, ...]] = None
+        self._snapshot = ConfigSnapshot(version=1, data=data, sources=sources)
+
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """현재 스레드가 사용할 설정 스냅샷 (pinned() 블록 안이면 고정된 스냅샷)"""
+        pinned = getattr(self._pins, "snapshot", None)
+        return pinned if pinned is not None else self._snapshot
+
+    @property
+    def config_version(self) -> int:
+        """설정 버전"""
+        return self.snapshot.version
+
+    @contextmanager
+    def pinned(self) -> Iterator[ConfigSnapshot]:
+        """블록 동안 현재 스레드의 설정 스냅샷 고정 (중첩되면 바깥 스냅샷 유지)"""
+        pinned = getattr(self._pins, "snapshot", None)
+        if pinned is not None:
+            yield pinned
+            return
+
+        self._pins.snapshot = self._snapshot
+        try:
+            yield self._pins.snapshot
+        finally:
+            self._pins.snapshot = None
+
+    def reload(self, force: bool = False) -> bool:
+        """설정 파일이 바뀌었으면 다시 읽어 새 버전으로 교체
+
+        Args:
+            force: 변경 여부와 무관하게 다시 읽기
+
+        Returns:
+            새 버전을 적용했으면 True (변경 없음/실패 시 False, 실패하면 기존 버전 유지)
+        """
+        if not self._config_paths():
+            return False
+
+        with self._reload_lock:
+            current = self._snapshot
+            sources = self._config_sources()
+            if not force and sources in (current.sources, self._failed_sources):
+                return False
+
+            try:
+                data = self._build_config()
+            except Exception as e:
+                self._failed_sources = sources
+                logger.error(f"{type(self).__name__} 설정 리로드 실패, 버전 {current.version} 유지: {e}")
+                return False
+
+            self._failed_sources = None
+            self._snapshot = ConfigSnapshot(version=current.version + 1, data=data, sources=sources)
+
+        logger.info(f"{type(self).__name__} 설정 리로드: 버전 {current.version} → {current.version + 1}")
+        return True
+
+    def _config_sources(self) -> Tuple[FileSignature, ...]:
+        return tuple(file_signature(Path(path)) for path in self._config_paths())
+
+
+def pinned_config(method: Callable) -> Callable:
+    """메서드 실행 동안 설정 스냅샷 고정 (HotReloadable 메서드 데코레이터)"""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.pinned():
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class ConfigWatcher:
+    """설정 파일 폴링 감시
+
+    등록된 대상의 reload()를 백그라운드 스레드에서 주기적으로 호출합니다.
+    대상은 약한 참조로 보관하므로 등록만으로 객체 수명이 늘어나지 않습니다.
+    """
+
+    DEFAULT_INTERVAL_S = 2.0
+
+    def __init__(self, interval_s: float = DEFAULT_INTERVAL_S):
+        """초기화
+
+        Args:
+            interval_s: 폴링 간격 (초)
+
+        Raises:
+            ValueError: 폴링 간격이 0 이하일 때
+        """
+        if interval_s <= 0:
+            raise ValueError(f"폴링 간격은 0보다 커야 합니다: {interval_s}")
+        self.interval_s = interval_s
+        self._targets: "weakref.WeakSet[HotReloadable]" = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, target: HotReloadable) -> HotReloadable:
+        """감시 대상 등록 (대상을 그대로 반환)"""
+        with self._lock:
+            self._targets.add(target)
+        return target
+
+    def unregister(self, target: HotReloadable) -> None:
+        """감시 대상 해제"""
+        with self._lock:
+            self._targets.discard(target)
+
+    @property
+    def targets(self) -> List[HotReloadable]:
+        """등록된 대상 목록"""
+        with self._lock:
+            return list(self._targets)
+
+    @property
+    def running(self) -> bool:
+        """감시 스레드 실행 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def poll(self) -> List[HotReloadable]:
+        """모든 대상을 한 번 확인
+
+        Returns:
+            새 버전을 적용한 대상 목록
+        """
+        reloaded = []
+        for target in self.targets:
+            try:
+                if target.reload():
+                    reloaded.append(target)
+            except Exception as e:
+                logger.error(f"설정 감시 실패 ({type(target).__name__}): {e}")
+        return reloaded
+
+    def start(self) -> None:
+        """감시 스레드 시작 (이미 실행 중이면 무시)"""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="config-watcher", daemon=True)
+        self._thread.start()
+        logger.info(f"설정 감시 시작: {len(self.targets)}개 대상, {self.interval_s}초 간격")
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """감시 스레드 종료"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            self.poll()
+
+
+# 공유 감시자
+_watcher: Optional[ConfigWatcher] = None
+
+
+def get_config_watcher() -> ConfigWatcher:
+    """공유 ConfigWatcher (API 프로세스 전체에서 하나)"""
+    global _watcher
+    if _watcher is None:
+        _watcher = ConfigWatcher()
+    return _watcher
@@ -53,6 +53,10 @@ from .loader import (
     load_lexicon,
     resolve_alias,
 )
+from .event_timeline import (
+    EventTimeline,
+    PatternEvents,
+)
 from .rule_engine import (
     RuleEngine,
     InferenceResult,
@@ -99,6 +103,9 @@ __all__ = [
     "RuleEngine",
     "InferenceResult",
     "create_rule_engine",
+    # EventTimeline
+    "EventTimeline",
+    "PatternEvents",
     # GraphTraverser
     "GraphTraverser",
     "PathStep",
@@ -0,0 +1,131 @@
+"""
+패턴 이벤트 타임라인
+
+predict_error 입력 이력(pattern_history)을 한 번만 파싱해 패턴 ID별로
+시간순 int64 타임스탬프 배열(datetime.min 기준 마이크로초)로 보관합니다.
+윈도우 내 건수와 반구간 비교는 bisect 이진 탐색으로 O(log n)에 계산하므로
+예측 규칙마다 이력 전체를 다시 필터링하거나 파싱하지 않습니다.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# 강도 값으로 사용하는 이벤트 키 (앞선 키 우선)
+INTENSITY_KEYS = ("intensity", "severity", "confidence", "magnitude", "value")
+
+
+def parse_timestamp(ts_str: Optional[str]) -> datetime:
+    """이벤트 타임스탬프 파싱
+
+    시간대가 있는 값(예: "Z", "+09:00")은 로컬 시각으로 변환한 naive datetime을 반환합니다.
+
+    Returns:
+        datetime (없거나 해석할 수 없으면 datetime.min)
+    """
+    if not ts_str:
+        return datetime.min
+    try:
+        parsed = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone().replace(tzinfo=None)
+        return parsed
+    except Exception:
+        return datetime.min
+
+
+def timestamp_key(value: datetime) -> int:
+    """datetime → 정렬 키 (datetime.min 기준 마이크로초)"""
+    delta = value - datetime.min
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def event_intensity(event: Dict[str, Any]) -> Optional[float]:
+    """이벤트 강도 값 (INTENSITY_KEYS 중 숫자로 변환되는 첫 값, 없으면 None)"""
+    for key in INTENSITY_KEYS:
+        val = event.get(key)
+        if val is not None:
+            try:
+                return float(val)
+            except (ValueError, TypeError):
+                pass
+    return None
+
+
+@dataclass
+class PatternEvents:
+    """한 패턴의 시간순 이벤트 (같은 시각은 입력 순서 유지)
+
+    Attributes:
+        keys: 이벤트 타임스탬프 키 (int64, 오름차순)
+        intensity_keys: 강도 값이 있는 이벤트의 타임스탬프 키
+        intensities: 강도 값 (intensity_keys 순서)
+    """
+
+    keys: array = field(default_factory=lambda: array("q"))
+    intensity_keys: array = field(default_factory=lambda: array("q"))
+    intensities: List[float] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def count_after(self, cutoff: datetime) -> int:
+        """cutoff 이후(초과) 이벤트 수"""
+        return len(self.keys) - bisect_right(self.keys, timestamp_key(cutoff))
+
+    def split_after(self, cutoff: datetime, mid: datetime) -> Tuple[int, int]:
+        """cutoff 이후 이벤트를 mid 기준으로 나눈 건수
+
+        Returns:
+            (cutoff < t < mid 건수, t >= mid 건수)
+        """
+        lo = bisect_right(self.keys, timestamp_key(cutoff))
+        split = max(bisect_left(self.keys, timestamp_key(mid)), lo)
+        return split - lo, len(self.keys) - split
+
+    def intensities_after(self, cutoff: datetime) -> List[float]:
+        """cutoff 이후 이벤트의 강도 값 (시간순)"""
+        return self.intensities[bisect_right(self.intensity_keys, timestamp_key(cutoff)):]
+
+
+class EventTimeline:
+    """패턴 ID별 이벤트 타임라인"""
+
+    def __init__(self, events: Iterable[Dict[str, Any]] = ()):
+        """초기화
+
+        Args:
+            events: 패턴 발생 이력
+                [{"pattern": "PAT_OVERLOAD", "timestamp": "2026-01-20T10:00:00", "intensity": 0.8}, ...]
+        """
+        # 패턴별 (타임스탬프 키 목록, 강도 목록) - 입력 순서
+        grouped: Dict[Any, Tuple[List[int], List[Optional[float]]]] = {}
+        for event in events:
+            keys, intensities = grouped.setdefault(event.get("pattern"), ([], []))
+            keys.append(timestamp_key(parse_timestamp(event.get("timestamp"))))
+            intensities.append(event_intensity(event))
+
+        self._patterns: Dict[Any, PatternEvents] = {}
+        for pattern_id, (keys, intensities) in grouped.items():
+            # 안정 정렬 → 같은 시각은 입력 순서 유지
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            pattern_events = PatternEvents(keys=array("q", [keys[i] for i in order]))
+            for i in order:
+                if intensities[i] is not None:
+                    pattern_events.intensity_keys.append(keys[i])
+                    pattern_events.intensities.append(intensities[i])
+            self._patterns[pattern_id] = pattern_events
+
+    def __len__(self) -> int:
+        return sum(len(events) for events in self._patterns.values())
+
+    @property
+    def patterns(self) -> List[Any]:
+        """이력에 있는 패턴 ID 목록 (처음 나온 순서)"""
+        return list(self._patterns)
+
+    def events(self, pattern_id: Any) -> PatternEvents:
+        """패턴의 이벤트 (없으면 빈 PatternEvents)"""
+        return self._patterns.get(pattern_id) or PatternEvents()
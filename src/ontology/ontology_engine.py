@@ -7,10 +7,7 @@ QueryClassifier 결과를 받아 온톨로지 기반 추론을 수행합니다.
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-
-import json
-from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 
 from .models import OntologySchema, Entity
 from .schema import RelationType, EntityType
@@ -18,6 +15,9 @@ from .loader import load_ontology
 from .rule_engine import RuleEngine, InferenceResult
 from .graph_traverser import GraphTraverser, OntologyPath, TraversalResult
 
+if TYPE_CHECKING:
+    from src.sensor.pattern_repository import PatternRepository
+
 logger = logging.getLogger(__name__)
 
 
@@ -92,89 +92,68 @@ class OntologyEngine:
     def __init__(
         self,
         ontology: Optional[OntologySchema] = None,
-        rule_engine: Optional[RuleEngine] = None
+        rule_engine: Optional[RuleEngine] = None,
+        pattern_repository: Optional["PatternRepository"] = None
     ):
         """초기화
 
         Args:
             ontology: 온톨로지 스키마 (없으면 자동 로드)
             rule_engine: 추론 규칙 엔진 (없으면 자동 생성)
+            pattern_repository: 감지 패턴 저장소 (없으면 공유 PatternRepository)
         """
         self.ontology = ontology or load_ontology()
         self.rule_engine = rule_engine or RuleEngine()
         self.traverser = GraphTraverser(self.ontology)
-        self._pattern_log_cache: Optional[List[Dict[str, Any]]] = None
+        self._pattern_repository = pattern_repository
         logger.info("OntologyEngine 초기화 완료")
 
-    def _load_detected_patterns(self) -> List[Dict[str, Any]]:
-        """감지된 패턴 로그 로드 (캐싱)
-
-        data/sensor/processed/detected_patterns.json을 사용합니다.
-        """
-        if self._pattern_log_cache is not None:
-            return self._pattern_log_cache
-
-        root = Path(__file__).resolve().parents[2]
-        patterns_path = root / "data" / "sensor" / "processed" / "detected_patterns.json"
-        if not patterns_path.exists():
-            self._pattern_log_cache = []
-            return self._pattern_log_cache
+    def _get_pattern_repository(self) -> "PatternRepository":
+        """감지 패턴 저장소 (data/sensor/processed/detected_patterns.json 색인)"""
+        if self._pattern_repository is not None:
+            return self._pattern_repository
+        from src.sensor.pattern_repository import get_pattern_repository
+        return get_pattern_repository()
 
-        try:
-            with open(patterns_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            if isinstance(data, list):
-                self._pattern_log_cache = data
-            else:
-                self._pattern_log_cache = []
-        except Exception as e:
-            logger.warning(f"패턴 로그 로드 실패: {e}")
-            self._pattern_log_cache = []
-
-        return self._pattern_log_cache
+    def _load_detected_patterns(self) -> List[Dict[str, Any]]:
+        """감지된 패턴 로그 (파일 순서)"""
+        return self._get_pattern_repository().records
 
     def _build_pattern_history(self, resolved_pattern_id: str, limit: int = 3) -> Dict[str, Any]:
-        """패턴 이력(최근 감지 여부) 요약"""
-        patterns = self._load_detected_patterns()
+        """패턴 이력(최근 감지 여부) 요약
+
+        저장소의 타입별 시간순 색인을 사용하므로 패턴 로그 크기와 무관하게
+        건수/최신 감지/최근 샘플을 바로 얻습니다.
+        """
+        from src.sensor.pattern_repository import record_timestamp as _ts
 
+        repository = self._get_pattern_repository()
         target_type = resolved_pattern_id.replace("PAT_", "").lower()
-        matched: List[Dict[str, Any]] = []
-        for p in patterns:
-            pid = (p.get("pattern_id") or p.get("id") or "").upper()
-            ptype = (p.get("pattern_type") or p.get("type") or "").lower()
-            if pid == resolved_pattern_id or ptype == target_type:
-                matched.append(p)
-
-        # 타임스탬프 필드 후보
-        def _ts(item: Dict[str, Any]) -> str:
-            return str(item.get("timestamp") or item.get("start_time") or item.get("time") or "")
-
-        matched_sorted = sorted(matched, key=_ts)
-        count = len(matched_sorted)
-        latest_ts = _ts(matched_sorted[-1]) if count else ""
+        positions = repository.select(target_type, pattern_id=resolved_pattern_id)
+        records = repository.records
+
+        count = len(positions)
+        latest_ts = _ts(records[positions[-1]]) if count else ""
         recent_samples = [
             {
                 "timestamp": _ts(x),
                 "confidence": float(x.get("confidence", 0.0)) if x.get("confidence") is not None else 0.0,
                 "metrics": x.get("metrics", {}),
             }
-            for x in matched_sorted[-limit:]
+            for x in (records[p] for p in positions[max(count - limit, 0):])
         ]
 
-        # 데이터 기간(전체) 추정
-        all_ts = [_ts(x) for x in patterns if _ts(x)]
-        time_range = {
-            "start": min(all_ts) if all_ts else "",
-            "end": max(all_ts) if all_ts else "",
-        }
+        # 데이터 기간(전체)
+        start, end = repository.time_range()
+        time_range = {"start": start, "end": end}
 
-        if patterns and count == 0:
+        if len(repository) and count == 0:
             desc = (
                 f"최근 데이터 기간({time_range['start']} ~ {time_range['end']})에서 "
                 f"{resolved_pattern_id} 감지 기록이 없습니다."
             )
             confidence = 0.9
-        elif not patterns:
+        elif not len(repository):
             desc = (
                 "패턴 이력 데이터(detected_patterns.json)를 찾지 못해 최근 감지 여부를 확인할 수 없습니다. "
                 "(패턴 감지 파이프라인 실행 또는 데이터 경로 확인이 필요합니다.)"
@@ -202,38 +181,31 @@ class OntologyEngine:
 
         "지난 주 에러 패턴 알려줘" 같은 일반적인 패턴 조회 시 사용
         """
-        patterns = self._load_detected_patterns()
-
-        # 타임스탬프 필드 후보
-        def _ts(item: Dict[str, Any]) -> str:
-            return str(item.get("timestamp") or item.get("start_time") or item.get("time") or "")
+        from src.sensor.pattern_repository import record_timestamp as _ts
 
-        # 전체 패턴 정렬
-        patterns_sorted = sorted(patterns, key=_ts, reverse=True)
-        count = len(patterns_sorted)
+        repository = self._get_pattern_repository()
+        patterns = repository.records
+        count = len(repository)
 
-        # 패턴 타입별 카운트
-        type_counts: Dict[str, int] = {}
-        for p in patterns_sorted:
-            ptype = (p.get("pattern_type") or p.get("type") or "unknown").lower()
-            type_counts[ptype] = type_counts.get(ptype, 0) + 1
+        # 패턴 타입별 카운트 (최근 감지된 타입부터)
+        type_counts: Dict[str, int] = {
+            (ptype or "unknown"): n for ptype, n in repository.type_counts().items()
+        }
 
-        # 최근 샘플
+        # 최근 샘플 (최신순)
+        recent = repository.find(limit=limit)[::-1]
         recent_samples = [
             {
                 "timestamp": _ts(x),
                 "pattern_type": x.get("pattern_type") or x.get("type") or "unknown",
                 "confidence": float(x.get("confidence", 0.0)) if x.get("confidence") is not None else 0.0,
             }
-            for x in patterns_sorted[:limit]
+            for x in recent
         ]
 
         # 데이터 기간
-        all_ts = [_ts(x) for x in patterns if _ts(x)]
-        time_range = {
-            "start": min(all_ts) if all_ts else "",
-            "end": max(all_ts) if all_ts else "",
-        }
+        start, end = repository.time_range()
+        time_range = {"start": start, "end": end}
 
         if not patterns:
             desc = (
@@ -250,7 +222,7 @@ class OntologyEngine:
             confidence = 0.9
         else:
             type_summary = ", ".join([f"{k}: {v}건" for k, v in type_counts.items()])
-            latest_ts = _ts(patterns_sorted[0]) if count else ""
+            latest_ts = _ts(recent[0]) if recent else ""
             desc = (
                 f"데이터 기간({time_range['start']} ~ {time_range['end']})에서 "
                 f"총 {count}건의 패턴이 감지되었습니다.\n"
@@ -262,7 +234,7 @@ class OntologyEngine:
         return {
             "description": desc,
             "count": count,
-            "latest_timestamp": _ts(patterns_sorted[0]) if count else "",
+            "latest_timestamp": _ts(recent[0]) if recent else "",
             "samples": recent_samples,
             "time_range": time_range,
             "type_counts": type_counts,
@@ -1927,6 +1899,7 @@ class OntologyEngine:
                 "state_rules": len(self.rule_engine.inference_rules.get("state_rules", [])),
                 "cause_rules": len(self.rule_engine.inference_rules.get("cause_rules", [])),
                 "prediction_rules": len(self.rule_engine.inference_rules.get("prediction_rules", [])),
+                "config_version": self.rule_engine.config_version,
             }
         }
 
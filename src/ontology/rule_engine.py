@@ -5,19 +5,88 @@
 """
 
 import logging
+import operator
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
 
 import yaml
 
+from src.config_reload import HotReloadable, pinned_config
+from .event_timeline import EventTimeline, PatternEvents, parse_timestamp
 from .loader import load_ontology
 from .models import OntologySchema
 
 logger = logging.getLogger(__name__)
 
 
+# 컨텍스트 조건 연산자 (검사 순서: 두 글자 연산자 먼저)
+_CONDITION_OPERATORS = (">=", "<=", ">", "<", "==")
+_NUMERIC_COMPARATORS = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">": operator.gt,
+    "<": operator.lt,
+}
+
+
+def compile_condition(condition: str) -> Callable[[Dict], bool]:
+    """컨텍스트 조건 문자열을 판정 함수로 컴파일
+
+    지원 형식: "product_weight >= 4.0" (>=, <=, >, <), "workload == 'heavy'"
+    수치 비교에서 컨텍스트에 키가 없으면 0으로 비교합니다.
+
+    Args:
+        condition: 조건 문자열
+
+    Returns:
+        context 딕셔너리 → bool 함수
+
+    Raises:
+        ValueError: 연산자가 없거나 여러 개인 조건, 숫자가 아닌 비교값
+    """
+    op = next((op for op in _CONDITION_OPERATORS if op in condition), None)
+    if op is None:
+        raise ValueError(f"지원하지 않는 조건 형식: {condition!r}")
+
+    parts = condition.split(op)
+    if len(parts) != 2:
+        raise ValueError(f"조건에 연산자가 여러 개입니다: {condition!r}")
+    key, value = parts[0].strip(), parts[1].strip()
+
+    if op == "==":
+        expected = value.strip("'\"")
+        return lambda context: str(context.get(key)) == expected
+
+    try:
+        threshold = float(value)
+    except ValueError:
+        raise ValueError(f"비교값을 숫자로 해석할 수 없습니다: {condition!r}") from None
+    compare = _NUMERIC_COMPARATORS[op]
+
+    def predicate(context: Dict) -> bool:
+        try:
+            return compare(context.get(key, 0), threshold)
+        except TypeError:
+            # 컨텍스트 값이 숫자가 아니면 불일치
+            return False
+
+    return predicate
+
+
+@dataclass
+class _RuleConfig:
+    """RuleEngine 설정 스냅샷 데이터 (검증/컴파일 완료, 교체 단위)"""
+
+    inference_rules: Dict[str, Any]
+    pattern_thresholds: Dict[str, Any]
+    cause_plans: Dict[str, List[Dict[str, Any]]]
+    condition_errors: List[str]
+    # 축별 컴파일된 상태 규칙 (배열 상태 추론용, 지연 생성)
+    state_plans: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+
 @dataclass
 class InferenceResult:
     """추론 결과"""
@@ -29,8 +98,13 @@ class InferenceResult:
     message: str = ""
 
 
-class RuleEngine:
-    """온톨로지 기반 추론 규칙 엔진"""
+class RuleEngine(HotReloadable):
+    """온톨로지 기반 추론 규칙 엔진
+
+    규칙/임계값 파일은 reload()(또는 ConfigWatcher)로 재시작 없이 다시 읽을 수 있습니다.
+    새 설정은 검증/컴파일 후 버전 스냅샷으로 한 번에 교체되며,
+    처리 중인 full_inference/detect_patterns 호출은 시작 시점 버전으로 끝납니다.
+    """
 
     DEFAULT_INFERENCE_RULES_PATH = Path("configs/inference_rules.yaml")
     DEFAULT_PATTERN_THRESHOLDS_PATH = Path("configs/pattern_thresholds.yaml")
@@ -50,24 +124,15 @@ class RuleEngine:
             FileNotFoundError: 필수 설정 파일이 없을 때
             ValueError: 필수 설정 키가 없을 때
         """
-        # 추론 규칙 로드 (필수)
-        self.inference_rules = self._load_yaml(
-            inference_rules_path or self.DEFAULT_INFERENCE_RULES_PATH,
-            required=True
-        )
+        self.inference_rules_path = Path(inference_rules_path or self.DEFAULT_INFERENCE_RULES_PATH)
+        self.pattern_thresholds_path = Path(pattern_thresholds_path or self.DEFAULT_PATTERN_THRESHOLDS_PATH)
 
-        # 패턴 임계값 로드 (필수)
-        self.pattern_thresholds = self._load_yaml(
-            pattern_thresholds_path or self.DEFAULT_PATTERN_THRESHOLDS_PATH,
-            required=True
-        )
-
-        # 필수 키 검증
-        self._validate_required_keys()
-
-        # 온톨로지 로드
+        # 온톨로지 로드 (원인 규칙 컴파일 시 원인 이름 조회)
         self.ontology = load_ontology()
 
+        # 규칙/임계값 로드 → 검증 → 컴파일 (설정 버전 1)
+        self._init_config()
+
         logger.info(
             f"RuleEngine 초기화 완료: "
             f"state_rules={len(self.inference_rules.get('state_rules', []))}, "
@@ -75,7 +140,56 @@ class RuleEngine:
             f"prediction_rules={len(self.inference_rules.get('prediction_rules', []))}"
         )
 
-    def _validate_required_keys(self) -> None:
+    # ================================================================
+    # 설정 (버전 스냅샷)
+    # ================================================================
+
+    @property
+    def inference_rules(self) -> Dict[str, Any]:
+        """추론 규칙 (현재 설정 버전)"""
+        return self.snapshot.data.inference_rules
+
+    @property
+    def pattern_thresholds(self) -> Dict[str, Any]:
+        """패턴 임계값 (현재 설정 버전)"""
+        return self.snapshot.data.pattern_thresholds
+
+    @property
+    def condition_errors(self) -> List[str]:
+        """해석할 수 없어 무시된 cause_rules 조건 (현재 설정 버전)"""
+        return self.snapshot.data.condition_errors
+
+    def _config_paths(self) -> Tuple[Path, Path]:
+        return self.inference_rules_path, self.pattern_thresholds_path
+
+    def _build_config(self) -> _RuleConfig:
+        """규칙/임계값 파일 로드, 검증, 원인 규칙 컴파일
+
+        Raises:
+            FileNotFoundError: 필수 설정 파일이 없을 때
+            ValueError: 필수 설정 키가 없을 때
+        """
+        # 추론 규칙 로드 (필수)
+        inference_rules = self._load_yaml(self.inference_rules_path, required=True)
+
+        # 패턴 임계값 로드 (필수)
+        pattern_thresholds = self._load_yaml(self.pattern_thresholds_path, required=True)
+
+        # 필수 키 검증
+        self._validate_required_keys(inference_rules, pattern_thresholds)
+
+        # 원인 규칙 컴파일 (패턴별 색인, 조건 판정 함수, 원인 이름)
+        cause_plans, condition_errors = self.compile_cause_rules(inference_rules)
+
+        return _RuleConfig(
+            inference_rules=inference_rules,
+            pattern_thresholds=pattern_thresholds,
+            cause_plans=cause_plans,
+            condition_errors=condition_errors,
+        )
+
+    @staticmethod
+    def _validate_required_keys(inference_rules: Dict, pattern_thresholds: Dict) -> None:
         """필수 설정 키 검증
 
         Raises:
@@ -84,19 +198,19 @@ class RuleEngine:
         # inference_rules 필수 키
         required_inference_keys = ["state_rules"]
         for key in required_inference_keys:
-            if key not in self.inference_rules:
+            if key not in inference_rules:
                 raise ValueError(
                     f"inference_rules.yaml에 필수 키 '{key}'가 없습니다. "
-                    f"현재 키: {list(self.inference_rules.keys())}"
+                    f"현재 키: {list(inference_rules.keys())}"
                 )
 
         # pattern_thresholds 필수 키
         required_threshold_keys = ["collision", "overload"]
         for key in required_threshold_keys:
-            if key not in self.pattern_thresholds:
+            if key not in pattern_thresholds:
                 raise ValueError(
                     f"pattern_thresholds.yaml에 필수 키 '{key}'가 없습니다. "
-                    f"현재 키: {list(self.pattern_thresholds.keys())}"
+                    f"현재 키: {list(pattern_thresholds.keys())}"
                 )
 
     def _load_yaml(self, path: Path, required: bool = True) -> Dict:
@@ -183,6 +297,7 @@ class RuleEngine:
 
         return None
 
+    @pinned_config
     def infer_states(self, measurements: Dict[str, float]) -> List[InferenceResult]:
         """여러 측정값에서 상태 추론
 
@@ -199,12 +314,90 @@ class RuleEngine:
                 results.append(result)
         return results
 
+    def compile_state_rules(self, axis: str) -> Dict[str, Any]:
+        """축의 state_rules를 배열 평가용 형태로 컴파일 (축별 캐시)
+
+        규칙/매핑 순서를 그대로 유지하므로 경계값이 겹치면
+        infer_state와 같이 먼저 나온 매핑이 선택됩니다.
+
+        Args:
+            axis: 측정 축
+
+        Returns:
+            {"lower", "upper", "states", "labels", "severities", "rule_names"}
+            (매핑 순서, 상태 코드 = 매핑 인덱스)
+        """
+        config = self.snapshot.data
+        plan = config.state_plans.get(axis)
+        if plan is not None:
+            return plan
+
+        plan = {"lower": [], "upper": [], "states": [], "labels": [], "severities": [], "rule_names": []}
+        for rule in config.inference_rules.get("state_rules", []):
+            if rule.get("axis") != axis:
+                continue
+            for mapping in rule.get("mappings", []):
+                range_min, range_max = mapping["range"]
+                plan["lower"].append(float(range_min))
+                plan["upper"].append(float(range_max))
+                plan["states"].append(mapping["state"])
+                plan["labels"].append(mapping.get("label", ""))
+                plan["severities"].append(mapping.get("severity", "normal"))
+                plan["rule_names"].append(rule["name"])
+
+        config.state_plans[axis] = plan
+        return plan
+
+    def infer_state_codes(self, axis: str, values: Any) -> Any:
+        """배열 상태 추론 - 매핑 인덱스 코드
+
+        Args:
+            axis: 측정 축
+            values: 측정값 배열
+
+        Returns:
+            int16 코드 배열 (compile_state_rules 매핑 인덱스, 매칭 없음/NaN = -1)
+        """
+        import numpy as np
+
+        values = np.asarray(values, dtype=np.float64)
+        plan = self.compile_state_rules(axis)
+        if not plan["states"]:
+            return np.full(values.shape, -1, dtype=np.int16)
+
+        # np.select는 첫 번째로 참인 조건을 선택 → 순차 first-match와 동일
+        conditions = [
+            (values >= lower) & (values <= upper)
+            for lower, upper in zip(plan["lower"], plan["upper"])
+        ]
+        choices = [np.int16(i) for i in range(len(conditions))]
+        return np.select(conditions, choices, default=np.int16(-1)).astype(np.int16, copy=False)
+
+    @pinned_config
+    def infer_states_array(self, axis: str, values: Any) -> Any:
+        """배열 상태 추론 - 샘플별 상태 ID
+
+        infer_state를 원소마다 호출한 결과의 result_id와 같습니다.
+
+        Args:
+            axis: 측정 축
+            values: 측정값 배열
+
+        Returns:
+            object 배열 (상태 ID, 매칭 없으면 None)
+        """
+        import numpy as np
+
+        plan = self.compile_state_rules(axis)
+        lookup = np.array(plan["states"] + [None], dtype=object)
+        return lookup[self.infer_state_codes(axis, values)]
+
     # ================================================================
     # 패턴 감지 (Pattern Detection)
     # ================================================================
 
     def detect_collision(self, fz_values: List[float], timestamps_ms: List[int]) -> Optional[InferenceResult]:
-        """충돌 패턴 감지
+        """충돌 패턴 감지 (리스트 입력, detect_collision_array 래퍼)
 
         Args:
             fz_values: Fz 값 리스트
@@ -213,46 +406,68 @@ class RuleEngine:
         Returns:
             InferenceResult 또는 None
         """
+        import numpy as np
+
+        return self.detect_collision_array(np.asarray(fz_values), np.asarray(timestamps_ms))
+
+    def detect_collision_array(self, fz_values: Any, timestamps_ms: Any) -> Optional[InferenceResult]:
+        """충돌 패턴 감지 - 배열 입력
+
+        인접 샘플 변화량(np.diff)이 임계값을 넘고 시간 간격이 상승 시간 이내인
+        첫 위치를 찾습니다.
+
+        Args:
+            fz_values: Fz 값 배열
+            timestamps_ms: 타임스탬프 배열 (밀리초)
+
+        Returns:
+            InferenceResult 또는 None
+        """
+        import numpy as np
+
         collision_config = self.pattern_thresholds.get("collision", {})
         threshold = collision_config.get("threshold_N", 500)
         rise_time_ms = collision_config.get("rise_time_ms", 100)
 
+        fz_values = np.asarray(fz_values)
         if len(fz_values) < 2:
             return None
 
-        for i in range(1, len(fz_values)):
-            delta = abs(fz_values[i] - fz_values[i-1])
-            time_diff = timestamps_ms[i] - timestamps_ms[i-1]
-
-            if delta > threshold and time_diff <= rise_time_ms:
-                return InferenceResult(
-                    rule_name="COLLISION_DETECTION",
-                    result_type="pattern",
-                    result_id="PAT_COLLISION",
-                    confidence=0.95,
-                    evidence={
-                        "features": {
-                            "delta_Fz_N": round(delta, 1),
-                            "rise_time_ms": time_diff
-                        },
-                        "thresholds": {
-                            "delta_threshold_N": threshold,
-                            "rise_time_max_ms": rise_time_ms
-                        },
-                        "judgment": f"delta_Fz_N({delta:.1f}) > threshold({threshold}) within {time_diff}ms",
-                        "data_index": i
-                    },
-                    message=f"충돌 감지: {delta:.1f}N 변화 ({time_diff}ms 내)"
-                )
+        deltas = np.abs(np.diff(fz_values))
+        time_diffs = np.diff(np.asarray(timestamps_ms)[:len(fz_values)])
+        hits = np.flatnonzero((deltas > threshold) & (time_diffs <= rise_time_ms))
+        if len(hits) == 0:
+            return None
 
-        return None
+        i = int(hits[0]) + 1
+        delta = deltas[i - 1].item()
+        time_diff = time_diffs[i - 1].item()
+        return InferenceResult(
+            rule_name="COLLISION_DETECTION",
+            result_type="pattern",
+            result_id="PAT_COLLISION",
+            confidence=0.95,
+            evidence={
+                "features": {
+                    "delta_Fz_N": round(delta, 1),
+                    "rise_time_ms": time_diff
+                },
+                "thresholds": {
+                    "delta_threshold_N": threshold,
+                    "rise_time_max_ms": rise_time_ms
+                },
+                "judgment": f"delta_Fz_N({delta:.1f}) > threshold({threshold}) within {time_diff}ms",
+                "data_index": i
+            },
+            message=f"충돌 감지: {delta:.1f}N 변화 ({time_diff}ms 내)"
+        )
 
     def detect_overload(
         self,
         fz_values: List[float],
         timestamps_s: List[float]
     ) -> Optional[InferenceResult]:
-        """과부하 패턴 감지
+        """과부하 패턴 감지 (리스트 입력, detect_overload_array 래퍼)
 
         Args:
             fz_values: Fz 값 리스트
@@ -261,6 +476,26 @@ class RuleEngine:
         Returns:
             InferenceResult 또는 None
         """
+        import numpy as np
+
+        return self.detect_overload_array(np.asarray(fz_values), np.asarray(timestamps_s))
+
+    def detect_overload_array(self, fz_values: Any, timestamps_s: Any) -> Optional[InferenceResult]:
+        """과부하 패턴 감지 - 배열 입력
+
+        |Fz| > 임계값인 연속 구간(런 길이 분할)마다 구간 시작 기준 경과 시간이
+        duration_s에 처음 도달하는 위치를 찾습니다.
+
+        Args:
+            fz_values: Fz 값 배열
+            timestamps_s: 타임스탬프 배열 (초)
+
+        Returns:
+            InferenceResult 또는 None
+        """
+        import numpy as np
+        from src.sensor.segments import find_segments
+
         overload_config = self.pattern_thresholds.get("overload", {})
         threshold = overload_config.get("threshold_N", 300)
         duration_s = overload_config.get("duration_s", 5)
@@ -268,52 +503,76 @@ class RuleEngine:
         if len(fz_values) < 2:
             return None
 
+        # zip(fz_values, timestamps_s)과 같이 짧은 쪽 길이까지만 사용
+        n = min(len(fz_values), len(timestamps_s))
+        fz_values = np.asarray(fz_values)[:n]
+        timestamps_s = np.asarray(timestamps_s)[:n]
+
         # 연속 과부하 구간 찾기
-        overload_start = None
-        for i, (fz, ts) in enumerate(zip(fz_values, timestamps_s)):
-            if abs(fz) > threshold:
-                if overload_start is None:
-                    overload_start = i
-                elif ts - timestamps_s[overload_start] >= duration_s:
-                    actual_duration = ts - timestamps_s[overload_start]
-                    max_fz = max(abs(v) for v in fz_values[overload_start:i+1])
-                    return InferenceResult(
-                        rule_name="OVERLOAD_DETECTION",
-                        result_type="pattern",
-                        result_id="PAT_OVERLOAD",
-                        confidence=0.90,
-                        evidence={
-                            "features": {
-                                "max_Fz_N": round(max_fz, 1),
-                                "overload_duration_s": round(actual_duration, 2)
-                            },
-                            "thresholds": {
-                                "force_threshold_N": threshold,
-                                "duration_threshold_s": duration_s
-                            },
-                            "judgment": f"max_Fz_N({max_fz:.1f}) > threshold({threshold}) for {actual_duration:.1f}s",
-                            "data_range": {"start_idx": overload_start, "end_idx": i}
-                        },
-                        message=f"과부하 감지: {actual_duration:.1f}초 동안 {threshold}N 초과 (최대 {max_fz:.1f}N)"
-                    )
-            else:
-                overload_start = None
+        segments = find_segments(np.abs(fz_values) > threshold)
+        if not len(segments):
+            return None
+        run_starts = np.repeat(segments.starts, segments.counts)
+        elapsed = timestamps_s[segments.positions] - timestamps_s[run_starts]
+        # 구간 시작 샘플 자체에서는 판정하지 않음
+        reached = np.flatnonzero((segments.positions != run_starts) & (elapsed >= duration_s))
+        if len(reached) == 0:
+            return None
 
-        return None
+        hit = reached[0]
+        i = int(segments.positions[hit])
+        overload_start = int(run_starts[hit])
+        actual_duration = elapsed[hit].item()
+        max_fz = np.abs(fz_values[overload_start:i + 1]).max().item()
+        return InferenceResult(
+            rule_name="OVERLOAD_DETECTION",
+            result_type="pattern",
+            result_id="PAT_OVERLOAD",
+            confidence=0.90,
+            evidence={
+                "features": {
+                    "max_Fz_N": round(max_fz, 1),
+                    "overload_duration_s": round(actual_duration, 2)
+                },
+                "thresholds": {
+                    "force_threshold_N": threshold,
+                    "duration_threshold_s": duration_s
+                },
+                "judgment": f"max_Fz_N({max_fz:.1f}) > threshold({threshold}) for {actual_duration:.1f}s",
+                "data_range": {"start_idx": overload_start, "end_idx": i}
+            },
+            message=f"과부하 감지: {actual_duration:.1f}초 동안 {threshold}N 초과 (최대 {max_fz:.1f}N)"
+        )
 
     def detect_vibration(
         self,
         fz_values: List[float],
         timestamps_s: List[float]
     ) -> Optional[InferenceResult]:
-        """진동 패턴 감지
-
-        표준편차 증가로 진동을 감지합니다.
+        """진동 패턴 감지 (리스트 입력, detect_vibration_array 래퍼)
 
         Args:
             fz_values: Fz 값 리스트
             timestamps_s: 타임스탬프 리스트 (초)
 
+        Returns:
+            InferenceResult 또는 None
+        """
+        import numpy as np
+
+        return self.detect_vibration_array(np.asarray(fz_values), np.asarray(timestamps_s))
+
+    def detect_vibration_array(self, fz_values: Any, timestamps_s: Any) -> Optional[InferenceResult]:
+        """진동 패턴 감지 - 배열 입력
+
+        표준편차 증가로 진동을 감지합니다. 판정 윈도우 샘플 수는 양수 타임스탬프 간격의
+        중앙값으로 추정한 샘플링 주기 × window_s이므로, 간격이 불규칙하면
+        전체 길이/기간 비율로 잡던 이전 윈도우와 다를 수 있습니다.
+
+        Args:
+            fz_values: Fz 값 배열
+            timestamps_s: 타임스탬프 배열 (초)
+
         Returns:
             InferenceResult 또는 None
         """
@@ -326,69 +585,102 @@ class RuleEngine:
             return None
 
         import numpy as np
+        from src.sensor.rolling import infer_sample_rate, rolling_std, window_samples
+        from src.sensor.segments import find_segments
+
+        values = np.asarray(fz_values, dtype=np.float64)
+        timestamps_s = np.asarray(timestamps_s)
 
         # 전체 표준편차 계산
-        global_std = float(np.std(fz_values))
+        global_std = float(np.std(values))
         if global_std < 0.01:  # 거의 변화가 없으면 스킵
             return None
 
-        # 롤링 표준편차 계산 (간단 구현)
-        window_size = max(2, int(len(fz_values) * window_s / (timestamps_s[-1] - timestamps_s[0])) if timestamps_s[-1] != timestamps_s[0] else 10)
-
-        vibration_start = None
-        max_local_std = 0
-
-        for i in range(window_size, len(fz_values)):
-            window_data = fz_values[i-window_size:i]
-            local_std = float(np.std(window_data))
+        # 윈도우 크기: 간격 중앙값으로 추정한 샘플링 주기 기준 (추정 불가 시 10)
+        ts_ns = np.round(timestamps_s.astype(np.float64) * 1e9).astype(np.int64)
+        sample_rate = infer_sample_rate(ts_ns)
+        window_size = window_samples(window_s, sample_rate) if sample_rate else 10
+        if window_size >= len(values):
+            return None
 
-            if local_std > global_std * amplitude_threshold:
-                if vibration_start is None:
-                    vibration_start = i - window_size
-                max_local_std = max(max_local_std, local_std)
+        # i번째 판정 윈도우 fz_values[i-window_size:i]의 표준편차 (O(n) 롤링 커널)
+        local_stds = rolling_std(values, window_size, ddof=0)[window_size - 1:-1]
+        exceed = np.zeros(len(values), dtype=bool)
+        exceed[window_size:] = local_stds > global_std * amplitude_threshold
 
-                duration = timestamps_s[i] - timestamps_s[vibration_start]
-                if duration >= min_duration_s:
-                    return InferenceResult(
-                        rule_name="VIBRATION_DETECTION",
-                        result_type="pattern",
-                        result_id="PAT_VIBRATION",
-                        confidence=min(0.95, 0.6 + (local_std / global_std - amplitude_threshold) * 0.1),
-                        evidence={
-                            "features": {
-                                "global_std": round(global_std, 3),
-                                "max_local_std": round(max_local_std, 3),
-                                "std_ratio": round(max_local_std / global_std, 2),
-                                "duration_s": round(duration, 2)
-                            },
-                            "thresholds": {
-                                "amplitude_threshold": amplitude_threshold,
-                                "min_duration_s": min_duration_s
-                            },
-                            "judgment": f"std_ratio({max_local_std/global_std:.2f}) > threshold({amplitude_threshold}) for {duration:.1f}s",
-                            "data_range": {"start_idx": vibration_start, "end_idx": i}
-                        },
-                        message=f"진동 감지: 표준편차 {max_local_std/global_std:.1f}배 증가 ({duration:.1f}초 지속)"
-                    )
-            else:
-                vibration_start = None
-                max_local_std = 0
+        # 연속 초과 구간별로 시작점 기준 지속 시간이 min_duration_s에 처음 도달하는 위치
+        segments = find_segments(exceed)
+        if not len(segments):
+            return None
+        run_ids = np.repeat(np.arange(len(segments)), segments.counts)
+        run_starts = segments.starts[run_ids] - window_size
+        elapsed = timestamps_s[segments.positions] - timestamps_s[run_starts]
+        reached = np.flatnonzero(elapsed >= min_duration_s)
+        if len(reached) == 0:
+            return None
 
-        return None
+        hit = reached[0]
+        i = int(segments.positions[hit])
+        vibration_start = int(run_starts[hit])
+        duration = elapsed[hit].item()
+
+        # 보고값은 해당 윈도우를 직접 계산 (기존 구간 루프와 동일한 값)
+        run_positions = segments.positions[segments.offsets[run_ids[hit]]:hit + 1]
+        peak = int(run_positions[np.argmax(local_stds[run_positions - window_size])])
+        local_std = float(np.std(values[i - window_size:i]))
+        max_local_std = max(float(np.std(values[peak - window_size:peak])), local_std)
+
+        return InferenceResult(
+            rule_name="VIBRATION_DETECTION",
+            result_type="pattern",
+            result_id="PAT_VIBRATION",
+            confidence=min(0.95, 0.6 + (local_std / global_std - amplitude_threshold) * 0.1),
+            evidence={
+                "features": {
+                    "global_std": round(global_std, 3),
+                    "max_local_std": round(max_local_std, 3),
+                    "std_ratio": round(max_local_std / global_std, 2),
+                    "duration_s": round(duration, 2)
+                },
+                "thresholds": {
+                    "amplitude_threshold": amplitude_threshold,
+                    "min_duration_s": min_duration_s
+                },
+                "judgment": f"std_ratio({max_local_std/global_std:.2f}) > threshold({amplitude_threshold}) for {duration:.1f}s",
+                "data_range": {"start_idx": vibration_start, "end_idx": i}
+            },
+            message=f"진동 감지: 표준편차 {max_local_std/global_std:.1f}배 증가 ({duration:.1f}초 지속)"
+        )
 
     def detect_drift(
         self,
         fz_values: List[float],
         timestamps_s: List[float]
     ) -> Optional[InferenceResult]:
-        """드리프트 패턴 감지
-
-        Baseline 대비 지속적인 이동을 감지합니다.
+        """드리프트 패턴 감지 (리스트 입력, detect_drift_array 래퍼)
 
         Args:
             fz_values: Fz 값 리스트
             timestamps_s: 타임스탬프 리스트 (초)
 
+        Returns:
+            InferenceResult 또는 None
+        """
+        import numpy as np
+
+        return self.detect_drift_array(np.asarray(fz_values), np.asarray(timestamps_s))
+
+    def detect_drift_array(self, fz_values: Any, timestamps_s: Any) -> Optional[InferenceResult]:
+        """드리프트 패턴 감지 - 배열 입력
+
+        Baseline 대비 지속적인 이동을 감지합니다.
+        시간 구간 경계는 타임스탬프 누적 최댓값에서 이진 탐색으로 찾으므로
+        샘플 단위 루프 없이 구간 수만큼만 반복합니다.
+
+        Args:
+            fz_values: Fz 값 배열
+            timestamps_s: 타임스탬프 배열 (초)
+
         Returns:
             InferenceResult 또는 None
         """
@@ -402,6 +694,9 @@ class RuleEngine:
 
         import numpy as np
 
+        fz_values = np.asarray(fz_values)
+        timestamps_s = np.asarray(timestamps_s)
+
         # 전체 baseline 계산
         baseline = float(np.mean(fz_values))
 
@@ -415,29 +710,34 @@ class RuleEngine:
             use_absolute_mode = False
 
         # 시간 범위 확인
-        total_duration_s = timestamps_s[-1] - timestamps_s[0] if timestamps_s else 0
+        total_duration_s = timestamps_s[-1] - timestamps_s[0] if len(timestamps_s) else 0
         total_duration_h = total_duration_s / 3600
 
         if total_duration_h < min_duration_h:
             return None
 
         # 데이터를 시간 구간별로 나누어 평균 계산
+        # 구간은 시작 시각에서 window_s를 초과하는 첫 샘플부터 새로 시작
         window_s = window_h * 3600
-        segments = []
-        current_segment = []
-        segment_start_s = timestamps_s[0]
-
-        for fz, ts in zip(fz_values, timestamps_s):
-            if ts - segment_start_s > window_s:
-                if current_segment:
-                    segments.append(float(np.mean(current_segment)))
-                current_segment = [fz]
-                segment_start_s = ts
-            else:
-                current_segment.append(fz)
-
-        if current_segment:
-            segments.append(float(np.mean(current_segment)))
+        n = min(len(fz_values), len(timestamps_s))
+        latest_ts = np.fmax.accumulate(timestamps_s[:n].astype(np.float64))
+        bounds = [0]
+        while True:
+            lo = bounds[-1]
+            segment_start_s = timestamps_s[lo]
+            if np.isnan(segment_start_s):
+                break
+            # ts - start > window_s는 ts에 대해 단조 → 누적 최댓값에서 이진 탐색 후 경계 보정
+            j = max(int(np.searchsorted(latest_ts, segment_start_s + window_s, side="right")), lo + 1)
+            while j < n and not latest_ts[j] - segment_start_s > window_s:
+                j += 1
+            while j - 1 > lo and latest_ts[j - 1] - segment_start_s > window_s:
+                j -= 1
+            if j >= n:
+                break
+            bounds.append(j)
+        bounds.append(n)
+        segments = [float(np.mean(fz_values[a:b])) for a, b in zip(bounds[:-1], bounds[1:])]
 
         if len(segments) < 2:
             return None
@@ -495,38 +795,42 @@ class RuleEngine:
 
         return None
 
+    @pinned_config
     def detect_patterns(self, data: Dict[str, List[float]]) -> List[InferenceResult]:
         """시계열 데이터에서 모든 패턴 감지
 
         Args:
-            data: 센서 데이터 {"Fz": [...], "timestamp_ms": [...], ...}
+            data: 센서 데이터 {"Fz": [...], "timestamp_ms": [...], ...} (리스트 또는 배열)
 
         Returns:
             감지된 패턴 리스트
         """
+        import numpy as np
+
         results = []
 
-        fz = data.get("Fz", [])
-        ts_ms = data.get("timestamp_ms", [])
-        ts_s = data.get("timestamp_s", [i/1000 for i in ts_ms] if ts_ms else [])
+        # 한 번만 배열로 변환해 모든 감지기에 전달
+        fz = np.asarray(data.get("Fz", []))
+        ts_ms = np.asarray(data.get("timestamp_ms", []))
+        ts_s = np.asarray(data["timestamp_s"]) if "timestamp_s" in data else ts_ms / 1000
 
         # 충돌 감지
-        collision = self.detect_collision(fz, ts_ms)
+        collision = self.detect_collision_array(fz, ts_ms)
         if collision:
             results.append(collision)
 
         # 과부하 감지
-        overload = self.detect_overload(fz, ts_s)
+        overload = self.detect_overload_array(fz, ts_s)
         if overload:
             results.append(overload)
 
         # 진동 감지
-        vibration = self.detect_vibration(fz, ts_s)
+        vibration = self.detect_vibration_array(fz, ts_s)
         if vibration:
             results.append(vibration)
 
         # 드리프트 감지
-        drift = self.detect_drift(fz, ts_s)
+        drift = self.detect_drift_array(fz, ts_s)
         if drift:
             results.append(drift)
 
@@ -536,6 +840,54 @@ class RuleEngine:
     # 원인 추론 (Cause Inference)
     # ================================================================
 
+    def compile_cause_rules(
+        self,
+        inference_rules: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Dict[str, List[Dict[str, Any]]], List[str]]:
+        """cause_rules를 패턴 ID별 실행 계획으로 컴파일
+
+        context_boost 조건은 판정 함수로 바꾸고 원인 이름은 온톨로지에서 미리 조회합니다.
+        해석할 수 없는 조건은 로드 시 한 번 경고하고 추론 시에는 적용하지 않습니다.
+
+        Args:
+            inference_rules: 추론 규칙 (기본: 현재 설정 버전)
+
+        Returns:
+            (계획, 조건 오류 목록)
+            계획 = {pattern_id: [{"cause_id", "base_confidence", "description", "cause_name", "boosts"}, ...]}
+            (규칙/원인 순서 유지, boosts = [(판정 함수, boost), ...])
+        """
+        if inference_rules is None:
+            inference_rules = self.inference_rules
+        plans: Dict[str, List[Dict[str, Any]]] = {}
+        errors: List[str] = []
+
+        for rule in inference_rules.get("cause_rules", []):
+            causes = plans.setdefault(rule.get("pattern"), [])
+            for cause_info in rule.get("causes", []):
+                boosts = []
+                for boost_rule in cause_info.get("context_boost", []):
+                    condition = boost_rule.get("condition")
+                    if not condition:
+                        continue
+                    try:
+                        boosts.append((compile_condition(condition), boost_rule.get("boost", 0)))
+                    except ValueError as e:
+                        errors.append(f"{rule.get('pattern')}/{cause_info.get('cause_id')}: {e}")
+
+                cause_entity = self.ontology.get_entity(cause_info["cause_id"])
+                causes.append({
+                    "cause_id": cause_info["cause_id"],
+                    "base_confidence": cause_info.get("base_confidence", 0.5),
+                    "description": cause_info.get("description", ""),
+                    "cause_name": cause_entity.name if cause_entity else cause_info.get("description", ""),
+                    "boosts": boosts,
+                })
+
+        for error in errors:
+            logger.warning(f"cause_rules 조건 무시: {error}")
+        return plans, errors
+
     def infer_cause(
         self,
         pattern_id: str,
@@ -551,83 +903,50 @@ class RuleEngine:
             추론된 원인 리스트 (신뢰도 순)
         """
         context = context or {}
-        cause_rules = self.inference_rules.get("cause_rules", [])
         results = []
 
-        for rule in cause_rules:
-            if rule.get("pattern") != pattern_id:
-                continue
-
-            for cause_info in rule.get("causes", []):
-                confidence = cause_info.get("base_confidence", 0.5)
+        for cause in self.snapshot.data.cause_plans.get(pattern_id, ()):
+            confidence = cause["base_confidence"]
 
-                # 컨텍스트 기반 신뢰도 조정
-                for boost_rule in cause_info.get("context_boost", []):
-                    if self._evaluate_context_condition(boost_rule.get("condition"), context):
-                        confidence += boost_rule.get("boost", 0)
+            # 컨텍스트 기반 신뢰도 조정
+            for predicate, boost in cause["boosts"]:
+                if predicate(context):
+                    confidence += boost
 
-                confidence = min(1.0, confidence)
+            confidence = min(1.0, confidence)
 
-                # 온톨로지에서 원인 엔티티 조회
-                cause_entity = self.ontology.get_entity(cause_info["cause_id"])
-                cause_name = cause_entity.name if cause_entity else cause_info.get("description", "")
-
-                results.append(InferenceResult(
-                    rule_name=f"CAUSE_{pattern_id}",
-                    result_type="cause",
-                    result_id=cause_info["cause_id"],
-                    confidence=confidence,
-                    evidence={
-                        "pattern": pattern_id,
-                        "context": context,
-                        "description": cause_info.get("description", "")
-                    },
-                    message=f"원인 추정: {cause_name} (신뢰도 {confidence:.0%})"
-                ))
+            results.append(InferenceResult(
+                rule_name=f"CAUSE_{pattern_id}",
+                result_type="cause",
+                result_id=cause["cause_id"],
+                confidence=confidence,
+                evidence={
+                    "pattern": pattern_id,
+                    "context": context,
+                    "description": cause["description"]
+                },
+                message=f"원인 추정: {cause['cause_name']} (신뢰도 {confidence:.0%})"
+            ))
 
         # 신뢰도 순 정렬
         results.sort(key=lambda x: x.confidence, reverse=True)
         return results
 
-    def _evaluate_context_condition(self, condition: Optional[str], context: Dict) -> bool:
-        """컨텍스트 조건 평가 (간단한 구현)"""
-        if not condition:
-            return False
-
-        try:
-            # 간단한 비교 연산 지원
-            if ">=" in condition:
-                key, value = condition.split(">=")
-                return context.get(key.strip(), 0) >= float(value.strip())
-            elif "<=" in condition:
-                key, value = condition.split("<=")
-                return context.get(key.strip(), 0) <= float(value.strip())
-            elif ">" in condition:
-                key, value = condition.split(">")
-                return context.get(key.strip(), 0) > float(value.strip())
-            elif "<" in condition:
-                key, value = condition.split("<")
-                return context.get(key.strip(), 0) < float(value.strip())
-            elif "==" in condition:
-                key, value = condition.split("==")
-                return str(context.get(key.strip())) == value.strip().strip("'\"")
-        except Exception as e:
-            logger.warning(f"조건 평가 실패 (condition={condition}): {e}")
-
-        return False
-
     # ================================================================
     # 에러 예측 (Error Prediction)
     # ================================================================
 
     def predict_error(
         self,
-        pattern_history: List[Dict]
+        pattern_history: Union[List[Dict], EventTimeline]
     ) -> List[InferenceResult]:
         """패턴 이력에서 에러 예측
 
+        이력은 EventTimeline으로 한 번만 파싱/정렬하고, 규칙별 윈도우 조건은
+        이진 탐색으로 평가합니다.
+
         Args:
-            pattern_history: 패턴 발생 이력
+            pattern_history: 패턴 발생 이력 (또는 미리 만든 EventTimeline)
                 [{"pattern": "PAT_OVERLOAD", "timestamp": "2026-01-20T10:00:00", "intensity": 0.8}, ...]
 
         Returns:
@@ -636,23 +955,27 @@ class RuleEngine:
         prediction_rules = self.inference_rules.get("prediction_rules", [])
         results = []
 
+        timeline = (
+            pattern_history if isinstance(pattern_history, EventTimeline)
+            else EventTimeline(pattern_history)
+        )
+        # 모든 규칙이 같은 기준 시각 사용
+        now = datetime.now()
+
         for rule in prediction_rules:
             pattern_id = rule.get("pattern")
             condition = rule.get("condition", {})
             prediction = rule.get("prediction", {})
 
-            # 해당 패턴만 필터
-            pattern_events = [
-                e for e in pattern_history
-                if e.get("pattern") == pattern_id
-            ]
+            # 해당 패턴 이벤트
+            pattern_events = timeline.events(pattern_id)
 
             condition_type = condition.get("type")
 
             if condition_type == "frequency":
                 # 빈도 기반 예측
                 result = self._evaluate_frequency_condition(
-                    rule, pattern_id, pattern_events, condition, prediction
+                    rule, pattern_id, pattern_events, condition, prediction, now
                 )
                 if result:
                     results.append(result)
@@ -660,7 +983,7 @@ class RuleEngine:
             elif condition_type == "trend":
                 # 추세 기반 예측 (증가/감소 추세)
                 result = self._evaluate_trend_condition(
-                    rule, pattern_id, pattern_events, condition, prediction
+                    rule, pattern_id, pattern_events, condition, prediction, now
                 )
                 if result:
                     results.append(result)
@@ -671,18 +994,20 @@ class RuleEngine:
         self,
         rule: Dict,
         pattern_id: str,
-        pattern_events: List[Dict],
+        pattern_events: PatternEvents,
         condition: Dict,
-        prediction: Dict
+        prediction: Dict,
+        now: Optional[datetime] = None
     ) -> Optional[InferenceResult]:
         """빈도 기반 예측 조건 평가
 
         Args:
             rule: 규칙 정의
             pattern_id: 패턴 ID
-            pattern_events: 해당 패턴의 이벤트 목록
+            pattern_events: 해당 패턴의 시간순 이벤트
             condition: 조건 정의
             prediction: 예측 정의
+            now: 기준 시각 (기본: 현재)
 
         Returns:
             InferenceResult 또는 None
@@ -690,14 +1015,11 @@ class RuleEngine:
         count_threshold = condition.get("count", 3)
         time_window_days = condition.get("time_window_days", 3)
 
-        # 최근 N일 내 이벤트 필터
-        cutoff = datetime.now() - timedelta(days=time_window_days)
-        recent_events = [
-            e for e in pattern_events
-            if self._parse_timestamp(e.get("timestamp")) > cutoff
-        ]
+        # 최근 N일 내 이벤트 수
+        cutoff = (now or datetime.now()) - timedelta(days=time_window_days)
+        recent_count = pattern_events.count_after(cutoff)
 
-        if len(recent_events) >= count_threshold:
+        if recent_count >= count_threshold:
             return InferenceResult(
                 rule_name=rule["name"],
                 result_type="prediction",
@@ -706,7 +1028,7 @@ class RuleEngine:
                 evidence={
                     "pattern": pattern_id,
                     "condition_type": "frequency",
-                    "event_count": len(recent_events),
+                    "event_count": recent_count,
                     "time_window_days": time_window_days,
                     "threshold": count_threshold
                 },
@@ -719,9 +1041,10 @@ class RuleEngine:
         self,
         rule: Dict,
         pattern_id: str,
-        pattern_events: List[Dict],
+        pattern_events: PatternEvents,
         condition: Dict,
-        prediction: Dict
+        prediction: Dict,
+        now: Optional[datetime] = None
     ) -> Optional[InferenceResult]:
         """추세 기반 예측 조건 평가
 
@@ -730,9 +1053,10 @@ class RuleEngine:
         Args:
             rule: 규칙 정의
             pattern_id: 패턴 ID
-            pattern_events: 해당 패턴의 이벤트 목록
+            pattern_events: 해당 패턴의 시간순 이벤트
             condition: 조건 정의 (direction, threshold_pct, time_window_days)
             prediction: 예측 정의
+            now: 기준 시각 (기본: 현재)
 
         Returns:
             InferenceResult 또는 None
@@ -741,51 +1065,28 @@ class RuleEngine:
         threshold_pct = condition.get("threshold_pct", 20)  # 20% 변화
         time_window_days = condition.get("time_window_days", 7)
 
-        # 최근 N일 내 이벤트 필터
-        cutoff = datetime.now() - timedelta(days=time_window_days)
-        recent_events = [
-            e for e in pattern_events
-            if self._parse_timestamp(e.get("timestamp")) > cutoff
-        ]
+        # 최근 N일 내 이벤트
+        cutoff = (now or datetime.now()) - timedelta(days=time_window_days)
+        recent_count = pattern_events.count_after(cutoff)
 
         # 최소 2개 이상의 이벤트 필요
-        if len(recent_events) < 2:
+        if recent_count < 2:
             return None
 
-        # 시간순 정렬
-        sorted_events = sorted(
-            recent_events,
-            key=lambda e: self._parse_timestamp(e.get("timestamp"))
-        )
-
-        # 강도(intensity) 값 추출
+        # 강도(intensity) 값 (시간순)
         # intensity, severity, confidence, magnitude 등 다양한 키 지원
-        def get_intensity(event: Dict) -> Optional[float]:
-            for key in ["intensity", "severity", "confidence", "magnitude", "value"]:
-                val = event.get(key)
-                if val is not None:
-                    try:
-                        return float(val)
-                    except (ValueError, TypeError):
-                        pass
-            return None
-
-        intensities = [get_intensity(e) for e in sorted_events]
-        valid_intensities = [i for i in intensities if i is not None]
+        valid_intensities = pattern_events.intensities_after(cutoff)
 
         # 강도 값이 없으면 발생 빈도로 대체 (단순 카운트 증가)
         if len(valid_intensities) < 2:
             # 빈도 기반 추세: 기간을 절반으로 나누어 비교
             mid_time = cutoff + timedelta(days=time_window_days / 2)
-            first_half = [e for e in sorted_events if self._parse_timestamp(e.get("timestamp")) < mid_time]
-            second_half = [e for e in sorted_events if self._parse_timestamp(e.get("timestamp")) >= mid_time]
+            first_count, second_count = pattern_events.split_after(cutoff, mid_time)
 
-            if len(first_half) == 0:
+            if first_count == 0:
                 return None
 
             # 빈도 변화율 계산
-            first_count = len(first_half)
-            second_count = len(second_half)
             change_pct = ((second_count - first_count) / first_count) * 100 if first_count > 0 else 0
 
             trend_detected = (
@@ -809,7 +1110,7 @@ class RuleEngine:
                         "change_pct": round(change_pct, 1),
                         "threshold_pct": threshold_pct,
                         "time_window_days": time_window_days,
-                        "total_events": len(sorted_events)
+                        "total_events": recent_count
                     },
                     message=prediction.get("message", "")
                 )
@@ -845,7 +1146,7 @@ class RuleEngine:
                         "change_pct": round(change_pct, 1),
                         "threshold_pct": threshold_pct,
                         "time_window_days": time_window_days,
-                        "total_events": len(sorted_events)
+                        "total_events": recent_count
                     },
                     message=prediction.get("message", "")
                 )
@@ -853,13 +1154,8 @@ class RuleEngine:
         return None
 
     def _parse_timestamp(self, ts_str: Optional[str]) -> datetime:
-        """타임스탬프 문자열 파싱"""
-        if not ts_str:
-            return datetime.min
-        try:
-            return datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-        except Exception:
-            return datetime.min
+        """타임스탬프 문자열 파싱 (event_timeline.parse_timestamp)"""
+        return parse_timestamp(ts_str)
 
     # ================================================================
     # 해결책 조회 (Resolution Lookup)
@@ -903,6 +1199,7 @@ class RuleEngine:
     # 통합 추론 (Full Inference Chain)
     # ================================================================
 
+    @pinned_config
     def full_inference(
         self,
         sensor_data: Dict[str, List[float]],
@@ -928,7 +1225,7 @@ class RuleEngine:
         }
 
         # 1. 상태 추론
-        if "Fz" in sensor_data and sensor_data["Fz"]:
+        if "Fz" in sensor_data and len(sensor_data["Fz"]):
             latest_fz = sensor_data["Fz"][-1]
             state = self.infer_state("Fz", latest_fz)
             if state:
@@ -31,10 +31,24 @@ Axia80 센서 데이터 로드, 저장, 조회, 패턴 감지, 온톨로지 연
     causes = connector.map_pattern_to_causes(patterns[0])
 """
 
+from .column_cache import ColumnCache
 from .data_loader import (
     DataLoader,
     load_sensor_data,
 )
+from .range_stats import RangeStatistics
+from .downsample_pyramid import DownsamplePyramid
+from .duckdb_backend import DuckDBSensorBackend
+from .partitioned_dataset import (
+    PartitionInfo,
+    PartitionedDataset,
+)
+from .timeseries_db import SensorTimeSeriesDB
+from .ring_buffer import (
+    ParquetSegmentSink,
+    RingSnapshot,
+    SensorRingBuffer,
+)
 from .sensor_store import (
     SensorStore,
     create_sensor_store,
@@ -43,20 +57,42 @@ from .patterns import (
     PatternType,
     DetectedPattern,
     DEFAULT_ERROR_MAPPING,
+    save_patterns,
 )
 from .pattern_detector import (
     PatternDetector,
     create_pattern_detector,
 )
+from .streaming_detector import StreamingPatternDetector
+from .detection_checkpoint import DetectionCheckpoint
+from .parallel_detection import ParallelPatternDetector
+from .pattern_repository import PatternRepository, get_pattern_repository
 from .ontology_connector import (
     OntologyConnector,
     create_ontology_connector,
 )
 
 __all__ = [
+    # ColumnCache
+    "ColumnCache",
     # DataLoader
     "DataLoader",
     "load_sensor_data",
+    # RangeStatistics
+    "RangeStatistics",
+    # DownsamplePyramid
+    "DownsamplePyramid",
+    # DuckDBSensorBackend
+    "DuckDBSensorBackend",
+    # PartitionedDataset
+    "PartitionInfo",
+    "PartitionedDataset",
+    # SensorTimeSeriesDB
+    "SensorTimeSeriesDB",
+    # SensorRingBuffer
+    "SensorRingBuffer",
+    "RingSnapshot",
+    "ParquetSegmentSink",
     # SensorStore
     "SensorStore",
     "create_sensor_store",
@@ -64,9 +100,15 @@ __all__ = [
     "PatternType",
     "DetectedPattern",
     "DEFAULT_ERROR_MAPPING",
+    "save_patterns",
     # PatternDetector
     "PatternDetector",
     "create_pattern_detector",
+    "StreamingPatternDetector",
+    "DetectionCheckpoint",
+    "ParallelPatternDetector",
+    "PatternRepository",
+    "get_pattern_repository",
     # OntologyConnector
     "OntologyConnector",
     "create_ontology_connector",
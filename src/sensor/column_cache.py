@@ -0,0 +1,236 @@
+"""
+컬럼 단위 센서 캐시
+
+전처리된 센서 데이터를 컬럼별 .npy 파일로 저장하고 memory-map으로 읽습니다.
+- 요청한 컬럼만 열기 때문에 축 조회는 문자열 컬럼을 건드리지 않습니다.
+- mmap 페이지는 OS 페이지 캐시를 통해 프로세스/워커 간에 공유됩니다.
+- 문자열 컬럼은 사전 인코딩(int32 코드 + categories JSON)으로 저장합니다.
+"""
+
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class ColumnCache:
+    """컬럼별 memory-mapped 캐시
+
+    디렉토리 구조:
+        <stem>.columns/
+            manifest.json
+            timestamp.npy        (int64 ns)
+            Fz.npy ...           (숫자 컬럼)
+            status.codes.npy     (int32 코드, 결측 = -1)
+    """
+
+    DIR_SUFFIX = ".columns"
+    MANIFEST_NAME = "manifest.json"
+    FORMAT_VERSION = 1
+
+    def __init__(self, directory: Path):
+        """초기화
+
+        Args:
+            directory: 캐시 디렉토리
+
+        Raises:
+            FileNotFoundError: manifest가 없을 때
+        """
+        self._dir = Path(directory)
+        with open(self._dir / self.MANIFEST_NAME, "r", encoding="utf-8") as f:
+            self._manifest: Dict[str, Any] = json.load(f)
+        self._arrays: Dict[str, np.ndarray] = {}
+
+    @property
+    def directory(self) -> Path:
+        """캐시 디렉토리"""
+        return self._dir
+
+    @property
+    def columns(self) -> List[str]:
+        """컬럼 목록 (원본 순서)"""
+        return list(self._manifest["columns"])
+
+    @property
+    def num_rows(self) -> int:
+        """레코드 수"""
+        return int(self._manifest["rows"])
+
+    def column_kind(self, name: str) -> str:
+        """컬럼 저장 형식 ("datetime", "numeric", "category")"""
+        return self._manifest["columns"][name]["kind"]
+
+    def categories(self, name: str) -> List[Any]:
+        """사전 인코딩 컬럼의 categories"""
+        return self._manifest["columns"][name]["categories"]
+
+    # ================================================================
+    # 경로 / 신선도
+    # ================================================================
+
+    @classmethod
+    def path_for(cls, source_path: Path) -> Path:
+        """원본 parquet 옆 캐시 디렉토리 경로"""
+        source_path = Path(source_path)
+        return source_path.with_name(source_path.stem + cls.DIR_SUFFIX)
+
+    @staticmethod
+    def _source_signature(source_path: Path) -> Dict[str, Any]:
+        """원본 파일 시그니처 (변경 감지용)"""
+        stat = Path(source_path).stat()
+        return {"source_mtime_ns": stat.st_mtime_ns, "source_size": stat.st_size}
+
+    @classmethod
+    def open_fresh(cls, source_path: Path) -> Optional["ColumnCache"]:
+        """원본과 일치하는 캐시가 있으면 열기
+
+        Args:
+            source_path: 원본 parquet 경로
+
+        Returns:
+            ColumnCache 또는 None (없거나 오래된 경우)
+        """
+        directory = cls.path_for(source_path)
+        if not (directory / cls.MANIFEST_NAME).exists():
+            return None
+
+        try:
+            cache = cls(directory)
+        except (OSError, ValueError) as e:
+            logger.warning(f"컬럼 캐시 manifest 읽기 실패: {directory} ({e})")
+            return None
+
+        manifest = cache._manifest
+        signature = cls._source_signature(source_path)
+        if manifest.get("version") != cls.FORMAT_VERSION or any(
+            manifest.get(k) != v for k, v in signature.items()
+        ):
+            logger.info(f"원본 변경 감지, 컬럼 캐시 무효화: {directory}")
+            return None
+        return cache
+
+    # ================================================================
+    # 쓰기
+    # ================================================================
+
+    @classmethod
+    def write(cls, df: pd.DataFrame, source_path: Path) -> "ColumnCache":
+        """DataFrame을 컬럼 캐시로 저장
+
+        임시 디렉토리에 쓴 뒤 교체하므로 다른 프로세스가
+        반쯤 쓰인 캐시를 읽지 않습니다.
+
+        Args:
+            df: 전처리된 센서 데이터
+            source_path: 원본 parquet 경로 (캐시 위치 및 시그니처)
+
+        Returns:
+            새로 쓴 ColumnCache
+        """
+        directory = cls.path_for(source_path)
+        tmp_dir = directory.with_name(f"{directory.name}.tmp-{os.getpid()}")
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir)
+        tmp_dir.mkdir(parents=True)
+
+        columns: Dict[str, Dict[str, Any]] = {}
+        for name in df.columns:
+            series = df[name]
+            if pd.api.types.is_datetime64_any_dtype(series):
+                values = series.to_numpy(dtype="datetime64[ns]").view("int64")
+                np.save(tmp_dir / f"{name}.npy", values)
+                columns[name] = {"kind": "datetime", "file": f"{name}.npy"}
+            elif pd.api.types.is_numeric_dtype(series) and not isinstance(series.dtype, pd.CategoricalDtype):
+                np.save(tmp_dir / f"{name}.npy", series.to_numpy())
+                columns[name] = {"kind": "numeric", "file": f"{name}.npy"}
+            else:
+                codes, uniques = pd.factorize(series, use_na_sentinel=True)
+                np.save(tmp_dir / f"{name}.codes.npy", codes.astype(np.int32))
+                columns[name] = {
+                    "kind": "category",
+                    "file": f"{name}.codes.npy",
+                    "categories": [cls._json_value(v) for v in uniques],
+                }
+
+        manifest = {
+            "version": cls.FORMAT_VERSION,
+            "rows": len(df),
+            "columns": columns,
+            **cls._source_signature(source_path),
+        }
+        with open(tmp_dir / cls.MANIFEST_NAME, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False)
+
+        if directory.exists():
+            shutil.rmtree(directory)
+        os.replace(tmp_dir, directory)
+
+        logger.info(f"컬럼 캐시 저장: {directory} ({len(columns)} 컬럼, {len(df)} 레코드)")
+        return cls(directory)
+
+    @staticmethod
+    def _json_value(value: Any) -> Any:
+        """categories 값을 JSON 호환 값으로 변환"""
+        if isinstance(value, (np.generic,)):
+            return value.item()
+        if isinstance(value, (str, int, float, bool)) or value is None:
+            return value
+        return str(value)
+
+    # ================================================================
+    # 읽기 (지연 materialize)
+    # ================================================================
+
+    def array(self, name: str) -> np.ndarray:
+        """컬럼 원시 배열 (memory-mapped, 읽기 전용)
+
+        datetime은 int64 ns, category는 int32 코드 배열입니다.
+        """
+        values = self._arrays.get(name)
+        if values is None:
+            info = self._manifest["columns"][name]
+            values = np.load(self._dir / info["file"], mmap_mode="r")
+            self._arrays[name] = values
+        return values
+
+    def column(self, name: str, categorical: bool = False) -> Any:
+        """컬럼 materialize (DataFrame 컬럼용 배열)
+
+        숫자/시각 컬럼은 복사 없는 mmap 뷰, 문자열 컬럼은 코드로부터 디코딩합니다.
+        categorical이면 문자열 컬럼을 디코딩하지 않고 코드 그대로 Categorical로 반환합니다.
+        """
+        kind = self.column_kind(name)
+        values = self.array(name)
+        if kind == "datetime":
+            return values.view("datetime64[ns]")
+        if kind == "numeric":
+            return values
+        if categorical:
+            return pd.Categorical.from_codes(values, categories=self.categories(name))
+
+        categories = np.empty(len(self.categories(name)) + 1, dtype=object)
+        categories[:-1] = self.categories(name)
+        categories[-1] = None  # 코드 -1 → None
+        return categories[values]
+
+    def to_frame(self, columns: Optional[List[str]] = None, categorical: bool = False) -> pd.DataFrame:
+        """요청 컬럼만으로 DataFrame 구성
+
+        Args:
+            columns: 컬럼 목록 (기본: 전체, 없는 컬럼은 무시)
+            categorical: 문자열 컬럼을 Categorical로 반환
+
+        Returns:
+            DataFrame (숫자/시각 컬럼은 mmap 뷰 - 수정 불가)
+        """
+        names = self.columns if columns is None else [c for c in columns if c in self._manifest["columns"]]
+        data = {name: self.column(name, categorical) for name in names}
+        return pd.DataFrame(data, copy=False)
@@ -8,10 +8,12 @@ import logging
 from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Any, Dict, Optional, Tuple, List
 
 import pandas as pd
 
+from .column_cache import ColumnCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,6 +32,13 @@ class DataLoader:
         "tool_id", "status", "event_id", "error_code"
     ]
 
+    # 컬럼 캐시 사용 여부 (parquet 옆 <stem>.columns/ 디렉토리, memory-mapped)
+    USE_COLUMN_CACHE = True
+
+    # 컴팩트 모드 (컨텍스트 컬럼 → Categorical, DOWNCAST_AXES면 축 → float32)
+    COMPACT_MODE = False
+    DOWNCAST_AXES = False
+
     # LRU 캐시 설정
     _MAX_CACHE_SIZE = 5  # 최대 캐시 항목 수 (메모리 관리)
     _cache: OrderedDict = OrderedDict()  # LRU 캐시 (path별)
@@ -38,19 +47,31 @@ class DataLoader:
     def load(
         cls,
         path: Optional[Path] = None,
-        use_cache: bool = True
+        use_cache: bool = True,
+        columns: Optional[List[str]] = None,
+        compact: Optional[bool] = None
     ) -> pd.DataFrame:
         """Parquet 파일 로드
 
+        컬럼 캐시가 있으면 요청한 컬럼만 memory-map으로 엽니다.
+        없거나 원본이 바뀌었으면 parquet을 읽어 전처리 후 캐시를 새로 씁니다.
+
         Args:
             path: Parquet 파일 경로 (기본: DEFAULT_PATH)
             use_cache: 캐시 사용 여부
+            columns: 로드할 컬럼 (기본: 전체)
+            compact: 컴팩트 모드 (기본: COMPACT_MODE)
 
         Returns:
             센서 데이터 DataFrame
         """
-        path = path or cls.DEFAULT_PATH
-        cache_key = str(path.resolve()) if isinstance(path, Path) else str(Path(path).resolve())
+        path = Path(path or cls.DEFAULT_PATH)
+        compact = cls.COMPACT_MODE if compact is None else compact
+        cache_key = str(path.resolve())
+        if columns is not None:
+            cache_key += "|" + ",".join(columns)
+        if compact:
+            cache_key += "|compact"
 
         if use_cache and cache_key in cls._cache:
             # LRU: 접근 시 순서를 맨 뒤로 이동
@@ -59,8 +80,7 @@ class DataLoader:
 
         logger.info(f"센서 데이터 로드: {path}")
 
-        df = pd.read_parquet(path)
-        df = cls.preprocess(df)
+        df = cls._load_columns(path, columns, compact)
 
         if use_cache:
             # LRU 제거: 캐시 크기 초과 시 가장 오래된 항목 제거
@@ -74,11 +94,52 @@ class DataLoader:
         return df
 
     @classmethod
-    def preprocess(cls, df: pd.DataFrame) -> pd.DataFrame:
+    def _load_columns(cls, path: Path, columns: Optional[List[str]], compact: bool = False) -> pd.DataFrame:
+        """컬럼 캐시 우선 로드 (없으면 parquet 로드 + 캐시 생성)
+
+        컴팩트 모드에서는 캐시의 사전 인코딩 코드를 그대로 Categorical로 사용합니다.
+        """
+        if cls.USE_COLUMN_CACHE:
+            cache = ColumnCache.open_fresh(path)
+            if cache is not None:
+                return cls._downcast(cache.to_frame(columns, categorical=compact), compact)
+
+        df = pd.read_parquet(path)
+        df = cls.preprocess(df)
+
+        if cls.USE_COLUMN_CACHE:
+            try:
+                # 캐시에서 다시 열어 mmap 페이지를 프로세스 간 공유
+                return cls._downcast(ColumnCache.write(df, path).to_frame(columns, categorical=compact), compact)
+            except OSError as e:
+                logger.warning(f"컬럼 캐시 저장 실패, 메모리 데이터 사용: {e}")
+
+        if columns is not None:
+            df = df[[c for c in columns if c in df.columns]]
+        if compact:
+            df, _ = cls.compact(df, downcast_axes=cls.DOWNCAST_AXES)
+        return df
+
+    @classmethod
+    def _downcast(cls, df: pd.DataFrame, compact: bool) -> pd.DataFrame:
+        """컴팩트 모드 + DOWNCAST_AXES면 축을 float32로 변환"""
+        if not (compact and cls.DOWNCAST_AXES):
+            return df
+        return df.astype({axis: "float32" for axis in cls.SENSOR_AXES if axis in df.columns})
+
+    @classmethod
+    def preprocess(
+        cls,
+        df: pd.DataFrame,
+        compact: bool = False,
+        downcast_axes: bool = False
+    ) -> pd.DataFrame:
         """데이터 전처리
 
         Args:
             df: 원본 DataFrame
+            compact: 컨텍스트 컬럼을 Categorical로 변환
+            downcast_axes: compact일 때 축을 float32로 변환
 
         Returns:
             전처리된 DataFrame
@@ -98,8 +159,85 @@ class DataLoader:
                 # 남은 결측치는 0으로
                 df[axis] = df[axis].fillna(0)
 
+        if compact:
+            df, _ = cls.compact(df, downcast_axes=downcast_axes)
+
         return df
 
+    @classmethod
+    def compact(
+        cls,
+        df: pd.DataFrame,
+        downcast_axes: bool = False
+    ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """컴팩트 표현으로 변환
+
+        문자열 컨텍스트 컬럼은 Categorical(정수 코드 + 사전)로,
+        downcast_axes면 센서 축은 float32로 변환합니다.
+
+        Args:
+            df: 전처리된 DataFrame
+            downcast_axes: 축 float32 변환 여부
+
+        Returns:
+            (변환된 DataFrame, 메모리 리포트) 튜플
+        """
+        before = cls.memory_usage(df)
+
+        conversions: Dict[str, Any] = {}
+        for col in cls.CONTEXT_COLUMNS:
+            if col not in df.columns:
+                continue
+            dtype = df[col].dtype
+            if isinstance(dtype, pd.CategoricalDtype) or pd.api.types.is_numeric_dtype(dtype):
+                continue
+            conversions[col] = "category"
+        if downcast_axes:
+            conversions.update({
+                axis: "float32"
+                for axis in cls.SENSOR_AXES
+                if axis in df.columns and df[axis].dtype != "float32"
+            })
+        if conversions:
+            df = df.astype(conversions)
+
+        after = cls.memory_usage(df)
+        report = cls.memory_report(before, after)
+        logger.info(
+            f"컴팩트 변환: {report['before_mb']:.1f} MB → {report['after_mb']:.1f} MB "
+            f"({report['ratio']:.1f}배 감소, {len(conversions)} 컬럼)"
+        )
+        return df, report
+
+    @staticmethod
+    def memory_usage(df: pd.DataFrame) -> Dict[str, int]:
+        """컬럼별 메모리 사용량 (bytes, 문자열 객체 포함)"""
+        usage = df.memory_usage(deep=True, index=True)
+        return {str(name): int(size) for name, size in usage.items()}
+
+    @staticmethod
+    def memory_report(before: Dict[str, int], after: Dict[str, int]) -> Dict[str, Any]:
+        """변환 전후 메모리 리포트
+
+        Args:
+            before: 변환 전 memory_usage 결과
+            after: 변환 후 memory_usage 결과
+
+        Returns:
+            {"before_mb", "after_mb", "ratio", "columns": {컬럼: {"before", "after"}}}
+        """
+        total_before = sum(before.values())
+        total_after = sum(after.values())
+        return {
+            "before_mb": total_before / 1024 / 1024,
+            "after_mb": total_after / 1024 / 1024,
+            "ratio": total_before / total_after if total_after else 1.0,
+            "columns": {
+                name: {"before": before[name], "after": after.get(name, 0)}
+                for name in before
+            },
+        }
+
     @classmethod
     def get_time_range(cls, df: pd.DataFrame) -> Tuple[datetime, datetime]:
         """데이터 시간 범위 반환
@@ -132,9 +270,12 @@ class DataLoader:
             path: 특정 경로만 초기화 (None이면 전체 초기화)
         """
         if path is not None:
-            cache_key = str(path.resolve()) if isinstance(path, Path) else str(Path(path).resolve())
-            if cache_key in cls._cache:
-                del cls._cache[cache_key]
+            cache_key = str(Path(path).resolve())
+            # 컬럼 부분 로드 항목(path|columns)도 함께 제거
+            keys = [k for k in cls._cache if k == cache_key or k.startswith(cache_key + "|")]
+            for key in keys:
+                del cls._cache[key]
+            if keys:
                 logger.info(f"센서 데이터 캐시 초기화: {path}")
         else:
             cls._cache.clear()
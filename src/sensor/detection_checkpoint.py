@@ -0,0 +1,95 @@
+"""
+증분 패턴 감지 체크포인트
+
+축별 감지 워터마크(마지막으로 처리한 샘플 시각), 감지기별 확정 워터마크,
+StreamingPatternDetector의 열린 구간 상태를 JSON 파일로 저장합니다.
+다음 실행은 워터마크 이후 샘플만 처리하고 열린 구간을 이어서 감지합니다.
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class DetectionCheckpoint:
+    """축별 증분 감지 체크포인트"""
+
+    # 기본 체크포인트 경로 (detected_patterns.json 옆)
+    DEFAULT_PATH = Path("data/sensor/processed/detection_checkpoint.json")
+
+    VERSION = 1
+
+    def __init__(self, path: Optional[Path] = None):
+        """초기화 (파일이 있으면 로드)
+
+        Args:
+            path: 체크포인트 파일 경로 (기본: DEFAULT_PATH)
+        """
+        self.path = Path(path) if path is not None else self.DEFAULT_PATH
+        self._axes: Dict[str, Dict[str, Any]] = {}
+
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != self.VERSION:
+                raise ValueError(f"지원하지 않는 체크포인트 버전: {data.get('version')} ({self.path})")
+            self._axes = data.get("axes", {})
+            logger.info(f"감지 체크포인트 로드: {self.path} ({', '.join(self._axes) or '없음'})")
+
+    @property
+    def axes(self) -> list:
+        """체크포인트가 있는 축 목록"""
+        return list(self._axes)
+
+    def get_state(self, axis: str) -> Optional[Dict[str, Any]]:
+        """축의 스트리밍 감지 상태 (없으면 None)"""
+        entry = self._axes.get(axis)
+        return entry["state"] if entry else None
+
+    def watermark(self, axis: str, detector: Optional[str] = None) -> Optional[pd.Timestamp]:
+        """워터마크 조회
+
+        Args:
+            axis: 축
+            detector: 감지기 이름 (collision, overload, drift, vibration).
+                None이면 마지막으로 처리한 샘플 시각
+
+        Returns:
+            워터마크 시각 (없으면 None). 감지기 워터마크 이전 시각의 패턴은 모두 확정됨
+        """
+        entry = self._axes.get(axis)
+        if not entry:
+            return None
+        value = entry["watermark"] if detector is None else entry["detectors"].get(detector)
+        return pd.Timestamp(value) if value is not None else None
+
+    def update(self, axis: str, stream) -> None:
+        """스트리밍 감지기 상태로 축 체크포인트 갱신 (save() 전까지 메모리에만 반영)
+
+        Args:
+            axis: 축
+            stream: StreamingPatternDetector
+        """
+        state = stream.get_state()
+        self._axes[axis] = {
+            "watermark": state["last_ts"],
+            "detectors": stream.watermarks(),
+            "state": state,
+            "updated_at": datetime.now().isoformat(),
+        }
+
+    def save(self) -> None:
+        """체크포인트 저장 (임시 파일 → 교체로 원자적 기록)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": self.VERSION, "axes": self._axes}, f)
+        os.replace(tmp_path, self.path)
+        logger.info(f"감지 체크포인트 저장: {self.path}")
@@ -0,0 +1,372 @@
+"""
+다중 해상도 다운샘플 피라미드
+
+1s → 10s → 1min → 10min → 1h 버킷별 축 min/max/mean/last를 미리 계산해
+긴 기간 차트를 상수 시간에 제공합니다. 버킷 min/max를 유지하므로
+샘플링 사이의 충돌 피크가 사라지지 않습니다.
+
+조회 구간 경계에 걸친 양 끝 버킷은 원본 샘플이 연결되어 있으면 구간 안 샘플만으로
+다시 집계합니다. 원본이 없으면(파일에서 로드만 한 경우) 버킷 전체 값을 그대로 쓰며,
+조회 결과의 edges_clipped가 False로 표시됩니다.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .data_loader import DataLoader
+
+logger = logging.getLogger(__name__)
+
+_NS_PER_SECOND = 1_000_000_000
+
+
+class DownsamplePyramid:
+    """버킷 집계 피라미드
+
+    레벨별 배열:
+        bucket_ns: 버킷 시작 시각 (int64 ns)
+        count: 버킷 내 샘플 수
+        {axis}_min / {axis}_max / {axis}_mean / {axis}_last
+    """
+
+    LEVELS_S = [1, 10, 60, 600, 3600]
+    FIELDS = ("min", "max", "mean", "last")
+    FILE_SUFFIX = ".pyramid.npz"
+
+    def __init__(
+        self,
+        levels: Dict[int, Dict[str, np.ndarray]],
+        axes: List[str],
+        meta: Optional[Dict[str, Any]] = None,
+        source: Optional[Tuple[np.ndarray, Dict[str, np.ndarray]]] = None
+    ):
+        """초기화
+
+        Args:
+            levels: 버킷 크기(초) → 레벨 배열 딕셔너리
+            axes: 포함된 축 목록
+            meta: 원본 파일 정보 등 메타데이터
+            source: 경계 버킷 재집계용 원본 (시간순 타임스탬프 ns, 축 → 값 배열)
+        """
+        self._levels = levels
+        self._axes = axes
+        self.meta = meta or {}
+        self._source = source
+
+    @staticmethod
+    def _source_arrays(
+        df: pd.DataFrame,
+        axes: List[str]
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """DataFrame → (시간순 타임스탬프 ns, 축 → float64 값) (정렬되어 있으면 복사 없음)"""
+        ts_ns = df["timestamp"].to_numpy(dtype="datetime64[ns]").view("int64")
+        order = None if np.all(ts_ns[1:] >= ts_ns[:-1]) else np.argsort(ts_ns, kind="stable")
+        columns = {}
+        for axis in axes:
+            values = df[axis].to_numpy(dtype="float64")
+            columns[axis] = values if order is None else values[order]
+        return (ts_ns if order is None else ts_ns[order]), columns
+
+    def attach_source(self, df: pd.DataFrame) -> None:
+        """경계 버킷 재집계용 원본 연결 (피라미드를 만든 데이터와 같아야 함)"""
+        self._source = self._source_arrays(df, self._axes)
+
+    @property
+    def has_source(self) -> bool:
+        """원본 연결 여부 (조회 경계 버킷을 구간 안 샘플로 재집계할 수 있는지)"""
+        return self._source is not None
+
+    @property
+    def axes(self) -> List[str]:
+        """포함된 축 목록"""
+        return list(self._axes)
+
+    @property
+    def level_seconds(self) -> List[int]:
+        """레벨 목록 (버킷 크기, 초)"""
+        return sorted(self._levels)
+
+    def level(self, seconds: int) -> Dict[str, np.ndarray]:
+        """레벨 배열 조회"""
+        return self._levels[seconds]
+
+    # ================================================================
+    # 구축
+    # ================================================================
+
+    @classmethod
+    def build(cls, df: pd.DataFrame, axes: Optional[List[str]] = None) -> "DownsamplePyramid":
+        """DataFrame에서 피라미드 구축
+
+        Args:
+            df: 센서 데이터 (timestamp + 축 컬럼)
+            axes: 포함할 축 (기본: 존재하는 SENSOR_AXES)
+
+        Returns:
+            DownsamplePyramid
+        """
+        axes = axes or [a for a in DataLoader.SENSOR_AXES if a in df.columns]
+        ts_ns, columns = cls._source_arrays(df, axes)
+
+        # 최하위 레벨은 원본 샘플을 단일 샘플 버킷으로 취급
+        base: Dict[str, np.ndarray] = {
+            "bucket_ns": ts_ns,
+            "count": np.ones(len(ts_ns), dtype=np.int64),
+        }
+        for axis in axes:
+            for field in cls.FIELDS:
+                base[f"{axis}_{field}"] = columns[axis]
+
+        levels: Dict[int, Dict[str, np.ndarray]] = {}
+        previous = base
+        for seconds in cls.LEVELS_S:
+            previous = cls._aggregate(previous, seconds * _NS_PER_SECOND, axes)
+            levels[seconds] = previous
+
+        logger.info(
+            "다운샘플 피라미드 구축: "
+            + ", ".join(f"{s}s={len(levels[s]['bucket_ns'])}" for s in cls.LEVELS_S)
+        )
+        return cls(levels, axes, source=(ts_ns, columns))
+
+    @classmethod
+    def _aggregate(
+        cls,
+        source: Dict[str, np.ndarray],
+        bucket_ns: int,
+        axes: List[str]
+    ) -> Dict[str, np.ndarray]:
+        """하위 레벨을 bucket_ns 크기 버킷으로 집계 (reduceat)"""
+        keys = source["bucket_ns"] // bucket_ns
+        if len(keys) == 0:
+            empty = {"bucket_ns": keys.copy(), "count": source["count"][:0].copy()}
+            for axis in axes:
+                for field in cls.FIELDS:
+                    empty[f"{axis}_{field}"] = source[f"{axis}_{field}"][:0].copy()
+            return empty
+
+        starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+        ends = np.append(starts[1:], len(keys))
+        counts = np.add.reduceat(source["count"], starts)
+
+        level = {
+            "bucket_ns": keys[starts] * bucket_ns,
+            "count": counts,
+        }
+        weights = source["count"].astype(np.float64)
+        for axis in axes:
+            level[f"{axis}_min"] = np.fmin.reduceat(source[f"{axis}_min"], starts)
+            level[f"{axis}_max"] = np.fmax.reduceat(source[f"{axis}_max"], starts)
+            level[f"{axis}_mean"] = np.add.reduceat(source[f"{axis}_mean"] * weights, starts) / counts
+            level[f"{axis}_last"] = source[f"{axis}_last"][ends - 1]
+        return level
+
+    # ================================================================
+    # 저장 / 로드
+    # ================================================================
+
+    @classmethod
+    def path_for(cls, source_path: Path) -> Path:
+        """원본 parquet 옆 피라미드 파일 경로"""
+        source_path = Path(source_path)
+        return source_path.with_name(source_path.stem + cls.FILE_SUFFIX)
+
+    @staticmethod
+    def _source_signature(source_path: Path) -> Dict[str, Any]:
+        """원본 파일 시그니처 (변경 감지용)"""
+        stat = Path(source_path).stat()
+        return {"source_mtime_ns": stat.st_mtime_ns, "source_size": stat.st_size}
+
+    def save(self, path: Path) -> None:
+        """npz 파일로 저장"""
+        arrays = {
+            f"L{seconds}__{name}": values
+            for seconds, level in self._levels.items()
+            for name, values in level.items()
+        }
+        meta = dict(self.meta, axes=self._axes, levels=sorted(self._levels))
+        arrays["__meta__"] = np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8)
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez(f, **arrays)
+        logger.info(f"다운샘플 피라미드 저장: {path}")
+
+    @classmethod
+    def load(cls, path: Path) -> "DownsamplePyramid":
+        """npz 파일에서 로드"""
+        with np.load(path) as npz:
+            meta = json.loads(npz["__meta__"].tobytes().decode("utf-8"))
+            levels: Dict[int, Dict[str, np.ndarray]] = {}
+            for key in npz.files:
+                if key == "__meta__":
+                    continue
+                level_key, name = key.split("__", 1)
+                levels.setdefault(int(level_key[1:]), {})[name] = npz[key]
+
+        axes = meta.pop("axes")
+        meta.pop("levels", None)
+        return cls(levels, axes, meta)
+
+    @classmethod
+    def load_or_build(cls, source_path: Path, df: pd.DataFrame) -> "DownsamplePyramid":
+        """저장된 피라미드가 원본과 일치하면 로드, 아니면 구축 후 저장
+
+        Args:
+            source_path: 원본 parquet 경로
+            df: 원본 데이터 (재구축 시 사용)
+
+        Returns:
+            DownsamplePyramid
+        """
+        path = cls.path_for(source_path)
+        signature = cls._source_signature(source_path)
+
+        if path.exists():
+            try:
+                pyramid = cls.load(path)
+                if all(pyramid.meta.get(k) == v for k, v in signature.items()):
+                    logger.info(f"다운샘플 피라미드 로드: {path}")
+                    pyramid.attach_source(df)
+                    return pyramid
+                logger.info(f"원본 변경 감지, 피라미드 재구축: {path}")
+            except Exception as e:
+                logger.warning(f"피라미드 로드 실패, 재구축: {path} ({e})")
+
+        pyramid = cls.build(df)
+        pyramid.meta.update(signature)
+        try:
+            pyramid.save(path)
+        except OSError as e:
+            logger.warning(f"피라미드 저장 실패 (메모리에서만 사용): {path} ({e})")
+        return pyramid
+
+    # ================================================================
+    # 조회
+    # ================================================================
+
+    def time_range_ns(self) -> Optional[tuple]:
+        """(첫 버킷, 마지막 버킷) 시작 시각 - 최소 레벨 기준 (int64 ns)"""
+        finest = self._levels[min(self._levels)]["bucket_ns"]
+        if len(finest) == 0:
+            return None
+        return int(finest[0]), int(finest[-1])
+
+    def select_level(self, start_ns: int, end_ns: int, samples: int) -> int:
+        """요청 샘플 수를 만족하는 가장 거친 레벨 선택
+
+        Args:
+            start_ns: 시작 시각 (포함)
+            end_ns: 종료 시각 (포함)
+            samples: 요청 샘플 수
+
+        Returns:
+            버킷 크기 (초)
+        """
+        for seconds in sorted(self._levels, reverse=True):
+            lo, hi = self._bounds(seconds, start_ns, end_ns)
+            if hi - lo >= samples:
+                return seconds
+        return min(self._levels)
+
+    def _bounds(self, seconds: int, start_ns: int, end_ns: int) -> tuple:
+        """레벨 내 [start, end] 버킷 위치 (lo, hi)"""
+        buckets = self._levels[seconds]["bucket_ns"]
+        # start가 속한 버킷부터 포함
+        lo = int(np.searchsorted(buckets, start_ns - start_ns % (seconds * _NS_PER_SECOND), side="left"))
+        hi = int(np.searchsorted(buckets, end_ns, side="right"))
+        return lo, max(lo, hi)
+
+    def query(self, start_ns: int, end_ns: int, samples: int) -> Dict[str, Any]:
+        """구간 다운샘플 조회
+
+        선택된 레벨의 버킷이 samples보다 많으면 인접 버킷을
+        다시 묶어 samples개 이하로 만듭니다 (min/max 보존).
+        구간 경계에 걸친 양 끝 버킷은 원본이 연결되어 있으면 구간 안 샘플만으로
+        다시 집계하고(구간 밖 샘플이 없는 버킷은 제외), 아니면 버킷 전체 값을 씁니다.
+
+        Args:
+            start_ns: 시작 시각 (포함)
+            end_ns: 종료 시각 (포함)
+            samples: 최대 샘플 수
+
+        Returns:
+            {"resolution_s", "total", "edges_clipped", "bucket_ns", "count", "{axis}_{field}", ...}
+            (edges_clipped가 False면 양 끝 버킷에 구간 밖 샘플이 포함될 수 있음)
+        """
+        seconds = self.select_level(start_ns, end_ns, samples)
+        level = self._levels[seconds]
+        lo, hi = self._bounds(seconds, start_ns, end_ns)
+
+        sliced = {name: values[lo:hi] for name, values in level.items()}
+        edges_clipped = self._source is not None
+        if edges_clipped:
+            sliced = self._clip_edges(sliced, seconds * _NS_PER_SECOND, start_ns, end_ns)
+        total = int(sliced["count"].sum())
+        n = len(sliced["bucket_ns"])
+        if n > samples:
+            starts = (np.arange(samples, dtype=np.int64) * n) // samples
+            ends = np.append(starts[1:], n)
+            counts = np.add.reduceat(sliced["count"], starts)
+            weights = sliced["count"].astype(np.float64)
+            grouped = {
+                "bucket_ns": sliced["bucket_ns"][starts],
+                "count": counts,
+            }
+            for axis in self._axes:
+                grouped[f"{axis}_min"] = np.fmin.reduceat(sliced[f"{axis}_min"], starts)
+                grouped[f"{axis}_max"] = np.fmax.reduceat(sliced[f"{axis}_max"], starts)
+                grouped[f"{axis}_mean"] = np.add.reduceat(sliced[f"{axis}_mean"] * weights, starts) / counts
+                grouped[f"{axis}_last"] = sliced[f"{axis}_last"][ends - 1]
+            sliced = grouped
+
+        sliced["resolution_s"] = seconds
+        sliced["total"] = total
+        sliced["edges_clipped"] = edges_clipped
+        return sliced
+
+    def _clip_edges(
+        self,
+        sliced: Dict[str, np.ndarray],
+        width_ns: int,
+        start_ns: int,
+        end_ns: int
+    ) -> Dict[str, np.ndarray]:
+        """양 끝 버킷을 [start_ns, end_ns] 안의 원본 샘플로 재집계"""
+        n = len(sliced["bucket_ns"])
+        edges = sorted({0, n - 1}) if n else []
+        partial = [
+            i for i in edges
+            if sliced["bucket_ns"][i] < start_ns or sliced["bucket_ns"][i] + width_ns - 1 > end_ns
+        ]
+        if not partial:
+            return sliced
+
+        ts_ns, columns = self._source
+        clipped = {name: values.copy() for name, values in sliced.items()}
+        keep = np.ones(n, dtype=bool)
+        for i in partial:
+            bucket_start = int(sliced["bucket_ns"][i])
+            a = int(np.searchsorted(ts_ns, max(bucket_start, start_ns), side="left"))
+            b = int(np.searchsorted(ts_ns, min(bucket_start + width_ns - 1, end_ns), side="right"))
+            if b <= a:
+                keep[i] = False
+                continue
+            clipped["count"][i] = b - a
+            for axis in self._axes:
+                values = columns[axis][a:b]
+                # 레벨 집계와 같은 규칙 (min/max는 NaN 무시, mean은 NaN 전파)
+                clipped[f"{axis}_min"][i] = np.fmin.reduce(values)
+                clipped[f"{axis}_max"][i] = np.fmax.reduce(values)
+                clipped[f"{axis}_mean"][i] = values.sum() / (b - a)
+                clipped[f"{axis}_last"][i] = values[-1]
+
+        if not keep.all():
+            clipped = {name: values[keep] for name, values in clipped.items()}
+        return clipped
@@ -0,0 +1,155 @@
+"""
+형태 보존 다운샘플링
+
+차트용 다운샘플러를 제공합니다. 모두 선택된 샘플의 위치 인덱스를 반환하므로
+한 축으로 선택한 인덱스를 다른 축/컬럼에도 그대로 적용할 수 있습니다.
+
+- uniform: 균등 인덱스 샘플링 (기존 방식)
+- lttb: Largest-Triangle-Three-Buckets (시각적 형태 보존)
+- minmax: 버킷별 최소/최대 포락선 (짧은 스파이크 보존)
+"""
+
+from typing import Optional
+
+import numpy as np
+
+DOWNSAMPLE_MODES = ("uniform", "lttb", "minmax")
+
+
+def uniform_indices(n: int, n_out: int) -> np.ndarray:
+    """균등 인덱스 샘플링
+
+    Args:
+        n: 원본 샘플 수
+        n_out: 목표 샘플 수
+
+    Returns:
+        선택된 위치 인덱스
+    """
+    if n <= n_out:
+        return np.arange(n)
+    return (np.arange(n_out, dtype=np.int64) * n) // n_out
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets 다운샘플링
+
+    첫/마지막 점을 고정하고 내부 점을 n_out-2개 버킷으로 나눈 뒤,
+    이전 선택점과 다음 버킷 평균점으로 만든 삼각형 면적이 최대인 점을 고릅니다.
+    버킷 평균과 면적 계산은 NumPy로 처리하며, 루프는 버킷 단위(n_out회)입니다.
+
+    Args:
+        x: x 좌표 (예: 상대 시각, 단조 증가)
+        y: y 값
+        n_out: 목표 샘플 수
+
+    Returns:
+        선택된 위치 인덱스 (오름차순)
+    """
+    n = len(y)
+    if n_out >= n or n <= 2:
+        return np.arange(n)
+    if n_out < 3:
+        return np.array([0, n - 1])[:max(n_out, 0)]
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # 내부 점 [1, n-1)을 n_out-2개 버킷으로 분할
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    starts, ends = edges[:-1], edges[1:]
+
+    # 버킷 평균 (reduceat) - 마지막 버킷의 "다음 버킷"은 마지막 점
+    counts = ends - starts
+    avg_x = np.add.reduceat(x[: ends[-1]], starts) / counts
+    avg_y = np.add.reduceat(y[: ends[-1]], starts) / counts
+    next_x = np.append(avg_x[1:], x[-1]).tolist()
+    next_y = np.append(avg_y[1:], y[-1]).tolist()
+    starts, ends = starts.tolist(), ends.tolist()
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    # 삼각형 면적 |A*y + B*x + C| (A, B, C는 이전 선택점과 다음 버킷 평균으로 결정)
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = starts[i], ends[i]
+        ax, ay = float(x[a]), float(y[a])
+        coef_a = ax - next_x[i]
+        coef_b = next_y[i] - ay
+        area = np.abs(coef_a * y[lo:hi] + coef_b * x[lo:hi] - (coef_a * ay + coef_b * ax))
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return selected
+
+
+def minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """최소/최대 포락선 다운샘플링
+
+    n_out/2개 버킷 각각에서 최소값과 최대값 위치를 선택합니다.
+    버킷 경계는 np.linspace로 나눠 폭 차이가 최대 1샘플이며(나머지를 한 버킷에 몰지 않음),
+    버킷 최소/최대는 reduceat으로 한 번에 계산합니다.
+
+    Args:
+        y: y 값
+        n_out: 목표 샘플 수 (최대)
+
+    Returns:
+        선택된 위치 인덱스 (오름차순, 중복 제거)
+    """
+    n = len(y)
+    if n_out >= n:
+        return np.arange(n)
+
+    n_buckets = max(1, n_out // 2)
+    edges = np.linspace(0, n, n_buckets + 1).astype(np.int64)
+    starts = edges[:-1]
+    bucket = np.repeat(np.arange(n_buckets), np.diff(edges))
+
+    y = np.asarray(y, dtype=np.float64)
+    nan = np.isnan(y)
+    has_nan = bool(nan.any())
+    low = np.where(nan, np.inf, y) if has_nan else y
+    high = np.where(nan, -np.inf, y) if has_nan else y
+
+    argmins = _first_in_bucket(low == np.minimum.reduceat(low, starts)[bucket], bucket)
+    argmaxs = _first_in_bucket(high == np.maximum.reduceat(high, starts)[bucket], bucket)
+    return np.unique(np.concatenate((argmins, argmaxs)))
+
+
+def _first_in_bucket(mask: np.ndarray, bucket: np.ndarray) -> np.ndarray:
+    """버킷별로 mask가 True인 첫 위치 (모든 버킷에 하나 이상 있어야 함)"""
+    hits = np.flatnonzero(mask)
+    _, first = np.unique(bucket[hits], return_index=True)
+    return hits[first]
+
+
+def downsample_indices(
+    y: np.ndarray,
+    n_out: int,
+    mode: str = "uniform",
+    x: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """모드별 다운샘플링 인덱스
+
+    Args:
+        y: 기준 축 값
+        n_out: 목표 샘플 수
+        mode: "uniform", "lttb", "minmax"
+        x: LTTB x 좌표 (기본: 인덱스)
+
+    Returns:
+        선택된 위치 인덱스
+
+    Raises:
+        ValueError: 지원하지 않는 모드
+    """
+    if mode == "uniform":
+        return uniform_indices(len(y), n_out)
+    if mode == "lttb":
+        return lttb_indices(np.arange(len(y)) if x is None else x, y, n_out)
+    if mode == "minmax":
+        return minmax_indices(y, n_out)
+    raise ValueError(f"지원하지 않는 다운샘플링 모드: {mode} (가능한 값: {DOWNSAMPLE_MODES})")
@@ -0,0 +1,454 @@
+"""
+DuckDB 센서 조회 백엔드
+
+parquet 파일에 DuckDB SQL을 직접 실행하여 구간 조회, 임계값 이상치 스캔,
+교대/제품별 집계, 백분위수 집계를 처리합니다.
+- 필요한 컬럼만 읽고(projection pushdown), 시간/임계값 조건은
+  parquet row group 통계로 건너뜁니다(predicate pushdown).
+- 파티션 데이터셋이면 manifest로 겹치는 파티션 파일만 스캔합니다.
+- 결과 행만 pandas로 변환하므로 수개월 데이터도 전체 로드 없이 조회합니다.
+- 센서 축에 NULL이 있는 파일은 DataLoader.preprocess와 같은 결측치 처리
+  (시간순 위치 기준 선형 보간, 앞쪽 결측은 0, 뒤쪽 결측은 마지막 값)를 SQL 윈도우로
+  적용해 pandas 백엔드와 같은 값을 조회합니다. 이 경우 파일 전체를 보간한 뒤 시간 조건을
+  적용하므로 시간 조건 pushdown은 적용되지 않습니다 (NULL 여부는 parquet 메타데이터로 판단).
+"""
+
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .data_loader import DataLoader
+
+if TYPE_CHECKING:
+    from .partitioned_dataset import PartitionedDataset
+
+logger = logging.getLogger(__name__)
+
+
+class DuckDBSensorBackend:
+    """parquet 직접 조회 백엔드 (DuckDB)"""
+
+    # 집계 기본 백분위수
+    DEFAULT_PERCENTILES = (0.5, 0.95, 0.99)
+
+    # GROUP BY 허용 컬럼
+    GROUP_COLUMNS = ["shift", "product_id", "task_mode", "operator_id", "payload_class", "tool_id", "status"]
+
+    def __init__(
+        self,
+        source: Optional[Path] = None,
+        dataset: Optional["PartitionedDataset"] = None,
+        threads: Optional[int] = None
+    ):
+        """초기화
+
+        Args:
+            source: parquet 파일 또는 glob 패턴 (기본: DataLoader.DEFAULT_PATH)
+            dataset: 파티션 데이터셋 (지정 시 source 대신 사용)
+            threads: DuckDB 스레드 수 (기본: DuckDB 기본값)
+        """
+        self._source = Path(source or DataLoader.DEFAULT_PATH)
+        self._dataset = dataset
+        self._threads = threads
+        self._conn = None
+        self._columns: Optional[List[str]] = None
+        # 파일 목록 → NULL이 있는 센서 축 (parquet 메타데이터 기준)
+        self._null_axes: Dict[Tuple[str, ...], List[str]] = {}
+
+    @property
+    def connection(self):
+        """DuckDB 연결 (지연 생성)"""
+        if self._conn is None:
+            try:
+                import duckdb
+            except ImportError:
+                raise ImportError(
+                    "duckdb가 필요합니다. "
+                    "설치: pip install duckdb"
+                )
+            self._conn = duckdb.connect(database=":memory:")
+            if self._threads:
+                self._conn.execute(f"SET threads TO {int(self._threads)}")
+        return self._conn
+
+    def close(self) -> None:
+        """연결 종료"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # ================================================================
+    # SQL 구성
+    # ================================================================
+
+    def _files(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> List[str]:
+        """스캔할 parquet 파일 목록 (파티션 데이터셋은 겹치는 파티션만)"""
+        if self._dataset is not None:
+            return [p.path.as_posix() for p in self._dataset.partitions_for(start, end)]
+        return [self._source.as_posix()]
+
+    @staticmethod
+    def _quote(value: str) -> str:
+        """SQL 문자열 리터럴"""
+        return "'" + value.replace("'", "''") + "'"
+
+    @staticmethod
+    def _ident(name: str) -> str:
+        """SQL 식별자"""
+        return '"' + name.replace('"', '""') + '"'
+
+    def _scan(self, files: List[str]) -> str:
+        """parquet 스캔 테이블 (센서 축에 NULL이 있으면 보간한 서브쿼리)"""
+        listing = ", ".join(self._quote(f) for f in files)
+        source = f"read_parquet([{listing}], union_by_name = true)"
+        axes = self._axes_with_nulls(files, listing)
+        if not axes:
+            return source
+        return self._interpolated(source, axes)
+
+    def _axes_with_nulls(self, files: List[str], listing: str) -> List[str]:
+        """NULL 값이 있는 센서 축 (통계가 없는 축은 NULL이 있다고 간주)"""
+        key = tuple(files)
+        axes = self._null_axes.get(key)
+        if axes is None:
+            rows = self.connection.execute(
+                f"SELECT path_in_schema, bool_or(stats_null_count IS NULL OR stats_null_count > 0) "
+                f"FROM parquet_metadata([{listing}]) GROUP BY 1"
+            ).fetchall()
+            flagged = {name for name, has_null in rows if has_null}
+            axes = [a for a in DataLoader.SENSOR_AXES if a in flagged]
+            self._null_axes[key] = axes
+        return axes
+
+    def _interpolated(self, source: str, axes: List[str]) -> str:
+        """DataLoader.preprocess와 같은 결측치 처리를 적용한 서브쿼리
+
+        시간순 행 번호를 x로 앞/뒤 유효 값 사이를 선형 보간하고,
+        앞쪽 결측은 0, 뒤쪽 결측은 마지막 유효 값으로 채웁니다
+        (pandas interpolate(method="linear") + fillna(0)과 동일).
+        """
+        replaced = []
+        for axis in axes:
+            col = self._ident(axis)
+            valid_rn = f"CASE WHEN {col} IS NOT NULL THEN __rn END"
+            prev_rn = f"last_value({valid_rn} IGNORE NULLS) OVER prev_w"
+            prev_val = f"last_value({col} IGNORE NULLS) OVER prev_w"
+            next_rn = f"first_value({valid_rn} IGNORE NULLS) OVER next_w"
+            next_val = f"first_value({col} IGNORE NULLS) OVER next_w"
+            replaced.append(
+                f"coalesce({col}, CASE WHEN {prev_rn} IS NULL THEN 0.0 "
+                f"WHEN {next_rn} IS NULL THEN {prev_val} "
+                f"ELSE {prev_val} + ({next_val} - {prev_val}) * (__rn - {prev_rn}) / ({next_rn} - {prev_rn}) END"
+                f") AS {col}"
+            )
+        return (
+            f"(SELECT * EXCLUDE (__rn) REPLACE ({', '.join(replaced)}) "
+            f"FROM (SELECT *, row_number() OVER (ORDER BY timestamp) AS __rn FROM {source}) "
+            "WINDOW prev_w AS (ORDER BY __rn ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW), "
+            "next_w AS (ORDER BY __rn ROWS BETWEEN CURRENT ROW AND UNBOUNDED FOLLOWING))"
+        )
+
+    @property
+    def columns(self) -> List[str]:
+        """parquet 스키마 컬럼 목록"""
+        if self._columns is None:
+            files = self._files()
+            if not files:
+                return []
+            rows = self.connection.execute(f"DESCRIBE SELECT * FROM {self._scan(files)}").fetchall()
+            self._columns = [row[0] for row in rows]
+        return self._columns
+
+    def _check_column(self, name: str) -> None:
+        """존재하는 컬럼인지 확인
+
+        Raises:
+            ValueError: 없는 컬럼
+        """
+        if name not in self.columns:
+            raise ValueError(f"알 수 없는 컬럼: {name}")
+
+    @staticmethod
+    def _naive(ts: datetime) -> datetime:
+        """tz-aware 시각을 UTC 기준 naive로 변환"""
+        stamp = pd.Timestamp(ts)
+        if stamp.tzinfo is not None:
+            stamp = stamp.tz_convert(None)
+        return stamp.to_pydatetime()
+
+    def _where(
+        self,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        conditions: Sequence[str] = (),
+        params: Sequence[Any] = ()
+    ) -> Tuple[str, List[Any]]:
+        """WHERE 절과 바인딩 파라미터"""
+        clauses = []
+        values: List[Any] = []
+        if start is not None:
+            clauses.append("timestamp >= ?")
+            values.append(self._naive(start))
+        if end is not None:
+            clauses.append("timestamp <= ?")
+            values.append(self._naive(end))
+        clauses.extend(conditions)
+        values.extend(params)
+        sql = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+        return sql, values
+
+    def query(self, sql: str, params: Optional[Sequence[Any]] = None) -> pd.DataFrame:
+        """SQL 실행 결과를 DataFrame으로 반환
+
+        `{source}` 자리에 전체 parquet 스캔이 들어갑니다.
+
+        Args:
+            sql: SQL 문 (예: "SELECT shift, max(Fz) FROM {source} GROUP BY 1")
+            params: 바인딩 파라미터
+
+        Returns:
+            결과 DataFrame
+        """
+        files = self._files()
+        if not files:
+            return pd.DataFrame()
+        return self.connection.execute(sql.format(source=self._scan(files)), list(params or [])).df()
+
+    def _select(
+        self,
+        select: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        conditions: Sequence[str] = (),
+        params: Sequence[Any] = (),
+        tail: str = ""
+    ) -> Optional[pd.DataFrame]:
+        """구간 SELECT 실행 (스캔할 파일이 없으면 None)"""
+        files = self._files(start, end)
+        if not files:
+            return None
+        where, values = self._where(start, end, conditions, params)
+        sql = f"SELECT {select} FROM {self._scan(files)}{where}{tail}"
+        return self.connection.execute(sql, values).df()
+
+    # ================================================================
+    # 조회
+    # ================================================================
+
+    def get_data(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        axes: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """시간 범위 데이터 조회
+
+        Args:
+            start: 시작 시각
+            end: 종료 시각
+            axes: 조회할 축 (기본: 전체 컬럼)
+
+        Returns:
+            시간순 DataFrame
+        """
+        if axes is None:
+            select = "*"
+        else:
+            select = ", ".join(self._ident(c) for c in ["timestamp", *axes] if c in self.columns)
+        df = self._select(select, start, end, tail=" ORDER BY timestamp")
+        if df is None:
+            return pd.DataFrame(columns=["timestamp", *(axes or DataLoader.SENSOR_AXES)])
+        return df
+
+    def get_statistics(
+        self,
+        axis: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """축별 통계 (SensorStore.get_statistics와 동일 형식)"""
+        if axis not in self.columns:
+            return {"error": f"No data for axis {axis}"}
+
+        col = self._ident(axis)
+        df = self._select(
+            f"avg({col}) AS mean, stddev_samp({col}) AS std, min({col}) AS min, max({col}) AS max, "
+            "count(*) AS count, min(timestamp) AS first, max(timestamp) AS last",
+            start, end,
+        )
+        if df is None or int(df["count"].iloc[0]) == 0:
+            return {"error": f"No data for axis {axis}"}
+
+        row = df.iloc[0]
+        return {
+            "axis": axis,
+            "mean": round(float(row["mean"]), 4),
+            "std": round(float(row["std"]), 4) if pd.notna(row["std"]) else float("nan"),
+            "min": round(float(row["min"]), 4),
+            "max": round(float(row["max"]), 4),
+            "count": int(row["count"]),
+            "period": {
+                "start": pd.Timestamp(row["first"]).isoformat(),
+                "end": pd.Timestamp(row["last"]).isoformat()
+            }
+        }
+
+    def get_anomalies(
+        self,
+        axis: str,
+        threshold: float,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        direction: str = "absolute"
+    ) -> pd.DataFrame:
+        """임계값 이상치 스캔
+
+        "above"/"below" 조건은 row group min/max 통계로 해당 없는 블록을 건너뜁니다.
+        """
+        if axis not in self.columns:
+            return pd.DataFrame()
+
+        col = self._ident(axis)
+        if direction == "above":
+            condition = f"{col} > ?"
+        elif direction == "below":
+            condition = f"{col} < ?"
+        else:
+            # abs()는 pushdown되지 않으므로 OR 조건으로 전개
+            condition = f"({col} > ? OR {col} < -?)"
+
+        params = [float(threshold)] * condition.count("?")
+        df = self._select("*", start, end, [condition], params, tail=" ORDER BY timestamp")
+        return pd.DataFrame() if df is None else df
+
+    def get_percentiles(
+        self,
+        axis: str,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> Dict[str, float]:
+        """축 백분위수 (선형 보간, numpy 기본 방식과 동일)
+
+        Returns:
+            {"p50": ..., "p95": ...}
+        """
+        self._check_column(axis)
+        col = self._ident(axis)
+        select = ", ".join(f"quantile_cont({col}, {float(q)}) AS q{i}" for i, q in enumerate(percentiles))
+        df = self._select(select, start, end)
+        if df is None:
+            return {self.percentile_key(q): float("nan") for q in percentiles}
+        row = df.iloc[0]
+        return {self.percentile_key(q): float(row[f"q{i}"]) for i, q in enumerate(percentiles)}
+
+    def get_group_statistics(
+        self,
+        axis: str,
+        by: str = "shift",
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES
+    ) -> List[Dict[str, Any]]:
+        """그룹별 축 통계 (교대, 제품 등)
+
+        Args:
+            axis: 측정 축
+            by: 그룹 컬럼 (GROUP_COLUMNS)
+            start: 시작 시각
+            end: 종료 시각
+            percentiles: 함께 계산할 백분위수
+
+        Returns:
+            그룹별 통계 리스트 (그룹 값 순)
+
+        Raises:
+            ValueError: 허용되지 않은 그룹 컬럼
+        """
+        if by not in self.GROUP_COLUMNS:
+            raise ValueError(f"지원하지 않는 그룹 컬럼: {by} (가능한 값: {self.GROUP_COLUMNS})")
+        self._check_column(axis)
+        self._check_column(by)
+
+        col, key = self._ident(axis), self._ident(by)
+        select = (
+            f"{key} AS grp, count(*) AS count, avg({col}) AS mean, stddev_samp({col}) AS std, "
+            f"min({col}) AS min, max({col}) AS max"
+            + "".join(f", quantile_cont({col}, {float(q)}) AS q{i}" for i, q in enumerate(percentiles))
+        )
+        df = self._select(select, start, end, tail=" GROUP BY grp ORDER BY grp NULLS LAST")
+        if df is None:
+            return []
+
+        return [
+            {
+                by: None if pd.isna(row["grp"]) else row["grp"],
+                "count": int(row["count"]),
+                "mean": round(float(row["mean"]), 4),
+                "std": round(float(row["std"]), 4) if pd.notna(row["std"]) else float("nan"),
+                "min": round(float(row["min"]), 4),
+                "max": round(float(row["max"]), 4),
+                **{self.percentile_key(q): round(float(row[f"q{i}"]), 4) for i, q in enumerate(percentiles)},
+            }
+            for _, row in df.iterrows()
+        ]
+
+    def get_context_at(self, timestamp: datetime) -> Optional[pd.Series]:
+        """가장 가까운 시점의 행 (앞/뒤 한 행씩만 조회)"""
+        ts = self._naive(timestamp)
+        before = self._select("*", None, ts, tail=" ORDER BY timestamp DESC LIMIT 1")
+        after = self._select("*", ts, None, tail=" ORDER BY timestamp LIMIT 1")
+        rows = [df.iloc[0] for df in (before, after) if df is not None and not df.empty]
+        if not rows:
+            return None
+        target = pd.Timestamp(ts)
+        return min(rows, key=lambda row: abs(pd.Timestamp(row["timestamp"]) - target))
+
+    def latest_row(self) -> Optional[pd.Series]:
+        """최신 행"""
+        df = self._select("*", tail=" ORDER BY timestamp DESC LIMIT 1")
+        if df is None or df.empty:
+            return None
+        return df.iloc[0]
+
+    def time_range(self) -> Optional[Tuple[datetime, datetime]]:
+        """전체 시간 범위"""
+        df = self._select("min(timestamp) AS first, max(timestamp) AS last")
+        if df is None or pd.isna(df["first"].iloc[0]):
+            return None
+        return pd.Timestamp(df["first"].iloc[0]).to_pydatetime(), pd.Timestamp(df["last"].iloc[0]).to_pydatetime()
+
+    def count(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> int:
+        """구간 레코드 수"""
+        df = self._select("count(*) AS n", start, end)
+        return 0 if df is None else int(df["n"].iloc[0])
+
+    def get_axis_values(
+        self,
+        axis: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> np.ndarray:
+        """구간 축 값 배열 (시간순)"""
+        df = self._select(self._ident(axis), start, end, tail=" ORDER BY timestamp")
+        return np.empty(0) if df is None else df[axis].to_numpy(dtype="float64")
+
+    def get_timestamps_ns(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> np.ndarray:
+        """구간 타임스탬프 (int64 ns, 시간순)"""
+        df = self._select("timestamp", start, end, tail=" ORDER BY timestamp")
+        if df is None:
+            return np.empty(0, dtype="int64")
+        return df["timestamp"].to_numpy(dtype="datetime64[ns]").view("int64")
+
+    @staticmethod
+    def percentile_key(q: float) -> str:
+        """백분위수 키 (0.95 → "p95", 0.999 → "p99.9")"""
+        return f"p{q * 100:g}"
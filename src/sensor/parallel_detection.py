@@ -0,0 +1,231 @@
+"""
+병렬 패턴 감지
+
+(파일, 축, 감지기) 단위 샤드를 ProcessPoolExecutor로 분산 실행합니다.
+파일 데이터(타임스탬프, 축 값)는 부모 프로세스가 공유 메모리에 한 번 올리고,
+작업자는 이를 붙여서(attach) 필요한 축만 읽으므로 샤드마다 데이터를 pickle로 보내지 않습니다.
+
+결과는 샤드 키(파일 순서, 축 순서, 감지기 순서) 순으로 병합하고
+PAT-### ID를 순차 부여하므로, 작업자 완료 순서와 무관하게
+순차 실행(파일별·축별 detect())과 같은 결과/ID를 얻습니다.
+"""
+
+import logging
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .data_loader import DataLoader
+from .patterns import DetectedPattern
+
+logger = logging.getLogger(__name__)
+
+Source = Union[str, Path, pd.DataFrame]
+
+
+def _to_shared(array: np.ndarray) -> Tuple[shared_memory.SharedMemory, Dict[str, Any]]:
+    """배열을 공유 메모리로 복사 (핸들, 작업자용 명세)"""
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+    view[...] = array
+    del view
+    return shm, {"name": shm.name, "shape": array.shape, "dtype": array.dtype.str}
+
+
+def _read_shared(spec: Dict[str, Any], column: Optional[int] = None) -> np.ndarray:
+    """공유 메모리 배열(또는 한 축) 복사본 읽기"""
+    shm = shared_memory.SharedMemory(name=spec["name"])
+    try:
+        view = np.ndarray(spec["shape"], dtype=np.dtype(spec["dtype"]), buffer=shm.buf)
+        result = (view if column is None else view[column]).copy()
+        del view
+        return result
+    finally:
+        shm.close()
+
+
+def _run_shard(shard: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """샤드 1개 실행 (작업자 프로세스)
+
+    Args:
+        shard: 공유 메모리 명세, 축/감지기, 설정 딕셔너리
+
+    Returns:
+        패턴 딕셔너리 목록 (ID는 병합 시 부여)
+    """
+    from .pattern_detector import PatternDetector
+    from .sensor_store import SensorStore
+
+    axis = shard["axis"]
+    ts_ns = _read_shared(shard["timestamps"])
+    values = _read_shared(shard["values"], column=shard["column"])
+    frame = pd.DataFrame({"timestamp": ts_ns.view("datetime64[ns]"), axis: values})
+
+    detector = PatternDetector(SensorStore(frame), config=shard["config"])
+    method = getattr(detector, f"detect_{shard['detector']}")
+    return [p.to_dict() for p in method(axis=axis)]
+
+
+class ParallelPatternDetector:
+    """(파일, 축, 감지기) 샤드 병렬 감지"""
+
+    DETECTORS = ("collision", "overload", "drift", "vibration")
+
+    # 동시에 공유 메모리에 올려 둘 최대 파일 수 (다음 파일 로드와 감지를 겹침)
+    MAX_FILES_IN_FLIGHT = 2
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        config_path: Optional[Path] = None,
+        start_id: int = 0
+    ):
+        """초기화
+
+        Args:
+            max_workers: 작업자 프로세스 수 (기본: CPU 수, 1이면 현재 프로세스에서 실행)
+            config_path: 패턴 설정 파일 경로 (기본: PatternDetector.CONFIG_PATH)
+            start_id: 첫 패턴 ID 직전 번호 (기존 패턴 뒤에 이어 붙일 때)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.config_path = Path(config_path) if config_path is not None else None
+        self.start_id = start_id
+
+    def detect(
+        self,
+        sources: Sequence[Source],
+        axes: Sequence[str] = ("Fz",),
+        detectors: Optional[Sequence[str]] = None
+    ) -> List[DetectedPattern]:
+        """파일 × 축 × 감지기 병렬 감지
+
+        Args:
+            sources: parquet 경로 또는 DataFrame 목록 (파일 단위로 독립 감지)
+            axes: 분석할 축 목록
+            detectors: 감지기 목록 (기본: 전체, DETECTORS 순서로 실행)
+
+        Returns:
+            병합된 패턴 목록 (파일 → 축 → 감지기 순, ID 순차 부여)
+
+        Raises:
+            ValueError: 알 수 없는 감지기
+        """
+        from .pattern_detector import PatternDetector
+
+        detectors = list(detectors or self.DETECTORS)
+        unknown = [d for d in detectors if d not in self.DETECTORS]
+        if unknown:
+            raise ValueError(f"알 수 없는 감지기: {unknown} (지원: {', '.join(self.DETECTORS)})")
+        axes = list(axes)
+        # 설정은 한 번만 읽어 샤드에 전달
+        config = PatternDetector._load_config(self.config_path or PatternDetector.CONFIG_PATH)
+
+        results: Dict[Tuple[int, int, int], List[Dict[str, Any]]] = {}
+        executor = ProcessPoolExecutor(max_workers=self.max_workers) if self.max_workers > 1 else None
+        in_flight: List[Tuple[List[shared_memory.SharedMemory], Dict[Tuple, Future]]] = []
+
+        try:
+            for file_idx, source in enumerate(sources):
+                if len(in_flight) >= self.MAX_FILES_IN_FLIGHT:
+                    self._collect(in_flight.pop(0), results)
+
+                handles, shards = self._share_source(source, axes)
+                futures = {}
+                for axis_idx, axis in enumerate(axes):
+                    for name in detectors:
+                        shard = dict(shards[axis], detector=name, config=config)
+                        key = (file_idx, axis_idx, self.DETECTORS.index(name))
+                        futures[key] = (
+                            executor.submit(_run_shard, shard) if executor is not None
+                            else self._completed(_run_shard(shard))
+                        )
+                in_flight.append((handles, futures))
+
+            while in_flight:
+                self._collect(in_flight.pop(0), results)
+        finally:
+            for handles, _ in in_flight:
+                self._release(handles)
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+        patterns = []
+        counter = self.start_id
+        for key in sorted(results):
+            for data in results[key]:
+                counter += 1
+                data["pattern_id"] = f"PAT-{counter:03d}"
+                patterns.append(DetectedPattern.from_dict(data))
+
+        logger.info(
+            f"병렬 패턴 감지: {len(sources)}개 파일 × {len(axes)}개 축 × {len(detectors)}개 감지기 "
+            f"→ {len(patterns)}개 패턴 (작업자 {self.max_workers})"
+        )
+        return patterns
+
+    @staticmethod
+    def _completed(value: Any) -> Future:
+        """이미 계산된 결과를 Future로 감싸기 (단일 프로세스 실행)"""
+        future: Future = Future()
+        future.set_result(value)
+        return future
+
+    @staticmethod
+    def _share_source(
+        source: Source,
+        axes: List[str]
+    ) -> Tuple[List[shared_memory.SharedMemory], Dict[str, Dict[str, Any]]]:
+        """파일 데이터를 공유 메모리에 올리고 축별 샤드 명세 생성"""
+        if isinstance(source, pd.DataFrame):
+            df = source
+        else:
+            df = DataLoader.load(Path(source), use_cache=False, columns=["timestamp", *axes])
+        df = df.sort_values("timestamp") if not df["timestamp"].is_monotonic_increasing else df
+
+        ts_ns = df["timestamp"].to_numpy(dtype="datetime64[ns]").view("int64")
+        # 축별 연속 메모리 (k, n) → 작업자는 자기 축 한 행만 복사
+        values = np.ascontiguousarray(df[axes].to_numpy(dtype=np.float64).T)
+
+        handles = []
+        try:
+            ts_shm, ts_spec = _to_shared(ts_ns)
+            handles.append(ts_shm)
+            values_shm, values_spec = _to_shared(values)
+            handles.append(values_shm)
+        except Exception:
+            ParallelPatternDetector._release(handles)
+            raise
+
+        shards = {
+            axis: {"timestamps": ts_spec, "values": values_spec, "column": j, "axis": axis}
+            for j, axis in enumerate(axes)
+        }
+        return handles, shards
+
+    @staticmethod
+    def _collect(
+        entry: Tuple[List[shared_memory.SharedMemory], Dict[Tuple, Future]],
+        results: Dict[Tuple[int, int, int], List[Dict[str, Any]]]
+    ) -> None:
+        """파일 1개의 샤드 결과 수집 후 공유 메모리 해제"""
+        handles, futures = entry
+        try:
+            for key, future in futures.items():
+                results[key] = future.result()
+        finally:
+            ParallelPatternDetector._release(handles)
+
+    @staticmethod
+    def _release(handles: List[shared_memory.SharedMemory]) -> None:
+        for shm in handles:
+            shm.close()
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+        handles.clear()
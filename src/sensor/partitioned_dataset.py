@@ -0,0 +1,258 @@
+"""
+파티션 센서 데이터셋
+
+장기간 Axia80 데이터를 ISO 주 단위 파티션으로 저장하고,
+manifest(파티션별 시간 범위, 축별 min/max)로 조회 구간과 겹치는
+파티션만 엽니다.
+
+디렉토리 구조:
+    data/sensor/raw/
+        _manifest.json
+        year=2026/week=04/part-0.parquet
+        year=2026/week=05/part-0.parquet
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from .data_loader import DataLoader
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PartitionInfo:
+    """파티션 메타데이터"""
+    key: str                       # "year=2026/week=04"
+    path: Path                     # parquet 파일 경로
+    start: datetime                # 첫 샘플 시각
+    end: datetime                  # 마지막 샘플 시각
+    rows: int                      # 레코드 수
+    axes: Dict[str, Dict[str, float]] = field(default_factory=dict)  # 축별 {"min", "max"}
+
+    def overlaps(self, start: Optional[datetime], end: Optional[datetime]) -> bool:
+        """[start, end] 구간과 겹치는지 여부"""
+        if start is not None and self.end < start:
+            return False
+        if end is not None and self.start > end:
+            return False
+        return True
+
+    def max_abs(self, axis: str) -> Optional[float]:
+        """축 절대값 최대 (manifest 기준)"""
+        stats = self.axes.get(axis)
+        if stats is None:
+            return None
+        return max(abs(stats["min"]), abs(stats["max"]))
+
+    def to_dict(self, root: Path) -> Dict[str, Any]:
+        """딕셔너리 변환 (경로는 root 기준 상대 경로)"""
+        return {
+            "key": self.key,
+            "path": self.path.relative_to(root).as_posix(),
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat(),
+            "rows": self.rows,
+            "axes": self.axes,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], root: Path) -> "PartitionInfo":
+        """딕셔너리에서 생성"""
+        return cls(
+            key=data["key"],
+            path=root / data["path"],
+            start=datetime.fromisoformat(data["start"]),
+            end=datetime.fromisoformat(data["end"]),
+            rows=data["rows"],
+            axes=data.get("axes", {}),
+        )
+
+
+class PartitionedDataset:
+    """주 단위 파티션 센서 데이터셋"""
+
+    DEFAULT_ROOT = Path("data/sensor/raw")
+    MANIFEST_NAME = "_manifest.json"
+    PARTITION_FILE = "part-0.parquet"
+
+    def __init__(self, root: Optional[Path] = None):
+        """초기화
+
+        Args:
+            root: 데이터셋 루트 디렉토리 (기본: DEFAULT_ROOT)
+        """
+        self._root = Path(root or self.DEFAULT_ROOT)
+        self._partitions: Optional[List[PartitionInfo]] = None
+
+    @property
+    def root(self) -> Path:
+        """데이터셋 루트"""
+        return self._root
+
+    @property
+    def manifest_path(self) -> Path:
+        """manifest 파일 경로"""
+        return self._root / self.MANIFEST_NAME
+
+    @property
+    def partitions(self) -> List[PartitionInfo]:
+        """파티션 목록 (시간순, manifest 없으면 스캔 후 생성)"""
+        if self._partitions is None:
+            if self.manifest_path.exists():
+                self._partitions = self._read_manifest()
+            else:
+                self._partitions = self.build_manifest()
+        return self._partitions
+
+    # ================================================================
+    # 쓰기
+    # ================================================================
+
+    def write(self, df: pd.DataFrame) -> List[PartitionInfo]:
+        """데이터를 ISO 주 단위 파티션으로 저장
+
+        이미 존재하는 파티션은 기존 데이터와 병합합니다 (타임스탬프 중복 제거).
+
+        Args:
+            df: 센서 데이터 (timestamp 필수)
+
+        Returns:
+            갱신된 파티션 목록
+        """
+        df = DataLoader.preprocess(df.copy())
+        iso = df["timestamp"].dt.isocalendar()
+        keys = (
+            "year=" + iso["year"].astype(str).str.zfill(4)
+            + "/week=" + iso["week"].astype(str).str.zfill(2)
+        )
+
+        for key, part in df.groupby(keys, sort=True):
+            path = self._root / key / self.PARTITION_FILE
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if path.exists():
+                existing = pd.read_parquet(path)
+                part = pd.concat([existing, part], ignore_index=True)
+                part = part.drop_duplicates(subset="timestamp", keep="last")
+                part = DataLoader.preprocess(part)
+            tmp_path = path.with_suffix(".parquet.tmp")
+            part.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, path)
+            DataLoader.clear_cache(path)
+            logger.info(f"파티션 저장: {key} ({len(part)} 레코드)")
+
+        return self.build_manifest()
+
+    def build_manifest(self) -> List[PartitionInfo]:
+        """파티션 디렉토리를 스캔하여 manifest 재생성
+
+        Returns:
+            파티션 목록
+        """
+        partitions: List[PartitionInfo] = []
+        for path in sorted(self._root.glob(f"year=*/week=*/{self.PARTITION_FILE}")):
+            df = DataLoader.load(path, use_cache=False, columns=["timestamp", *DataLoader.SENSOR_AXES])
+            if df.empty:
+                continue
+            axes = {
+                axis: {"min": float(df[axis].min()), "max": float(df[axis].max())}
+                for axis in DataLoader.SENSOR_AXES
+                if axis in df.columns
+            }
+            start, end = DataLoader.get_time_range(df)
+            partitions.append(PartitionInfo(
+                key=path.parent.relative_to(self._root).as_posix(),
+                path=path,
+                start=start,
+                end=end,
+                rows=len(df),
+                axes=axes,
+            ))
+
+        partitions.sort(key=lambda p: p.start)
+        self._partitions = partitions
+
+        if partitions or self._root.exists():
+            self._root.mkdir(parents=True, exist_ok=True)
+            with open(self.manifest_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"partitions": [p.to_dict(self._root) for p in partitions]},
+                    f, ensure_ascii=False, indent=2,
+                )
+        logger.info(f"파티션 manifest 생성: {len(partitions)}개 ({self.manifest_path})")
+        return partitions
+
+    def _read_manifest(self) -> List[PartitionInfo]:
+        """manifest 파일 읽기"""
+        with open(self.manifest_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        partitions = [PartitionInfo.from_dict(p, self._root) for p in data.get("partitions", [])]
+        partitions.sort(key=lambda p: p.start)
+        return partitions
+
+    # ================================================================
+    # 조회 (파티션 프루닝)
+    # ================================================================
+
+    def partitions_for(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> List[PartitionInfo]:
+        """[start, end]와 겹치는 파티션만 반환"""
+        return [p for p in self.partitions if p.overlaps(start, end)]
+
+    def time_range(self) -> Optional[tuple]:
+        """전체 시간 범위 (manifest 기준)"""
+        partitions = self.partitions
+        if not partitions:
+            return None
+        return partitions[0].start, partitions[-1].end
+
+    def load_partition(
+        self,
+        partition: PartitionInfo,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """파티션 로드 (DataLoader LRU + 컬럼 캐시 사용)"""
+        return DataLoader.load(partition.path, columns=columns)
+
+    def read_range(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """구간 데이터 조회 (겹치는 파티션만 로드)
+
+        Args:
+            start: 시작 시각 (포함)
+            end: 종료 시각 (포함)
+            columns: 로드할 컬럼 (기본: 전체, timestamp는 항상 포함)
+
+        Returns:
+            구간 DataFrame
+        """
+        if columns is not None and "timestamp" not in columns:
+            columns = ["timestamp", *columns]
+
+        frames = []
+        for partition in self.partitions_for(start, end):
+            df = self.load_partition(partition, columns)
+            ts = df["timestamp"]
+            lo = 0 if start is None else int(ts.searchsorted(pd.Timestamp(start), side="left"))
+            hi = len(df) if end is None else int(ts.searchsorted(pd.Timestamp(end), side="right"))
+            frames.append(df.iloc[lo:hi])
+
+        if not frames:
+            return pd.DataFrame(columns=columns or ["timestamp", *DataLoader.SENSOR_AXES])
+        if len(frames) == 1:
+            return frames[0]
+        return pd.concat(frames, ignore_index=True)
@@ -4,7 +4,7 @@
 센서 데이터에서 이상 패턴을 자동 감지합니다.
 """
 
-import json
+import dataclasses
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -14,14 +14,24 @@ import numpy as np
 import pandas as pd
 import yaml
 
-from .patterns import DetectedPattern, PatternType, DEFAULT_ERROR_MAPPING
+from src.config_reload import HotReloadable, pinned_config
+from .data_loader import DataLoader
+from .pattern_repository import PatternRepository, get_pattern_repository
+from .patterns import DetectedPattern, PatternType, DEFAULT_ERROR_MAPPING, save_patterns
+from .range_stats import window_means
+from .rolling import infer_sample_rate, rolling_std, window_samples
+from .segments import find_segments
 from .sensor_store import SensorStore
 
 logger = logging.getLogger(__name__)
 
 
-class PatternDetector:
-    """패턴 감지 엔진"""
+class PatternDetector(HotReloadable):
+    """패턴 감지 엔진
+
+    설정 파일 기반이면 reload()(또는 ConfigWatcher)로 재시작 없이 임계값을 다시 읽습니다.
+    감지 호출은 시작 시점 설정 버전으로 끝까지 실행됩니다.
+    """
 
     # 설정 파일 경로
     CONFIG_PATH = Path("configs/pattern_thresholds.yaml")
@@ -45,6 +55,18 @@ class PatternDetector:
         "vibration": {
             "window_s": 60.0,
             "amplitude_threshold": 2.0,
+            "spectral": {
+                "axes": ["Fz", "Tx", "Ty"],
+                "nperseg": 256,
+                "overlap": 0.5,
+                "energy_ratio": 4.0,
+                "min_duration_s": 10.0,
+                "bands": {
+                    "low_freq": [0.05, 0.5],
+                    "joint_wear": [5.0, 20.0],
+                    "high_freq": [50.0, 62.5],
+                },
+            },
         },
     }
 
@@ -52,19 +74,30 @@ class PatternDetector:
     DRIFT_BASELINE_EPSILON = 1.0      # N (baseline이 이 값 미만이면 절대값 모드)
     DRIFT_ABSOLUTE_THRESHOLD = 5.0    # N (절대값 모드에서 드리프트 임계값)
 
+    # 충돌 baseline 윈도우 (피크 기준 ±5초)
+    COLLISION_BASELINE_WINDOW_NS = 5_000_000_000
+
+    # 타임스탬프로 샘플링 주기를 추정할 수 없을 때의 기본값 (실시간 수집 주기)
+    DEFAULT_SAMPLE_RATE_HZ = 125.0
+
+    # 증분 감지 시 스트리밍 입력 청크 크기
+    INCREMENTAL_CHUNK_SIZE = 500_000
+
     # 패턴 저장 경로
     PATTERNS_PATH = Path("data/sensor/processed/detected_patterns.json")
 
     def __init__(
         self,
         sensor_store: Optional[SensorStore] = None,
-        config_path: Optional[Path] = None
+        config_path: Optional[Path] = None,
+        config: Optional[Dict[str, Any]] = None
     ):
         """초기화
 
         Args:
             sensor_store: 센서 저장소 (없으면 자동 생성)
             config_path: 설정 파일 경로 (기본: configs/pattern_thresholds.yaml)
+            config: 이미 로드한 설정 딕셔너리 (주면 파일을 읽지 않음)
         """
         if sensor_store is not None:
             self._store = sensor_store
@@ -72,14 +105,18 @@ class PatternDetector:
             self._store = SensorStore()
 
         self._pattern_counter = 0
-        self._existing_patterns: List[DetectedPattern] = []
+        self._existing_patterns: Optional[List[DetectedPattern]] = None
 
-        # 설정 로드
-        self._config = self._load_config(config_path or self.CONFIG_PATH)
+        # 설정 로드 (config를 주면 파일을 감시하지 않음)
+        self.config_path = None if config is not None else Path(config_path or self.CONFIG_PATH)
+        self._init_config(
+            (lambda: config) if config is not None else (lambda: self._load_config(self.config_path))
+        )
 
         logger.info("PatternDetector 초기화 완료")
 
-    def _load_config(self, config_path: Path) -> Dict[str, Any]:
+    @classmethod
+    def _load_config(cls, config_path: Path) -> Dict[str, Any]:
         """설정 파일 로드
 
         Args:
@@ -96,10 +133,47 @@ class PatternDetector:
                 return config
             except Exception as e:
                 logger.warning(f"설정 파일 로드 실패, 기본값 사용: {e}")
-                return self.DEFAULT_CONFIG
+                return cls.DEFAULT_CONFIG
         else:
             logger.warning(f"설정 파일 없음, 기본값 사용: {config_path}")
-            return self.DEFAULT_CONFIG
+            return cls.DEFAULT_CONFIG
+
+    @classmethod
+    def _validate_config(cls, config: Any) -> Dict[str, Any]:
+        """설정 검증 (DEFAULT_CONFIG에 있는 섹션은 딕셔너리, 수치 키는 숫자)
+
+        Raises:
+            ValueError: 형식이 잘못된 설정
+        """
+        if not isinstance(config, dict):
+            raise ValueError(f"패턴 설정은 딕셔너리여야 합니다: {type(config).__name__}")
+        for section, defaults in cls.DEFAULT_CONFIG.items():
+            values = config.get(section)
+            if values is None:
+                continue
+            if not isinstance(values, dict):
+                raise ValueError(f"패턴 설정 '{section}'은 딕셔너리여야 합니다")
+            for key, default in defaults.items():
+                value = values.get(key)
+                if isinstance(default, (int, float)) and value is not None and (
+                    isinstance(value, bool) or not isinstance(value, (int, float))
+                ):
+                    raise ValueError(f"패턴 설정 '{section}.{key}'는 숫자여야 합니다: {value!r}")
+        return config
+
+    @property
+    def _config(self) -> Dict[str, Any]:
+        """패턴 설정 (현재 설정 버전)"""
+        return self.snapshot.data
+
+    def _config_paths(self) -> Tuple[Path, ...]:
+        return (self.config_path,) if self.config_path is not None else ()
+
+    def _build_config(self) -> Dict[str, Any]:
+        """설정 파일 다시 읽기 (리로드용, 실패하면 예외 → 기존 버전 유지)"""
+        with open(self.config_path, "r", encoding="utf-8") as f:
+            config = yaml.safe_load(f)
+        return self._validate_config(config)
 
     @property
     def collision_threshold(self) -> float:
@@ -157,11 +231,25 @@ class PatternDetector:
             "amplitude_threshold", self.DEFAULT_CONFIG["vibration"]["amplitude_threshold"]
         )
 
+    @property
+    def spectral_config(self) -> Dict[str, Any]:
+        """스펙트럼 진동 감지 설정 (기본값에 설정 파일 값을 덮어씀)"""
+        return {
+            **self.DEFAULT_CONFIG["vibration"]["spectral"],
+            **(self._config.get("vibration", {}).get("spectral") or {}),
+        }
+
+    @property
+    def repository(self) -> PatternRepository:
+        """기존 감지 패턴 저장소 (PATTERNS_PATH 공유 인스턴스)"""
+        return get_pattern_repository(self.PATTERNS_PATH)
+
     @property
     def sensor_store(self) -> SensorStore:
         """센서 저장소"""
         return self._store
 
+    @pinned_config
     def detect(
         self,
         df: Optional[pd.DataFrame] = None,
@@ -196,6 +284,219 @@ class PatternDetector:
             if df is not None:
                 self._store = original_store
 
+    @pinned_config
+    def detect_axes(
+        self,
+        axes: Optional[List[str]] = None,
+        df: Optional[pd.DataFrame] = None
+    ) -> List[DetectedPattern]:
+        """여러 축 동시 감지 (단일 패스)
+
+        (n_samples × n_axes) 배열 하나로 네 가지 감지를 수행합니다.
+        마스크/구간 분할은 열 우선으로 펼친 배열에서 한 번, 롤링 표준편차와
+        드리프트 resample도 모든 축에 대해 한 번씩만 계산합니다.
+        결과는 축별 detect(axis=...)와 같고, 모든 패턴에 축이 기록됩니다
+        (충돌: peak_axis, 그 외: axis).
+
+        Args:
+            axes: 분석할 축 목록 (기본: 6축 전체)
+            df: 센서 데이터 DataFrame (None이면 내부 store 사용)
+
+        Returns:
+            감지된 패턴 목록 (충돌, 과부하, 드리프트, 진동 순, 각 타입 안에서 축 순서)
+        """
+        axes = list(axes or DataLoader.SENSOR_AXES)
+        data = df if df is not None else self._store.data
+        n = len(data)
+        if n == 0:
+            return []
+
+        frame = data[axes]
+        values = frame.to_numpy(dtype=np.float64)        # (n, k)
+        flat = values.T.ravel()                           # 열 우선 (k * n)
+        ts_ns = self._timestamps_ns(data)
+        timestamps = data["timestamp"]
+        patterns = []
+
+        # 충돌: 임계값 미만 구간의 최소 피크 + 축별 baseline
+        threshold = self.collision_threshold
+        segments = find_segments(flat < threshold, column_length=n)
+        peak_cols, peak_rows = np.divmod(segments.argmin(flat), n)
+        for j in np.unique(peak_cols):
+            rows = peak_rows[peak_cols == j]
+            column = values[:, j]
+            baselines = window_means(
+                ts_ns, column, column > threshold,
+                centers_ns=ts_ns[rows],
+                half_window_ns=self.COLLISION_BASELINE_WINDOW_NS,
+            )
+            for row, baseline in zip(rows, baselines):
+                patterns.append(self._collision_pattern(
+                    axes[j], timestamps.iloc[row], float(column[row]), float(baseline)
+                ))
+
+        # 과부하: 절대값 임계값 초과 구간
+        abs_flat = np.abs(flat)
+        segments = find_segments(abs_flat > self.overload_threshold, column_length=n)
+        cols, start_rows = np.divmod(segments.starts, n)
+        durations_s = (ts_ns[segments.ends % n] - ts_ns[start_rows]) / 1e9
+        max_values = segments.reduce(abs_flat, "max")
+        mean_values = segments.reduce(abs_flat, "mean")
+        for i in np.flatnonzero(durations_s >= self.overload_min_duration_s):
+            patterns.append(self._overload_pattern(
+                axes[cols[i]], timestamps.iloc[start_rows[i]], float(durations_s[i]),
+                float(max_values[i]), float(mean_values[i]),
+            ))
+
+        # 드리프트: 한 번의 resample로 모든 축의 윈도우 평균
+        window_hours = self.drift_window_hours
+        baselines = frame.mean()
+        indexed = pd.DataFrame(values, index=pd.DatetimeIndex(timestamps), columns=axes)
+        window_means_df = indexed.resample(f"{int(window_hours * 60)}min").mean()
+        for axis in axes:
+            patterns.extend(self._drift_patterns(
+                window_means_df[axis], float(baselines[axis]), window_hours,
+                self.drift_threshold_pct, self.drift_min_duration_h, axis=axis,
+            ))
+
+        # 진동: 모든 축의 롤링 표준편차를 한 번에 계산
+        window_size = self._vibration_window_size(ts_ns)
+        global_stds = frame.std().to_numpy()
+        thresholds = global_stds * self.vibration_std_multiplier
+        std_flat = rolling_std(values, window_size, min_periods=window_size // 2).T.ravel()
+        segments = find_segments(std_flat > np.repeat(thresholds, n), max_gap=window_size, column_length=n)
+        cols, start_rows = np.divmod(segments.starts, n)
+        durations_s = (ts_ns[segments.ends % n] - ts_ns[start_rows]) / 1e9
+        max_stds = segments.reduce(std_flat, "max")
+        mean_stds = segments.reduce(std_flat, "mean")
+        for i in range(len(segments)):
+            j = cols[i]
+            patterns.append(self._vibration_pattern(
+                axes[j], timestamps.iloc[start_rows[i]], float(durations_s[i]),
+                float(global_stds[j]), float(max_stds[i]), float(mean_stds[i]), float(thresholds[j]),
+            ))
+
+        logger.info(f"다축 패턴 감지 ({', '.join(axes)}): {len(patterns)}개")
+        return patterns
+
+    def stream(self, axis: str = "Fz", **kwargs):
+        """스트리밍(청크 단위) 감지기 생성
+
+        Args:
+            axis: 분석할 축
+            **kwargs: StreamingPatternDetector 옵션 (reference_baseline, reference_std)
+
+        Returns:
+            StreamingPatternDetector (설정/패턴 ID 카운터 공유)
+        """
+        from .streaming_detector import StreamingPatternDetector
+
+        return StreamingPatternDetector(self, axis=axis, **kwargs)
+
+    @pinned_config
+    def detect_incremental(
+        self,
+        checkpoint,
+        axis: str = "Fz",
+        chunk_size: Optional[int] = None,
+        **stream_kwargs
+    ) -> List[DetectedPattern]:
+        """워터마크 이후 샘플만 감지 (증분 감지)
+
+        체크포인트의 열린 구간 상태를 복원해 워터마크 이후 샘플을 청크 단위로 입력하고,
+        갱신된 상태를 체크포인트에 반영합니다 (파일 저장은 checkpoint.save()).
+        열린 구간은 닫히지 않은 채 다음 실행으로 이어집니다.
+
+        체크포인트가 없는 첫 실행은 배치 감지(detect)와 같은 전체 구간 평균/표준편차를
+        드리프트 baseline/진동 기준 표준편차로 고정하므로 배치 결과와 같은 패턴을 내고,
+        배치 결과에 병합해도 중복되지 않습니다. 기준 통계는 체크포인트에 저장되어
+        이후 실행에서도 유지됩니다 (reference_baseline/reference_std로 직접 지정 가능).
+
+        Args:
+            checkpoint: DetectionCheckpoint
+            axis: 분석할 축
+            chunk_size: 스트리밍 입력 청크 크기 (기본: INCREMENTAL_CHUNK_SIZE)
+            **stream_kwargs: StreamingPatternDetector 옵션
+
+        Returns:
+            이번 실행에서 새로 확정된 패턴 목록
+        """
+        chunk_size = chunk_size or self.INCREMENTAL_CHUNK_SIZE
+        stream = self.stream(axis, **stream_kwargs)
+
+        state = checkpoint.get_state(axis)
+        watermark = None
+        if state is not None:
+            stream.load_state(state)
+            watermark = stream.last_timestamp
+        else:
+            self._seed_reference_stats(stream, axis)
+
+        # 워터마크 이후 샘플만 조회 (분할 데이터셋이면 해당 파티션만 읽음)
+        data = self._store.get_data(start=watermark)
+        if watermark is not None and len(data):
+            data = data[data["timestamp"] > watermark]
+
+        patterns = []
+        for start in range(0, len(data), chunk_size):
+            patterns.extend(stream.feed(data.iloc[start:start + chunk_size]))
+
+        checkpoint.update(axis, stream)
+        logger.info(
+            f"증분 감지 ({axis}): {len(data)}개 샘플, 패턴 {len(patterns)}개 "
+            f"(워터마크 {watermark} → {stream.last_timestamp})"
+        )
+        return patterns
+
+    def _seed_reference_stats(self, stream, axis: str) -> None:
+        """지정되지 않은 스트리밍 기준 통계를 전체 구간 평균/표준편차로 설정 (배치 감지와 동일)"""
+        if stream.reference_baseline is not None and stream.reference_std is not None:
+            return
+        values = pd.Series(self._store.get_axis_values(axis))
+        if len(values) == 0:
+            return
+        if stream.reference_baseline is None:
+            stream.reference_baseline = float(values.mean())
+        if stream.reference_std is None:
+            stream.reference_std = float(values.std())
+
+    def merge_patterns(
+        self,
+        existing: List[DetectedPattern],
+        new: List[DetectedPattern]
+    ) -> List[DetectedPattern]:
+        """패턴 멱등 병합
+
+        (패턴 타입, 시각, 축)이 같은 패턴은 기존 것을 유지하고,
+        새 패턴에는 기존 최대 ID 다음 번호부터 ID를 다시 매깁니다.
+        같은 구간을 다시 감지해도 결과가 중복되지 않습니다.
+
+        Args:
+            existing: 저장되어 있던 패턴 목록
+            new: 새로 감지한 패턴 목록
+
+        Returns:
+            병합된 패턴 목록 (기존 순서 + 새 패턴)
+        """
+        merged = list(existing)
+        seen = {self._pattern_key(p) for p in existing}
+        counter = max((self._pattern_number(p.pattern_id) for p in existing), default=0)
+
+        added = 0
+        for pattern in new:
+            key = self._pattern_key(pattern)
+            if key in seen:
+                continue
+            seen.add(key)
+            counter += 1
+            added += 1
+            merged.append(dataclasses.replace(pattern, pattern_id=f"PAT-{counter:03d}"))
+
+        self._pattern_counter = max(self._pattern_counter, counter)
+        logger.info(f"패턴 병합: 기존 {len(existing)}개 + 신규 {added}개 (중복 {len(new) - added}개 제외)")
+        return merged
+
+    @pinned_config
     def detect_all(
         self,
         axis: str = "Fz",
@@ -222,6 +523,7 @@ class PatternDetector:
         logger.info(f"총 {len(patterns)}개 패턴 로드/감지")
         return patterns
 
+    @pinned_config
     def detect_collision(
         self,
         axis: str = "Fz",
@@ -241,50 +543,35 @@ class PatternDetector:
         threshold = threshold or self.collision_threshold
         data = self._store.data
 
-        # 임계값 미만 데이터 찾기
-        collision_mask = data[axis] < threshold
-        collision_indices = data[collision_mask].index.tolist()
+        # 임계값 미만 연속 구간
+        values = data[axis].to_numpy()
+        segments = find_segments(values < threshold)
 
-        if not collision_indices:
+        if not len(segments):
             return []
 
-        # 연속 구간 그룹핑
-        groups = self._group_continuous_indices(collision_indices)
+        # 피크 주변 baseline (±5초, 임계값 초과 샘플 평균)을 한 번에 계산
+        peak_positions = segments.argmin(values)
+        ts_ns = self._timestamps_ns(data)
+        baselines = window_means(
+            ts_ns, values, values > threshold,
+            centers_ns=ts_ns[peak_positions],
+            half_window_ns=self.COLLISION_BASELINE_WINDOW_NS,
+        )
+        timestamps = data["timestamp"]
         patterns = []
 
-        for group in groups:
-            group_data = data.loc[group]
-            peak_idx = group_data[axis].idxmin()
-            peak_row = data.loc[peak_idx]
-
-            # 피크 주변 baseline 계산 (±5초)
-            timestamp = peak_row["timestamp"]
-            window = self._store.get_window(timestamp, window_seconds=5.0)
-            baseline_data = window[window[axis] > threshold]
-            baseline = baseline_data[axis].mean() if len(baseline_data) > 0 else 0
-
-            peak_value = float(peak_row[axis])
-            deviation = abs(peak_value - baseline)
-
-            pattern = DetectedPattern(
-                pattern_id=self._generate_pattern_id(),
-                pattern_type=PatternType.COLLISION,
-                timestamp=timestamp,
-                duration_ms=0,  # 순간 이벤트
-                confidence=1.0,
-                metrics={
-                    "peak_axis": axis,
-                    "peak_value": peak_value,
-                    "baseline": baseline,
-                    "deviation": deviation,
-                },
-                related_error_codes=DEFAULT_ERROR_MAPPING[PatternType.COLLISION].copy(),
-            )
+        for peak_pos, baseline in zip(peak_positions, baselines):
+            timestamp = timestamps.iloc[peak_pos]
+            baseline = float(baseline)
+            peak_value = float(values[peak_pos])
+            pattern = self._collision_pattern(axis, timestamp, peak_value, baseline)
             patterns.append(pattern)
 
         logger.info(f"충돌 패턴 {len(patterns)}개 감지")
         return patterns
 
+    @pinned_config
     def detect_overload(
         self,
         axis: str = "Fz",
@@ -307,51 +594,33 @@ class PatternDetector:
         min_duration_s = min_duration_s or self.overload_min_duration_s
         data = self._store.data
 
-        # 절대값이 임계값 초과하는 데이터
-        overload_mask = data[axis].abs() > threshold
-        overload_indices = data[overload_mask].index.tolist()
+        # 절대값이 임계값 초과하는 연속 구간
+        abs_values = np.abs(data[axis].to_numpy())
+        segments = find_segments(abs_values > threshold)
 
-        if not overload_indices:
+        if not len(segments):
             return []
 
-        # 연속 구간 그룹핑
-        groups = self._group_continuous_indices(overload_indices)
+        # 구간별 지속 시간/집계 (세그먼트 단위 벡터 연산)
+        ts_ns = self._timestamps_ns(data)
+        durations_s = segments.durations_ns(ts_ns) / 1e9
+        max_values = segments.reduce(abs_values, "max")
+        mean_values = segments.reduce(abs_values, "mean")
+        timestamps = data["timestamp"]
         patterns = []
 
-        for group in groups:
-            group_data = data.loc[group]
-
-            # 지속 시간 계산
-            start_time = group_data["timestamp"].min()
-            end_time = group_data["timestamp"].max()
-            duration_s = (end_time - start_time).total_seconds()
-
-            # 최소 지속 시간 필터
-            if duration_s < min_duration_s:
-                continue
-
-            max_value = float(group_data[axis].abs().max())
-            mean_value = float(group_data[axis].abs().mean())
-
-            pattern = DetectedPattern(
-                pattern_id=self._generate_pattern_id(),
-                pattern_type=PatternType.OVERLOAD,
-                timestamp=start_time,
-                duration_ms=int(duration_s * 1000),
-                confidence=1.0,
-                metrics={
-                    "axis": axis,
-                    "max_value": max_value,
-                    "mean_value": mean_value,
-                    "duration_s": duration_s,
-                },
-                related_error_codes=DEFAULT_ERROR_MAPPING[PatternType.OVERLOAD].copy(),
-            )
+        for i in np.flatnonzero(durations_s >= min_duration_s):
+            start_time = timestamps.iloc[segments.starts[i]]
+            duration_s = float(durations_s[i])
+            max_value = float(max_values[i])
+            mean_value = float(mean_values[i])
+            pattern = self._overload_pattern(axis, start_time, duration_s, max_value, mean_value)
             patterns.append(pattern)
 
         logger.info(f"과부하 패턴 {len(patterns)}개 감지")
         return patterns
 
+    @pinned_config
     def detect_drift(
         self,
         axis: str = "Fz",
@@ -387,117 +656,14 @@ class PatternDetector:
         window_str = f"{int(window_hours * 60)}min"  # 분 단위
         rolling_mean = data_indexed[axis].resample(window_str).mean()
 
-        # baseline이 0에 가까우면 절대값 기반 감지로 전환
-        use_absolute_mode = abs(baseline) < self.DRIFT_BASELINE_EPSILON
-
-        if use_absolute_mode:
-            logger.info(f"드리프트 감지: 절대값 모드 (baseline={baseline:.4f}, 임계값={self.DRIFT_ABSOLUTE_THRESHOLD}N)")
-            # 절대값 기반: rolling_mean이 절대 임계값을 초과하는지 확인
-            deviation_abs = (rolling_mean - baseline).abs()
-            drift_mask = deviation_abs > self.DRIFT_ABSOLUTE_THRESHOLD
-            # deviation_pct는 참고용으로 계산 (baseline=0 방지)
-            deviation_pct = deviation_abs  # 절대값 모드에서는 절대값을 저장
-        else:
-            # 퍼센트 기반: baseline 대비 변화율
-            deviation_pct = ((rolling_mean - baseline) / abs(baseline)) * 100
-            drift_mask = deviation_pct.abs() > threshold_pct
-
-        drift_times = deviation_pct[drift_mask].index.tolist()
-
-        if not drift_times:
-            return []
-
-        # 연속 구간 그룹핑 (시간 기반)
-        patterns = []
-        current_group_start = None
-        current_group_end = None
-        group_deviations = []
-
-        for i, ts in enumerate(drift_times):
-            if current_group_start is None:
-                current_group_start = ts
-                current_group_end = ts
-                group_deviations = [deviation_pct[ts]]
-            else:
-                # 연속 여부 판단 (2배 윈도우 이내)
-                gap = (ts - current_group_end).total_seconds() / 3600
-                if gap <= window_hours * 2:
-                    current_group_end = ts
-                    group_deviations.append(deviation_pct[ts])
-                else:
-                    # 이전 그룹 저장
-                    duration_h = (current_group_end - current_group_start).total_seconds() / 3600
-                    if duration_h >= min_duration_h:
-                        avg_deviation = np.mean(group_deviations)
-
-                        if use_absolute_mode:
-                            # 절대값 모드: drift_amount = avg_deviation (이미 절대값)
-                            drift_amount = avg_deviation
-                            confidence = min(1.0, avg_deviation / self.DRIFT_ABSOLUTE_THRESHOLD * 0.5 + 0.5)
-                            deviation_pct_value = 0.0  # 퍼센트 의미 없음
-                        else:
-                            # 퍼센트 모드
-                            drift_amount = avg_deviation * abs(baseline) / 100
-                            confidence = min(1.0, abs(avg_deviation) / threshold_pct * 0.5 + 0.5)
-                            deviation_pct_value = abs(avg_deviation)
-
-                        pattern = DetectedPattern(
-                            pattern_id=self._generate_pattern_id(),
-                            pattern_type=PatternType.DRIFT,
-                            timestamp=current_group_start,
-                            duration_ms=int(duration_h * 3600 * 1000),
-                            confidence=confidence,
-                            metrics={
-                                "baseline": baseline,
-                                "drift_amount": drift_amount,
-                                "deviation_pct": deviation_pct_value,
-                                "duration_hours": duration_h,
-                                "detection_mode": "absolute" if use_absolute_mode else "percentage",
-                            },
-                        )
-                        patterns.append(pattern)
-
-                    # 새 그룹 시작
-                    current_group_start = ts
-                    current_group_end = ts
-                    group_deviations = [deviation_pct[ts]]
-
-        # 마지막 그룹 처리
-        if current_group_start is not None:
-            duration_h = (current_group_end - current_group_start).total_seconds() / 3600
-            if duration_h >= min_duration_h:
-                avg_deviation = np.mean(group_deviations)
-
-                if use_absolute_mode:
-                    # 절대값 모드
-                    drift_amount = avg_deviation
-                    confidence = min(1.0, avg_deviation / self.DRIFT_ABSOLUTE_THRESHOLD * 0.5 + 0.5)
-                    deviation_pct_value = 0.0
-                else:
-                    # 퍼센트 모드
-                    drift_amount = avg_deviation * abs(baseline) / 100
-                    confidence = min(1.0, abs(avg_deviation) / threshold_pct * 0.5 + 0.5)
-                    deviation_pct_value = abs(avg_deviation)
-
-                pattern = DetectedPattern(
-                    pattern_id=self._generate_pattern_id(),
-                    pattern_type=PatternType.DRIFT,
-                    timestamp=current_group_start,
-                    duration_ms=int(duration_h * 3600 * 1000),
-                    confidence=confidence,
-                    metrics={
-                        "baseline": baseline,
-                        "drift_amount": drift_amount,
-                        "deviation_pct": deviation_pct_value,
-                        "duration_hours": duration_h,
-                        "detection_mode": "absolute" if use_absolute_mode else "percentage",
-                    },
-                )
-                patterns.append(pattern)
+        patterns = self._drift_patterns(
+            rolling_mean, baseline, window_hours, threshold_pct, min_duration_h, axis=axis
+        )
 
         logger.info(f"드리프트 패턴 {len(patterns)}개 감지")
         return patterns
 
+    @pinned_config
     def detect_vibration(
         self,
         axis: str = "Fz",
@@ -524,79 +690,130 @@ class PatternDetector:
         # 전체 표준편차
         global_std = float(data[axis].std())
 
-        # Rolling 표준편차 계산
-        # 125Hz 샘플링 기준 윈도우 크기
-        window_size = int(window_seconds * 125)
-        rolling_std = data[axis].rolling(window=window_size, min_periods=window_size // 2).std()
+        # Rolling 표준편차 계산 (윈도우 크기는 타임스탬프의 샘플링 주기 기준)
+        ts_ns = self._timestamps_ns(data)
+        window_size = self._vibration_window_size(ts_ns, window_seconds)
+        std_values = rolling_std(data[axis].to_numpy(dtype=np.float64), window_size, min_periods=window_size // 2)
 
         # 임계값 초과 구간
         threshold = global_std * std_multiplier
-        vibration_mask = rolling_std > threshold
-        vibration_indices = data[vibration_mask].index.tolist()
+        segments = find_segments(std_values > threshold, max_gap=window_size)
 
-        if not vibration_indices:
+        if not len(segments):
             return []
 
-        # 연속 구간 그룹핑
-        groups = self._group_continuous_indices(vibration_indices, max_gap=window_size)
+        # 구간별 지속 시간/집계 (세그먼트 단위 벡터 연산)
+        durations_s = segments.durations_ns(ts_ns) / 1e9
+        max_stds = segments.reduce(std_values, "max")
+        mean_stds = segments.reduce(std_values, "mean")
+        timestamps = data["timestamp"]
         patterns = []
 
-        for group in groups:
-            group_data = data.loc[group]
-
-            start_time = group_data["timestamp"].min()
-            end_time = group_data["timestamp"].max()
-            duration_s = (end_time - start_time).total_seconds()
-
-            max_std = float(rolling_std.loc[group].max())
-            mean_std = float(rolling_std.loc[group].mean())
-
-            pattern = DetectedPattern(
-                pattern_id=self._generate_pattern_id(),
-                pattern_type=PatternType.VIBRATION,
-                timestamp=start_time,
-                duration_ms=int(duration_s * 1000),
-                confidence=min(1.0, mean_std / threshold),
-                metrics={
-                    "axis": axis,
-                    "global_std": global_std,
-                    "max_std": max_std,
-                    "mean_std": mean_std,
-                    "std_multiplier": max_std / global_std,
-                    "duration_s": duration_s,
-                },
+        for i in range(len(segments)):
+            start_time = timestamps.iloc[segments.starts[i]]
+            duration_s = float(durations_s[i])
+            max_std = float(max_stds[i])
+            mean_std = float(mean_stds[i])
+            pattern = self._vibration_pattern(
+                axis, start_time, duration_s, global_std, max_std, mean_std, threshold
             )
             patterns.append(pattern)
 
         logger.info(f"진동 패턴 {len(patterns)}개 감지")
         return patterns
 
+    @pinned_config
+    def detect_spectral_vibration(
+        self,
+        axes: Optional[List[str]] = None,
+        df: Optional[pd.DataFrame] = None
+    ) -> List[DetectedPattern]:
+        """스펙트럼(STFT) 진동 패턴 감지
+
+        여러 축을 scipy.signal.stft 한 번으로 변환해 설정된 주파수 대역의
+        프레임별 에너지를 구하고, 축·대역별 중앙값 대비 energy_ratio배 이상인
+        연속 프레임 구간을 진동으로 감지합니다. 모든 (축, 대역) 시계열의
+        구간 분할도 한 번에 수행합니다.
+
+        Args:
+            axes: 분석할 축 목록 (기본: 설정의 spectral.axes)
+            df: 센서 데이터 DataFrame (None이면 내부 store 사용)
+
+        Returns:
+            진동 패턴 목록 (축 → 대역 → 시간 순)
+        """
+        from .spectral import band_energies
+
+        config = self.spectral_config
+        axes = list(axes or config["axes"])
+        data = df if df is not None else self._store.data
+        if len(data) < 2:
+            return []
+
+        ts_ns = self._timestamps_ns(data)
+        sample_rate = infer_sample_rate(ts_ns, default=self.DEFAULT_SAMPLE_RATE_HZ)
+        spectrum = band_energies(
+            data[axes].to_numpy(dtype=np.float64), sample_rate, config["bands"],
+            nperseg=int(config["nperseg"]), overlap=float(config["overlap"]),
+        )
+        n_bands, n_frames = spectrum.energies.shape[1:]
+        if n_bands == 0 or n_frames == 0:
+            return []
+
+        # 축·대역별 baseline 대비 에너지 비율 → (축, 대역) 시계열을 이어 붙여 한 번에 분할
+        baselines = np.median(spectrum.energies, axis=2, keepdims=True)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ratios = np.where(baselines > 0, spectrum.energies / baselines, 0.0)
+        flat = ratios.ravel()
+        energy_ratio = float(config["energy_ratio"])
+        segments = find_segments(flat > energy_ratio, column_length=n_frames)
+        if not len(segments):
+            return []
+
+        series, first_frames = np.divmod(segments.starts, n_frames)
+        start_rows = spectrum.frame_starts[first_frames]
+        end_rows = spectrum.frame_starts[segments.ends % n_frames] + spectrum.frame_length - 1
+        durations_s = (ts_ns[end_rows] - ts_ns[start_rows]) / 1e9
+        max_ratios = segments.reduce(flat, "max")
+        mean_ratios = segments.reduce(flat, "mean")
+        peak_freqs = spectrum.peak_freqs_hz.ravel()[segments.argmax(flat)]
+        baseline_flat = baselines.ravel()
+        timestamps = data["timestamp"]
+
+        patterns = []
+        for i in np.flatnonzero(durations_s >= float(config["min_duration_s"])):
+            axis_idx, band_idx = divmod(int(series[i]), n_bands)
+            patterns.append(self._spectral_vibration_pattern(
+                axes[axis_idx], timestamps.iloc[start_rows[i]], float(durations_s[i]),
+                spectrum.bands[band_idx], spectrum.edges_hz[band_idx], float(peak_freqs[i]),
+                float(baseline_flat[series[i]]), float(max_ratios[i]), float(mean_ratios[i]),
+                energy_ratio,
+            ))
+
+        logger.info(
+            f"스펙트럼 진동 패턴 {len(patterns)}개 감지 "
+            f"({', '.join(axes)}, {sample_rate:g}Hz, 대역 {', '.join(spectrum.bands)})"
+        )
+        return patterns
+
     def load_existing_patterns(self) -> List[DetectedPattern]:
         """기존 감지 패턴 로드
 
         Returns:
-            기존 패턴 목록
+            기존 패턴 목록 (파일 순서, 저장소가 변환해 캐싱한 목록)
         """
-        if self._existing_patterns:
-            return self._existing_patterns
-
         if not self.PATTERNS_PATH.exists():
             logger.warning(f"패턴 파일 없음: {self.PATTERNS_PATH}")
             return []
 
-        with open(self.PATTERNS_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        patterns = [DetectedPattern.from_dict(p) for p in data]
+        patterns = self.repository.patterns()
+        if patterns is self._existing_patterns:
+            return patterns
         self._existing_patterns = patterns
 
         # 패턴 카운터 업데이트
         for p in patterns:
-            try:
-                num = int(p.pattern_id.split("-")[1])
-                self._pattern_counter = max(self._pattern_counter, num)
-            except (IndexError, ValueError):
-                pass
+            self._pattern_counter = max(self._pattern_counter, self._pattern_number(p.pattern_id))
 
         logger.info(f"기존 패턴 {len(patterns)}개 로드")
         return patterns
@@ -606,21 +823,13 @@ class PatternDetector:
         patterns: List[DetectedPattern],
         path: Optional[Path] = None
     ) -> None:
-        """패턴 저장
+        """패턴 저장 (patterns.save_patterns)
 
         Args:
             patterns: 저장할 패턴 목록
             path: 저장 경로 (기본: PATTERNS_PATH)
         """
-        path = path or self.PATTERNS_PATH
-        path.parent.mkdir(parents=True, exist_ok=True)
-
-        data = [p.to_dict() for p in patterns]
-
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-
-        logger.info(f"패턴 {len(patterns)}개 저장: {path}")
+        save_patterns(patterns, path or self.PATTERNS_PATH)
 
     def get_patterns_by_type(
         self,
@@ -631,13 +840,14 @@ class PatternDetector:
 
         Args:
             pattern_type: 패턴 타입
-            patterns: 패턴 목록 (없으면 기존 패턴 사용)
+            patterns: 패턴 목록 (없으면 기존 패턴 저장소 색인 조회, 시간순)
 
         Returns:
             필터된 패턴 목록
         """
         if patterns is None:
-            patterns = self.load_existing_patterns()
+            self.load_existing_patterns()
+            return self.repository.find_patterns(pattern_type.value)
 
         return [p for p in patterns if p.pattern_type == pattern_type]
 
@@ -652,13 +862,14 @@ class PatternDetector:
         Args:
             start: 시작 시각
             end: 종료 시각
-            patterns: 패턴 목록 (없으면 기존 패턴 사용)
+            patterns: 패턴 목록 (없으면 기존 패턴 저장소 이진 탐색, 시간순)
 
         Returns:
             필터된 패턴 목록
         """
         if patterns is None:
-            patterns = self.load_existing_patterns()
+            self.load_existing_patterns()
+            return self.repository.find_patterns(start=start, end=end)
 
         return [p for p in patterns if start <= p.timestamp <= end]
 
@@ -676,7 +887,7 @@ class PatternDetector:
         }
 
         for pt in PatternType:
-            type_patterns = self.get_patterns_by_type(pt, patterns)
+            type_patterns = self.repository.find_patterns(pt.value) if patterns else []
             if type_patterns:
                 summary["by_type"][pt.value] = {
                     "count": len(type_patterns),
@@ -690,35 +901,275 @@ class PatternDetector:
         self._pattern_counter += 1
         return f"PAT-{self._pattern_counter:03d}"
 
-    def _group_continuous_indices(
+    @staticmethod
+    def _pattern_number(pattern_id: str) -> int:
+        """패턴 ID 번호 (PAT-012 → 12, 형식이 다르면 0)"""
+        try:
+            return int(pattern_id.split("-")[1])
+        except (IndexError, ValueError):
+            return 0
+
+    @staticmethod
+    def _pattern_key(pattern: DetectedPattern) -> Tuple[str, str, Optional[str], Optional[str]]:
+        """멱등 병합 키 (타입, 시각, 축, 스펙트럼 대역)"""
+        metrics = pattern.metrics or {}
+        axis = metrics.get("axis", metrics.get("peak_axis"))
+        return (
+            pattern.pattern_type.value, pd.Timestamp(pattern.timestamp).isoformat(),
+            axis, metrics.get("band"),
+        )
+
+    def _collision_pattern(
         self,
-        indices: List[int],
-        max_gap: int = 1
-    ) -> List[List[int]]:
-        """연속 인덱스 그룹핑
+        axis: str,
+        timestamp: datetime,
+        peak_value: float,
+        baseline: float
+    ) -> DetectedPattern:
+        """충돌 패턴 생성"""
+        return DetectedPattern(
+            pattern_id=self._generate_pattern_id(),
+            pattern_type=PatternType.COLLISION,
+            timestamp=timestamp,
+            duration_ms=0,  # 순간 이벤트
+            confidence=1.0,
+            metrics={
+                "peak_axis": axis,
+                "peak_value": peak_value,
+                "baseline": baseline,
+                "deviation": abs(peak_value - baseline),
+            },
+            related_error_codes=DEFAULT_ERROR_MAPPING[PatternType.COLLISION].copy(),
+        )
+
+    def _overload_pattern(
+        self,
+        axis: str,
+        start_time: datetime,
+        duration_s: float,
+        max_value: float,
+        mean_value: float
+    ) -> DetectedPattern:
+        """과부하 패턴 생성"""
+        return DetectedPattern(
+            pattern_id=self._generate_pattern_id(),
+            pattern_type=PatternType.OVERLOAD,
+            timestamp=start_time,
+            duration_ms=int(duration_s * 1000),
+            confidence=1.0,
+            metrics={
+                "axis": axis,
+                "max_value": max_value,
+                "mean_value": mean_value,
+                "duration_s": duration_s,
+            },
+            related_error_codes=DEFAULT_ERROR_MAPPING[PatternType.OVERLOAD].copy(),
+        )
+
+    def _drift_pattern(
+        self,
+        start_time: datetime,
+        duration_h: float,
+        avg_deviation: float,
+        baseline: float,
+        use_absolute_mode: bool,
+        threshold_pct: float,
+        axis: str
+    ) -> DetectedPattern:
+        """드리프트 패턴 생성
 
         Args:
-            indices: 인덱스 목록
-            max_gap: 최대 허용 갭
+            start_time: 그룹 시작 윈도우 시각
+            duration_h: 지속 시간 (시간)
+            avg_deviation: 그룹 평균 편차 (절대값 모드: N, 퍼센트 모드: %)
+            baseline: 기준값
+            use_absolute_mode: 절대값 모드 여부
+            threshold_pct: 변화율 임계값 (%)
+            axis: 축 태그 (metrics["axis"])
+        """
+        if use_absolute_mode:
+            # 절대값 모드: drift_amount = avg_deviation (이미 절대값)
+            drift_amount = avg_deviation
+            confidence = min(1.0, avg_deviation / self.DRIFT_ABSOLUTE_THRESHOLD * 0.5 + 0.5)
+            deviation_pct_value = 0.0  # 퍼센트 의미 없음
+        else:
+            # 퍼센트 모드
+            drift_amount = avg_deviation * abs(baseline) / 100
+            confidence = min(1.0, abs(avg_deviation) / threshold_pct * 0.5 + 0.5)
+            deviation_pct_value = abs(avg_deviation)
+
+        metrics = {
+            "baseline": baseline,
+            "drift_amount": drift_amount,
+            "deviation_pct": deviation_pct_value,
+            "duration_hours": duration_h,
+            "detection_mode": "absolute" if use_absolute_mode else "percentage",
+            "axis": axis,
+        }
+
+        return DetectedPattern(
+            pattern_id=self._generate_pattern_id(),
+            pattern_type=PatternType.DRIFT,
+            timestamp=start_time,
+            duration_ms=int(duration_h * 3600 * 1000),
+            confidence=confidence,
+            metrics=metrics,
+        )
+
+    def _drift_patterns(
+        self,
+        rolling_mean: pd.Series,
+        baseline: float,
+        window_hours: float,
+        threshold_pct: float,
+        min_duration_h: float,
+        axis: str
+    ) -> List[DetectedPattern]:
+        """윈도우 평균 시계열에서 드리프트 구간 그룹핑
+
+        Args:
+            rolling_mean: 시간 윈도우별 평균 (resample 결과)
+            baseline: 기준값
+            window_hours: 윈도우 (시간)
+            threshold_pct: 변화율 임계값 (%)
+            min_duration_h: 최소 지속 시간 (시간)
+            axis: 축 태그 (metrics["axis"])
 
         Returns:
-            그룹 목록
+            드리프트 패턴 목록
         """
-        if not indices:
+        # baseline이 0에 가까우면 절대값 기반 감지로 전환
+        use_absolute_mode = abs(baseline) < self.DRIFT_BASELINE_EPSILON
+
+        if use_absolute_mode:
+            logger.info(f"드리프트 감지: 절대값 모드 (baseline={baseline:.4f}, 임계값={self.DRIFT_ABSOLUTE_THRESHOLD}N)")
+            # 절대값 기반: rolling_mean이 절대 임계값을 초과하는지 확인
+            deviation_abs = (rolling_mean - baseline).abs()
+            drift_mask = deviation_abs > self.DRIFT_ABSOLUTE_THRESHOLD
+            # deviation_pct는 참고용으로 계산 (baseline=0 방지)
+            deviation_pct = deviation_abs  # 절대값 모드에서는 절대값을 저장
+        else:
+            # 퍼센트 기반: baseline 대비 변화율
+            deviation_pct = ((rolling_mean - baseline) / abs(baseline)) * 100
+            drift_mask = deviation_pct.abs() > threshold_pct
+
+        drift_times = deviation_pct[drift_mask].index.tolist()
+
+        if not drift_times:
             return []
 
-        groups = []
-        current_group = [indices[0]]
+        # 연속 구간 그룹핑 (시간 기반)
+        patterns = []
+        current_group_start = None
+        current_group_end = None
+        group_deviations = []
 
-        for idx in indices[1:]:
-            if idx - current_group[-1] <= max_gap:
-                current_group.append(idx)
+        for i, ts in enumerate(drift_times):
+            if current_group_start is None:
+                current_group_start = ts
+                current_group_end = ts
+                group_deviations = [deviation_pct[ts]]
             else:
-                groups.append(current_group)
-                current_group = [idx]
+                # 연속 여부 판단 (2배 윈도우 이내)
+                gap = (ts - current_group_end).total_seconds() / 3600
+                if gap <= window_hours * 2:
+                    current_group_end = ts
+                    group_deviations.append(deviation_pct[ts])
+                else:
+                    # 이전 그룹 저장
+                    duration_h = (current_group_end - current_group_start).total_seconds() / 3600
+                    if duration_h >= min_duration_h:
+                        patterns.append(self._drift_pattern(
+                            current_group_start, duration_h, np.mean(group_deviations),
+                            baseline, use_absolute_mode, threshold_pct, axis,
+                        ))
+
+                    # 새 그룹 시작
+                    current_group_start = ts
+                    current_group_end = ts
+                    group_deviations = [deviation_pct[ts]]
+
+        # 마지막 그룹 처리
+        if current_group_start is not None:
+            duration_h = (current_group_end - current_group_start).total_seconds() / 3600
+            if duration_h >= min_duration_h:
+                patterns.append(self._drift_pattern(
+                    current_group_start, duration_h, np.mean(group_deviations),
+                    baseline, use_absolute_mode, threshold_pct, axis,
+                ))
+
+        return patterns
+
+    def _vibration_pattern(
+        self,
+        axis: str,
+        start_time: datetime,
+        duration_s: float,
+        global_std: float,
+        max_std: float,
+        mean_std: float,
+        threshold: float
+    ) -> DetectedPattern:
+        """진동 패턴 생성"""
+        return DetectedPattern(
+            pattern_id=self._generate_pattern_id(),
+            pattern_type=PatternType.VIBRATION,
+            timestamp=start_time,
+            duration_ms=int(duration_s * 1000),
+            confidence=min(1.0, mean_std / threshold),
+            metrics={
+                "axis": axis,
+                "global_std": global_std,
+                "max_std": max_std,
+                "mean_std": mean_std,
+                "std_multiplier": max_std / global_std,
+                "duration_s": duration_s,
+            },
+        )
+
+    def _vibration_window_size(self, ts_ns: np.ndarray, window_seconds: Optional[float] = None) -> int:
+        """진동 롤링 윈도우 샘플 수 (타임스탬프로 추정한 샘플링 주기 기준)"""
+        sample_rate = infer_sample_rate(ts_ns, default=self.DEFAULT_SAMPLE_RATE_HZ)
+        return window_samples(window_seconds or self.vibration_window_seconds, sample_rate)
+
+    def _spectral_vibration_pattern(
+        self,
+        axis: str,
+        start_time: datetime,
+        duration_s: float,
+        band: str,
+        edges_hz: Tuple[float, float],
+        peak_freq_hz: float,
+        baseline_energy: float,
+        max_ratio: float,
+        mean_ratio: float,
+        energy_ratio: float
+    ) -> DetectedPattern:
+        """스펙트럼 진동 패턴 생성"""
+        return DetectedPattern(
+            pattern_id=self._generate_pattern_id(),
+            pattern_type=PatternType.VIBRATION,
+            timestamp=start_time,
+            duration_ms=int(duration_s * 1000),
+            confidence=min(1.0, mean_ratio / energy_ratio),
+            metrics={
+                "axis": axis,
+                "method": "stft",
+                "band": band,
+                "band_low_hz": edges_hz[0],
+                "band_high_hz": edges_hz[1],
+                "peak_freq_hz": peak_freq_hz,
+                "baseline_energy": baseline_energy,
+                "max_energy_ratio": max_ratio,
+                "mean_energy_ratio": mean_ratio,
+                "duration_s": duration_s,
+            },
+        )
 
-        groups.append(current_group)
-        return groups
+    @staticmethod
+    def _timestamps_ns(data: pd.DataFrame) -> np.ndarray:
+        """타임스탬프 int64(ns) 배열"""
+        return data["timestamp"].to_numpy(dtype="datetime64[ns]").view("int64")
 
 
 # 편의 함수
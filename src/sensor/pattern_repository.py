@@ -0,0 +1,325 @@
+"""
+감지 패턴 저장소
+
+detected_patterns.json 패턴 로그를 한 번 읽어 색인합니다.
+- 타입별 시간순 위치/타임스탬프(int64 ns) 배열 → 범위 조회는 이진 탐색 O(log n)
+- 타입별 건수, 최신 패턴, 전체 기간은 색인 시 미리 계산 → O(1)
+
+PatternDetector, OntologyEngine, /api/sensors 라우트가 get_pattern_repository()로
+같은 인스턴스를 공유하며, 파일이 바뀌면(mtime/크기) 다음 조회 때 다시 색인합니다.
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .patterns import DetectedPattern
+
+logger = logging.getLogger(__name__)
+
+# 타임스탬프가 없거나 해석할 수 없는 패턴의 정렬 키 (가장 앞)
+_MISSING_NS = np.iinfo(np.int64).min
+
+TimeBound = Union[str, datetime, pd.Timestamp, None]
+
+
+def record_timestamp(record: Dict[str, Any]) -> str:
+    """패턴 레코드의 타임스탬프 문자열 (timestamp → start_time → time, 없으면 "")"""
+    return str(record.get("timestamp") or record.get("start_time") or record.get("time") or "")
+
+
+def record_type(record: Dict[str, Any]) -> str:
+    """패턴 레코드의 타입 (소문자)"""
+    return str(record.get("pattern_type") or record.get("type") or "").lower()
+
+
+@dataclass
+class _Index:
+    """패턴 로그 색인 (교체 단위로 사용, 생성 후 변경하지 않음 - DetectedPattern 캐시 제외)"""
+
+    records: List[Dict[str, Any]]
+    order: np.ndarray                                   # 시간순 위치
+    sorted_ns: np.ndarray                               # 시간순 타임스탬프
+    type_order: Dict[str, np.ndarray] = field(default_factory=dict)
+    type_ns: Dict[str, np.ndarray] = field(default_factory=dict)
+    id_positions: Dict[str, np.ndarray] = field(default_factory=dict)
+    type_rank: Dict[str, int] = field(default_factory=dict)    # 최신 감지 순위
+    time_range: Tuple[str, str] = ("", "")
+    # 이 색인의 레코드로 만든 DetectedPattern (최초 조회 시 변환)
+    _patterns: Optional[List[DetectedPattern]] = field(default=None, repr=False)
+
+    def patterns(self) -> List[DetectedPattern]:
+        """DetectedPattern 목록 (레코드 순서, 색인별로 캐싱)"""
+        if self._patterns is None:
+            self._patterns = [DetectedPattern.from_dict(r) for r in self.records]
+        return self._patterns
+
+
+def _build_index(records: List[Dict[str, Any]]) -> _Index:
+    timestamps = [record_timestamp(r) for r in records]
+    parsed = pd.to_datetime(pd.Series(timestamps, dtype=object), errors="coerce", format="ISO8601")
+    ts_ns = np.where(parsed.isna().to_numpy(), _MISSING_NS, parsed.to_numpy(dtype="datetime64[ns]").view("int64"))
+
+    order = np.argsort(ts_ns, kind="stable")
+    sorted_ns = ts_ns[order]
+    types = np.array([record_type(r) for r in records], dtype=object)
+    sorted_types = types[order]
+
+    type_order, type_ns, latest_ns = {}, {}, {}
+    for ptype in dict.fromkeys(sorted_types):
+        keep = sorted_types == ptype
+        type_order[ptype] = order[keep]
+        type_ns[ptype] = sorted_ns[keep]
+        latest_ns[ptype] = type_ns[ptype][-1]
+
+    ids: Dict[str, List[int]] = {}
+    for position in order:
+        record = records[position]
+        pid = str(record.get("pattern_id") or record.get("id") or "").upper()
+        if pid:
+            ids.setdefault(pid, []).append(int(position))
+
+    valid = np.flatnonzero(sorted_ns != _MISSING_NS)
+    time_range = (
+        (timestamps[order[valid[0]]], timestamps[order[valid[-1]]]) if len(valid) else ("", "")
+    )
+    # 최신 감지가 앞서는 타입 순서 (동률이면 먼저 나온 타입)
+    by_latest = sorted(latest_ns, key=latest_ns.get, reverse=True)
+    return _Index(
+        records=records,
+        order=order,
+        sorted_ns=sorted_ns,
+        type_order=type_order,
+        type_ns=type_ns,
+        id_positions={k: np.asarray(v, dtype=np.int64) for k, v in ids.items()},
+        type_rank={t: i for i, t in enumerate(by_latest)},
+        time_range=time_range,
+    )
+
+
+def _bound_ns(value: TimeBound) -> Optional[int]:
+    if value is None:
+        return None
+    return int(pd.Timestamp(value).value)
+
+
+class PatternRepository:
+    """색인된 감지 패턴 로그"""
+
+    def __init__(self, records: Optional[List[Dict[str, Any]]] = None, path: Optional[Path] = None):
+        """초기화
+
+        Args:
+            records: 패턴 레코드 목록 (DetectedPattern.to_dict() 형식)
+            path: 원본 파일 경로 (refresh()로 변경 감지)
+        """
+        self.path = Path(path) if path is not None else None
+        self._source: Optional[Tuple[int, int]] = None
+        self._index = _build_index(list(records or []))
+
+    @classmethod
+    def load(cls, path: Path) -> "PatternRepository":
+        """패턴 파일에서 생성 (파일이 없거나 읽을 수 없으면 빈 저장소)"""
+        repository = cls(path=path)
+        repository.refresh()
+        return repository
+
+    def refresh(self) -> bool:
+        """원본 파일이 바뀌었으면 다시 읽고 색인
+
+        Returns:
+            다시 색인했으면 True
+        """
+        if self.path is None:
+            return False
+        try:
+            stat = os.stat(self.path)
+            source = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            source = None
+        if source == self._source:
+            return False
+
+        records: List[Dict[str, Any]] = []
+        if source is not None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                records = data if isinstance(data, list) else []
+            except Exception as e:
+                logger.warning(f"패턴 로그 로드 실패: {self.path} ({e})")
+        self._source = source
+        self.replace(records)
+        logger.info(f"패턴 저장소 색인: {len(records)}개 ({self.path})")
+        return True
+
+    def replace(self, records: List[Dict[str, Any]]) -> None:
+        """레코드 전체 교체 (새 색인을 만든 뒤 한 번에 교체)
+
+        DetectedPattern 캐시도 색인에 속하므로 참조 교체 한 번으로 함께 바뀝니다.
+        """
+        self._index = _build_index(list(records))
+
+    # ============================================================
+    # 조회
+    # ============================================================
+
+    def __len__(self) -> int:
+        return len(self._index.records)
+
+    @property
+    def records(self) -> List[Dict[str, Any]]:
+        """패턴 레코드 (파일 순서)"""
+        return self._index.records
+
+    @property
+    def types(self) -> List[str]:
+        """패턴 타입 목록 (최근 감지 순)"""
+        return sorted(self._index.type_rank, key=self._index.type_rank.get)
+
+    def patterns(self) -> List[DetectedPattern]:
+        """DetectedPattern 목록 (파일 순서, 최초 호출 시 변환 후 캐싱)"""
+        return self._index.patterns()
+
+    def count(self, pattern_type: Optional[str] = None) -> int:
+        """건수 (타입 지정 시 해당 타입)"""
+        if pattern_type is None:
+            return len(self._index.records)
+        return len(self._index.type_order.get(pattern_type.lower(), ()))
+
+    def type_counts(self) -> Dict[str, int]:
+        """타입별 건수 (최근 감지된 타입부터)"""
+        return {t: len(self._index.type_order[t]) for t in self.types}
+
+    def latest(self, pattern_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """가장 최근 패턴 레코드 (없으면 None)"""
+        order = self._order(pattern_type)
+        return self._index.records[order[-1]] if len(order) else None
+
+    def time_range(self) -> Tuple[str, str]:
+        """전체 패턴 기간 (첫/마지막 타임스탬프 문자열, 없으면 빈 문자열)"""
+        return self._index.time_range
+
+    def select(
+        self,
+        pattern_type: Optional[str] = None,
+        start: TimeBound = None,
+        end: TimeBound = None,
+        pattern_id: Optional[str] = None
+    ) -> np.ndarray:
+        """조건에 맞는 레코드 위치 (시간순)
+
+        Args:
+            pattern_type: 패턴 타입 (None이면 전체)
+            start: 시작 시각 (포함, None이면 제한 없음)
+            end: 종료 시각 (포함, None이면 제한 없음)
+            pattern_id: 이 ID의 패턴도 포함 (타입과 OR 조건)
+
+        Returns:
+            레코드 위치 배열 (시간순)
+        """
+        return self._select(self._index, pattern_type, start, end, pattern_id)
+
+    @staticmethod
+    def _select(
+        index: _Index,
+        pattern_type: Optional[str] = None,
+        start: TimeBound = None,
+        end: TimeBound = None,
+        pattern_id: Optional[str] = None
+    ) -> np.ndarray:
+        if pattern_type is None:
+            order, ts_ns = index.order, index.sorted_ns
+        else:
+            key = pattern_type.lower()
+            order = index.type_order.get(key, np.empty(0, dtype=np.int64))
+            ts_ns = index.type_ns.get(key, np.empty(0, dtype=np.int64))
+
+        if pattern_id is not None and pattern_type is not None:
+            extra = [
+                p for p in index.id_positions.get(pattern_id.upper(), ())
+                if record_type(index.records[p]) != pattern_type.lower()
+            ]
+            if extra:
+                # ID로만 일치하는 패턴 병합 (드묾)
+                merged = np.concatenate((order, np.asarray(extra, dtype=np.int64)))
+                rank = np.empty(len(index.order), dtype=np.int64)
+                rank[index.order] = np.arange(len(index.order))
+                order = merged[np.argsort(rank[merged], kind="stable")]
+                ts_ns = index.sorted_ns[rank[order]]
+
+        if start is None and end is None:
+            return order
+        # 시간 조건이 있으면 타임스탬프 없는 패턴(맨 앞)은 제외
+        if start is None:
+            lo = np.searchsorted(ts_ns, _MISSING_NS, side="right")
+        else:
+            lo = np.searchsorted(ts_ns, _bound_ns(start), side="left")
+        hi = len(ts_ns) if end is None else np.searchsorted(ts_ns, _bound_ns(end), side="right")
+        return order[lo:max(lo, hi)]
+
+    def find(
+        self,
+        pattern_type: Optional[str] = None,
+        start: TimeBound = None,
+        end: TimeBound = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """조건에 맞는 패턴 레코드 (시간순, limit이면 가장 최근 limit개)"""
+        # 조회 도중 교체되어도 같은 색인의 위치/레코드 사용
+        index = self._index
+        positions = self._select(index, pattern_type, start, end)
+        if limit is not None:
+            positions = positions[max(len(positions) - limit, 0):] if limit > 0 else positions[:0]
+        return [index.records[p] for p in positions]
+
+    def find_patterns(
+        self,
+        pattern_type: Optional[str] = None,
+        start: TimeBound = None,
+        end: TimeBound = None
+    ) -> List[DetectedPattern]:
+        """조건에 맞는 DetectedPattern (시간순)"""
+        index = self._index
+        patterns = index.patterns()
+        return [patterns[p] for p in self._select(index, pattern_type, start, end)]
+
+    def _order(self, pattern_type: Optional[str]) -> np.ndarray:
+        if pattern_type is None:
+            return self._index.order
+        return self._index.type_order.get(pattern_type.lower(), np.empty(0, dtype=np.int64))
+
+
+# 공유 인스턴스 (경로별)
+_DEFAULT_PATH = Path(__file__).resolve().parents[2] / "data" / "sensor" / "processed" / "detected_patterns.json"
+_repositories: Dict[Path, PatternRepository] = {}
+
+
+def get_pattern_repository(path: Optional[Path] = None) -> PatternRepository:
+    """공유 패턴 저장소 (파일이 바뀌었으면 다시 색인)
+
+    Args:
+        path: 패턴 파일 경로 (기본: data/sensor/processed/detected_patterns.json)
+
+    Returns:
+        경로별로 하나인 PatternRepository
+    """
+    key = Path(path if path is not None else _DEFAULT_PATH).resolve()
+    repository = _repositories.get(key)
+    if repository is None:
+        repository = _repositories[key] = PatternRepository.load(key)
+    else:
+        repository.refresh()
+    return repository
+
+
+def reset_pattern_repository() -> None:
+    """공유 패턴 저장소 초기화"""
+    _repositories.clear()
@@ -4,11 +4,17 @@
 감지된 패턴의 데이터 클래스를 정의합니다.
 """
 
+import json
+import logging
+import os
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from pathlib import Path
 from typing import Dict, Any, List, Optional
 
+logger = logging.getLogger(__name__)
+
 
 class PatternType(Enum):
     """패턴 타입"""
@@ -90,3 +96,26 @@ DEFAULT_ERROR_MAPPING = {
     PatternType.DRIFT: [],                     # 경고 수준, 에러 코드 없음
     PatternType.VIBRATION: [],                 # 경고 수준, 에러 코드 없음
 }
+
+
+def save_patterns(patterns: List[DetectedPattern], path: Path) -> None:
+    """패턴 목록을 JSON 파일로 저장
+
+    임시 파일에 쓴 뒤 교체하므로 중단되어도 기존 파일이 유지됩니다.
+
+    Args:
+        patterns: 저장할 패턴 목록
+        path: 저장 경로
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # JSON 타입이 아닌 지표 값(numpy 스칼라, Timestamp 등)은 문자열로 저장
+    text = json.dumps([p.to_dict() for p in patterns], indent=2, ensure_ascii=False, default=str)
+
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+    logger.info(f"패턴 {len(patterns)}개 저장: {path}")
@@ -0,0 +1,194 @@
+"""
+구간 통계 엔진
+
+누적합(prefix sum)과 블록 min/max 인덱스로 임의 구간의
+mean, std, min, max, count를 O(1) ~ O(log n)에 계산합니다.
+"""
+
+import logging
+from typing import Dict, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+logger = logging.getLogger(__name__)
+
+
+class _AxisIndex:
+    """단일 축 구간 통계 인덱스"""
+
+    def __init__(self, values: ArrayLike, block_size: int):
+        values = np.asarray(values, dtype=np.float64)
+        valid = ~np.isnan(values)
+        self._has_nan = not bool(valid.all())
+
+        # 평균만큼 이동한 값으로 누적 → 분산 계산 시 상쇄 오차 감소
+        self._offset = float(values[valid].mean()) if valid.any() else 0.0
+        shifted = np.where(valid, values - self._offset, 0.0)
+
+        self._csum = np.concatenate(([0.0], np.cumsum(shifted)))
+        self._csq = np.concatenate(([0.0], np.cumsum(shifted * shifted)))
+        self._ccount = (
+            np.concatenate(([0], np.cumsum(valid, dtype=np.int64)))
+            if self._has_nan else None
+        )
+
+        self._values = values
+        self._block_size = block_size
+
+        # 블록별 min/max (NaN 무시)
+        n_blocks = len(values) // block_size
+        blocks = values[: n_blocks * block_size].reshape(n_blocks, block_size)
+        self._min_table = self._build_sparse_table(np.fmin.reduce(blocks, axis=1), np.fmin)
+        self._max_table = self._build_sparse_table(np.fmax.reduce(blocks, axis=1), np.fmax)
+
+    @staticmethod
+    def _build_sparse_table(base: np.ndarray, op) -> list:
+        """블록 단위 sparse table (level k: 2^k 블록 구간의 min/max)"""
+        table = [base]
+        span = 1
+        while span * 2 <= len(base):
+            prev = table[-1]
+            table.append(op(prev[:-span], prev[span:]))
+            span *= 2
+        return table
+
+    @staticmethod
+    def _query_sparse(table: list, lo: int, hi: int, op) -> float:
+        """블록 [lo, hi) 구간 min/max - O(1)"""
+        level = int(hi - lo).bit_length() - 1
+        return float(op(table[level][lo], table[level][hi - (1 << level)]))
+
+    def _extreme(self, lo: int, hi: int, op, table: list) -> float:
+        """원소 [lo, hi) 구간 min/max"""
+        b = self._block_size
+        block_lo = -(-lo // b)
+        block_hi = hi // b
+
+        if block_lo >= block_hi:
+            # 블록 두 개 이하 길이: 직접 스캔
+            return float(op.reduce(self._values[lo:hi]))
+
+        result = self._query_sparse(table, block_lo, block_hi, op)
+        if lo < block_lo * b:
+            result = float(op(result, op.reduce(self._values[lo:block_lo * b])))
+        if block_hi * b < hi:
+            result = float(op(result, op.reduce(self._values[block_hi * b:hi])))
+        return result
+
+    def query(self, lo: int, hi: int) -> Dict[str, float]:
+        """원소 [lo, hi) 구간 통계"""
+        count = int(self._ccount[hi] - self._ccount[lo]) if self._has_nan else hi - lo
+        if count == 0:
+            return {"mean": np.nan, "std": np.nan, "min": np.nan, "max": np.nan, "count": 0}
+
+        s = self._csum[hi] - self._csum[lo]
+        sq = self._csq[hi] - self._csq[lo]
+        mean = s / count + self._offset
+
+        # 표본 표준편차 (ddof=1, pandas 기본값과 동일)
+        if count > 1:
+            var = (sq - s * s / count) / (count - 1)
+            std = float(np.sqrt(max(var, 0.0)))
+        else:
+            std = np.nan
+
+        return {
+            "mean": float(mean),
+            "std": std,
+            "min": self._extreme(lo, hi, np.fmin, self._min_table),
+            "max": self._extreme(lo, hi, np.fmax, self._max_table),
+            "count": count,
+        }
+
+
+class RangeStatistics:
+    """축별 구간 통계 인덱스
+
+    위치 인덱스 [lo, hi) 기준으로 조회합니다.
+    시간 → 위치 변환은 SensorStore의 타임스탬프 인덱스가 담당합니다.
+    """
+
+    BLOCK_SIZE = 1024
+
+    def __init__(self, columns: Dict[str, ArrayLike], block_size: Optional[int] = None):
+        """초기화
+
+        Args:
+            columns: 축 이름 → 값 배열 (Series 등 배열 유사 객체, 축별 첫 조회 시 float64로 변환)
+            block_size: min/max 블록 크기 (기본: BLOCK_SIZE)
+        """
+        self._columns = columns
+        self._block_size = block_size or self.BLOCK_SIZE
+        self._indexes: Dict[str, _AxisIndex] = {}
+
+    def _index(self, axis: str) -> _AxisIndex:
+        """축 인덱스 (첫 조회 시 1회 구축)"""
+        index = self._indexes.get(axis)
+        if index is None:
+            index = _AxisIndex(self._columns[axis], self._block_size)
+            self._indexes[axis] = index
+            logger.debug(f"구간 통계 인덱스 구축: {axis} ({len(self._columns[axis])} 레코드)")
+        return index
+
+    def has_axis(self, axis: str) -> bool:
+        """축 존재 여부"""
+        return axis in self._columns
+
+    def query(self, axis: str, lo: int, hi: int) -> Dict[str, float]:
+        """구간 통계 조회
+
+        Args:
+            axis: 측정 축
+            lo: 시작 위치 (포함)
+            hi: 종료 위치 (미포함)
+
+        Returns:
+            통계 딕셔너리 (mean, std, min, max, count)
+        """
+        return self._index(axis).query(lo, hi)
+
+
+def window_means(
+    ts_ns: np.ndarray,
+    values: np.ndarray,
+    keep: np.ndarray,
+    centers_ns: np.ndarray,
+    half_window_ns: int,
+    default: float = 0.0,
+) -> np.ndarray:
+    """여러 시점 주변 윈도우의 조건부 평균을 한 번에 계산
+
+    keep이 True인 샘플만 누적합/개수 prefix 배열로 만든 뒤, 각 중심 시각의
+    [center - half, center + half] 구간 경계를 searchsorted로 찾아 차분합니다.
+    시점 수와 관계없이 전체 비용은 O(n + k log n)입니다.
+
+    Args:
+        ts_ns: 정렬된 타임스탬프 int64(ns)
+        values: 값 배열
+        keep: 평균에 포함할 샘플 마스크
+        centers_ns: 윈도우 중심 시각 int64(ns)
+        half_window_ns: 윈도우 반폭 (ns, 양 끝 포함)
+        default: 포함 샘플이 없는 윈도우의 값
+
+    Returns:
+        중심 시각별 평균 (len(centers_ns),)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    keep = np.asarray(keep, dtype=bool)
+    centers_ns = np.asarray(centers_ns, dtype=np.int64)
+
+    # 평균만큼 이동한 값으로 누적 → 긴 시계열에서 누적 오차 감소
+    offset = float(values[keep].mean()) if keep.any() else 0.0
+    csum = np.concatenate(([0.0], np.cumsum(np.where(keep, values - offset, 0.0))))
+    ccount = np.concatenate(([0], np.cumsum(keep, dtype=np.int64)))
+
+    lo = np.searchsorted(ts_ns, centers_ns - half_window_ns, side="left")
+    hi = np.searchsorted(ts_ns, centers_ns + half_window_ns, side="right")
+    counts = ccount[hi] - ccount[lo]
+    sums = csum[hi] - csum[lo]
+
+    means = np.full(len(centers_ns), float(default))
+    valid = counts > 0
+    means[valid] = sums[valid] / counts[valid] + offset
+    return means
@@ -0,0 +1,370 @@
+"""
+실시간 센서 링 버퍼
+
+Axia80 125Hz 실시간 샘플을 축별로 미리 할당된 NumPy 링 버퍼에 적재합니다.
+- 메모리 사용량은 생성 시 고정되며 연속 적재에도 늘어나지 않습니다.
+- 세그먼트(기본 1분)가 채워지면 즉시 디스크(parquet 또는 SQLite 시계열 DB)로 내보냅니다.
+- 읽기는 writer를 잠그지 않는 낙관적 스냅샷입니다. 복사 전후의 쓰기 카운터를
+  비교해 복사 중 덮어쓰인 구간이 있으면 다시 읽습니다.
+
+단일 writer / 다중 reader를 가정합니다.
+"""
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .data_loader import DataLoader
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RingSnapshot:
+    """링 버퍼 스냅샷 (복사본, 시간순)"""
+    ts_ns: np.ndarray                  # 타임스탬프 (int64 ns)
+    values: Dict[str, np.ndarray]      # 축별 값
+
+    def __len__(self) -> int:
+        return len(self.ts_ns)
+
+    def to_frame(self, axes: Optional[List[str]] = None) -> pd.DataFrame:
+        """DataFrame 변환 (timestamp + 축)"""
+        names = list(self.values) if axes is None else [a for a in axes if a in self.values]
+        data = {"timestamp": self.ts_ns.view("datetime64[ns]")}
+        data.update({axis: self.values[axis] for axis in names})
+        return pd.DataFrame(data, copy=False)
+
+    def statistics(self, axis: str) -> Optional[Dict[str, float]]:
+        """축 통계 (SensorStore 파티션 병합 형식)"""
+        if axis not in self.values or len(self.ts_ns) == 0:
+            return None
+        values = self.values[axis]
+        valid = values[~np.isnan(values)]
+        count = len(valid)
+        return {
+            "mean": float(valid.mean()) if count else float("nan"),
+            "std": float(valid.std(ddof=1)) if count > 1 else float("nan"),
+            "min": float(valid.min()) if count else float("nan"),
+            "max": float(valid.max()) if count else float("nan"),
+            "count": count,
+            "rows": len(values),
+            "first_ns": int(self.ts_ns[0]),
+            "last_ns": int(self.ts_ns[-1]),
+        }
+
+
+class ParquetSegmentSink:
+    """세그먼트를 parquet 파일로 내보내는 spill 대상
+
+    segment-<첫 타임스탬프 ns>.parquet 파일을 세그먼트마다 하나씩 씁니다.
+    """
+
+    def __init__(self, directory: Path):
+        """초기화
+
+        Args:
+            directory: 세그먼트 파일 디렉토리
+        """
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def directory(self) -> Path:
+        """세그먼트 디렉토리"""
+        return self._dir
+
+    def __call__(self, df: pd.DataFrame) -> None:
+        first_ns = int(df["timestamp"].iloc[0].value)
+        path = self._dir / f"segment-{first_ns}.parquet"
+        tmp_path = path.with_suffix(".parquet.tmp")
+        df.to_parquet(tmp_path, index=False)
+        tmp_path.replace(path)
+
+
+class SensorRingBuffer:
+    """축별 고정 크기 링 버퍼"""
+
+    # 기본 메모리 예산 (ts + 6축 float64 ≈ 56 bytes/샘플 → 약 1.2M 샘플, 125Hz 기준 약 2.6시간)
+    DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+
+    # 기본 세그먼트 크기 (125Hz × 60초)
+    DEFAULT_SEGMENT_SIZE = 125 * 60
+
+    # 스냅샷 재시도 횟수 (writer가 복사 구간을 덮어쓴 경우)
+    MAX_SNAPSHOT_RETRIES = 5
+
+    def __init__(
+        self,
+        capacity: Optional[int] = None,
+        axes: Optional[List[str]] = None,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        spill: Optional[Callable[[pd.DataFrame], None]] = None,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET
+    ):
+        """초기화
+
+        Args:
+            capacity: 샘플 수 (기본: memory_budget으로 계산)
+            axes: 저장할 축 (기본: SENSOR_AXES)
+            segment_size: spill 단위 샘플 수
+            spill: 채워진 세그먼트를 받는 함수
+                (예: SensorTimeSeriesDB.append, ParquetSegmentSink)
+            memory_budget: capacity 미지정 시 메모리 예산 (bytes)
+
+        Raises:
+            ValueError: capacity가 세그먼트 2개보다 작을 때
+        """
+        self._axes = list(axes or DataLoader.SENSOR_AXES)
+        bytes_per_sample = 8 * (1 + len(self._axes))
+        if capacity is None:
+            capacity = (memory_budget // bytes_per_sample) // segment_size * segment_size
+        if capacity < 2 * segment_size:
+            raise ValueError(
+                f"capacity({capacity})는 segment_size({segment_size})의 2배 이상이어야 합니다"
+            )
+
+        self._capacity = int(capacity)
+        self._segment_size = int(segment_size)
+        self._spill = spill
+
+        self._ts = np.zeros(self._capacity, dtype=np.int64)
+        self._values = {axis: np.zeros(self._capacity, dtype=np.float64) for axis in self._axes}
+
+        # 논리 위치 카운터 (단조 증가, 위치 = 카운터 % capacity)
+        self._written = 0      # 게시된(읽기 가능한) 샘플 수
+        self._spilled = 0      # 내보낸 샘플 수
+        self._last_ns: Optional[int] = None
+
+        logger.info(
+            f"SensorRingBuffer 생성: {self._capacity} 샘플, "
+            f"{self.nbytes / 1024 / 1024:.1f} MB, 세그먼트 {self._segment_size}"
+        )
+
+    @property
+    def axes(self) -> List[str]:
+        """저장 축"""
+        return list(self._axes)
+
+    @property
+    def capacity(self) -> int:
+        """버퍼 크기 (샘플 수)"""
+        return self._capacity
+
+    @property
+    def nbytes(self) -> int:
+        """할당된 메모리 (bytes)"""
+        return self._ts.nbytes + sum(v.nbytes for v in self._values.values())
+
+    @property
+    def total_written(self) -> int:
+        """누적 적재 샘플 수"""
+        return self._written
+
+    @property
+    def total_spilled(self) -> int:
+        """누적 spill 샘플 수"""
+        return self._spilled
+
+    def __len__(self) -> int:
+        """스냅샷으로 읽을 수 있는 샘플 수"""
+        return min(self._written, self._capacity - self._segment_size)
+
+    # ================================================================
+    # 쓰기 (단일 writer)
+    # ================================================================
+
+    def append(self, df: pd.DataFrame) -> int:
+        """샘플 추가
+
+        Args:
+            df: timestamp + 축 컬럼 (없는 축은 NaN)
+
+        Returns:
+            추가한 샘플 수
+
+        Raises:
+            ValueError: 타임스탬프가 이전 샘플보다 앞설 때
+        """
+        ts = pd.to_datetime(df["timestamp"])
+        if ts.dt.tz is not None:
+            ts = ts.dt.tz_convert(None)
+        ts_ns = ts.to_numpy(dtype="datetime64[ns]").view("int64")
+        values = {
+            axis: df[axis].to_numpy(dtype=np.float64) if axis in df.columns else np.full(len(df), np.nan)
+            for axis in self._axes
+        }
+        return self.append_arrays(ts_ns, values)
+
+    def append_arrays(self, ts_ns: np.ndarray, values: Dict[str, np.ndarray]) -> int:
+        """배열 샘플 추가 (append의 저수준 버전)
+
+        Args:
+            ts_ns: 타임스탬프 (int64 ns, 오름차순)
+            values: 축별 값 배열
+
+        Returns:
+            추가한 샘플 수
+        """
+        n = len(ts_ns)
+        if n == 0:
+            return 0
+        if np.any(ts_ns[1:] < ts_ns[:-1]) or (self._last_ns is not None and ts_ns[0] < self._last_ns):
+            raise ValueError("타임스탬프는 오름차순으로 추가해야 합니다")
+
+        # writer는 한 번에 최대 세그먼트 하나만 게시 (스냅샷 보호 구간과 맞춤)
+        for offset in range(0, n, self._segment_size):
+            chunk = slice(offset, min(offset + self._segment_size, n))
+            self._write_chunk(ts_ns[chunk], {axis: values[axis][chunk] for axis in self._axes if axis in values})
+
+        self._last_ns = int(ts_ns[-1])
+        return n
+
+    def _write_chunk(self, ts_ns: np.ndarray, values: Dict[str, np.ndarray]) -> None:
+        """청크 기록 후 게시"""
+        m = len(ts_ns)
+        start = self._written % self._capacity
+        first = min(m, self._capacity - start)
+
+        self._ts[start:start + first] = ts_ns[:first]
+        self._ts[:m - first] = ts_ns[first:]
+        for axis, buf in self._values.items():
+            src = values.get(axis)
+            if src is None:
+                buf[start:start + first] = np.nan
+                buf[:m - first] = np.nan
+            else:
+                buf[start:start + first] = src[:first]
+                buf[:m - first] = src[first:]
+
+        # 데이터 기록 후 카운터 갱신 (게시)
+        self._written += m
+        self._spill_full_segments()
+
+    def _spill_full_segments(self) -> None:
+        """채워진 세그먼트를 spill 대상으로 내보내기"""
+        while self._written - self._spilled >= self._segment_size:
+            lo = self._spilled
+            hi = lo + self._segment_size
+            if self._spill is not None:
+                ts_ns, values = self._gather(lo, hi)
+                segment = RingSnapshot(ts_ns, values).to_frame()
+                try:
+                    self._spill(segment)
+                except Exception as e:
+                    # 메모리 상한을 지키기 위해 진행 (세그먼트는 유실)
+                    logger.error(f"세그먼트 spill 실패 ({lo}~{hi}): {e}")
+            self._spilled = hi
+
+    def flush(self) -> int:
+        """채워지지 않은 마지막 세그먼트까지 내보내기 (종료 시)
+
+        Returns:
+            내보낸 샘플 수
+        """
+        lo, hi = self._spilled, self._written
+        if hi <= lo:
+            return 0
+        if self._spill is not None:
+            ts_ns, values = self._gather(lo, hi)
+            self._spill(RingSnapshot(ts_ns, values).to_frame())
+        self._spilled = hi
+        return hi - lo
+
+    # ================================================================
+    # 읽기 (잠금 없는 스냅샷)
+    # ================================================================
+
+    def _pieces(self, lo: int, hi: int) -> List[Tuple[int, int]]:
+        """논리 구간 [lo, hi)의 물리 구간 목록 (최대 2개)"""
+        if hi <= lo:
+            return []
+        start = lo % self._capacity
+        end = start + (hi - lo)
+        if end <= self._capacity:
+            return [(start, end)]
+        return [(start, self._capacity), (0, end - self._capacity)]
+
+    def _gather(self, lo: int, hi: int) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """논리 구간 [lo, hi) 복사"""
+        pieces = self._pieces(lo, hi)
+        if not pieces:
+            return np.empty(0, dtype=np.int64), {axis: np.empty(0) for axis in self._axes}
+        ts_ns = np.concatenate([self._ts[a:b] for a, b in pieces])
+        values = {
+            axis: np.concatenate([buf[a:b] for a, b in pieces])
+            for axis, buf in self._values.items()
+        }
+        return ts_ns, values
+
+    def _search(self, lo: int, hi: int, value: int, side: str) -> int:
+        """논리 구간 [lo, hi)에서 타임스탬프 이진 탐색 → 논리 위치"""
+        position = lo
+        for a, b in self._pieces(lo, hi):
+            idx = int(np.searchsorted(self._ts[a:b], value, side=side))
+            position += idx
+            if idx < b - a:
+                break
+        return position
+
+    def snapshot(
+        self,
+        start_ns: Optional[int] = None,
+        end_ns: Optional[int] = None,
+        axes: Optional[List[str]] = None
+    ) -> RingSnapshot:
+        """구간 스냅샷 (writer를 잠그지 않음)
+
+        가장 오래된 세그먼트 하나는 writer가 덮어쓰는 중일 수 있어 제외합니다
+        (이미 spill된 구간). 복사 중 writer가 복사 구간까지 진행했으면 다시 읽고,
+        재시도가 모두 실패하면 덮어쓰였을 수 있는 앞부분을 잘라 반환합니다.
+
+        Args:
+            start_ns: 시작 시각 (포함, int64 ns)
+            end_ns: 종료 시각 (포함, int64 ns)
+            axes: 복사할 축 (기본: 전체)
+
+        Returns:
+            RingSnapshot (복사본)
+        """
+        axes = self._axes if axes is None else [a for a in axes if a in self._values]
+        for attempt in range(self.MAX_SNAPSHOT_RETRIES):
+            written = self._written
+            base = max(0, written - self._capacity + self._segment_size)
+
+            lo = base if start_ns is None else self._search(base, written, start_ns, "left")
+            hi = written if end_ns is None else self._search(base, written, end_ns, "right")
+            hi = max(lo, hi)
+
+            pieces = self._pieces(lo, hi)
+            ts_ns = np.concatenate([self._ts[a:b] for a, b in pieces]) if pieces else np.empty(0, dtype=np.int64)
+            values = {
+                axis: np.concatenate([self._values[axis][a:b] for a, b in pieces]) if pieces else np.empty(0)
+                for axis in axes
+            }
+
+            # 복사 후 시점에 writer가 덮어썼을 수 있는 가장 앞 논리 위치
+            # (게시된 카운터 + 진행 중인 청크 최대 크기 - capacity)
+            safe = self._written + self._segment_size - self._capacity
+            if safe <= lo:
+                return RingSnapshot(ts_ns, values)
+            if attempt == self.MAX_SNAPSHOT_RETRIES - 1:
+                # 덮어쓰였을 수 있는 앞부분만 버림
+                trim = min(safe - lo, len(ts_ns))
+                return RingSnapshot(ts_ns[trim:], {axis: v[trim:] for axis, v in values.items()})
+
+        return RingSnapshot(np.empty(0, dtype=np.int64), {axis: np.empty(0) for axis in axes})
+
+    def latest(self) -> Optional[Dict[str, float]]:
+        """최신 샘플 (timestamp ns + 축 값)"""
+        written = self._written
+        if written == 0:
+            return None
+        pos = (written - 1) % self._capacity
+        sample = {"ts_ns": int(self._ts[pos])}
+        sample.update({axis: float(buf[pos]) for axis, buf in self._values.items()})
+        return sample
@@ -0,0 +1,102 @@
+"""
+롤링 통계 커널
+
+누적합(prefix sum)으로 후행(trailing) 윈도우의 평균/분산/표준편차를
+O(n)에 계산합니다. 윈도우 크기와 무관하게 샘플당 비용이 일정하며,
+1D 시계열과 (n, k) 다축 배열(축 0 방향)을 모두 지원합니다.
+
+윈도우 크기는 초 단위 설정과 타임스탬프에서 추정한 샘플링 주기로 정하므로
+1Hz 저장 데이터와 125Hz 실시간 데이터에 같은 설정을 쓸 수 있습니다.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+
+def infer_sample_rate(ts_ns: np.ndarray, default: Optional[float] = None) -> Optional[float]:
+    """타임스탬프로 샘플링 주기(Hz) 추정
+
+    양수 간격의 중앙값을 사용하므로 결측 구간이나 중복 타임스탬프에 강합니다.
+
+    Args:
+        ts_ns: 정렬된 타임스탬프 int64(ns)
+        default: 추정할 수 없을 때(샘플 2개 미만, 간격 없음)의 값
+
+    Returns:
+        샘플링 주기 (Hz)
+    """
+    ts_ns = np.asarray(ts_ns, dtype=np.int64)
+    if len(ts_ns) < 2:
+        return default
+    gaps = np.diff(ts_ns)
+    gaps = gaps[gaps > 0]
+    if len(gaps) == 0:
+        return default
+    return 1e9 / float(np.median(gaps))
+
+
+def window_samples(window_seconds: float, sample_rate_hz: float, minimum: int = 2) -> int:
+    """초 단위 윈도우를 샘플 수로 변환 (최소 minimum)"""
+    return max(minimum, int(window_seconds * sample_rate_hz))
+
+
+def rolling_moments(
+    values: np.ndarray,
+    window: int,
+    min_periods: Optional[int] = None,
+    ddof: int = 1
+):
+    """후행 윈도우 평균/분산
+
+    i번째 결과는 values[i - window + 1 : i + 1] 중 NaN이 아닌 샘플의 통계입니다.
+    (pandas rolling(window, min_periods).mean()/var(ddof)와 같은 정렬)
+
+    Args:
+        values: 1D 또는 (n, k) 배열 (축 0 방향으로 롤링)
+        window: 윈도우 샘플 수
+        min_periods: 결과를 내는 최소 유효 샘플 수 (기본: window)
+        ddof: 분산 자유도 보정 (1: 표본분산, 0: 모분산)
+
+    Returns:
+        (means, variances) — 유효 샘플이 부족한 위치는 NaN
+    """
+    if window < 1:
+        raise ValueError(f"윈도우 크기는 1 이상이어야 합니다: {window}")
+    values = np.asarray(values, dtype=np.float64)
+    min_periods = window if min_periods is None else max(min_periods, 1)
+
+    valid = ~np.isnan(values)
+    # 평균만큼 이동한 값으로 누적 → 제곱합 상쇄 오차 감소
+    offset = np.nanmean(values, axis=0) if valid.any() else 0.0
+    offset = np.where(np.isnan(offset), 0.0, offset)
+    shifted = np.where(valid, values - offset, 0.0)
+
+    pad = np.zeros((1,) + values.shape[1:])
+    csum = np.concatenate((pad, np.cumsum(shifted, axis=0)))
+    csq = np.concatenate((pad, np.cumsum(shifted * shifted, axis=0)))
+    ccount = np.concatenate((pad.astype(np.int64), np.cumsum(valid, axis=0, dtype=np.int64)))
+
+    hi = np.arange(1, len(values) + 1)
+    lo = np.maximum(hi - window, 0)
+    counts = ccount[hi] - ccount[lo]
+    sums = csum[hi] - csum[lo]
+    squares = csq[hi] - csq[lo]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / counts
+        variances = np.maximum(squares - sums * means, 0.0) / (counts - ddof)
+    means = np.where(counts >= min_periods, means + offset, np.nan)
+    variances = np.where((counts >= min_periods) & (counts > ddof), variances, np.nan)
+    return means, variances
+
+
+def rolling_std(
+    values: np.ndarray,
+    window: int,
+    min_periods: Optional[int] = None,
+    ddof: int = 1
+) -> np.ndarray:
+    """후행 윈도우 표준편차 (rolling_moments 참고)"""
+    _, variances = rolling_moments(values, window, min_periods=min_periods, ddof=ddof)
+    return np.sqrt(variances)
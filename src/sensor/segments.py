@@ -0,0 +1,134 @@
+"""
+런 길이 구간 분할
+
+불리언 마스크에서 연속 구간(세그먼트)을 NumPy로 추출하고,
+세그먼트별 집계(최대/최소/합/평균/argmin)를 reduceat으로 계산합니다.
+파이썬 루프는 세그먼트 수만큼만 돌므로 감지 비용이 플래그된 샘플 수가 아니라
+구간 수에 비례합니다.
+
+집계는 PatternDetector 기존 그룹핑과 같이 "플래그된 샘플"만 대상으로 합니다.
+max_gap > 1로 병합된 구간 사이의 플래그되지 않은 샘플은 포함하지 않습니다.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+_REDUCERS = {
+    "max": np.maximum,
+    "min": np.minimum,
+    "sum": np.add,
+}
+
+
+@dataclass
+class Segments:
+    """연속 구간 목록
+
+    Attributes:
+        positions: 플래그된 샘플 위치 (오름차순)
+        offsets: positions 내 각 세그먼트 시작 오프셋
+        starts: 세그먼트 시작 샘플 위치 (포함)
+        ends: 세그먼트 끝 샘플 위치 (포함)
+    """
+
+    positions: np.ndarray
+    offsets: np.ndarray
+    starts: np.ndarray
+    ends: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    @property
+    def counts(self) -> np.ndarray:
+        """세그먼트별 플래그 샘플 수"""
+        return np.diff(np.append(self.offsets, len(self.positions)))
+
+    def values(self, values: np.ndarray) -> np.ndarray:
+        """플래그된 샘플 값 (positions 순서)"""
+        return np.asarray(values)[self.positions]
+
+    def reduce(self, values: np.ndarray, op: str = "max") -> np.ndarray:
+        """세그먼트별 집계
+
+        Args:
+            values: 전체 샘플 값 배열 (마스크와 같은 길이)
+            op: "max" | "min" | "sum" | "mean"
+
+        Returns:
+            세그먼트별 집계값 (len(self),)
+        """
+        if len(self) == 0:
+            return np.empty(0, dtype=np.float64)
+        flagged = self.values(values)
+        if op == "mean":
+            return np.add.reduceat(flagged.astype(np.float64), self.offsets) / self.counts
+        if op not in _REDUCERS:
+            raise ValueError(f"지원하지 않는 집계: {op} (max, min, sum, mean)")
+        return _REDUCERS[op].reduceat(flagged, self.offsets)
+
+    def argmin(self, values: np.ndarray) -> np.ndarray:
+        """세그먼트별 최솟값 샘플 위치 (동률이면 앞선 샘플, idxmin과 동일)"""
+        return self._arg_extreme(values, "min")
+
+    def argmax(self, values: np.ndarray) -> np.ndarray:
+        """세그먼트별 최댓값 샘플 위치 (동률이면 앞선 샘플)"""
+        return self._arg_extreme(values, "max")
+
+    def durations_ns(self, ts_ns: np.ndarray) -> np.ndarray:
+        """세그먼트별 지속 시간 (ns, 첫~마지막 플래그 샘플)"""
+        ts_ns = np.asarray(ts_ns)
+        return ts_ns[self.ends] - ts_ns[self.starts]
+
+    def _arg_extreme(self, values: np.ndarray, op: str) -> np.ndarray:
+        if len(self) == 0:
+            return np.empty(0, dtype=np.int64)
+        flagged = self.values(values)
+        extremes = self.reduce(values, op)
+        hits = np.flatnonzero(flagged == np.repeat(extremes, self.counts))
+        segment_ids = np.searchsorted(self.offsets, hits, side="right") - 1
+        _, first = np.unique(segment_ids, return_index=True)
+        return self.positions[hits[first]]
+
+
+def find_segments(
+    mask: np.ndarray,
+    max_gap: int = 1,
+    column_length: Optional[int] = None
+) -> Segments:
+    """마스크에서 연속 구간 추출
+
+    인접한 플래그 샘플의 위치 차이가 max_gap 이하이면 같은 구간으로 묶습니다.
+    (max_gap=1이면 끊김 없는 런, 그보다 크면 짧은 틈을 병합)
+
+    여러 축을 한 번에 분할할 때는 (n, k) 마스크를 열 우선으로 펼쳐 넘기고
+    column_length=n을 지정합니다. 구간은 열 경계를 넘지 않으며,
+    위치 p는 (열 p // n, 행 p % n)에 해당합니다.
+
+    Args:
+        mask: 불리언 마스크 (NaN 비교 결과는 False로 취급)
+        max_gap: 같은 구간으로 볼 최대 위치 차이
+        column_length: 펼친 2D 마스크의 열 길이 (1D 마스크면 None)
+
+    Returns:
+        Segments
+    """
+    positions = np.flatnonzero(np.asarray(mask, dtype=bool))
+    if len(positions) == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return Segments(positions, empty, empty, empty)
+
+    split = np.diff(positions) > max_gap
+    if column_length:
+        split |= np.diff(positions // column_length) != 0
+    breaks = np.flatnonzero(split) + 1
+    offsets = np.concatenate(([0], breaks))
+    last = np.append(breaks, len(positions)) - 1
+    return Segments(
+        positions=positions,
+        offsets=offsets,
+        starts=positions[offsets],
+        ends=positions[last],
+    )
@@ -5,12 +5,22 @@
 """
 
 import logging
+import math
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 from .data_loader import DataLoader
+from .duckdb_backend import DuckDBSensorBackend
+from .range_stats import RangeStatistics
+from .ring_buffer import RingSnapshot, SensorRingBuffer
+from .timeseries_db import SensorTimeSeriesDB
+
+if TYPE_CHECKING:
+    from .partitioned_dataset import PartitionedDataset
 
 logger = logging.getLogger(__name__)
 
@@ -18,25 +28,146 @@ logger = logging.getLogger(__name__)
 class SensorStore:
     """센서 데이터 저장소"""
 
-    def __init__(self, data: Optional[pd.DataFrame] = None):
+    # 파티션 모드에서 동시에 메모리에 유지할 파티션 수
+    MAX_OPEN_PARTITIONS = 4
+
+    # 조회 백엔드 ("pandas": 메모리 DataFrame, "duckdb": parquet 직접 SQL 조회,
+    # "sqlite": data/sensor_timeseries.db 실시간 시계열 저장소)
+    BACKENDS = ("pandas", "duckdb", "sqlite")
+
+    # 집계 기본 백분위수
+    DEFAULT_PERCENTILES = (0.5, 0.95, 0.99)
+
+    def __init__(
+        self,
+        data: Optional[pd.DataFrame] = None,
+        dataset: Optional["PartitionedDataset"] = None,
+        backend: Union[str, Any] = "pandas",
+        live: Optional[SensorRingBuffer] = None
+    ):
         """초기화
 
         Args:
             data: 센서 데이터 (없으면 자동 로드)
+            dataset: 파티션 데이터셋 (지정 시 조회 구간과 겹치는 파티션만 로드)
+            backend: "pandas", "duckdb", "sqlite" 또는 백엔드 인스턴스
+                (예: DuckDBSensorBackend, SensorTimeSeriesDB)
+            live: 실시간 샘플 링 버퍼 (없으면 append 첫 호출 시 생성)
+
+        Raises:
+            ValueError: 지원하지 않는 백엔드
         """
+        self._rule_engine = None
+        self._dataset = dataset
+        self._partition_stores: "OrderedDict[str, SensorStore]" = OrderedDict()
+        self._backend = None
+        self._live = live
+        self._state_cache: Dict[str, np.ndarray] = {}
+
+        if isinstance(backend, str):
+            if backend not in self.BACKENDS:
+                raise ValueError(f"지원하지 않는 백엔드: {backend} (가능한 값: {self.BACKENDS})")
+            if backend == "duckdb":
+                self._backend = DuckDBSensorBackend(dataset=dataset)
+            elif backend == "sqlite":
+                self._backend = SensorTimeSeriesDB()
+        else:
+            self._backend = backend
+
+        if self._backend is not None:
+            # 백엔드가 파티션 프루닝까지 처리
+            self._dataset = None
+            self._data = None
+            logger.info(f"SensorStore 초기화 완료 ({type(self._backend).__name__} 백엔드)")
+            return
+
+        if dataset is not None:
+            self._data = None
+            partitions = dataset.partitions
+            logger.info(
+                f"SensorStore 초기화 완료 (파티션 모드): {len(partitions)}개 파티션, "
+                f"{sum(p.rows for p in partitions)} 레코드"
+            )
+            return
+
         if data is not None:
             self._data = data
         else:
             self._data = DataLoader.load()
 
-        self._rule_engine = None
+        self._build_index()
         logger.info(f"SensorStore 초기화 완료: {len(self._data)} 레코드")
 
     @property
     def data(self) -> pd.DataFrame:
-        """전체 데이터"""
+        """전체 데이터
+
+        파티션 모드에서는 전체 파티션을 메모리에 올리므로 범위 조회 메서드를 권장합니다.
+        """
+        if self._data is None:
+            if self._backend is not None:
+                logger.warning("백엔드 모드에서 전체 데이터 로드")
+                self._data = self._backend.get_data()
+            else:
+                logger.warning("파티션 모드에서 전체 데이터 로드 (모든 파티션)")
+                self._data = self._dataset.read_range()
+            self._build_index()
         return self._data
 
+    @property
+    def live(self) -> Optional[SensorRingBuffer]:
+        """실시간 링 버퍼"""
+        return self._live
+
+    def append(self, samples: pd.DataFrame) -> int:
+        """실시간 샘플 추가
+
+        링 버퍼에 적재되어 이후 범위 조회(get_data, get_statistics 등)에 즉시 반영됩니다.
+        과거 데이터(메모리/파티션/백엔드)보다 새로운 샘플만 조회에 합쳐집니다.
+
+        Args:
+            samples: timestamp + 축 컬럼 DataFrame
+
+        Returns:
+            추가한 샘플 수
+        """
+        if self._live is None:
+            self._live = SensorRingBuffer()
+        return self._live.append(samples)
+
+    def _historical_end_ns(self) -> Optional[int]:
+        """과거 데이터의 마지막 타임스탬프 (ns)"""
+        if self._backend is not None:
+            time_range = self._backend.time_range()
+            return None if time_range is None else self._to_ns(time_range[1])
+        if self._dataset is not None:
+            time_range = self._dataset.time_range()
+            return None if time_range is None else self._to_ns(time_range[1])
+        return int(self._ts_ns[-1]) if len(self._ts_ns) else None
+
+    def _live_snapshot(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        axes: Optional[List[str]] = None
+    ) -> Optional[RingSnapshot]:
+        """과거 데이터 이후 구간의 실시간 스냅샷 (없으면 None)"""
+        if self._live is None or self._live.total_written == 0:
+            return None
+
+        start_ns = None if start is None else self._to_ns(start)
+        historical_end = self._historical_end_ns()
+        if historical_end is not None and (start_ns is None or start_ns <= historical_end):
+            start_ns = historical_end + 1
+
+        snapshot = self._live.snapshot(start_ns, None if end is None else self._to_ns(end), axes)
+        return snapshot if len(snapshot) else None
+
+    @property
+    def backend(self) -> str:
+        """조회 백엔드 이름"""
+        return "pandas" if self._backend is None else type(self._backend).__name__
+
     def load_data(self, path: Optional[str] = None) -> None:
         """데이터 로드 (호환성 메서드)
 
@@ -49,8 +180,163 @@ class SensorStore:
         from pathlib import Path as PathLib
         path_obj = PathLib(path) if path else None
         self._data = DataLoader.load(path_obj, use_cache=False)
+        self._build_index()
         logger.info(f"SensorStore 데이터 재로드: {len(self._data)} 레코드")
 
+    def _build_index(self) -> None:
+        """시간 인덱스 구축
+
+        정렬된 int64(ns) 타임스탬프 배열을 만들어 범위 조회를
+        np.searchsorted 기반 O(log n) 슬라이스로 처리합니다.
+        """
+        if "timestamp" in self._data.columns:
+            if not pd.api.types.is_datetime64_any_dtype(self._data["timestamp"]):
+                self._data = self._data.assign(timestamp=pd.to_datetime(self._data["timestamp"]))
+            if not self._data["timestamp"].is_monotonic_increasing:
+                self._data = self._data.sort_values("timestamp").reset_index(drop=True)
+            ts = self._data["timestamp"].to_numpy(dtype="datetime64[ns]").view("int64")
+        else:
+            ts = np.empty(0, dtype="int64")
+
+        self._ts_ns = ts
+        self._ts_ns.flags.writeable = False
+
+        # 샘플별 상태 코드 캐시 (축별 첫 조회 시 계산)
+        self._state_cache = {}
+
+        # 축별 누적합/블록 min-max 구간 통계 (축별 첫 조회 시 float64 변환 후 구축
+        # → float32 축은 조회 전까지 복사본을 만들지 않음)
+        self._range_stats = RangeStatistics({
+            axis: self._data[axis]
+            for axis in DataLoader.SENSOR_AXES
+            if axis in self._data.columns
+        })
+
+    # ================================================================
+    # 파티션 모드
+    # ================================================================
+
+    def _partition_store(self, partition) -> "SensorStore":
+        """파티션 단위 SensorStore (LRU로 최근 파티션만 유지)"""
+        store = self._partition_stores.get(partition.key)
+        if store is None:
+            store = SensorStore(self._dataset.load_partition(partition))
+            store._rule_engine = self._rule_engine
+            self._partition_stores[partition.key] = store
+            while len(self._partition_stores) > self.MAX_OPEN_PARTITIONS:
+                self._partition_stores.popitem(last=False)
+        else:
+            self._partition_stores.move_to_end(partition.key)
+        return store
+
+    def _range_stores(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> List["SensorStore"]:
+        """조회 구간에 해당하는 저장소 목록 (파티션 모드: 겹치는 파티션만)"""
+        if self._dataset is None:
+            return [self]
+        return [self._partition_store(p) for p in self._dataset.partitions_for(start, end)]
+
+    @staticmethod
+    def _to_ns(ts: datetime) -> int:
+        """datetime → int64 나노초 (tz-aware는 UTC 기준 naive로 변환)"""
+        stamp = pd.Timestamp(ts)
+        if stamp.tzinfo is not None:
+            stamp = stamp.tz_convert(None)
+        return int(stamp.value)
+
+    @staticmethod
+    def _ns_to_datetime(ns: int) -> datetime:
+        """int64 나노초 → datetime"""
+        return pd.Timestamp(int(ns)).to_pydatetime()
+
+    def _slice_bounds(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> Tuple[int, int]:
+        """[start, end] 구간의 위치 인덱스 (lo, hi) 반환 (hi 미포함)"""
+        lo = 0 if start is None else int(np.searchsorted(self._ts_ns, self._to_ns(start), side="left"))
+        hi = len(self._ts_ns) if end is None else int(np.searchsorted(self._ts_ns, self._to_ns(end), side="right"))
+        return lo, max(lo, hi)
+
+    def get_axis_values(
+        self,
+        axis: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> np.ndarray:
+        """시간 범위의 축 값 (읽기 전용 NumPy 뷰)
+
+        Args:
+            axis: 측정 축
+            start: 시작 시각
+            end: 종료 시각
+
+        Returns:
+            복사 없이 슬라이스된 읽기 전용 배열
+        """
+        live = self._live_snapshot(start, end, [axis])
+        if live is not None:
+            values = np.concatenate([self._historical_axis_values(axis, start, end), live.values[axis]])
+            values.flags.writeable = False
+            return values
+        return self._historical_axis_values(axis, start, end)
+
+    def _historical_axis_values(
+        self,
+        axis: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> np.ndarray:
+        """과거 데이터 축 값"""
+        if self._backend is not None:
+            return self._backend.get_axis_values(axis, start, end)
+
+        if self._dataset is not None:
+            parts = [s.get_axis_values(axis, start, end) for s in self._range_stores(start, end)]
+            values = np.concatenate(parts) if parts else np.empty(0)
+            values.flags.writeable = False
+            return values
+
+        lo, hi = self._slice_bounds(start, end)
+        values = self._data[axis].to_numpy()[lo:hi]
+        values.flags.writeable = False
+        return values
+
+    def get_timestamps_ns(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> np.ndarray:
+        """시간 범위의 타임스탬프 (int64 ns, 읽기 전용 뷰)"""
+        live = self._live_snapshot(start, end, [])
+        if live is not None:
+            values = np.concatenate([self._historical_timestamps_ns(start, end), live.ts_ns])
+            values.flags.writeable = False
+            return values
+        return self._historical_timestamps_ns(start, end)
+
+    def _historical_timestamps_ns(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> np.ndarray:
+        """과거 데이터 타임스탬프"""
+        if self._backend is not None:
+            return self._backend.get_timestamps_ns(start, end)
+
+        if self._dataset is not None:
+            parts = [s.get_timestamps_ns(start, end) for s in self._range_stores(start, end)]
+            values = np.concatenate(parts) if parts else np.empty(0, dtype="int64")
+            values.flags.writeable = False
+            return values
+
+        lo, hi = self._slice_bounds(start, end)
+        return self._ts_ns[lo:hi]
+
     def get_data(
         self,
         start: Optional[datetime] = None,
@@ -65,15 +351,33 @@ class SensorStore:
             axes: 조회할 축 목록 (기본: 전체)
 
         Returns:
-            필터링된 DataFrame
+            필터링된 DataFrame (원본 슬라이스 뷰 - 수정하지 말 것, 필요 시 .copy())
         """
-        df = self._data.copy()
+        live = self._live_snapshot(start, end, axes)
+        if live is not None:
+            historical = self._historical_data(start, end, axes)
+            return pd.concat([historical, live.to_frame(axes)], ignore_index=True)
+        return self._historical_data(start, end, axes)
+
+    def _historical_data(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        axes: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """과거 데이터 구간 조회"""
+        if self._backend is not None:
+            return self._backend.get_data(start, end, axes)
 
-        # 시간 범위 필터
-        if start is not None:
-            df = df[df["timestamp"] >= start]
-        if end is not None:
-            df = df[df["timestamp"] <= end]
+        if self._dataset is not None:
+            frames = [s.get_data(start, end, axes) for s in self._range_stores(start, end)]
+            if not frames:
+                return pd.DataFrame(columns=["timestamp", *(axes or DataLoader.SENSOR_AXES)])
+            return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+        # 정렬된 타임스탬프에 대한 이진 탐색 (복사 없는 위치 슬라이스)
+        lo, hi = self._slice_bounds(start, end)
+        df = self._data.iloc[lo:hi]
 
         # 축 필터
         if axes is not None:
@@ -98,27 +402,102 @@ class SensorStore:
         Returns:
             통계 딕셔너리 (mean, std, min, max, count)
         """
-        df = self.get_data(start=start, end=end, axes=[axis])
+        live = self._live_snapshot(start, end, [axis])
+        live_stats = None if live is None else live.statistics(axis)
 
-        if axis not in df.columns or len(df) == 0:
+        if self._backend is not None:
+            if live_stats is None:
+                return self._backend.get_statistics(axis, start, end)
+            parts = [self._backend_moments(axis, start, end)]
+        else:
+            parts = [s._range_moments(axis, start, end) for s in self._range_stores(start, end)]
+        parts = [p for p in parts + [live_stats] if p is not None]
+        if not parts:
             return {"error": f"No data for axis {axis}"}
 
-        values = df[axis]
-        time_range = DataLoader.get_time_range(df)
+        stats = parts[0] if len(parts) == 1 else self._merge_moments(parts)
 
         return {
             "axis": axis,
-            "mean": round(float(values.mean()), 4),
-            "std": round(float(values.std()), 4),
-            "min": round(float(values.min()), 4),
-            "max": round(float(values.max()), 4),
-            "count": len(values),
+            "mean": round(stats["mean"], 4),
+            "std": round(stats["std"], 4),
+            "min": round(stats["min"], 4),
+            "max": round(stats["max"], 4),
+            "count": stats["rows"],
             "period": {
-                "start": time_range[0].isoformat(),
-                "end": time_range[1].isoformat()
+                "start": self._ns_to_datetime(stats["first_ns"]).isoformat(),
+                "end": self._ns_to_datetime(stats["last_ns"]).isoformat()
             }
         }
 
+    def _range_moments(
+        self,
+        axis: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> Optional[Dict[str, Any]]:
+        """구간 통계 원값 (반올림 전, 파티션 병합용)"""
+        lo, hi = self._slice_bounds(start, end)
+
+        if not self._range_stats.has_axis(axis) or hi <= lo:
+            return None
+
+        # 누적합 기반 O(1) 통계 + 블록 인덱스 기반 min/max
+        stats = self._range_stats.query(axis, lo, hi)
+        stats["rows"] = hi - lo
+        stats["first_ns"] = int(self._ts_ns[lo])
+        stats["last_ns"] = int(self._ts_ns[hi - 1])
+        return stats
+
+    def _backend_moments(
+        self,
+        axis: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> Optional[Dict[str, Any]]:
+        """백엔드 통계를 병합용 형식으로 변환"""
+        stats = self._backend.get_statistics(axis, start, end)
+        if "error" in stats:
+            return None
+        count = stats["count"]
+        return {
+            "mean": stats["mean"],
+            "std": stats["std"],
+            "min": stats["min"],
+            "max": stats["max"],
+            "count": count,
+            "rows": count,
+            "first_ns": self._to_ns(datetime.fromisoformat(stats["period"]["start"])),
+            "last_ns": self._to_ns(datetime.fromisoformat(stats["period"]["end"])),
+        }
+
+    @staticmethod
+    def _merge_moments(parts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """파티션별 통계 병합 (평균/제곱편차합 결합, ddof=1)"""
+        valid = [p for p in parts if p["count"] > 0]
+        count = sum(p["count"] for p in valid)
+        merged = {
+            "count": count,
+            "rows": sum(p["rows"] for p in parts),
+            "first_ns": parts[0]["first_ns"],
+            "last_ns": parts[-1]["last_ns"],
+            "min": min((p["min"] for p in valid), default=float("nan")),
+            "max": max((p["max"] for p in valid), default=float("nan")),
+        }
+        if count == 0:
+            merged.update(mean=float("nan"), std=float("nan"))
+            return merged
+
+        mean = sum(p["mean"] * p["count"] for p in valid) / count
+        m2 = sum(
+            (p["std"] ** 2 * (p["count"] - 1) if p["count"] > 1 else 0.0)
+            + p["count"] * (p["mean"] - mean) ** 2
+            for p in valid
+        )
+        merged["mean"] = mean
+        merged["std"] = math.sqrt(m2 / (count - 1)) if count > 1 else float("nan")
+        return merged
+
     def get_current_state(self) -> Dict[str, str]:
         """현재 상태 (각 축별)
 
@@ -127,17 +506,13 @@ class SensorStore:
         Returns:
             축별 상태 딕셔너리
         """
-        # RuleEngine 지연 로딩
-        if self._rule_engine is None:
-            try:
-                from src.ontology import create_rule_engine
-                self._rule_engine = create_rule_engine()
-            except ImportError:
-                logger.warning("RuleEngine 로드 실패, 기본 상태 반환")
-                return {axis: "Unknown" for axis in DataLoader.SENSOR_AXES}
+        if self._get_rule_engine() is None:
+            return {axis: "Unknown" for axis in DataLoader.SENSOR_AXES}
 
         states = {}
-        latest_row = self._data.iloc[-1]
+        latest_row = self._latest_row()
+        if latest_row is None:
+            return {axis: "Unknown" for axis in DataLoader.SENSOR_AXES}
 
         for axis in DataLoader.SENSOR_AXES:
             if axis in latest_row:
@@ -149,6 +524,147 @@ class SensorStore:
 
         return states
 
+    def _get_rule_engine(self):
+        """RuleEngine 지연 로딩 (실패 시 None)"""
+        if self._rule_engine is None:
+            try:
+                from src.ontology import create_rule_engine
+                self._rule_engine = create_rule_engine()
+            except ImportError:
+                logger.warning("RuleEngine 로드 실패, 기본 상태 반환")
+                return None
+        return self._rule_engine
+
+    def _state_codes(
+        self,
+        axis: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> np.ndarray:
+        """구간 샘플별 상태 코드 (RuleEngine.compile_state_rules 매핑 인덱스, -1 = 매칭 없음)
+
+        메모리 모드에서는 전체 시계열 코드를 축별로 한 번 계산해 캐시하고 슬라이스합니다.
+        """
+        engine = self._get_rule_engine()
+        if engine is None:
+            raise RuntimeError("RuleEngine을 로드할 수 없어 상태를 계산할 수 없습니다")
+
+        if self._backend is not None or self._dataset is not None:
+            return engine.infer_state_codes(axis, self.get_axis_values(axis, start, end))
+
+        codes = self._state_cache.get(axis)
+        if codes is None:
+            codes = engine.infer_state_codes(axis, self._historical_axis_values(axis))
+            codes.flags.writeable = False
+            self._state_cache[axis] = codes
+
+        lo, hi = self._slice_bounds(start, end)
+        live = self._live_snapshot(start, end, [axis])
+        if live is None:
+            return codes[lo:hi]
+        return np.concatenate([codes[lo:hi], engine.infer_state_codes(axis, live.values[axis])])
+
+    def get_states(
+        self,
+        axis: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> np.ndarray:
+        """샘플별 상태 ID (State_Normal, State_Warning, ...)
+
+        Args:
+            axis: 측정 축
+            start: 시작 시각
+            end: 종료 시각
+
+        Returns:
+            object 배열 (매칭 규칙이 없으면 None)
+        """
+        codes = self._state_codes(axis, start, end)
+        plan = self._rule_engine.compile_state_rules(axis)
+        return np.array(plan["states"] + [None], dtype=object)[codes]
+
+    def get_state_kpis(
+        self,
+        axis: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """상태 KPI (정상 비율, 상태별 체류 시간, 상태 전환 수)
+
+        각 샘플의 체류 시간은 다음 샘플까지의 간격이며, 마지막 샘플은
+        중앙값 간격을 사용합니다.
+
+        Args:
+            axis: 측정 축
+            start: 시작 시각
+            end: 종료 시각
+
+        Returns:
+            KPI 딕셔너리
+        """
+        codes = self._state_codes(axis, start, end)
+        ts_ns = self.get_timestamps_ns(start, end)
+        n = len(codes)
+        if n == 0:
+            return {"error": f"No data for axis {axis}"}
+
+        plan = self._rule_engine.compile_state_rules(axis)
+
+        # 매핑 코드 → 상태 ID 코드 (여러 매핑이 같은 상태를 가리킬 수 있음, 마지막 = Unknown)
+        state_names = list(dict.fromkeys(plan["states"]))
+        state_of_mapping = np.array(
+            [state_names.index(state) for state in plan["states"]] + [len(state_names)],
+            dtype=np.int64,
+        )
+        state_codes = state_of_mapping[codes]
+        state_names.append("Unknown")
+
+        gaps = np.diff(ts_ns)
+        last_gap = int(np.median(gaps)) if len(gaps) else 0
+        durations_s = np.append(gaps, last_gap) / 1e9
+
+        counts = np.bincount(state_codes, minlength=len(state_names))
+        seconds = np.bincount(state_codes, weights=durations_s, minlength=len(state_names))
+        total_seconds = float(durations_s.sum())
+
+        states = {
+            name: {
+                "samples": int(counts[i]),
+                "ratio": round(counts[i] / n, 4),
+                "seconds": round(float(seconds[i]), 3),
+                "time_ratio": round(float(seconds[i]) / total_seconds, 4) if total_seconds else 0.0,
+            }
+            for i, name in enumerate(state_names)
+            if counts[i]
+        }
+
+        return {
+            "axis": axis,
+            "samples": n,
+            "normal_rate": states.get("State_Normal", {}).get("ratio", 0.0),
+            "states": states,
+            "transitions": int(np.count_nonzero(state_codes[1:] != state_codes[:-1])),
+            "period": {
+                "start": self._ns_to_datetime(ts_ns[0]).isoformat(),
+                "end": self._ns_to_datetime(ts_ns[-1]).isoformat()
+            }
+        }
+
+    def _latest_row(self) -> Optional[pd.Series]:
+        """최신 행"""
+        live = self._live_snapshot()
+        if live is not None:
+            return live.to_frame().iloc[-1]
+        if self._backend is not None:
+            return self._backend.latest_row()
+        if self._dataset is not None:
+            partitions = self._dataset.partitions
+            if not partitions:
+                return None
+            return self._partition_store(partitions[-1])._data.iloc[-1]
+        return self._data.iloc[-1]
+
     def get_anomalies(
         self,
         axis: str,
@@ -169,21 +685,157 @@ class SensorStore:
         Returns:
             이상치 DataFrame
         """
-        df = self.get_data(start=start, end=end)
+        anomalies = self._historical_anomalies(axis, threshold, start, end, direction)
+
+        live = self._live_snapshot(start, end)
+        if live is None or axis not in live.values:
+            return anomalies
+
+        values = live.values[axis]
+        if direction == "above":
+            mask = values > threshold
+        elif direction == "below":
+            mask = values < threshold
+        else:
+            mask = np.abs(values) > threshold
+        if not mask.any():
+            return anomalies
+        live_rows = live.to_frame().iloc[np.flatnonzero(mask)]
+        if anomalies.empty:
+            return live_rows.reset_index(drop=True)
+        return pd.concat([anomalies, live_rows], ignore_index=True)
+
+    def _historical_anomalies(
+        self,
+        axis: str,
+        threshold: float,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        direction: str
+    ) -> pd.DataFrame:
+        """과거 데이터 이상치 조회"""
+        if self._backend is not None:
+            return self._backend.get_anomalies(axis, threshold, start, end, direction)
+
+        if self._dataset is not None:
+            return self._partitioned_anomalies(axis, threshold, start, end, direction)
 
-        if axis not in df.columns:
+        if axis not in self._data.columns:
             return pd.DataFrame()
 
+        lo, hi = self._slice_bounds(start, end)
+        values = self._data[axis].to_numpy()[lo:hi]
+
         if direction == "absolute":
-            mask = df[axis].abs() > threshold
+            mask = np.abs(values) > threshold
         elif direction == "above":
-            mask = df[axis] > threshold
+            mask = values > threshold
         elif direction == "below":
-            mask = df[axis] < threshold
+            mask = values < threshold
         else:
-            mask = df[axis].abs() > threshold
+            mask = np.abs(values) > threshold
+
+        # 이상치 행만 복사
+        return self._data.iloc[lo + np.flatnonzero(mask)]
+
+    def _partitioned_anomalies(
+        self,
+        axis: str,
+        threshold: float,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        direction: str
+    ) -> pd.DataFrame:
+        """파티션 모드 이상치 조회
+
+        manifest의 축별 min/max로 임계값을 넘을 수 없는 파티션은 열지 않습니다.
+        """
+        frames = []
+        for partition in self._dataset.partitions_for(start, end):
+            bounds = partition.axes.get(axis)
+            if bounds is not None:
+                if direction == "above" and bounds["max"] <= threshold:
+                    continue
+                if direction == "below" and bounds["min"] >= threshold:
+                    continue
+                if direction not in ("above", "below") and partition.max_abs(axis) <= threshold:
+                    continue
+            anomalies = self._partition_store(partition).get_anomalies(axis, threshold, start, end, direction)
+            if not anomalies.empty:
+                frames.append(anomalies)
+
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+    def get_percentiles(
+        self,
+        axis: str,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> Dict[str, float]:
+        """축 백분위수
+
+        Args:
+            axis: 측정 축
+            percentiles: 백분위수 (0~1)
+            start: 시작 시각
+            end: 종료 시각
+
+        Returns:
+            {"p50": ..., "p95": ..., "p99": ...}
+        """
+        if self._backend is not None and hasattr(self._backend, "get_percentiles"):
+            return self._backend.get_percentiles(axis, percentiles, start, end)
+
+        values = self.get_axis_values(axis, start, end)
+        if len(values) == 0:
+            return {DuckDBSensorBackend.percentile_key(q): float("nan") for q in percentiles}
+        result = np.quantile(values, list(percentiles))
+        return {DuckDBSensorBackend.percentile_key(q): float(v) for q, v in zip(percentiles, result)}
 
-        return df[mask]
+    def get_group_statistics(
+        self,
+        axis: str,
+        by: str = "shift",
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES
+    ) -> List[Dict[str, Any]]:
+        """그룹별 축 통계 (교대, 제품 등)
+
+        Args:
+            axis: 측정 축
+            by: 그룹 컬럼 (예: "shift", "product_id")
+            start: 시작 시각
+            end: 종료 시각
+            percentiles: 함께 계산할 백분위수
+
+        Returns:
+            그룹별 통계 리스트 (그룹 값 순, 결측 그룹은 마지막)
+        """
+        if self._backend is not None and hasattr(self._backend, "get_group_statistics"):
+            return self._backend.get_group_statistics(axis, by, start, end, percentiles)
+
+        df = self.get_data(start, end)
+        if axis not in df.columns or by not in df.columns or df.empty:
+            return []
+
+        results = []
+        for key, values in df.groupby(by, sort=True, dropna=False, observed=True)[axis]:
+            arr = values.to_numpy(dtype="float64")
+            quantiles = np.quantile(arr, list(percentiles))
+            results.append({
+                by: None if pd.isna(key) else key,
+                "count": len(arr),
+                "mean": round(float(arr.mean()), 4),
+                "std": round(float(arr.std(ddof=1)), 4) if len(arr) > 1 else float("nan"),
+                "min": round(float(arr.min()), 4),
+                "max": round(float(arr.max()), 4),
+                **{DuckDBSensorBackend.percentile_key(q): round(float(v), 4) for q, v in zip(percentiles, quantiles)},
+            })
+        return results
 
     def get_window(
         self,
@@ -214,10 +866,77 @@ class SensorStore:
         Returns:
             컨텍스트 딕셔너리
         """
-        # 가장 가까운 시점 찾기
-        idx = (self._data["timestamp"] - timestamp).abs().idxmin()
-        row = self._data.loc[idx]
+        if self._backend is not None:
+            row = self._backend.get_context_at(timestamp)
+            return {} if row is None else self._format_context(row)
+
+        return self.get_context_at_many([timestamp])[0]
+
+    def get_context_at_many(self, timestamps: Sequence[datetime]) -> List[Dict[str, Any]]:
+        """여러 시점의 컨텍스트 정보 (일괄 조회)
+
+        정렬된 타임스탬프 인덱스에 대한 searchsorted 한 번으로 각 시각의
+        최근접 샘플을 찾고, 컨텍스트 컬럼을 컬럼 단위로 추출합니다.
+        거리가 같으면 앞쪽 샘플을 선택합니다.
+
+        Args:
+            timestamps: 조회 시각 목록
+
+        Returns:
+            입력 순서와 같은 컨텍스트 딕셔너리 목록
+        """
+        if len(timestamps) == 0:
+            return []
+
+        if self._backend is not None:
+            return [self.get_context_at(ts) for ts in timestamps]
+
+        if self._dataset is not None:
+            # 최근접 파티션별로 묶어 파티션당 한 번씩 일괄 조회
+            contexts: List[Dict[str, Any]] = [{} for _ in timestamps]
+            groups: Dict[str, Tuple[Any, List[int]]] = {}
+            for i, ts in enumerate(timestamps):
+                partition = self._nearest_partition(ts)
+                groups.setdefault(partition.key, (partition, []))[1].append(i)
+            for partition, positions in groups.values():
+                found = self._partition_store(partition).get_context_at_many([timestamps[i] for i in positions])
+                for i, context in zip(positions, found):
+                    contexts[i] = context
+            return contexts
+
+        if len(self._ts_ns) == 0:
+            return [{} for _ in timestamps]
+
+        targets = pd.DatetimeIndex(pd.to_datetime(list(timestamps)))
+        if targets.tz is not None:
+            targets = targets.tz_convert(None)
+        positions = self._nearest_positions(targets.asi8)
+
+        stamps = self._data["timestamp"].iloc[positions]
+        contexts = [{"timestamp": ts.isoformat()} for ts in stamps]
 
+        for col in DataLoader.get_context_columns():
+            if col not in self._data.columns:
+                continue
+            column = self._data[col].iloc[positions]
+            missing = column.isna().to_numpy()
+            values = column.astype(object).tolist()
+            for context, value, is_missing in zip(contexts, values, missing):
+                context[col] = None if is_missing else value
+
+        return contexts
+
+    def _nearest_positions(self, targets_ns: np.ndarray) -> np.ndarray:
+        """각 시각의 최근접 샘플 위치 (거리가 같으면 앞쪽)"""
+        ts = self._ts_ns
+        right = np.clip(np.searchsorted(ts, targets_ns, side="left"), 0, len(ts) - 1)
+        left = np.maximum(right - 1, 0)
+        use_left = np.abs(targets_ns - ts[left]) <= np.abs(ts[right] - targets_ns)
+        return np.where(use_left, left, right)
+
+    @staticmethod
+    def _format_context(row: pd.Series) -> Dict[str, Any]:
+        """행을 컨텍스트 딕셔너리로 변환"""
         context = {
             "timestamp": row["timestamp"].isoformat(),
         }
@@ -233,16 +952,50 @@ class SensorStore:
 
         return context
 
+    def _nearest_partition(self, timestamp: datetime):
+        """시각을 포함하거나 가장 가까운 파티션"""
+        partitions = self._dataset.partitions
+        if not partitions:
+            raise ValueError("파티션 데이터셋이 비어 있습니다")
+
+        target = pd.Timestamp(timestamp)
+        if target.tzinfo is not None:
+            target = target.tz_convert(None)
+
+        def distance(partition) -> float:
+            if partition.start <= target <= partition.end:
+                return 0.0
+            return min(abs(partition.start - target), abs(partition.end - target)).total_seconds()
+
+        return min(partitions, key=distance)
+
     def get_summary(self) -> Dict[str, Any]:
         """전체 데이터 요약
 
         Returns:
             요약 딕셔너리
         """
-        time_range = DataLoader.get_time_range(self._data)
+        if self._backend is not None:
+            time_range = self._backend.time_range()
+            total_records = self._backend.count()
+        elif self._dataset is not None:
+            time_range = self._dataset.time_range()
+            total_records = sum(p.rows for p in self._dataset.partitions)
+        else:
+            time_range = (
+                self._ns_to_datetime(self._ts_ns[0]),
+                self._ns_to_datetime(self._ts_ns[-1]),
+            )
+            total_records = len(self._data)
+
+        # 실시간 적재 샘플 (get_data/get_statistics와 같은 범위)
+        live = self._live_snapshot(axes=[])
+        if live is not None:
+            total_records += len(live)
+            time_range = (time_range[0], self._ns_to_datetime(live.ts_ns[-1]))
 
         summary = {
-            "total_records": len(self._data),
+            "total_records": total_records,
             "time_range": {
                 "start": time_range[0].isoformat(),
                 "end": time_range[1].isoformat(),
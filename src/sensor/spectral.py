@@ -0,0 +1,109 @@
+"""
+단시간 푸리에 변환(STFT) 대역 에너지
+
+여러 축 시계열을 scipy.signal.stft 한 번으로 변환하고,
+주파수 누적합으로 설정된 대역들의 프레임별 에너지를 한 번에 계산합니다.
+(k축 × b대역 × t프레임) 배열을 반환하므로 대역/축 수와 무관하게 FFT는 한 번입니다.
+
+STFT는 균일 샘플링을 가정합니다. 결측 구간이 있는 데이터는 인접 샘플이
+이어진 것으로 취급됩니다.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+from scipy import signal
+
+
+@dataclass
+class BandEnergies:
+    """STFT 대역 에너지
+
+    Attributes:
+        bands: 대역 이름 목록 (나이퀴스트 이하로 잘린 대역만)
+        edges_hz: 대역별 (하한, 상한) 주파수
+        frame_starts: 프레임별 첫 샘플 위치
+        frame_length: 프레임 샘플 수 (nperseg)
+        energies: 대역 에너지 (n_axes, n_bands, n_frames)
+        peak_freqs_hz: 대역 안 최대 성분 주파수 (n_axes, n_bands, n_frames)
+    """
+
+    bands: List[str]
+    edges_hz: List[Tuple[float, float]]
+    frame_starts: np.ndarray
+    frame_length: int
+    energies: np.ndarray
+    peak_freqs_hz: np.ndarray
+
+
+def band_energies(
+    values: np.ndarray,
+    sample_rate_hz: float,
+    bands: Dict[str, Sequence[float]],
+    nperseg: int = 256,
+    overlap: float = 0.5
+) -> BandEnergies:
+    """축별 STFT 대역 에너지 계산
+
+    Args:
+        values: (n_samples, n_axes) 배열 (1D면 단일 축)
+        sample_rate_hz: 샘플링 주기 (Hz)
+        bands: 대역 이름 → [하한 Hz, 상한 Hz] (상한은 나이퀴스트로 잘림)
+        nperseg: 프레임 샘플 수
+        overlap: 프레임 겹침 비율 (0 ≤ overlap < 1)
+
+    Returns:
+        BandEnergies (프레임이 없으면 n_frames = 0)
+
+    Raises:
+        ValueError: 잘못된 대역 또는 겹침 비율
+    """
+    if not 0 <= overlap < 1:
+        raise ValueError(f"overlap은 0 이상 1 미만이어야 합니다: {overlap}")
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 1:
+        values = values[:, None]
+    n_samples, n_axes = values.shape
+
+    nyquist = sample_rate_hz / 2
+    names, edges = [], []
+    for name, (low, high) in bands.items():
+        if low >= high:
+            raise ValueError(f"대역 하한이 상한보다 커야 합니다: {name} [{low}, {high}]")
+        if low < nyquist:
+            names.append(name)
+            edges.append((float(low), float(min(high, nyquist))))
+
+    nperseg = min(nperseg, n_samples)
+    noverlap = min(int(nperseg * overlap), nperseg - 1)
+    step = nperseg - noverlap
+    if not names or n_samples < 2:
+        empty = np.empty((n_axes, len(names), 0))
+        return BandEnergies(names, edges, np.empty(0, dtype=np.int64), nperseg, empty, empty)
+
+    # 모든 축을 한 번에 변환 → (n_axes, n_freqs, n_frames)
+    freqs, _, spectrum = signal.stft(
+        values.T, fs=sample_rate_hz, nperseg=nperseg, noverlap=noverlap,
+        detrend="constant", boundary=None, padded=False, axis=-1,
+    )
+    power = np.abs(spectrum) ** 2
+    n_frames = power.shape[-1]
+
+    # 주파수 누적합 → 대역 경계 차분으로 모든 대역 에너지
+    cumulative = np.concatenate(
+        (np.zeros((n_axes, 1, n_frames)), np.cumsum(power, axis=1)), axis=1
+    )
+    lo = np.searchsorted(freqs, [e[0] for e in edges], side="left")
+    hi = np.searchsorted(freqs, [e[1] for e in edges], side="right")
+    energies = cumulative[:, hi, :] - cumulative[:, lo, :]
+
+    # 대역별 최대 성분 주파수 (빈 대역은 NaN)
+    peak_freqs = np.full((n_axes, len(names), n_frames), np.nan)
+    for b in range(len(names)):
+        if hi[b] > lo[b]:
+            peak_bins = lo[b] + np.argmax(power[:, lo[b]:hi[b], :], axis=1)
+            peak_freqs[:, b, :] = freqs[peak_bins]
+
+    frame_starts = np.arange(n_frames, dtype=np.int64) * step
+    return BandEnergies(names, edges, frame_starts, nperseg, energies, peak_freqs)
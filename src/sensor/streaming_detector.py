@@ -0,0 +1,653 @@
+"""
+스트리밍 패턴 감지
+
+임의 크기의 샘플 청크를 시간순으로 받아 PatternDetector와 같은 규칙으로
+충돌/과부하/드리프트/진동 패턴을 감지합니다. 청크 경계에 걸친 상태
+(열린 과부하/충돌/진동 구간, 롤링 표준편차 꼬리, 드리프트 시간 버킷/그룹,
+충돌 baseline용 최근 샘플)를 유지하고, 구간이 닫히는 시점에 DetectedPattern을 반환합니다.
+
+메모리는 청크 크기 + 롤링 윈도우 + baseline 윈도우(±5초)로 제한되며,
+get_state()/load_state()로 JSON 직렬화 가능한 상태를 저장·복원할 수 있습니다.
+
+배치 감지와의 차이:
+- 드리프트 baseline과 진동 global_std는 전체 데이터가 아니라 지금까지 본 샘플의
+  누적 통계를 사용합니다 (reference_baseline / reference_std로 고정 가능).
+  누적 통계는 샘플 단위로 갱신되어 청크/실행 경계와 무관합니다. 진동 임계값은
+  샘플마다 그 샘플까지의 표준편차로, 드리프트 baseline은 시간 버킷의 마지막
+  샘플까지의 평균으로 정하고, 진동 패턴의 global_std는 구간 시작 시점 값입니다.
+- 드리프트 시간 버킷은 epoch 기준으로 정렬합니다 (1시간 윈도우는 resample과 동일).
+- 진동 윈도우의 샘플링 주기는 첫 청크의 타임스탬프로 추정해 고정합니다
+  (sample_rate_hz로 지정 가능).
+"""
+
+import logging
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .pattern_detector import PatternDetector
+from .patterns import DetectedPattern
+from .range_stats import window_means
+from .rolling import infer_sample_rate, rolling_std, window_samples
+from .segments import Segments, find_segments
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Run:
+    """청크 경계를 넘어 이어질 수 있는 구간 (플래그 샘플 기준 집계)"""
+
+    start_ts: int
+    end_ts: int
+    start_index: int
+    end_index: int
+    count: int
+    total: float
+    peak: float
+    peak_ts: int
+    # 구간 시작 시점의 기준값 (진동: 누적 표준편차)
+    reference: float = 0.0
+
+    def merged(self, other: "_Run", peak_op: str) -> "_Run":
+        """뒤따르는 구간과 병합 (피크 동률이면 앞선 샘플 유지)"""
+        later_peak = other.peak < self.peak if peak_op == "min" else other.peak > self.peak
+        return _Run(
+            start_ts=self.start_ts,
+            end_ts=other.end_ts,
+            start_index=self.start_index,
+            end_index=other.end_index,
+            count=self.count + other.count,
+            total=self.total + other.total,
+            peak=other.peak if later_peak else self.peak,
+            peak_ts=other.peak_ts if later_peak else self.peak_ts,
+            reference=self.reference,
+        )
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count
+
+    @property
+    def duration_s(self) -> float:
+        return (self.end_ts - self.start_ts) / 1e9
+
+
+def _run_from_dict(data: Optional[Dict[str, Any]]) -> Optional[_Run]:
+    return _Run(**data) if data else None
+
+
+def _run_to_dict(run: Optional[_Run]) -> Optional[Dict[str, Any]]:
+    return asdict(run) if run is not None else None
+
+
+class StreamingPatternDetector:
+    """청크 단위 증분 패턴 감지기"""
+
+    # get_state() 포맷 버전
+    STATE_VERSION = 2
+
+    def __init__(
+        self,
+        detector: PatternDetector,
+        axis: str = "Fz",
+        reference_baseline: Optional[float] = None,
+        reference_std: Optional[float] = None,
+        sample_rate_hz: Optional[float] = None
+    ):
+        """초기화
+
+        Args:
+            detector: 설정/패턴 ID를 제공하는 PatternDetector
+            axis: 분석할 축
+            reference_baseline: 드리프트 기준 평균 (없으면 누적 평균)
+            reference_std: 진동 기준 표준편차 (없으면 누적 표준편차)
+            sample_rate_hz: 샘플링 주기 (없으면 첫 청크 타임스탬프로 추정)
+        """
+        self._detector = detector
+        self.axis = axis
+        self.reference_baseline = reference_baseline
+        self.reference_std = reference_std
+        self._reset()
+        self._sample_rate_hz = sample_rate_hz
+
+    def _reset(self) -> None:
+        """상태 초기화"""
+        self._n_seen = 0
+        self._last_ts: Optional[int] = None
+        # 누적 통계 (count, mean, M2) - Welford 병합
+        self._moments = [0, 0.0, 0.0]
+
+        self._collision_open: Optional[_Run] = None
+        self._collision_pending: List[Tuple[int, float]] = []
+        self._buffer_ts = np.empty(0, dtype=np.int64)
+        self._buffer_values = np.empty(0, dtype=np.float64)
+
+        self._overload_open: Optional[_Run] = None
+
+        self._vibration_open: Optional[_Run] = None
+        self._vibration_tail = np.empty(0, dtype=np.float64)
+        self._sample_rate_hz: Optional[float] = None
+
+        # 드리프트: 열린 시간 버킷 [key, sum, count], 열린 그룹
+        self._drift_bucket: Optional[List] = None
+        self._drift_group: Optional[Dict[str, Any]] = None
+
+    @property
+    def samples_seen(self) -> int:
+        """지금까지 입력된 샘플 수"""
+        return self._n_seen
+
+    @property
+    def baseline(self) -> float:
+        """드리프트 기준 평균"""
+        if self.reference_baseline is not None:
+            return float(self.reference_baseline)
+        return self._moments[1]
+
+    @property
+    def global_std(self) -> float:
+        """진동 기준 표준편차 (표본 표준편차, ddof=1)"""
+        if self.reference_std is not None:
+            return float(self.reference_std)
+        count, _, m2 = self._moments
+        return float(np.sqrt(m2 / (count - 1))) if count > 1 else 0.0
+
+    @property
+    def last_timestamp(self) -> Optional[pd.Timestamp]:
+        """마지막으로 입력된 샘플 시각"""
+        return pd.Timestamp(self._last_ts) if self._last_ts is not None else None
+
+    def watermarks(self) -> Dict[str, Optional[int]]:
+        """감지기별 확정 워터마크 (ns)
+
+        워터마크보다 이른 시각의 패턴은 모두 방출되었고, 이후 패턴은
+        열린 구간에 남아 있거나 아직 입력되지 않은 샘플에 속합니다.
+
+        Returns:
+            감지기 이름 → 워터마크 (입력 전이면 None)
+        """
+        if self._last_ts is None:
+            return {name: None for name in ("collision", "overload", "drift", "vibration")}
+
+        collision = [p[0] for p in self._collision_pending]
+        if self._collision_open is not None:
+            collision.append(self._collision_open.start_ts)
+        drift = self._drift_bucket[0] * self._drift_window_ns if self._drift_bucket else self._last_ts
+        if self._drift_group is not None:
+            drift = self._drift_group["start"]
+
+        return {
+            "collision": min(collision, default=self._last_ts),
+            "overload": self._overload_open.start_ts if self._overload_open else self._last_ts,
+            "drift": drift,
+            "vibration": self._vibration_open.start_ts if self._vibration_open else self._last_ts,
+        }
+
+    # ============================================================
+    # 입력
+    # ============================================================
+
+    def feed(self, chunk: pd.DataFrame) -> List[DetectedPattern]:
+        """샘플 청크 입력
+
+        청크 하나는 PatternDetector의 한 설정 버전으로 처리합니다.
+
+        Args:
+            chunk: timestamp + 축 컬럼 DataFrame (시간순, 이전 청크 이후)
+
+        Returns:
+            이번 청크로 닫힌 패턴 목록 (충돌, 과부하, 드리프트, 진동 순)
+
+        Raises:
+            ValueError: 타임스탬프가 정렬되어 있지 않거나 이전 청크와 겹칠 때
+        """
+        with self._detector.pinned():
+            return self._feed_chunk(chunk)
+
+    def _feed_chunk(self, chunk: pd.DataFrame) -> List[DetectedPattern]:
+        if chunk is None or len(chunk) == 0:
+            return []
+
+        ts = chunk["timestamp"].to_numpy(dtype="datetime64[ns]").view("int64")
+        values = chunk[self.axis].to_numpy(dtype=np.float64)
+        if np.any(np.diff(ts) <= 0):
+            raise ValueError("청크 타임스탬프는 오름차순이어야 합니다")
+        if self._last_ts is not None and ts[0] <= self._last_ts:
+            raise ValueError(
+                f"이전 청크 이후 샘플만 입력할 수 있습니다: {pd.Timestamp(int(ts[0]))} <= "
+                f"{pd.Timestamp(self._last_ts)}"
+            )
+
+        if self._sample_rate_hz is None and len(ts) > 1:
+            self._sample_rate_hz = infer_sample_rate(ts)
+
+        base = self._n_seen
+        means, stds = self._advance_moments(values)
+        self._n_seen += len(values)
+        self._last_ts = int(ts[-1])
+
+        patterns = []
+        patterns.extend(self._feed_collision(ts, values, base))
+        patterns.extend(self._feed_overload(ts, values, base))
+        patterns.extend(self._feed_drift(ts, values, means))
+        patterns.extend(self._feed_vibration(ts, values, base, stds))
+        return patterns
+
+    def flush(self) -> List[DetectedPattern]:
+        """열린 구간을 모두 닫고 패턴 반환 (스트림 종료 시)
+
+        Returns:
+            닫힌 패턴 목록 (충돌, 과부하, 드리프트, 진동 순)
+        """
+        with self._detector.pinned():
+            return self._flush_open_runs()
+
+    def _flush_open_runs(self) -> List[DetectedPattern]:
+        patterns = []
+
+        if self._collision_open is not None:
+            run = self._collision_open
+            self._collision_pending.append((run.peak_ts, run.peak))
+            self._collision_open = None
+        patterns.extend(self._resolve_collisions(final=True))
+
+        if self._overload_open is not None:
+            patterns.extend(self._overload_patterns([self._overload_open]))
+            self._overload_open = None
+
+        if self._drift_bucket is not None:
+            bucket, self._drift_bucket = self._drift_bucket, None
+            patterns.extend(self._process_drift_buckets([bucket]))
+        if self._drift_group is not None:
+            patterns.extend(self._close_drift_group())
+
+        if self._vibration_open is not None:
+            patterns.extend(self._vibration_patterns([self._vibration_open]))
+            self._vibration_open = None
+
+        return patterns
+
+    def _advance_moments(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """누적 평균/분산을 샘플 단위로 갱신 (NaN 제외)
+
+        이전 누적 평균(첫 입력이면 첫 유효 샘플)만큼 이동한 누적합으로 계산하므로
+        결과가 청크 경계와 무관하고 큰 오프셋에서도 안정적입니다.
+
+        Returns:
+            (각 샘플까지의 누적 평균, 누적 표준편차(ddof=1)) - 유효 샘플이 없으면 0
+        """
+        count, mean, m2 = self._moments
+        valid = ~np.isnan(values)
+        if not valid.any():
+            return np.full(len(values), float(mean)), np.full(len(values), self.global_std)
+
+        shift = mean if count > 0 else float(values[valid][0])
+        shifted = np.where(valid, values - shift, 0.0)
+        counts = count + np.cumsum(valid)
+        sums = np.cumsum(shifted)
+        sumsq = m2 + (mean - shift) ** 2 * count + np.cumsum(shifted * shifted)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = np.where(counts > 0, shift + sums / counts, 0.0)
+            m2s = np.maximum(sumsq - np.where(counts > 0, sums * sums / counts, 0.0), 0.0)
+            stds = np.where(counts > 1, np.sqrt(m2s / (counts - 1)), 0.0)
+
+        self._moments = [int(counts[-1]), float(means[-1]), float(m2s[-1])]
+        return means, stds
+
+    @staticmethod
+    def _advance_runs(
+        open_run: Optional[_Run],
+        segments: Segments,
+        ts: np.ndarray,
+        values: np.ndarray,
+        base: int,
+        max_gap: int,
+        peak_op: str,
+        references: Optional[np.ndarray] = None
+    ) -> Tuple[List[_Run], Optional[_Run]]:
+        """청크 세그먼트를 열린 구간에 이어붙이고 닫힌 구간 분리
+
+        Args:
+            open_run: 이전 청크에서 이어지는 구간
+            segments: 이번 청크의 세그먼트
+            ts: 청크 타임스탬프 (ns)
+            values: 집계 대상 값
+            base: 청크 첫 샘플의 전역 위치
+            max_gap: 같은 구간으로 볼 최대 위치 차이
+            peak_op: "min" | "max"
+            references: 샘플별 기준값 (구간 시작 샘플 값을 _Run.reference로 기록)
+
+        Returns:
+            (닫힌 구간 목록, 열린 구간)
+        """
+        closed = []
+        if len(segments):
+            counts = segments.counts
+            totals = segments.reduce(values, "sum")
+            peaks = segments.argmin(values) if peak_op == "min" else segments.argmax(values)
+
+            for i in range(len(segments)):
+                run = _Run(
+                    start_ts=int(ts[segments.starts[i]]),
+                    end_ts=int(ts[segments.ends[i]]),
+                    start_index=base + int(segments.starts[i]),
+                    end_index=base + int(segments.ends[i]),
+                    count=int(counts[i]),
+                    total=float(totals[i]),
+                    peak=float(values[peaks[i]]),
+                    peak_ts=int(ts[peaks[i]]),
+                    reference=float(references[segments.starts[i]]) if references is not None else 0.0,
+                )
+                if open_run is not None and run.start_index - open_run.end_index <= max_gap:
+                    open_run = open_run.merged(run, peak_op)
+                else:
+                    if open_run is not None:
+                        closed.append(open_run)
+                    open_run = run
+
+        # 이후 샘플이 더 이상 이어붙을 수 없으면 닫음
+        last_index = base + len(ts) - 1
+        if open_run is not None and last_index - open_run.end_index >= max_gap:
+            closed.append(open_run)
+            open_run = None
+        return closed, open_run
+
+    # ============================================================
+    # 충돌
+    # ============================================================
+
+    def _feed_collision(self, ts: np.ndarray, values: np.ndarray, base: int) -> List[DetectedPattern]:
+        threshold = self._detector.collision_threshold
+        closed, self._collision_open = self._advance_runs(
+            self._collision_open, find_segments(values < threshold),
+            ts, values, base, max_gap=1, peak_op="min",
+        )
+        self._collision_pending.extend((run.peak_ts, run.peak) for run in closed)
+
+        self._buffer_ts = np.concatenate((self._buffer_ts, ts))
+        self._buffer_values = np.concatenate((self._buffer_values, values))
+        patterns = self._resolve_collisions()
+
+        # baseline 계산에 필요한 최근 샘플만 유지
+        keep_from = self._last_ts
+        if self._collision_open is not None:
+            keep_from = min(keep_from, self._collision_open.peak_ts)
+        if self._collision_pending:
+            keep_from = min(keep_from, self._collision_pending[0][0])
+        keep_from -= PatternDetector.COLLISION_BASELINE_WINDOW_NS
+        cut = int(np.searchsorted(self._buffer_ts, keep_from, side="left"))
+        self._buffer_ts = self._buffer_ts[cut:]
+        self._buffer_values = self._buffer_values[cut:]
+        return patterns
+
+    def _resolve_collisions(self, final: bool = False) -> List[DetectedPattern]:
+        """baseline 윈도우(피크 +5초)가 채워진 충돌 확정"""
+        window_ns = PatternDetector.COLLISION_BASELINE_WINDOW_NS
+        if final:
+            ready, self._collision_pending = self._collision_pending, []
+        else:
+            ready = [p for p in self._collision_pending if p[0] + window_ns <= self._last_ts]
+            self._collision_pending = self._collision_pending[len(ready):]
+        if not ready:
+            return []
+
+        threshold = self._detector.collision_threshold
+        baselines = window_means(
+            self._buffer_ts, self._buffer_values, self._buffer_values > threshold,
+            centers_ns=np.array([p[0] for p in ready], dtype=np.int64),
+            half_window_ns=window_ns,
+        )
+        return [
+            self._detector._collision_pattern(self.axis, pd.Timestamp(peak_ts), peak, float(baseline))
+            for (peak_ts, peak), baseline in zip(ready, baselines)
+        ]
+
+    # ============================================================
+    # 과부하
+    # ============================================================
+
+    def _feed_overload(self, ts: np.ndarray, values: np.ndarray, base: int) -> List[DetectedPattern]:
+        abs_values = np.abs(values)
+        closed, self._overload_open = self._advance_runs(
+            self._overload_open, find_segments(abs_values > self._detector.overload_threshold),
+            ts, abs_values, base, max_gap=1, peak_op="max",
+        )
+        return self._overload_patterns(closed)
+
+    def _overload_patterns(self, runs: List[_Run]) -> List[DetectedPattern]:
+        min_duration_s = self._detector.overload_min_duration_s
+        return [
+            self._detector._overload_pattern(
+                self.axis, pd.Timestamp(run.start_ts), run.duration_s, run.peak, run.mean
+            )
+            for run in runs
+            if run.duration_s >= min_duration_s
+        ]
+
+    # ============================================================
+    # 드리프트
+    # ============================================================
+
+    @property
+    def _drift_window_ns(self) -> int:
+        return int(self._detector.drift_window_hours * 3600 * 1e9)
+
+    def _feed_drift(self, ts: np.ndarray, values: np.ndarray, means: np.ndarray) -> List[DetectedPattern]:
+        window_ns = self._drift_window_ns
+        valid = ~np.isnan(values)
+        keys, first = np.unique(ts // window_ns, return_index=True)
+        sums = np.add.reduceat(np.where(valid, values, 0.0), first)
+        counts = np.add.reduceat(valid.astype(np.int64), first)
+        # 버킷 기준 평균: 버킷 마지막 샘플까지의 누적 평균 (열린 버킷은 입력마다 갱신)
+        lasts = np.append(first[1:], len(ts)) - 1
+        buckets = [
+            [int(k), float(s), int(c), float(m)]
+            for k, s, c, m in zip(keys, sums, counts, means[lasts])
+        ]
+
+        closed = []
+        if self._drift_bucket is not None:
+            if self._drift_bucket[0] == buckets[0][0]:
+                buckets[0][1] += self._drift_bucket[1]
+                buckets[0][2] += self._drift_bucket[2]
+            else:
+                closed.append(self._drift_bucket)
+        closed.extend(buckets[:-1])
+        self._drift_bucket = buckets[-1]
+
+        patterns = self._process_drift_buckets(closed)
+
+        # 열린 버킷이 그룹과 2윈도우 넘게 떨어지면 더 이어질 수 없음
+        group = self._drift_group
+        if group is not None and self._drift_bucket[0] * window_ns - group["end"] > 2 * window_ns:
+            patterns.extend(self._close_drift_group())
+        return patterns
+
+    def _process_drift_buckets(self, buckets: List[List]) -> List[DetectedPattern]:
+        """닫힌 시간 버킷 평균으로 드리프트 그룹 갱신"""
+        window_ns = self._drift_window_ns
+        threshold_pct = self._detector.drift_threshold_pct
+        patterns = []
+
+        for key, total, count, bucket_baseline in buckets:
+            if count == 0:
+                continue
+            bucket_start = key * window_ns
+            baseline = self.baseline if self.reference_baseline is not None else bucket_baseline
+            use_absolute_mode = abs(baseline) < PatternDetector.DRIFT_BASELINE_EPSILON
+            if use_absolute_mode:
+                deviation = abs(total / count - baseline)
+                flagged = deviation > PatternDetector.DRIFT_ABSOLUTE_THRESHOLD
+            else:
+                deviation = (total / count - baseline) / abs(baseline) * 100
+                flagged = abs(deviation) > threshold_pct
+            if not flagged:
+                continue
+
+            group = self._drift_group
+            if group is not None and bucket_start - group["end"] > 2 * window_ns:
+                patterns.extend(self._close_drift_group())
+                group = None
+            if group is None:
+                self._drift_group = {
+                    "start": bucket_start,
+                    "end": bucket_start,
+                    "deviation_sum": deviation,
+                    "deviation_count": 1,
+                    "baseline": baseline,
+                    "absolute": use_absolute_mode,
+                }
+            else:
+                group["end"] = bucket_start
+                group["deviation_sum"] += deviation
+                group["deviation_count"] += 1
+                group["baseline"] = baseline
+
+        return patterns
+
+    def _close_drift_group(self) -> List[DetectedPattern]:
+        group, self._drift_group = self._drift_group, None
+        duration_h = (group["end"] - group["start"]) / 3600e9
+        if duration_h < self._detector.drift_min_duration_h:
+            return []
+        return [self._detector._drift_pattern(
+            pd.Timestamp(group["start"]),
+            duration_h,
+            group["deviation_sum"] / group["deviation_count"],
+            group["baseline"],
+            group["absolute"],
+            self._detector.drift_threshold_pct,
+            axis=self.axis,
+        )]
+
+    # ============================================================
+    # 진동
+    # ============================================================
+
+    @property
+    def sample_rate_hz(self) -> float:
+        """진동 윈도우 샘플링 주기 (Hz, 추정 전이면 PatternDetector 기본값)"""
+        if self._sample_rate_hz is None:
+            return self._detector.DEFAULT_SAMPLE_RATE_HZ
+        return self._sample_rate_hz
+
+    @property
+    def _vibration_window_size(self) -> int:
+        return window_samples(self._detector.vibration_window_seconds, self.sample_rate_hz)
+
+    def _feed_vibration(
+        self,
+        ts: np.ndarray,
+        values: np.ndarray,
+        base: int,
+        cumulative_stds: np.ndarray
+    ) -> List[DetectedPattern]:
+        window_size = self._vibration_window_size
+
+        # 직전 window_size-1 샘플을 앞에 붙여 배치와 같은 롤링 표준편차
+        extended = np.concatenate((self._vibration_tail, values))
+        stds = rolling_std(extended, window_size, min_periods=window_size // 2)[len(self._vibration_tail):]
+        self._vibration_tail = extended[-(window_size - 1):]
+
+        # 샘플마다 그 샘플까지의 누적 표준편차로 임계값 (기준 표준편차가 있으면 고정)
+        if self.reference_std is not None:
+            global_stds = np.full(len(values), float(self.reference_std))
+        else:
+            global_stds = cumulative_stds
+        closed, self._vibration_open = self._advance_runs(
+            self._vibration_open,
+            find_segments(stds > global_stds * self._detector.vibration_std_multiplier),
+            ts, stds, base, max_gap=window_size, peak_op="max", references=global_stds,
+        )
+        return self._vibration_patterns(closed)
+
+    def _vibration_patterns(self, runs: List[_Run]) -> List[DetectedPattern]:
+        multiplier = self._detector.vibration_std_multiplier
+        return [
+            self._detector._vibration_pattern(
+                self.axis, pd.Timestamp(run.start_ts), run.duration_s,
+                run.reference, run.peak, run.mean, run.reference * multiplier,
+            )
+            for run in runs
+        ]
+
+    # ============================================================
+    # 상태 저장/복원
+    # ============================================================
+
+    def get_state(self) -> Dict[str, Any]:
+        """JSON 직렬화 가능한 상태
+
+        Returns:
+            상태 딕셔너리 (load_state로 복원)
+        """
+        return {
+            "version": self.STATE_VERSION,
+            "axis": self.axis,
+            "n_seen": self._n_seen,
+            "last_ts": self._last_ts,
+            "moments": list(self._moments),
+            "reference_baseline": self.reference_baseline,
+            "reference_std": self.reference_std,
+            "collision": {
+                "open": _run_to_dict(self._collision_open),
+                "pending": [[int(t), float(v)] for t, v in self._collision_pending],
+                "buffer_ts": self._buffer_ts.tolist(),
+                "buffer_values": self._buffer_values.tolist(),
+            },
+            "overload": {"open": _run_to_dict(self._overload_open)},
+            "drift": {
+                "bucket": list(self._drift_bucket) if self._drift_bucket is not None else None,
+                "group": dict(self._drift_group) if self._drift_group is not None else None,
+            },
+            "vibration": {
+                "open": _run_to_dict(self._vibration_open),
+                "tail": self._vibration_tail.tolist(),
+                "sample_rate_hz": self._sample_rate_hz,
+            },
+        }
+
+    def load_state(self, state: Dict[str, Any]) -> None:
+        """get_state() 결과로 상태 복원
+
+        Args:
+            state: 상태 딕셔너리
+
+        Raises:
+            ValueError: 버전/축이 맞지 않을 때
+        """
+        if state.get("version") != self.STATE_VERSION:
+            raise ValueError(f"지원하지 않는 상태 버전: {state.get('version')}")
+        if state.get("axis") != self.axis:
+            raise ValueError(f"축 불일치: {state.get('axis')} != {self.axis}")
+
+        self._n_seen = int(state["n_seen"])
+        self._last_ts = state["last_ts"]
+        self._moments = list(state["moments"])
+        # 생성 시 지정한 기준 통계가 우선
+        if self.reference_baseline is None:
+            self.reference_baseline = state.get("reference_baseline")
+        if self.reference_std is None:
+            self.reference_std = state.get("reference_std")
+
+        collision = state["collision"]
+        self._collision_open = _run_from_dict(collision["open"])
+        self._collision_pending = [(int(t), float(v)) for t, v in collision["pending"]]
+        self._buffer_ts = np.asarray(collision["buffer_ts"], dtype=np.int64)
+        self._buffer_values = np.asarray(collision["buffer_values"], dtype=np.float64)
+
+        self._overload_open = _run_from_dict(state["overload"]["open"])
+
+        drift = state["drift"]
+        self._drift_bucket = list(drift["bucket"]) if drift["bucket"] is not None else None
+        self._drift_group = dict(drift["group"]) if drift["group"] is not None else None
+
+        vibration = state["vibration"]
+        self._vibration_open = _run_from_dict(vibration["open"])
+        self._vibration_tail = np.asarray(vibration["tail"], dtype=np.float64)
+        self._sample_rate_hz = vibration.get("sample_rate_hz", self._sample_rate_hz)
+        logger.debug(f"스트리밍 감지 상태 복원: {self._n_seen} 샘플")
@@ -0,0 +1,519 @@
+"""
+SQLite 센서 시계열 저장소
+
+data/sensor_timeseries.db에 센서 샘플과 감지 이벤트를 저장합니다.
+- WAL 모드: 수집(쓰기) 중에도 조회(읽기)가 막히지 않습니다.
+- samples 테이블은 ts(int64 ns)를 INTEGER PRIMARY KEY(rowid 별칭)로 사용해
+  타임스탬프 순서로 클러스터링되며, 구간 조회는 B-tree 범위 스캔입니다.
+- 수집은 executemany 배치 + 단일 트랜잭션이며 parquet 재작성이 필요 없습니다.
+- rollup_60 / rollup_3600 테이블에 버킷별 행 수와 축별 유효(NULL 제외) 건수/합/
+  버킷 평균 기준 제곱편차합(m2)/min/max를 유지해 긴 구간 통계는 버킷 단위로 계산합니다.
+"""
+
+import json
+import logging
+import math
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .data_loader import DataLoader
+from .patterns import DetectedPattern
+
+logger = logging.getLogger(__name__)
+
+_NS_PER_SECOND = 1_000_000_000
+
+
+class SensorTimeSeriesDB:
+    """SQLite 센서 시계열 저장소 (SensorStore 백엔드)"""
+
+    DEFAULT_PATH = Path("data/sensor_timeseries.db")
+
+    # 롤업 버킷 크기 (초)
+    ROLLUP_LEVELS_S = [60, 3600]
+
+    # executemany 배치 크기
+    BATCH_SIZE = 10000
+
+    # 숫자형 컨텍스트 컬럼 (나머지는 TEXT)
+    NUMERIC_CONTEXT = {"payload_kg"}
+
+    def __init__(self, path: Optional[Path] = None):
+        """초기화
+
+        Args:
+            path: DB 파일 경로 (기본: DEFAULT_PATH)
+        """
+        self._path = Path(path or self.DEFAULT_PATH)
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._columns = ["ts", *DataLoader.SENSOR_AXES, *DataLoader.CONTEXT_COLUMNS]
+        self._init_schema()
+
+    @property
+    def path(self) -> Path:
+        """DB 파일 경로"""
+        return self._path
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """스레드별 연결 (WAL 모드에서 읽기는 동시 진행)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self._path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        """현재 스레드 연결 종료"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ================================================================
+    # 스키마
+    # ================================================================
+
+    def _init_schema(self) -> None:
+        """테이블/인덱스 생성 (없을 때만)"""
+        axis_cols = ", ".join(f'"{a}" REAL' for a in DataLoader.SENSOR_AXES)
+        context_cols = ", ".join(
+            f'"{c}" {"REAL" if c in self.NUMERIC_CONTEXT else "TEXT"}' for c in DataLoader.CONTEXT_COLUMNS
+        )
+        statements = [
+            # ts = rowid 별칭 → 타임스탬프 순 클러스터링
+            f"CREATE TABLE IF NOT EXISTS samples (ts INTEGER PRIMARY KEY, {axis_cols}, {context_cols})",
+            """CREATE TABLE IF NOT EXISTS events (
+                pattern_id TEXT PRIMARY KEY,
+                pattern_type TEXT NOT NULL,
+                ts INTEGER NOT NULL,
+                duration_ms INTEGER NOT NULL DEFAULT 0,
+                confidence REAL NOT NULL DEFAULT 1.0,
+                payload TEXT NOT NULL
+            )""",
+            "CREATE INDEX IF NOT EXISTS idx_events_ts ON events (ts)",
+            "CREATE INDEX IF NOT EXISTS idx_events_type_ts ON events (pattern_type, ts)",
+        ]
+        for seconds in self.ROLLUP_LEVELS_S:
+            statements.append(
+                f"CREATE TABLE IF NOT EXISTS rollup_{seconds} "
+                f"(bucket INTEGER PRIMARY KEY, count INTEGER NOT NULL, {self._rollup_stats_columns()})"
+            )
+
+        conn = self.connection
+        with self._write_lock, conn:
+            # 이전 형식(sumsq) 롤업은 삭제 후 샘플에서 다시 계산
+            marker = f"{DataLoader.SENSOR_AXES[0]}_m2"
+            stale = []
+            for seconds in self.ROLLUP_LEVELS_S:
+                columns = self._table_columns(conn, f"rollup_{seconds}")
+                if columns and marker not in columns:
+                    stale.append(seconds)
+            for seconds in stale:
+                conn.execute(f"DROP TABLE rollup_{seconds}")
+            for sql in statements:
+                conn.execute(sql)
+            if stale:
+                bounds = conn.execute("SELECT min(ts), max(ts) FROM samples").fetchone()
+                if bounds[0] is not None:
+                    self._refresh_rollups(conn, *bounds)
+                logger.info(f"시계열 DB 롤업 형식 갱신: {', '.join(f'rollup_{s}' for s in stale)}")
+
+    @staticmethod
+    def _rollup_stats_columns() -> str:
+        return ", ".join(
+            f'"{a}_count" INTEGER, "{a}_sum" REAL, "{a}_m2" REAL, "{a}_min" REAL, "{a}_max" REAL'
+            for a in DataLoader.SENSOR_AXES
+        )
+
+    @staticmethod
+    def _table_columns(conn: sqlite3.Connection, table: str) -> set:
+        return {row[1] for row in conn.execute(f'PRAGMA table_info("{table}")')}
+
+    # ================================================================
+    # 수집
+    # ================================================================
+
+    def append(self, df: pd.DataFrame) -> int:
+        """센서 샘플 추가 (같은 타임스탬프는 교체)
+
+        배치 단위 executemany로 한 트랜잭션에 기록하고,
+        영향받은 롤업 버킷만 재계산합니다.
+
+        Args:
+            df: 센서 데이터 (timestamp 필수)
+
+        Returns:
+            기록한 레코드 수
+        """
+        if df.empty:
+            return 0
+
+        ts = pd.to_datetime(df["timestamp"])
+        if ts.dt.tz is not None:
+            ts = ts.dt.tz_convert(None)
+        ts_ns = ts.to_numpy(dtype="datetime64[ns]").view("int64")
+
+        columns = [c for c in self._columns[1:] if c in df.columns]
+        values = [ts_ns.tolist()]
+        for col in columns:
+            series = df[col]
+            if col in DataLoader.SENSOR_AXES or col in self.NUMERIC_CONTEXT:
+                arr = series.to_numpy(dtype="float64")
+                values.append([None if math.isnan(v) else v for v in arr.tolist()])
+            else:
+                values.append(series.astype(object).where(series.notna(), None).tolist())
+        rows = list(zip(*values))
+
+        names = ", ".join(f'"{c}"' for c in ["ts", *columns])
+        placeholders = ", ".join("?" for _ in range(len(columns) + 1))
+        sql = f"INSERT OR REPLACE INTO samples ({names}) VALUES ({placeholders})"
+
+        conn = self.connection
+        with self._write_lock, conn:
+            for i in range(0, len(rows), self.BATCH_SIZE):
+                conn.executemany(sql, rows[i:i + self.BATCH_SIZE])
+            self._refresh_rollups(conn, int(ts_ns.min()), int(ts_ns.max()))
+
+        logger.debug(f"시계열 DB 샘플 기록: {len(rows)} 레코드")
+        return len(rows)
+
+    def _refresh_rollups(self, conn: sqlite3.Connection, first_ns: int, last_ns: int) -> None:
+        """[first_ns, last_ns]에 걸친 롤업 버킷 재계산 (재수집에도 멱등)
+
+        제곱편차합은 버킷 평균을 먼저 구한 뒤 편차로 누적합니다 (sumsq - n·mean² 상쇄 오차 없음).
+        """
+        axes = DataLoader.SENSOR_AXES
+        names = ", ".join(
+            f'"{a}_count", "{a}_sum", "{a}_m2", "{a}_min", "{a}_max"' for a in axes
+        )
+        means = ", ".join(f'avg("{a}") AS "{a}_mean"' for a in axes)
+        aggregates = ", ".join(
+            f'count(s."{a}"), sum(s."{a}"), '
+            f'sum((s."{a}" - m."{a}_mean") * (s."{a}" - m."{a}_mean")), min(s."{a}"), max(s."{a}")'
+            for a in axes
+        )
+        for seconds in self.ROLLUP_LEVELS_S:
+            width = seconds * _NS_PER_SECOND
+            lo = first_ns - first_ns % width
+            hi = last_ns - last_ns % width + width
+            conn.execute(
+                f"INSERT OR REPLACE INTO rollup_{seconds} (bucket, count, {names}) "
+                f"WITH m AS (SELECT (ts / {width}) * {width} AS bucket, {means} "
+                f"FROM samples WHERE ts >= ? AND ts < ? GROUP BY bucket) "
+                f"SELECT m.bucket, count(*), {aggregates} "
+                f"FROM m JOIN samples s ON s.ts >= m.bucket AND s.ts < m.bucket + {width} "
+                f"GROUP BY m.bucket",
+                (lo, hi),
+            )
+
+    def insert_events(self, patterns: Iterable[DetectedPattern]) -> int:
+        """감지 이벤트 저장 (pattern_id 기준 교체)
+
+        Returns:
+            기록한 이벤트 수
+        """
+        rows = [
+            (
+                p.pattern_id,
+                p.pattern_type.value,
+                self._to_ns(p.timestamp),
+                int(p.duration_ms),
+                float(p.confidence),
+                json.dumps(p.to_dict(), ensure_ascii=False, default=str),
+            )
+            for p in patterns
+        ]
+        conn = self.connection
+        with self._write_lock, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO events (pattern_id, pattern_type, ts, duration_ms, confidence, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    # ================================================================
+    # 조회 공통
+    # ================================================================
+
+    @staticmethod
+    def _to_ns(ts: datetime) -> int:
+        """datetime → int64 나노초 (tz-aware는 UTC 기준 naive로 변환)"""
+        stamp = pd.Timestamp(ts)
+        if stamp.tzinfo is not None:
+            stamp = stamp.tz_convert(None)
+        return int(stamp.value)
+
+    def _range(
+        self,
+        start: Optional[datetime],
+        end: Optional[datetime]
+    ) -> Tuple[str, List[Any]]:
+        """ts 범위 조건 (PRIMARY KEY 범위 스캔)"""
+        clauses, params = [], []
+        if start is not None:
+            clauses.append("ts >= ?")
+            params.append(self._to_ns(start))
+        if end is not None:
+            clauses.append("ts <= ?")
+            params.append(self._to_ns(end))
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    @staticmethod
+    def _check_axis(axis: str) -> None:
+        """센서 축 이름 확인
+
+        Raises:
+            ValueError: 알 수 없는 축
+        """
+        if axis not in DataLoader.SENSOR_AXES:
+            raise ValueError(f"알 수 없는 축: {axis}")
+
+    def _frame(self, sql: str, params: Sequence[Any]) -> pd.DataFrame:
+        """SELECT 결과를 DataFrame으로 (ts → timestamp)"""
+        cursor = self.connection.execute(sql, list(params))
+        names = [d[0] for d in cursor.description]
+        df = pd.DataFrame.from_records(cursor.fetchall(), columns=names)
+        if "ts" in df.columns:
+            df.insert(0, "timestamp", pd.to_datetime(df.pop("ts").astype("int64"), unit="ns"))
+        return df
+
+    # ================================================================
+    # 조회 (SensorStore 백엔드 인터페이스)
+    # ================================================================
+
+    def get_data(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        axes: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """시간 범위 데이터 조회 (시간순)"""
+        if axes is None:
+            select = ", ".join(f'"{c}"' for c in self._columns)
+        else:
+            select = ", ".join(f'"{c}"' for c in ["ts", *axes] if c in self._columns)
+        where, params = self._range(start, end)
+        return self._frame(f"SELECT {select} FROM samples{where} ORDER BY ts", params)
+
+    def get_statistics(
+        self,
+        axis: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """축별 통계 (SensorStore.get_statistics와 동일 형식)
+
+        구간 안에 완전히 포함된 1분 버킷은 롤업 테이블에서, 양 끝 부분 버킷은
+        원본 샘플에서 집계해 부분별 (건수, 평균, 제곱편차합)을 병합합니다.
+        mean/std/min/max는 NULL 축 값을 제외하고, count는 구간 행 수입니다.
+        """
+        if axis not in DataLoader.SENSOR_AXES:
+            return {"error": f"No data for axis {axis}"}
+
+        where, params = self._range(start, end)
+        bounds = self.connection.execute(
+            f"SELECT min(ts), max(ts) FROM samples{where}", params
+        ).fetchone()
+        if bounds[0] is None:
+            return {"error": f"No data for axis {axis}"}
+        first_ns, last_ns = bounds
+
+        width = self.ROLLUP_LEVELS_S[0] * _NS_PER_SECOND
+        inner_lo = -(-first_ns // width) * width           # 첫 완전 버킷 시작
+        inner_hi = ((last_ns + 1) // width) * width        # 마지막 완전 버킷 끝 (미포함)
+
+        rollup = f"rollup_{self.ROLLUP_LEVELS_S[0]}"
+        parts = []
+        if inner_lo < inner_hi:
+            # 버킷별 (건수, 평균, m2) 병합: m2 = Σm2_i + Σn_i·(mean_i - mean)²
+            parts.append(self.connection.execute(
+                f'WITH r AS (SELECT "{axis}_count" AS n, "{axis}_sum" / "{axis}_count" AS mean, '
+                f'"{axis}_m2" AS m2, "{axis}_min" AS lo, "{axis}_max" AS hi, count AS rows '
+                f'FROM {rollup} WHERE bucket >= ? AND bucket < ?), '
+                f"g AS (SELECT sum(n * mean) / sum(n) AS mean FROM r WHERE n > 0) "
+                f"SELECT (SELECT sum(rows) FROM r), sum(r.n), g.mean, "
+                f"sum(r.m2 + r.n * (r.mean - g.mean) * (r.mean - g.mean)), min(r.lo), max(r.hi) "
+                f"FROM r, g WHERE r.n > 0",
+                (inner_lo, inner_hi),
+            ).fetchone())
+            edges = [(first_ns, inner_lo - 1), (inner_hi, last_ns)]
+        else:
+            edges = [(first_ns, last_ns)]
+
+        for lo, hi in edges:
+            if lo > hi:
+                continue
+            # 부분 버킷: 구간 평균을 먼저 구한 뒤 편차 제곱합
+            parts.append(self.connection.execute(
+                f'WITH g AS (SELECT avg("{axis}") AS mean FROM samples WHERE ts >= ? AND ts <= ?) '
+                f'SELECT count(*), count("{axis}"), g.mean, '
+                f'sum(("{axis}" - g.mean) * ("{axis}" - g.mean)), min("{axis}"), max("{axis}") '
+                "FROM samples, g WHERE ts >= ? AND ts <= ?",
+                (lo, hi, lo, hi),
+            ).fetchone())
+
+        rows = sum(p[0] or 0 for p in parts)
+        # NULL 축 값은 건수/평균/분산/min/max에서 제외 (pandas와 동일)
+        parts = [p for p in parts if p[1]]
+        count = sum(p[1] for p in parts)
+        if count:
+            mean = sum(p[1] * p[2] for p in parts) / count
+            m2 = sum((p[3] or 0.0) + p[1] * (p[2] - mean) ** 2 for p in parts)
+        else:
+            mean, m2 = float("nan"), float("nan")
+        var = m2 / (count - 1) if count > 1 else float("nan")
+        minimum = min((p[4] for p in parts if p[4] is not None), default=float("nan"))
+        maximum = max((p[5] for p in parts if p[5] is not None), default=float("nan"))
+
+        return {
+            "axis": axis,
+            "mean": round(mean, 4),
+            "std": round(math.sqrt(max(var, 0.0)), 4) if count > 1 else float("nan"),
+            "min": round(minimum, 4),
+            "max": round(maximum, 4),
+            "count": rows,
+            "period": {
+                "start": pd.Timestamp(first_ns).isoformat(),
+                "end": pd.Timestamp(last_ns).isoformat()
+            }
+        }
+
+    def get_anomalies(
+        self,
+        axis: str,
+        threshold: float,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        direction: str = "absolute"
+    ) -> pd.DataFrame:
+        """임계값 이상치 조회"""
+        if axis not in DataLoader.SENSOR_AXES:
+            return pd.DataFrame()
+
+        where, params = self._range(start, end)
+        if direction == "above":
+            condition, extra = f'"{axis}" > ?', [threshold]
+        elif direction == "below":
+            condition, extra = f'"{axis}" < ?', [threshold]
+        else:
+            condition, extra = f'("{axis}" > ? OR "{axis}" < ?)', [threshold, -threshold]
+        where = f"{where} AND {condition}" if where else f" WHERE {condition}"
+
+        select = ", ".join(f'"{c}"' for c in self._columns)
+        return self._frame(f"SELECT {select} FROM samples{where} ORDER BY ts", [*params, *extra])
+
+    def get_rollup(
+        self,
+        axis: str,
+        seconds: int = 60,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        """롤업 버킷 조회 (차트/추세용)
+
+        Returns:
+            bucket, count, mean, min, max 컬럼 DataFrame
+
+        Raises:
+            ValueError: 알 수 없는 축 또는 없는 롤업 레벨
+        """
+        self._check_axis(axis)
+        if seconds not in self.ROLLUP_LEVELS_S:
+            raise ValueError(f"지원하지 않는 롤업 레벨: {seconds} (가능한 값: {self.ROLLUP_LEVELS_S})")
+        clauses, params = [], []
+        if start is not None:
+            clauses.append("bucket >= ?")
+            width = seconds * _NS_PER_SECOND
+            start_ns = self._to_ns(start)
+            params.append(start_ns - start_ns % width)
+        if end is not None:
+            clauses.append("bucket <= ?")
+            params.append(self._to_ns(end))
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+        df = self._frame(
+            f'SELECT bucket, count, "{axis}_sum" / NULLIF("{axis}_count", 0) AS mean, '
+            f'"{axis}_min" AS min, "{axis}_max" AS max '
+            f"FROM rollup_{seconds}{where} ORDER BY bucket",
+            params,
+        )
+        df["bucket"] = pd.to_datetime(df["bucket"].astype("int64"), unit="ns")
+        return df
+
+    def get_events(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        pattern_type: Optional[str] = None
+    ) -> List[DetectedPattern]:
+        """구간 이벤트 조회 (시간순)"""
+        where, params = self._range(start, end)
+        if pattern_type is not None:
+            where = f"{where} AND pattern_type = ?" if where else " WHERE pattern_type = ?"
+            params.append(pattern_type)
+        rows = self.connection.execute(f"SELECT payload FROM events{where} ORDER BY ts", params).fetchall()
+        return [DetectedPattern.from_dict(json.loads(row[0])) for row in rows]
+
+    def get_context_at(self, timestamp: datetime) -> Optional[pd.Series]:
+        """가장 가까운 시점의 행 (앞/뒤 한 행씩 인덱스 조회)"""
+        ts = self._to_ns(timestamp)
+        select = ", ".join(f'"{c}"' for c in self._columns)
+        before = self._frame(f"SELECT {select} FROM samples WHERE ts <= ? ORDER BY ts DESC LIMIT 1", [ts])
+        after = self._frame(f"SELECT {select} FROM samples WHERE ts >= ? ORDER BY ts LIMIT 1", [ts])
+        rows = [df.iloc[0] for df in (before, after) if not df.empty]
+        if not rows:
+            return None
+        target = pd.Timestamp(ts)
+        return min(rows, key=lambda row: abs(row["timestamp"] - target))
+
+    def latest_row(self) -> Optional[pd.Series]:
+        """최신 행"""
+        select = ", ".join(f'"{c}"' for c in self._columns)
+        df = self._frame(f"SELECT {select} FROM samples ORDER BY ts DESC LIMIT 1", [])
+        return None if df.empty else df.iloc[0]
+
+    def time_range(self) -> Optional[Tuple[datetime, datetime]]:
+        """전체 시간 범위"""
+        first, last = self.connection.execute("SELECT min(ts), max(ts) FROM samples").fetchone()
+        if first is None:
+            return None
+        return pd.Timestamp(first).to_pydatetime(), pd.Timestamp(last).to_pydatetime()
+
+    def count(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> int:
+        """구간 레코드 수"""
+        where, params = self._range(start, end)
+        return int(self.connection.execute(f"SELECT count(*) FROM samples{where}", params).fetchone()[0])
+
+    def get_axis_values(
+        self,
+        axis: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> np.ndarray:
+        """구간 축 값 배열 (시간순)"""
+        self._check_axis(axis)
+        where, params = self._range(start, end)
+        rows = self.connection.execute(f'SELECT "{axis}" FROM samples{where} ORDER BY ts', params).fetchall()
+        return np.array([r[0] for r in rows], dtype="float64")
+
+    def get_timestamps_ns(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> np.ndarray:
+        """구간 타임스탬프 (int64 ns, 시간순)"""
+        where, params = self._range(start, end)
+        rows = self.connection.execute(f"SELECT ts FROM samples{where} ORDER BY ts", params).fetchall()
+        return np.array([r[0] for r in rows], dtype="int64")
@@ -0,0 +1,47 @@
+"""단위 테스트 공용 헬퍼 (합성 센서 데이터)"""
+
+from datetime import datetime
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.sensor.data_loader import DataLoader
+
+
+def build_sensor_frame(
+    n: int,
+    freq: str = "1s",
+    start: datetime = datetime(2026, 1, 20),
+    seed: int = 0,
+    axes: Sequence[str] = DataLoader.SENSOR_AXES,
+    noise_std: float = 5.0,
+    fz_mean: float = -50.0,
+    fz_std: Optional[float] = 5.0,
+    offset: int = 0
+) -> pd.DataFrame:
+    """합성 센서 데이터
+
+    축은 N(0, noise_std) 잡음이고, Fz는 N(fz_mean, fz_std)로 다시 채웁니다
+    (fz_std가 None이면 다른 축과 같은 잡음). 이벤트(스파이크, 과부하 등)는 각 테스트에서 주입합니다.
+
+    Args:
+        n: 샘플 수
+        freq: 샘플 간격 (pandas 주기 문자열)
+        start: 첫 샘플 시각 (offset 0 기준)
+        seed: 난수 시드
+        axes: 생성할 축
+        noise_std: 축 잡음 표준편차
+        fz_mean: Fz 평균
+        fz_std: Fz 표준편차
+        offset: 시작 샘플 번호 (연속 구간을 나눠 만들 때)
+    """
+    rng = np.random.default_rng(seed)
+    first = pd.Timestamp(start) + offset * pd.Timedelta(freq)
+    df = pd.DataFrame({"timestamp": pd.date_range(first, periods=n, freq=freq)})
+    for axis in axes:
+        df[axis] = rng.normal(0, noise_std, n)
+    if "Fz" in axes and fz_std is not None:
+        df["Fz"] = rng.normal(fz_mean, fz_std, n)
+    return df
+
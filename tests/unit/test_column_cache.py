@@ -0,0 +1,149 @@
+"""ColumnCache / DataLoader 컬럼 캐시 단위 테스트"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.sensor.column_cache import ColumnCache
+from src.sensor.data_loader import DataLoader
+
+
+START = datetime(2026, 1, 20, 0, 0, 0)
+
+
+@pytest.fixture
+def parquet_path(tmp_path):
+    """컨텍스트 문자열 컬럼을 포함한 parquet 파일"""
+    n = 100
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "timestamp": pd.date_range(START, periods=n, freq="1s"),
+        "Fz": rng.normal(-50, 5, n),
+        "Fx": rng.normal(0, 1, n),
+        "shift": ["A", "B"] * (n // 2),
+        "error_code": [None] * (n - 1) + ["C153"],
+    })
+    df.loc[5, "Fz"] = np.nan
+    path = tmp_path / "axia80_week_01.parquet"
+    df.iloc[::-1].to_parquet(path)
+    yield path
+    DataLoader.clear_cache()
+
+
+class TestColumnCache:
+    """컬럼 캐시 테스트"""
+
+    def test_write_and_roundtrip(self, parquet_path):
+        """저장 후 동일한 값으로 복원"""
+        df = DataLoader.preprocess(pd.read_parquet(parquet_path))
+        cache = ColumnCache.write(df, parquet_path)
+
+        restored = cache.to_frame()
+
+        assert cache.columns == list(df.columns)
+        assert cache.column_kind("shift") == "category"
+        pd.testing.assert_frame_equal(restored, df, check_dtype=False)
+        assert restored["error_code"].iloc[0] is None
+
+    def test_numeric_columns_are_memory_mapped(self, parquet_path):
+        """숫자 컬럼은 복사 없는 mmap 뷰"""
+        df = DataLoader.preprocess(pd.read_parquet(parquet_path))
+        cache = ColumnCache.write(df, parquet_path)
+
+        frame = cache.to_frame(["timestamp", "Fz"])
+
+        assert isinstance(cache.array("Fz"), np.memmap)
+        assert np.shares_memory(frame["Fz"].to_numpy(), cache.array("Fz"))
+        assert not frame["Fz"].to_numpy().flags.writeable
+
+    def test_axis_only_does_not_open_strings(self, parquet_path):
+        """축만 요청하면 문자열 컬럼 파일을 열지 않음"""
+        df = DataLoader.preprocess(pd.read_parquet(parquet_path))
+        ColumnCache.write(df, parquet_path)
+        cache = ColumnCache.open_fresh(parquet_path)
+
+        cache.to_frame(["timestamp", "Fz", "unknown"])
+
+        assert set(cache._arrays) == {"timestamp", "Fz"}
+
+    def test_stale_when_source_changes(self, parquet_path):
+        """원본 변경 시 무효화"""
+        df = DataLoader.preprocess(pd.read_parquet(parquet_path))
+        ColumnCache.write(df, parquet_path)
+        assert ColumnCache.open_fresh(parquet_path) is not None
+
+        df.iloc[:10].to_parquet(parquet_path)
+
+        assert ColumnCache.open_fresh(parquet_path) is None
+
+
+class TestDataLoaderColumnCache:
+    """DataLoader 컬럼 캐시 연동 테스트"""
+
+    def test_load_creates_cache_and_preprocesses(self, parquet_path):
+        """최초 로드 시 전처리 + 캐시 생성"""
+        df = DataLoader.load(parquet_path)
+
+        assert ColumnCache.path_for(parquet_path).is_dir()
+        assert df["timestamp"].is_monotonic_increasing
+        assert not df["Fz"].isna().any()
+
+    def test_load_columns_subset(self, parquet_path):
+        """요청 컬럼만 로드"""
+        DataLoader.load(parquet_path)
+        DataLoader.clear_cache()
+
+        df = DataLoader.load(parquet_path, columns=["timestamp", "Fz"])
+
+        assert list(df.columns) == ["timestamp", "Fz"]
+        assert len(df) == 100
+
+    def test_clear_cache_removes_column_entries(self, parquet_path):
+        """경로별 초기화 시 컬럼 부분 로드 항목도 제거"""
+        DataLoader.load(parquet_path, columns=["timestamp", "Fz"])
+        DataLoader.load(parquet_path)
+
+        DataLoader.clear_cache(parquet_path)
+
+        assert not DataLoader._cache
+
+
+class TestCompactMode:
+    """컴팩트(Categorical / float32) 모드 테스트"""
+
+    def test_preprocess_compact_converts_context(self, parquet_path):
+        """컨텍스트 문자열 컬럼은 Categorical, 값은 동일"""
+        raw = pd.read_parquet(parquet_path)
+        plain = DataLoader.preprocess(raw.copy())
+
+        compact = DataLoader.preprocess(raw.copy(), compact=True)
+
+        assert isinstance(compact["shift"].dtype, pd.CategoricalDtype)
+        assert compact["Fz"].dtype == np.float64
+        assert compact["shift"].astype(object).tolist() == plain["shift"].tolist()
+        assert compact["error_code"].isna().sum() == len(compact) - 1
+
+    def test_compact_report_and_downcast(self, parquet_path):
+        """변환 전후 메모리 리포트, 축 float32 변환"""
+        df = DataLoader.preprocess(pd.read_parquet(parquet_path))
+
+        compact, report = DataLoader.compact(df, downcast_axes=True)
+
+        assert compact["Fz"].dtype == np.float32
+        assert report["after_mb"] < report["before_mb"]
+        assert report["ratio"] > 1.0
+        assert report["columns"]["shift"]["after"] < report["columns"]["shift"]["before"]
+
+    def test_load_compact_uses_cache_codes(self, parquet_path):
+        """컬럼 캐시 코드를 그대로 Categorical로 사용"""
+        plain = DataLoader.load(parquet_path)
+        DataLoader.clear_cache()
+
+        compact = DataLoader.load(parquet_path, compact=True)
+
+        assert isinstance(compact["error_code"].dtype, pd.CategoricalDtype)
+        assert compact["error_code"].iloc[-1] == plain["error_code"].iloc[-1]
+        assert pd.isna(compact["error_code"].iloc[0])
+        np.testing.assert_array_equal(compact["Fz"].to_numpy(), plain["Fz"].to_numpy())
@@ -0,0 +1,171 @@
+"""설정 핫 리로드 단위 테스트"""
+
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+import yaml
+
+from src.config_reload import ConfigWatcher
+from src.ontology.rule_engine import RuleEngine
+from src.sensor.pattern_detector import PatternDetector
+from src.sensor.sensor_store import SensorStore
+
+
+def _write_yaml(path: Path, data) -> None:
+    """YAML 저장 후 mtime을 확실히 바꿈 (파일시스템 시각 해상도와 무관하게)"""
+    stat = path.stat() if path.exists() else None
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.safe_dump(data, f, allow_unicode=True)
+    if stat is not None:
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    shutil.copy("configs/inference_rules.yaml", tmp_path / "inference_rules.yaml")
+    shutil.copy("configs/pattern_thresholds.yaml", tmp_path / "pattern_thresholds.yaml")
+    return tmp_path
+
+
+@pytest.fixture
+def rule_engine(config_dir):
+    return RuleEngine(
+        inference_rules_path=config_dir / "inference_rules.yaml",
+        pattern_thresholds_path=config_dir / "pattern_thresholds.yaml",
+    )
+
+
+def _detector(**kwargs) -> PatternDetector:
+    return PatternDetector(SensorStore(pd.DataFrame(columns=["timestamp", "Fz"])), **kwargs)
+
+
+def _set_overload_threshold(config_dir: Path, threshold: float) -> None:
+    path = config_dir / "pattern_thresholds.yaml"
+    thresholds = yaml.safe_load(path.read_text(encoding="utf-8"))
+    thresholds["overload"]["threshold_N"] = threshold
+    _write_yaml(path, thresholds)
+
+
+class TestRuleEngineReload:
+    """RuleEngine 리로드 테스트"""
+
+    def test_reload_applies_new_thresholds(self, rule_engine, config_dir):
+        assert rule_engine.config_version == 1
+        assert rule_engine.reload() is False
+
+        _set_overload_threshold(config_dir, 999)
+
+        assert rule_engine.reload() is True
+        assert rule_engine.config_version == 2
+        assert rule_engine.pattern_thresholds["overload"]["threshold_N"] == 999
+        # 변경 없으면 다시 읽지 않음
+        assert rule_engine.reload() is False
+
+    def test_invalid_config_keeps_previous_version(self, rule_engine, config_dir):
+        rules_path = config_dir / "inference_rules.yaml"
+        rules = yaml.safe_load(rules_path.read_text(encoding="utf-8"))
+        _write_yaml(rules_path, {k: v for k, v in rules.items() if k != "state_rules"})
+
+        assert rule_engine.reload() is False
+        assert rule_engine.config_version == 1
+        assert "state_rules" in rule_engine.inference_rules
+        assert rule_engine.infer_cause("PAT_COLLISION")
+
+        # 고쳐진 파일은 다음 리로드에서 적용
+        _write_yaml(rules_path, rules)
+        assert rule_engine.reload() is True
+        assert rule_engine.config_version == 2
+
+    def test_pinned_request_finishes_on_old_version(self, rule_engine, config_dir):
+        """고정된 요청은 교체 후에도 시작 시점 버전 사용, 다른 스레드는 새 버전"""
+        _set_overload_threshold(config_dir, 999)
+        seen = {}
+
+        with rule_engine.pinned() as snapshot:
+            worker = threading.Thread(target=rule_engine.reload)
+            worker.start()
+            worker.join()
+            seen["pinned"] = rule_engine.pattern_thresholds["overload"]["threshold_N"]
+            assert rule_engine.config_version == snapshot.version == 1
+
+        assert seen["pinned"] != 999
+        assert rule_engine.config_version == 2
+        assert rule_engine.pattern_thresholds["overload"]["threshold_N"] == 999
+
+    def test_cause_plans_recompiled(self, rule_engine, config_dir):
+        rules_path = config_dir / "inference_rules.yaml"
+        rules = yaml.safe_load(rules_path.read_text(encoding="utf-8"))
+        rules["cause_rules"].append({
+            "pattern": "PAT_TEST",
+            "causes": [{"cause_id": "CAUSE_TEST", "base_confidence": 0.4}],
+        })
+        _write_yaml(rules_path, rules)
+
+        assert rule_engine.infer_cause("PAT_TEST") == []
+        assert rule_engine.reload() is True
+        assert [r.result_id for r in rule_engine.infer_cause("PAT_TEST")] == ["CAUSE_TEST"]
+
+
+class TestPatternDetectorReload:
+    """PatternDetector 리로드 테스트"""
+
+    def test_reload_and_validation(self, config_dir):
+        detector = _detector(config_path=config_dir / "pattern_thresholds.yaml")
+        original = detector.overload_threshold
+
+        _set_overload_threshold(config_dir, "heavy")
+        assert detector.reload() is False
+        assert detector.overload_threshold == original
+
+        _set_overload_threshold(config_dir, 250)
+        assert detector.reload() is True
+        assert detector.overload_threshold == 250
+        assert detector.config_version == 2
+
+    def test_dict_config_not_watched(self):
+        detector = _detector(config={"overload": {"threshold_N": 100}})
+
+        assert detector.reload(force=True) is False
+        assert detector.overload_threshold == 100
+
+
+class TestConfigWatcher:
+    """ConfigWatcher 테스트"""
+
+    def test_poll_reloads_changed_targets(self, rule_engine, config_dir):
+        watcher = ConfigWatcher(interval_s=60)
+        watcher.register(rule_engine)
+
+        assert watcher.poll() == []
+        _set_overload_threshold(config_dir, 999)
+        assert watcher.poll() == [rule_engine]
+
+    def test_background_thread(self, rule_engine, config_dir):
+        watcher = ConfigWatcher(interval_s=0.05)
+        watcher.register(rule_engine)
+        watcher.start()
+        try:
+            _set_overload_threshold(config_dir, 999)
+            deadline = time.time() + 5
+            while rule_engine.config_version == 1 and time.time() < deadline:
+                time.sleep(0.02)
+        finally:
+            watcher.stop(timeout=5)
+
+        assert rule_engine.config_version == 2
+        assert not watcher.running
+
+    def test_targets_are_weak(self, config_dir):
+        watcher = ConfigWatcher()
+        watcher.register(_detector(config_path=config_dir / "pattern_thresholds.yaml"))
+
+        assert watcher.targets == []
+
+    def test_invalid_interval(self):
+        with pytest.raises(ValueError):
+            ConfigWatcher(interval_s=0)
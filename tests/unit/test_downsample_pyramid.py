@@ -0,0 +1,173 @@
+"""DownsamplePyramid 단위 테스트"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.sensor.downsample_pyramid import DownsamplePyramid
+
+
+START = datetime(2026, 1, 20, 0, 0, 0)
+NS = 1_000_000_000
+
+
+@pytest.fixture
+def frame():
+    """3시간 1Hz 데이터 + 짧은 충돌 스파이크"""
+    n = 3 * 3600
+    rng = np.random.default_rng(0)
+    fz = rng.normal(-50, 2, n)
+    fz[4321] = -800.0
+    return pd.DataFrame({
+        "timestamp": pd.date_range(START, periods=n, freq="1s"),
+        "Fz": fz,
+        "Fx": rng.normal(0, 1, n),
+    })
+
+
+class TestBuild:
+    """피라미드 구축 테스트"""
+
+    def test_level_sizes(self, frame):
+        """레벨별 버킷 수"""
+        pyramid = DownsamplePyramid.build(frame)
+
+        assert len(pyramid.level(1)["bucket_ns"]) == 3 * 3600
+        assert len(pyramid.level(60)["bucket_ns"]) == 180
+        assert len(pyramid.level(3600)["bucket_ns"]) == 3
+
+    def test_bucket_aggregates(self, frame):
+        """버킷 min/max/mean/last가 원본과 일치"""
+        pyramid = DownsamplePyramid.build(frame)
+        level = pyramid.level(600)
+        chunk = frame["Fz"].to_numpy()[600:1200]
+
+        assert level["Fz_min"][1] == chunk.min()
+        assert level["Fz_max"][1] == chunk.max()
+        assert level["Fz_mean"][1] == pytest.approx(chunk.mean())
+        assert level["Fz_last"][1] == chunk[-1]
+        assert level["count"][1] == 600
+
+    def test_spike_preserved_at_coarsest_level(self, frame):
+        """최상위 레벨에서도 스파이크 유지"""
+        pyramid = DownsamplePyramid.build(frame)
+
+        assert pyramid.level(3600)["Fz_min"].min() == -800.0
+
+
+class TestQuery:
+    """피라미드 조회 테스트"""
+
+    def test_selects_coarsest_sufficient_level(self, frame):
+        """요청 샘플 수를 만족하는 가장 거친 레벨"""
+        pyramid = DownsamplePyramid.build(frame)
+        start_ns, end_ns = pyramid.time_range_ns()
+
+        assert pyramid.select_level(start_ns, end_ns, 100) == 60
+        assert pyramid.select_level(start_ns, end_ns, 10) == 600
+        assert pyramid.select_level(start_ns, end_ns, 1000) == 10
+
+    def test_query_limits_samples_and_keeps_peak(self, frame):
+        """결과는 samples개 이하, 피크 유지"""
+        pyramid = DownsamplePyramid.build(frame)
+        start_ns, end_ns = pyramid.time_range_ns()
+
+        result = pyramid.query(start_ns, end_ns, 150)
+
+        assert result["resolution_s"] == 60
+        assert len(result["bucket_ns"]) == 150
+        assert result["count"].sum() == len(frame)
+        assert result["total"] == len(frame)
+        assert result["Fz_min"].min() == -800.0
+        assert np.average(result["Fz_mean"], weights=result["count"]) == pytest.approx(frame["Fz"].mean())
+
+    def test_query_sub_range(self, frame):
+        """부분 구간 조회"""
+        pyramid = DownsamplePyramid.build(frame)
+        start_ns = pd.Timestamp(START).value + 3600 * NS
+        end_ns = start_ns + 599 * NS
+
+        result = pyramid.query(start_ns, end_ns, 500)
+
+        assert result["total"] == 600
+        assert result["bucket_ns"][0] == start_ns
+
+    def test_unaligned_range_clips_edge_buckets(self, frame):
+        """버킷 경계와 어긋난 구간은 양 끝 버킷을 구간 안 샘플로 재집계"""
+        pyramid = DownsamplePyramid.build(frame)
+        base_ns = pd.Timestamp(START).value
+        start_ns = base_ns + 1234 * NS
+        end_ns = base_ns + 9876 * NS
+        window = frame["Fz"].to_numpy()[1234:9877]
+
+        result = pyramid.query(start_ns, end_ns, 100)
+
+        assert result["edges_clipped"]
+        assert result["resolution_s"] == 60
+        assert result["total"] == len(window)
+        assert result["count"].sum() == len(window)
+        assert result["Fz_min"].min() == window.min()
+        assert result["Fz_last"][-1] == window[-1]
+        assert np.average(result["Fz_mean"], weights=result["count"]) == pytest.approx(window.mean())
+
+    def test_empty_edge_bucket_dropped_before_regrouping(self, frame):
+        """구간 안 샘플이 없는 끝 버킷을 뺀 뒤 남은 버킷으로 다시 묶음"""
+        pyramid = DownsamplePyramid.build(frame)
+        base_ns = pd.Timestamp(START).value
+        window = frame["Fz"].to_numpy()[1:101]
+
+        result = pyramid.query(base_ns + 300_000_000, base_ns + 100 * NS, 50)
+
+        assert result["resolution_s"] == 1
+        assert len(result["bucket_ns"]) == 50
+        assert result["bucket_ns"][0] == base_ns + NS
+        assert result["total"] == result["count"].sum() == len(window)
+        assert result["Fz_last"][-1] == window[-1]
+        assert result["Fz_min"].min() == window.min()
+
+    def test_loaded_pyramid_without_source_reports_unclipped(self, frame, tmp_path):
+        """원본 없이 로드한 피라미드는 경계 버킷 전체를 쓰고 edges_clipped=False"""
+        path = tmp_path / "week.pyramid.npz"
+        DownsamplePyramid.build(frame).save(path)
+        loaded = DownsamplePyramid.load(path)
+        base_ns = pd.Timestamp(START).value
+
+        result = loaded.query(base_ns + 1234 * NS, base_ns + 9876 * NS, 100)
+        loaded.attach_source(frame)
+        clipped = loaded.query(base_ns + 1234 * NS, base_ns + 9876 * NS, 100)
+
+        assert not result["edges_clipped"]
+        assert result["total"] == 9900 - 1200          # 1분 버킷 [1200s, 9900s)
+        assert clipped["edges_clipped"]
+        assert clipped["total"] == 9877 - 1234
+
+
+class TestPersistence:
+    """저장/로드 테스트"""
+
+    def test_load_or_build_roundtrip(self, frame, tmp_path):
+        """parquet 옆에 저장 후 재사용"""
+        source = tmp_path / "axia80_week_01.parquet"
+        source.write_bytes(b"placeholder")
+
+        built = DownsamplePyramid.load_or_build(source, frame)
+        path = DownsamplePyramid.path_for(source)
+        assert path.name == "axia80_week_01.pyramid.npz"
+        assert path.exists()
+
+        loaded = DownsamplePyramid.load_or_build(source, frame.iloc[:10])
+        assert loaded.axes == built.axes
+        np.testing.assert_array_equal(loaded.level(60)["Fz_min"], built.level(60)["Fz_min"])
+
+    def test_rebuild_when_source_changes(self, frame, tmp_path):
+        """원본 변경 시 재구축"""
+        source = tmp_path / "week.parquet"
+        source.write_bytes(b"v1")
+        DownsamplePyramid.load_or_build(source, frame)
+
+        source.write_bytes(b"version-2")
+        rebuilt = DownsamplePyramid.load_or_build(source, frame.iloc[:3600])
+
+        assert len(rebuilt.level(3600)["bucket_ns"]) == 1
@@ -0,0 +1,128 @@
+"""다운샘플링 단위 테스트"""
+
+import numpy as np
+import pytest
+
+from src.sensor.downsampling import (
+    downsample_indices,
+    lttb_indices,
+    minmax_indices,
+    uniform_indices,
+)
+
+
+def reference_lttb(x, y, n_out):
+    """LTTB 참조 구현 (버킷/점 단위 순수 파이썬 루프)"""
+    n = len(y)
+    edges = [int(v) for v in np.linspace(1, n - 1, n_out - 1)]
+    selected = [0]
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 1 < n_out - 2:
+            nlo, nhi = edges[i + 1], edges[i + 2]
+            cx = sum(x[nlo:nhi]) / (nhi - nlo)
+            cy = sum(y[nlo:nhi]) / (nhi - nlo)
+        else:
+            cx, cy = x[-1], y[-1]
+        best, best_area = lo, -1.0
+        for j in range(lo, hi):
+            area = abs((x[a] - cx) * (y[j] - y[a]) - (x[a] - x[j]) * (cy - y[a]))
+            if area > best_area:
+                best, best_area = j, area
+        selected.append(best)
+        a = best
+    selected.append(n - 1)
+    return selected
+
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(7)
+    y = rng.normal(-50, 3, 5000)
+    y[1234] = -900.0
+    return np.arange(len(y), dtype=float), y
+
+
+class TestLTTB:
+    """LTTB 테스트"""
+
+    def test_matches_reference(self, series):
+        """참조 구현과 동일한 인덱스"""
+        x, y = series
+        result = lttb_indices(x, y, 100)
+
+        assert result.tolist() == reference_lttb(x.tolist(), y.tolist(), 100)
+
+    def test_keeps_endpoints_and_spike(self, series):
+        """양 끝점과 스파이크 유지"""
+        x, y = series
+        result = lttb_indices(x, y, 50)
+
+        assert len(result) == 50
+        assert result[0] == 0 and result[-1] == len(y) - 1
+        assert 1234 in result
+
+    def test_short_input(self):
+        """목표 수 이상이면 전체 반환"""
+        y = np.array([1.0, 2.0, 3.0])
+
+        assert lttb_indices(np.arange(3), y, 10).tolist() == [0, 1, 2]
+
+
+class TestMinMax:
+    """최소/최대 포락선 테스트"""
+
+    def test_bucket_extremes(self):
+        """버킷별 최소/최대 위치"""
+        y = np.array([0, 5, -1, 2, 9, 3, -4, 1], dtype=float)
+
+        result = minmax_indices(y, 4)
+
+        assert result.tolist() == [1, 2, 4, 6]
+
+    def test_uneven_tail_and_spike(self, series):
+        """나누어떨어지지 않는 길이, 스파이크 유지"""
+        _, y = series
+        result = minmax_indices(y[:4999], 300)
+
+        assert len(result) <= 300
+        assert result.max() < 4999
+        assert 1234 in result
+
+    def test_remainder_spread_across_buckets(self):
+        """나머지 샘플은 마지막 버킷에 몰리지 않고 버킷 폭 차이는 최대 1"""
+        y = np.zeros(3600)
+        y[np.arange(0, 3600, 4)] = 1.0   # 4샘플마다 최대값 → 각 버킷 첫 최대값 위치로 폭 확인
+
+        result = minmax_indices(y, 500)
+        maxima = result[y[result] == 1.0]
+
+        assert len(maxima) == 250
+        assert np.diff(maxima).max() - np.diff(maxima).min() <= 4
+        assert maxima[-1] >= 3600 - 16
+
+    def test_nan_ignored(self):
+        """NaN은 선택하지 않음"""
+        y = np.array([np.nan, 1.0, 3.0, np.nan, -2.0, 0.5])
+
+        result = minmax_indices(y, 2)
+
+        assert result.tolist() == [2, 4]
+
+
+class TestDispatch:
+    """모드 선택 테스트"""
+
+    def test_uniform_matches_legacy(self):
+        """기존 균등 샘플링과 동일"""
+        n, samples = 1000, 37
+        legacy = [int(i * n / samples) for i in range(samples)]
+
+        assert uniform_indices(n, samples).tolist() == legacy
+        assert downsample_indices(np.zeros(n), samples).tolist() == legacy
+
+    def test_unknown_mode(self):
+        """지원하지 않는 모드"""
+        with pytest.raises(ValueError):
+            downsample_indices(np.zeros(10), 5, mode="median")
@@ -0,0 +1,166 @@
+"""DuckDBSensorBackend / SensorStore DuckDB 백엔드 단위 테스트"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("duckdb")
+
+from src.sensor.data_loader import DataLoader
+from src.sensor.duckdb_backend import DuckDBSensorBackend
+from src.sensor.partitioned_dataset import PartitionedDataset
+from src.sensor.sensor_store import SensorStore
+from tests.unit.conftest import build_sensor_frame
+
+
+START = datetime(2026, 1, 19, 0, 0, 0)
+
+
+@pytest.fixture
+def frame():
+    """교대/제품 컨텍스트를 포함한 10초 간격 센서 데이터"""
+    n = 5000
+    df = build_sensor_frame(n, freq="10s", start=START)
+    df.loc[1234, "Fz"] = -400.0
+    df.loc[4321, "Fz"] = 250.0
+    df["shift"] = np.where(df["timestamp"].dt.hour < 12, "A", "B")
+    df["product_id"] = np.random.default_rng(1).choice(["PART-A", "PART-B", "PART-C"], n)
+    df["status"] = "normal"
+    return df
+
+
+@pytest.fixture
+def parquet_path(tmp_path, frame):
+    path = tmp_path / "axia80_week_01.parquet"
+    frame.to_parquet(path, index=False)
+    yield path
+    DataLoader.clear_cache()
+
+
+@pytest.fixture
+def stores(parquet_path, frame):
+    """(duckdb, pandas) 저장소 쌍"""
+    backend = DuckDBSensorBackend(parquet_path)
+    yield SensorStore(backend=backend), SensorStore(frame.copy())
+    backend.close()
+
+
+class TestDuckDBBackend:
+    """DuckDB 백엔드 결과가 pandas 백엔드와 일치하는지 확인"""
+
+    def test_get_data_range_and_projection(self, stores):
+        duck, mem = stores
+        start, end = START + timedelta(hours=1), START + timedelta(hours=2)
+
+        result = duck.get_data(start, end, axes=["Fz", "Tx"])
+
+        assert list(result.columns) == ["timestamp", "Fz", "Tx"]
+        pd.testing.assert_frame_equal(
+            result.reset_index(drop=True),
+            mem.get_data(start, end, axes=["Fz", "Tx"]).reset_index(drop=True),
+            check_dtype=False,
+        )
+
+    def test_get_statistics(self, stores):
+        duck, mem = stores
+        start, end = START + timedelta(hours=2), START + timedelta(hours=10)
+
+        assert duck.get_statistics("Fz", start, end) == mem.get_statistics("Fz", start, end)
+        assert "error" in duck.get_statistics("Unknown")
+
+    @pytest.mark.parametrize("direction,threshold", [("absolute", 200), ("above", 100), ("below", -100)])
+    def test_get_anomalies(self, stores, direction, threshold):
+        duck, mem = stores
+
+        result = duck.get_anomalies("Fz", threshold, direction=direction)
+        expected = mem.get_anomalies("Fz", threshold, direction=direction)
+
+        np.testing.assert_array_equal(result["Fz"].to_numpy(), expected["Fz"].to_numpy())
+        assert len(result) >= 1
+
+    def test_percentiles(self, stores):
+        duck, mem = stores
+
+        result = duck.get_percentiles("Fz", (0.5, 0.95, 0.999))
+
+        assert list(result) == ["p50", "p95", "p99.9"]
+        for key, value in mem.get_percentiles("Fz", (0.5, 0.95, 0.999)).items():
+            assert result[key] == pytest.approx(value)
+
+    @pytest.mark.parametrize("by", ["shift", "product_id"])
+    def test_group_statistics(self, stores, by):
+        duck, mem = stores
+
+        result = duck.get_group_statistics("Fz", by=by)
+        expected = mem.get_group_statistics("Fz", by=by)
+
+        assert [r[by] for r in result] == [r[by] for r in expected]
+        for got, want in zip(result, expected):
+            assert got["count"] == want["count"]
+            for key in ("mean", "std", "min", "max", "p50", "p95", "p99"):
+                assert got[key] == pytest.approx(want[key], abs=1e-3)
+
+    def test_group_column_validated(self, parquet_path):
+        backend = DuckDBSensorBackend(parquet_path)
+
+        with pytest.raises(ValueError):
+            backend.get_group_statistics("Fz", by="timestamp; DROP TABLE x")
+
+    def test_context_and_current_state(self, stores):
+        duck, mem = stores
+        ts = START + timedelta(seconds=1234 * 10 + 3)
+
+        assert duck.get_context_at(ts) == mem.get_context_at(ts)
+        assert duck._latest_row()["Fz"] == mem._latest_row()["Fz"]
+
+    def test_null_axes_preprocessed_like_pandas(self, tmp_path, frame):
+        """NULL 축 값은 DataLoader.preprocess와 같이 보간/0 채움 후 조회"""
+        frame.loc[:2, "Fz"] = np.nan                # 앞쪽 → 0
+        frame.loc[100:104, "Fz"] = np.nan           # 내부 → 선형 보간
+        frame.loc[2000:2003, "Tx"] = np.nan
+        frame.loc[4995:, "Fz"] = np.nan             # 뒤쪽 → 마지막 값
+        path = tmp_path / "gaps.parquet"
+        frame.to_parquet(path, index=False)
+        backend = DuckDBSensorBackend(path)
+        duck = SensorStore(backend=backend)
+        mem = SensorStore(DataLoader.preprocess(frame.copy()))
+        start, end = START + timedelta(seconds=500), START + timedelta(hours=14)
+
+        result = duck.get_data(axes=["Fz", "Tx"])
+        expected = mem.get_data(axes=["Fz", "Tx"])
+
+        assert result["Fz"].notna().all()
+        np.testing.assert_allclose(result["Fz"].to_numpy(), expected["Fz"].to_numpy())
+        np.testing.assert_allclose(result["Tx"].to_numpy(), expected["Tx"].to_numpy())
+        assert duck.get_statistics("Fz", start, end) == mem.get_statistics("Fz", start, end)
+        assert duck.get_statistics("Fz") == mem.get_statistics("Fz")
+        assert backend._null_axes[(path.as_posix(),)] == ["Fz", "Tx"]
+        backend.close()
+
+    def test_invalid_backend(self):
+        with pytest.raises(ValueError):
+            SensorStore(backend="spark")
+
+
+class TestDuckDBPartitioned:
+    """파티션 데이터셋 위 DuckDB 조회"""
+
+    def test_scans_only_overlapping_partitions(self, tmp_path, frame):
+        long_frame = pd.concat([
+            frame,
+            frame.assign(timestamp=frame["timestamp"] + timedelta(days=14)),
+        ], ignore_index=True)
+        dataset = PartitionedDataset(tmp_path / "raw")
+        dataset.write(long_frame)
+        store = SensorStore(dataset=dataset, backend="duckdb")
+        start = START + timedelta(days=14)
+
+        files = store._backend._files(start, start + timedelta(hours=1))
+        stats = store.get_statistics("Fz", start, start + timedelta(hours=1))
+
+        assert files == [dataset.partitions[-1].path.as_posix()]
+        assert stats == SensorStore(long_frame).get_statistics("Fz", start, start + timedelta(hours=1))
+        assert store.get_summary()["total_records"] == len(long_frame)
+        DataLoader.clear_cache()
@@ -0,0 +1,92 @@
+"""패턴 이벤트 타임라인 단위 테스트"""
+
+from datetime import datetime, timedelta, timezone
+
+from src.ontology.event_timeline import EventTimeline, parse_timestamp, timestamp_key
+from src.ontology.rule_engine import RuleEngine
+
+NOW = datetime(2026, 3, 1, 12, 0, 0)
+
+
+def _event(pattern, days_ago, **extra):
+    return {"pattern": pattern, "timestamp": (NOW - timedelta(days=days_ago)).isoformat(), **extra}
+
+
+class TestEventTimeline:
+    """EventTimeline 테스트"""
+
+    def test_sorted_per_pattern(self):
+        timeline = EventTimeline([
+            _event("PAT_A", 1), _event("PAT_B", 5), _event("PAT_A", 3), _event("PAT_A", 2),
+        ])
+
+        keys = list(timeline.events("PAT_A").keys)
+        assert keys == sorted(keys)
+        assert len(timeline.events("PAT_A")) == 3
+        assert timeline.patterns == ["PAT_A", "PAT_B"]
+        assert len(timeline) == 4
+        assert len(timeline.events("PAT_MISSING")) == 0
+
+    def test_count_after_is_exclusive(self):
+        events = EventTimeline([_event("PAT_A", d) for d in (0, 1, 2, 3, 4)]).events("PAT_A")
+
+        assert events.count_after(NOW - timedelta(days=2)) == 2
+        assert events.count_after(NOW - timedelta(days=10)) == 5
+        assert events.count_after(NOW) == 0
+
+    def test_split_after(self):
+        events = EventTimeline([_event("PAT_A", d) for d in (6, 5, 3, 2, 1)]).events("PAT_A")
+        cutoff = NOW - timedelta(days=7)
+
+        # mid 시각의 이벤트는 후반부
+        assert events.split_after(cutoff, NOW - timedelta(days=3)) == (2, 3)
+        assert events.split_after(cutoff, cutoff) == (0, 5)
+
+    def test_intensities_time_ordered(self):
+        """강도 값은 시간순, 같은 시각은 입력 순서 (숫자로 변환되지 않는 값은 제외)"""
+        events = EventTimeline([
+            _event("PAT_A", 1, intensity=0.9),
+            _event("PAT_A", 3, intensity=0.1),
+            _event("PAT_A", 3, intensity=0.2),
+            _event("PAT_A", 2, severity="high"),
+            _event("PAT_A", 2, value="0.5"),
+        ]).events("PAT_A")
+
+        assert events.intensities_after(NOW - timedelta(days=7)) == [0.1, 0.2, 0.5, 0.9]
+        assert events.intensities_after(NOW - timedelta(days=2)) == [0.9]
+
+    def test_invalid_timestamps_sort_first(self):
+        events = EventTimeline([
+            {"pattern": "PAT_A"}, {"pattern": "PAT_A", "timestamp": "garbage"}, _event("PAT_A", 1),
+        ]).events("PAT_A")
+
+        assert list(events.keys[:2]) == [timestamp_key(datetime.min)] * 2
+        assert events.count_after(NOW - timedelta(days=7)) == 1
+
+    def test_timezone_aware_timestamp(self):
+        """시간대가 있는 타임스탬프는 로컬 naive 시각으로 변환"""
+        parsed = parse_timestamp("2026-03-01T12:00:00Z")
+
+        assert parsed.tzinfo is None
+        assert parsed == datetime(2026, 3, 1, 12, tzinfo=timezone.utc).astimezone().replace(tzinfo=None)
+
+
+class TestPredictWithTimeline:
+    """RuleEngine.predict_error + EventTimeline 테스트"""
+
+    def test_prebuilt_timeline_matches_list(self):
+        rule_engine = RuleEngine()
+        now = datetime.now()
+        history = [
+            {"pattern": "PAT_OVERLOAD", "timestamp": (now - timedelta(days=d)).isoformat()}
+            for d in (1, 2, 3)
+        ] + [
+            {"pattern": "PAT_VIBRATION", "timestamp": (now - timedelta(days=d)).isoformat(), "intensity": i}
+            for d, i in ((6, 0.3), (5, 0.35), (3, 0.5), (2, 0.6), (1, 0.7))
+        ]
+
+        from_list = rule_engine.predict_error(history)
+        from_timeline = rule_engine.predict_error(EventTimeline(history))
+
+        assert {r.result_id for r in from_list} >= {"C189", "C204"}
+        assert [r.evidence for r in from_timeline] == [r.evidence for r in from_list]
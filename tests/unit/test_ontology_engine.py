@@ -13,6 +13,7 @@ from src.ontology.ontology_engine import (
 )
 from src.ontology.models import Entity
 from src.ontology.schema import EntityType, RelationType
+from src.sensor.pattern_repository import PatternRepository
 
 
 class TestGetEntityAttr:
@@ -374,8 +375,7 @@ class TestOntologyEnginePatternHistory:
         mock_gt_class.return_value = Mock()
         mock_ontology = Mock()
 
-        engine = OntologyEngine(ontology=mock_ontology)
-        engine._pattern_log_cache = []  # 빈 캐시
+        engine = OntologyEngine(ontology=mock_ontology, pattern_repository=PatternRepository([]))
 
         history = engine._build_pattern_history("PAT_COLLISION")
 
@@ -388,8 +388,7 @@ class TestOntologyEnginePatternHistory:
         mock_gt_class.return_value = Mock()
         mock_ontology = Mock()
 
-        engine = OntologyEngine(ontology=mock_ontology)
-        engine._pattern_log_cache = [
+        engine = OntologyEngine(ontology=mock_ontology, pattern_repository=PatternRepository([
             {
                 "pattern_id": "PAT_COLLISION",
                 "pattern_type": "collision",
@@ -402,7 +401,7 @@ class TestOntologyEnginePatternHistory:
                 "timestamp": "2026-01-26T10:00:00",
                 "confidence": 0.85,
             },
-        ]
+        ]))
 
         history = engine._build_pattern_history("PAT_COLLISION")
 
@@ -0,0 +1,82 @@
+"""ParallelPatternDetector 단위 테스트"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.sensor.parallel_detection import ParallelPatternDetector
+from src.sensor.pattern_detector import PatternDetector
+from src.sensor.sensor_store import SensorStore
+from tests.unit.conftest import build_sensor_frame
+
+
+def make_frame(start: str, seed: int, n: int = 200_000) -> pd.DataFrame:
+    """25Hz 합성 데이터 (Fz 충돌/과부하/진동, Fx 충돌)"""
+    df = build_sensor_frame(n, freq="40ms", start=start, seed=seed, axes=["Fz", "Fx"], fz_std=10.0)
+    rng = np.random.default_rng(seed + 100)
+    fz = df["Fz"].to_numpy().copy()
+    fz[rng.integers(0, n, 10)] = -600.0
+    fz[20_000:21_500] = -200.0
+    fz[100_000:110_000] += rng.normal(0, 60, 10_000)
+    fx = df["Fx"].to_numpy().copy()
+    fx[rng.integers(0, n, 5)] = 400.0
+    df["Fz"] = fz
+    df["Fx"] = fx
+    return df
+
+
+@pytest.fixture(scope="module")
+def frames():
+    return [make_frame("2026-01-20", 1), make_frame("2026-01-27", 2)]
+
+
+def sequential(frames, axes):
+    """파일별·축별 순차 detect() 결과"""
+    patterns = []
+    for frame in frames:
+        detector = PatternDetector(SensorStore(frame))
+        for axis in axes:
+            patterns.extend(detector.detect(axis=axis))
+    return summarize(patterns)
+
+
+def summarize(patterns):
+    """ID를 제외한 비교용 요약"""
+    return [(p.pattern_type.value, str(p.timestamp), p.to_dict()["metrics"]) for p in patterns]
+
+
+class TestParallelPatternDetector:
+    """병렬 감지 테스트"""
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_matches_sequential_detection(self, frames, max_workers):
+        """작업자 수와 무관하게 순차 감지와 같은 순서/ID"""
+        patterns = ParallelPatternDetector(max_workers=max_workers).detect(frames, axes=["Fz", "Fx"])
+
+        assert summarize(patterns) == sequential(frames, ["Fz", "Fx"])
+        assert [p.pattern_id for p in patterns] == [f"PAT-{i:03d}" for i in range(1, len(patterns) + 1)]
+
+    def test_parquet_sources(self, frames, tmp_path):
+        paths = []
+        for i, frame in enumerate(frames):
+            path = tmp_path / f"part_{i}.parquet"
+            frame.to_parquet(path)
+            paths.append(path)
+
+        patterns = ParallelPatternDetector(max_workers=1).detect(paths, axes=["Fz"])
+
+        assert summarize(patterns) == sequential(frames, ["Fz"])
+
+    def test_detector_subset_and_start_id(self, frames):
+        patterns = ParallelPatternDetector(max_workers=1, start_id=10).detect(
+            frames[:1], axes=["Fz"], detectors=["overload", "collision"]
+        )
+
+        types = [p.pattern_type.value for p in patterns]
+        assert types == sorted(types, key=["collision", "overload"].index)
+        assert set(types) == {"collision", "overload"}
+        assert patterns[0].pattern_id == "PAT-011"
+
+    def test_unknown_detector(self, frames):
+        with pytest.raises(ValueError):
+            ParallelPatternDetector(max_workers=1).detect(frames, detectors=["spike"])
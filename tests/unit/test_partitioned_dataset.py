@@ -0,0 +1,149 @@
+"""PartitionedDataset / SensorStore 파티션 모드 단위 테스트"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.sensor.data_loader import DataLoader
+from src.sensor.partitioned_dataset import PartitionedDataset
+from src.sensor.sensor_store import SensorStore
+from tests.unit.conftest import build_sensor_frame
+
+
+# 2026-01-19(월) 시작 → ISO 4주차, 5주차, 6주차에 걸친 3주 데이터 (1분 간격)
+START = datetime(2026, 1, 19, 0, 0, 0)
+
+
+def make_frame(days: int = 21, seed: int = 0) -> pd.DataFrame:
+    """1분 간격 다주 센서 데이터"""
+    n = days * 24 * 60
+    df = build_sensor_frame(n, freq="1min", start=START, seed=seed)
+    df.loc[n - 100, "Fz"] = -900.0  # 마지막 주에만 스파이크
+    df["task_mode"] = np.where(np.arange(n) % 2 == 0, "idle", "pick")
+    return df
+
+
+@pytest.fixture
+def frame():
+    return make_frame()
+
+
+@pytest.fixture
+def dataset(tmp_path, frame):
+    ds = PartitionedDataset(tmp_path / "raw")
+    ds.write(frame)
+    yield ds
+    DataLoader.clear_cache()
+
+
+class TestPartitionedDataset:
+    """파티션 쓰기 / manifest 테스트"""
+
+    def test_write_splits_by_iso_week(self, dataset, frame):
+        """ISO 주 단위로 분할되고 manifest에 범위/통계가 기록됨"""
+        keys = [p.key for p in dataset.partitions]
+
+        assert keys == ["year=2026/week=04", "year=2026/week=05", "year=2026/week=06"]
+        assert sum(p.rows for p in dataset.partitions) == len(frame)
+        assert dataset.manifest_path.exists()
+        assert dataset.partitions[-1].axes["Fz"]["min"] == -900.0
+
+    def test_manifest_roundtrip(self, dataset):
+        """manifest를 다시 읽어도 동일한 파티션 정보"""
+        reopened = PartitionedDataset(dataset.root)
+
+        assert [(p.key, p.start, p.end, p.rows) for p in reopened.partitions] == \
+            [(p.key, p.start, p.end, p.rows) for p in dataset.partitions]
+
+    def test_write_merges_existing_partition(self, dataset, frame):
+        """기존 파티션에 추가 쓰기 시 중복 없이 병합"""
+        dataset.write(frame.iloc[:10])
+        extra = make_frame(days=1).assign(timestamp=lambda d: d["timestamp"] + timedelta(days=21))
+        dataset.write(extra)
+
+        assert len(dataset.partitions) == 4
+        assert sum(p.rows for p in dataset.partitions) == len(frame) + len(extra)
+
+    def test_partitions_for_prunes(self, dataset):
+        """조회 구간과 겹치는 파티션만 선택"""
+        start = START + timedelta(days=8)
+        selected = dataset.partitions_for(start, start + timedelta(hours=6))
+
+        assert [p.key for p in selected] == ["year=2026/week=05"]
+
+    def test_read_range_across_partitions(self, dataset, frame):
+        """경계를 넘는 구간 조회가 원본 슬라이스와 일치"""
+        start = START + timedelta(days=6, hours=20)
+        end = START + timedelta(days=7, hours=4)
+
+        result = dataset.read_range(start, end, columns=["Fz"])
+        expected = frame[(frame["timestamp"] >= start) & (frame["timestamp"] <= end)]
+
+        assert list(result.columns) == ["timestamp", "Fz"]
+        np.testing.assert_array_equal(result["Fz"].to_numpy(), expected["Fz"].to_numpy())
+
+
+class TestSensorStorePartitioned:
+    """SensorStore 파티션 모드 테스트"""
+
+    def test_only_overlapping_partitions_opened(self, dataset):
+        """구간 조회 시 겹치는 파티션만 로드"""
+        store = SensorStore(dataset=dataset)
+        start = START + timedelta(days=8)
+
+        store.get_data(start, start + timedelta(hours=1))
+
+        assert list(store._partition_stores) == ["year=2026/week=05"]
+
+    def test_get_data_matches_in_memory(self, dataset, frame):
+        """파티션 경계를 넘는 조회가 메모리 저장소와 동일"""
+        partitioned = SensorStore(dataset=dataset)
+        in_memory = SensorStore(DataLoader.preprocess(frame.copy()))
+        start = START + timedelta(days=6, hours=12)
+        end = START + timedelta(days=14, hours=12)
+
+        pd.testing.assert_frame_equal(
+            partitioned.get_data(start, end, axes=["Fz"]).reset_index(drop=True),
+            in_memory.get_data(start, end, axes=["Fz"]).reset_index(drop=True),
+        )
+
+    def test_statistics_merge_across_partitions(self, dataset, frame):
+        """파티션별 통계 병합 결과가 전체 통계와 일치"""
+        partitioned = SensorStore(dataset=dataset)
+        in_memory = SensorStore(DataLoader.preprocess(frame.copy()))
+        start = START + timedelta(days=3)
+        end = START + timedelta(days=17)
+
+        assert partitioned.get_statistics("Fz", start, end) == in_memory.get_statistics("Fz", start, end)
+        assert partitioned.get_statistics("Fz") == in_memory.get_statistics("Fz")
+
+    def test_anomalies_prune_by_manifest(self, dataset):
+        """manifest min/max로 임계값 미달 파티션은 열지 않음"""
+        store = SensorStore(dataset=dataset)
+
+        anomalies = store.get_anomalies("Fz", threshold=500)
+
+        assert len(anomalies) == 1
+        assert anomalies["Fz"].iloc[0] == -900.0
+        assert list(store._partition_stores) == ["year=2026/week=06"]
+
+    def test_context_at_nearest_partition(self, dataset):
+        """조회 시각이 속한 파티션에서 컨텍스트 조회"""
+        store = SensorStore(dataset=dataset)
+        ts = START + timedelta(days=9, seconds=61)
+
+        context = store.get_context_at(ts)
+
+        assert context["timestamp"] == (START + timedelta(days=9, minutes=1)).isoformat()
+        assert list(store._partition_stores) == ["year=2026/week=05"]
+
+    def test_open_partitions_bounded(self, dataset, monkeypatch):
+        """열린 파티션 수는 MAX_OPEN_PARTITIONS로 제한"""
+        monkeypatch.setattr(SensorStore, "MAX_OPEN_PARTITIONS", 2)
+        store = SensorStore(dataset=dataset)
+
+        store.get_statistics("Fz")
+
+        assert len(store._partition_stores) == 2
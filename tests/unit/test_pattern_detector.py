@@ -0,0 +1,93 @@
+"""PatternDetector 단위 테스트"""
+
+import json
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.sensor.pattern_detector import PatternDetector
+from src.sensor.patterns import DetectedPattern, PatternType, save_patterns
+from src.sensor.sensor_store import SensorStore
+
+
+class TestDetectAxes:
+    """다축 단일 패스 감지"""
+
+    def test_matches_per_axis_detection(self):
+        n = 400_000
+        rng = np.random.default_rng(5)
+        axes = ["Fx", "Fy", "Fz", "Tx", "Ty", "Tz"]
+        df = pd.DataFrame({"timestamp": pd.date_range("2026-01-20", periods=n, freq="40ms")})
+        for j, axis in enumerate(axes):
+            x = rng.normal(-50 if axis == "Fz" else 3, 10, n)
+            x[rng.integers(0, n, 5)] = -700.0
+            x[20_000 + j * 1000:21_500 + j * 1000] = 300.0
+            x[100_000:108_000] += rng.normal(0, 60, 8000)
+            x[200_000 + j * 10_000:] += 25.0
+            df[axis] = x
+        detector = PatternDetector(SensorStore(df))
+
+        per_axis = {axis: detector.detect(axis=axis) for axis in axes}
+        multi = detector.detect_axes()
+
+        def comparable(pattern):
+            data = pattern.to_dict()
+            data.pop("pattern_id")
+            data["confidence"] = round(data["confidence"], 9)
+            data["metrics"] = {k: round(v, 6) if isinstance(v, float) else v for k, v in data["metrics"].items()}
+            return data
+
+        expected = []
+        for pattern_type in ("collision", "overload", "drift", "vibration"):
+            for axis in axes:
+                for pattern in per_axis[axis]:
+                    if pattern.pattern_type.value == pattern_type:
+                        expected.append(comparable(pattern))
+
+        assert {p.pattern_type.value for p in multi} == {"collision", "overload", "drift", "vibration"}
+        assert [comparable(p) for p in multi] == expected
+
+
+class TestCollisionBaselines:
+    """충돌 baseline 일괄 계산"""
+
+    def test_collision_baselines_match_window_reference(self):
+        """배치 baseline이 피크별 get_window 평균과 일치"""
+        n = 20_000
+        rng = np.random.default_rng(7)
+        df = pd.DataFrame({"timestamp": pd.date_range("2026-01-20", periods=n, freq="8ms")})
+        for axis in ["Fx", "Fy", "Fz", "Tx", "Ty", "Tz"]:
+            df[axis] = 0.0
+        df["Fz"] = rng.normal(-50, 120, n)
+        store = SensorStore(df)
+
+        collisions = PatternDetector(store).detect_collision(axis="Fz", threshold=-350)
+
+        assert len(collisions) > 10
+        for pattern in collisions:
+            window = store.get_window(pattern.timestamp, window_seconds=5.0)
+            expected = window.loc[window["Fz"] > -350, "Fz"].mean()
+            assert pattern.metrics["baseline"] == pytest.approx(expected, abs=1e-9)
+
+
+class TestSavePatterns:
+    """패턴 파일 저장"""
+
+    def test_non_json_metrics_saved_as_strings(self, tmp_path):
+        path = tmp_path / "detected_patterns.json"
+        pattern = DetectedPattern(
+            pattern_id="PAT-001",
+            pattern_type=PatternType.COLLISION,
+            timestamp=datetime(2026, 1, 20, 10, 0, 0),
+            duration_ms=0,
+            confidence=0.9,
+            metrics={"peak_value": np.float32(-512.5), "peak_time": pd.Timestamp("2026-01-20T10:00:00")},
+        )
+
+        save_patterns([pattern], path)
+
+        saved = json.loads(path.read_text(encoding="utf-8"))
+        assert saved[0]["metrics"] == {"peak_value": "-512.5", "peak_time": "2026-01-20 10:00:00"}
+        assert list(tmp_path.iterdir()) == [path]
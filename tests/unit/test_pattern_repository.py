@@ -0,0 +1,166 @@
+"""PatternRepository 단위 테스트"""
+
+import json
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.sensor.pattern_detector import PatternDetector
+from src.sensor.pattern_repository import (
+    PatternRepository,
+    get_pattern_repository,
+    reset_pattern_repository,
+)
+from src.sensor.patterns import PatternType
+from src.sensor.sensor_store import SensorStore
+
+TYPES = ["collision", "overload", "drift", "vibration"]
+
+
+def make_records(n: int = 2_000, seed: int = 0):
+    """무작위 순서의 패턴 레코드 (DetectedPattern.to_dict() 형식)"""
+    rng = np.random.default_rng(seed)
+    base = pd.Timestamp("2026-01-20")
+    records = []
+    for i in range(n):
+        ts = base + pd.Timedelta(seconds=int(rng.integers(0, 7 * 86_400)))
+        records.append({
+            "pattern_id": f"PAT-{i + 1:03d}",
+            "pattern_type": TYPES[int(rng.integers(0, len(TYPES)))],
+            "timestamp": ts.isoformat(),
+            "duration_ms": 0,
+            "confidence": float(rng.random()),
+            "metrics": {},
+            "related_error_codes": [],
+            "event_id": "",
+            "context": {},
+        })
+    return records
+
+
+@pytest.fixture(autouse=True)
+def clean_shared():
+    reset_pattern_repository()
+    yield
+    reset_pattern_repository()
+
+
+class TestPatternRepository:
+    """색인 조회 테스트 (선형 스캔 참조 구현과 비교)"""
+
+    @pytest.fixture
+    def records(self):
+        return make_records()
+
+    @pytest.fixture
+    def repository(self, records):
+        return PatternRepository(records)
+
+    def test_type_index_matches_scan(self, records, repository):
+        for ptype in TYPES:
+            expected = sorted(
+                (r for r in records if r["pattern_type"] == ptype), key=lambda r: r["timestamp"]
+            )
+            assert repository.count(ptype) == len(expected)
+            assert [r["timestamp"] for r in repository.find(ptype)] == [r["timestamp"] for r in expected]
+            assert repository.latest(ptype)["timestamp"] == expected[-1]["timestamp"]
+
+    @pytest.mark.parametrize("ptype", [None, "overload"])
+    def test_range_matches_scan(self, records, repository, ptype):
+        start, end = records[10]["timestamp"], "2026-01-24T12:00:00"
+        expected = sorted(
+            r["pattern_id"] for r in records
+            if start <= r["timestamp"] <= end and ptype in (None, r["pattern_type"])
+        )
+
+        found = repository.find(ptype, start=start, end=end)
+
+        assert sorted(r["pattern_id"] for r in found) == expected
+        assert [r["timestamp"] for r in found] == sorted(r["timestamp"] for r in found)
+
+    def test_summary_values(self, records, repository):
+        timestamps = sorted(r["timestamp"] for r in records)
+        latest_first = sorted(
+            TYPES, key=lambda t: max(r["timestamp"] for r in records if r["pattern_type"] == t), reverse=True
+        )
+
+        assert repository.time_range() == (timestamps[0], timestamps[-1])
+        assert list(repository.type_counts()) == latest_first
+        assert sum(repository.type_counts().values()) == len(records)
+        assert [r["timestamp"] for r in repository.find(limit=3)] == timestamps[-3:]
+
+    def test_pattern_id_or_type(self):
+        repository = PatternRepository([
+            {"pattern_id": "PAT_COLLISION", "pattern_type": "", "timestamp": "2026-01-22T00:00:00"},
+            {"pattern_id": "PAT-001", "pattern_type": "collision", "timestamp": "2026-01-21T00:00:00"},
+            {"pattern_id": "PAT-002", "pattern_type": "drift", "timestamp": "2026-01-20T00:00:00"},
+        ])
+
+        positions = repository.select("collision", pattern_id="PAT_COLLISION")
+
+        assert positions.tolist() == [1, 0]
+
+    def test_missing_timestamps(self):
+        repository = PatternRepository([
+            {"pattern_type": "drift"},
+            {"pattern_type": "drift", "timestamp": "2026-01-20T00:00:00"},
+        ])
+
+        assert repository.count("drift") == 2
+        assert repository.time_range() == ("2026-01-20T00:00:00", "2026-01-20T00:00:00")
+        assert len(repository.find(end="2026-01-21")) == 1
+
+    def test_replace_swaps_pattern_cache_with_index(self, records, repository):
+        """DetectedPattern 캐시는 색인에 속해 교체와 함께 바뀜"""
+        old_index = repository._index
+        old_patterns = repository.patterns()
+
+        repository.replace(records[:5])
+
+        assert repository.patterns() is not old_patterns
+        assert old_index.patterns() is old_patterns
+        assert [p.pattern_id for p in repository.find_patterns()] == \
+            [r["pattern_id"] for r in repository.find()]
+
+
+class TestSharedRepository:
+    """공유 인스턴스 / 파일 변경 감지"""
+
+    def test_shared_instance_reloads_on_change(self, tmp_path):
+        path = tmp_path / "detected_patterns.json"
+        path.write_text(json.dumps(make_records(5)), encoding="utf-8")
+
+        repository = get_pattern_repository(path)
+        assert get_pattern_repository(path) is repository
+        assert len(repository) == 5
+
+        path.write_text(json.dumps(make_records(8)), encoding="utf-8")
+        os.utime(path, ns=(0, 10**18))
+        assert len(get_pattern_repository(path)) == 8
+
+    def test_missing_file(self, tmp_path):
+        assert len(get_pattern_repository(tmp_path / "none.json")) == 0
+
+    def test_detector_queries_use_repository(self, tmp_path, monkeypatch):
+        path = tmp_path / "detected_patterns.json"
+        records = make_records(50)
+        path.write_text(json.dumps(records), encoding="utf-8")
+        monkeypatch.setattr(PatternDetector, "PATTERNS_PATH", path)
+
+        df = pd.DataFrame({"timestamp": pd.date_range("2026-01-20", periods=10, freq="1s"), "Fz": 0.0})
+        detector = PatternDetector(SensorStore(df))
+
+        overloads = detector.get_patterns_by_type(PatternType.OVERLOAD)
+        in_range = detector.get_patterns_in_range(datetime(2026, 1, 21), datetime(2026, 1, 23))
+
+        assert {p.pattern_id for p in overloads} == {r["pattern_id"] for r in records if r["pattern_type"] == "overload"}
+        assert {p.pattern_id for p in in_range} == {
+            r["pattern_id"] for r in records if "2026-01-21" <= r["timestamp"] <= "2026-01-23T00:00:00"
+        }
+        assert detector.get_summary()["total_patterns"] == 50
+        assert detector._generate_pattern_id() == "PAT-051"
+        # 기존 패턴은 시간순이 아닌 파일 순서
+        assert [p.pattern_id for p in detector.load_existing_patterns()] == [r["pattern_id"] for r in records]
@@ -0,0 +1,181 @@
+"""SensorRingBuffer / SensorStore 실시간 적재 단위 테스트"""
+
+import threading
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.sensor.data_loader import DataLoader
+from src.sensor.ring_buffer import ParquetSegmentSink, SensorRingBuffer
+from src.sensor.sensor_store import SensorStore
+from src.sensor.timeseries_db import SensorTimeSeriesDB
+from tests.unit.conftest import build_sensor_frame
+
+
+START = datetime(2026, 1, 20, 0, 0, 0)
+PERIOD_NS = 8_000_000  # 125Hz
+
+
+def make_live(n: int, offset: int = 0, seed: int = 0) -> pd.DataFrame:
+    """125Hz 실시간 샘플 (Fz = 샘플 번호로 검증 용이)"""
+    df = build_sensor_frame(n, freq="8ms", start=START, seed=seed, noise_std=1.0, fz_std=None, offset=offset)
+    df["Fz"] = np.arange(offset, offset + n, dtype=np.float64)
+    return df
+
+
+class TestSensorRingBuffer:
+    """링 버퍼 테스트"""
+
+    def test_memory_budget_fixed(self):
+        """메모리 예산으로 capacity 결정, 연속 적재에도 할당 고정"""
+        buffer = SensorRingBuffer(memory_budget=1_000_000, segment_size=1000)
+        nbytes = buffer.nbytes
+
+        for i in range(10):
+            buffer.append(make_live(5000, offset=i * 5000))
+
+        assert buffer.capacity % 1000 == 0
+        assert nbytes <= 1_000_000
+        assert buffer.nbytes == nbytes
+
+    def test_capacity_must_hold_two_segments(self):
+        with pytest.raises(ValueError):
+            SensorRingBuffer(capacity=1500, segment_size=1000)
+
+    def test_snapshot_after_wraparound(self):
+        """랩어라운드 후에도 최근 구간을 시간순으로 반환"""
+        buffer = SensorRingBuffer(capacity=4000, segment_size=1000)
+        buffer.append(make_live(10_500))
+
+        snapshot = buffer.snapshot()
+
+        assert len(snapshot) == len(buffer) == 3000
+        np.testing.assert_array_equal(snapshot.values["Fz"], np.arange(7500, 10_500))
+
+    def test_snapshot_time_range(self):
+        buffer = SensorRingBuffer(capacity=4000, segment_size=1000)
+        buffer.append(make_live(5000))
+        start_ns = pd.Timestamp(START).value + 3500 * PERIOD_NS
+
+        snapshot = buffer.snapshot(start_ns, start_ns + 99 * PERIOD_NS, axes=["Fz"])
+
+        assert list(snapshot.values) == ["Fz"]
+        np.testing.assert_array_equal(snapshot.values["Fz"], np.arange(3500, 3600))
+
+    def test_out_of_order_rejected(self):
+        buffer = SensorRingBuffer(capacity=4000, segment_size=1000)
+        buffer.append(make_live(100, offset=100))
+
+        with pytest.raises(ValueError):
+            buffer.append(make_live(10))
+
+    def test_spill_segments_to_parquet(self, tmp_path):
+        """채워진 세그먼트는 parquet으로 내보내고, flush로 나머지까지"""
+        sink = ParquetSegmentSink(tmp_path / "segments")
+        buffer = SensorRingBuffer(capacity=4000, segment_size=1000, spill=sink)
+
+        buffer.append(make_live(5500))
+        assert len(list(sink.directory.glob("*.parquet"))) == 5
+        buffer.flush()
+
+        spilled = pd.concat([pd.read_parquet(p) for p in sorted(sink.directory.glob("*.parquet"))])
+        np.testing.assert_array_equal(np.sort(spilled["Fz"].to_numpy()), np.arange(5500))
+
+    def test_spill_to_sqlite(self, tmp_path):
+        db = SensorTimeSeriesDB(tmp_path / "live.db")
+        buffer = SensorRingBuffer(capacity=4000, segment_size=1000, spill=db.append)
+
+        buffer.append(make_live(3000))
+
+        assert db.count() == 3000
+        db.close()
+
+    def test_concurrent_reader_sees_consistent_snapshots(self):
+        """writer 진행 중 스냅샷은 항상 연속된 샘플 (잠금 없음)"""
+        buffer = SensorRingBuffer(capacity=3000, segment_size=500)
+        total = 60_000
+        data = make_live(total)
+        ts_ns = data["timestamp"].to_numpy(dtype="datetime64[ns]").view("int64")
+        values = {axis: data[axis].to_numpy() for axis in DataLoader.SENSOR_AXES}
+        errors = []
+
+        def writer():
+            for i in range(0, total, 100):
+                buffer.append_arrays(ts_ns[i:i + 100], {a: v[i:i + 100] for a, v in values.items()})
+
+        def reader():
+            while buffer.total_written < total:
+                snapshot = buffer.snapshot()
+                fz = snapshot.values["Fz"]
+                if len(fz) and not np.array_equal(fz, np.arange(fz[0], fz[0] + len(fz))):
+                    errors.append(fz)
+                expected_ts = pd.Timestamp(START).value + fz.astype(np.int64) * PERIOD_NS
+                if not np.array_equal(snapshot.ts_ns, expected_ts):
+                    errors.append(snapshot.ts_ns)
+
+        threads = [threading.Thread(target=writer), threading.Thread(target=reader)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+
+
+class TestSensorStoreLive:
+    """SensorStore 실시간 append API"""
+
+    @pytest.fixture
+    def store(self):
+        history = make_live(2000)
+        return SensorStore(history, live=SensorRingBuffer(capacity=4000, segment_size=1000))
+
+    def test_live_samples_queryable_immediately(self, store):
+        store.append(make_live(500, offset=2000))
+
+        data = store.get_data(axes=["Fz"])
+        values = store.get_axis_values("Fz")
+
+        np.testing.assert_array_equal(data["Fz"].to_numpy(), np.arange(2500))
+        np.testing.assert_array_equal(values, np.arange(2500))
+        assert len(store.get_timestamps_ns()) == 2500
+
+    def test_overlap_with_history_not_duplicated(self, store):
+        """과거 데이터와 겹치는 실시간 샘플은 중복 집계하지 않음"""
+        store.append(make_live(600, offset=1900))
+
+        stats = store.get_statistics("Fz")
+
+        assert stats["count"] == 2500
+        assert stats["max"] == 2499.0
+        assert stats["mean"] == pytest.approx(1249.5)
+
+    def test_live_anomalies_and_current_state(self, store):
+        live = make_live(100, offset=2000)
+        live.loc[50, "Tx"] = 99.0
+        store.append(live)
+
+        anomalies = store.get_anomalies("Tx", threshold=50)
+
+        assert anomalies["Tx"].tolist() == [99.0]
+        assert store._latest_row()["Fz"] == 2099.0
+
+    def test_summary_includes_live_samples(self, store):
+        """요약 건수/기간이 get_data와 같은 범위 (겹치는 샘플 중복 없음)"""
+        store.append(make_live(600, offset=1900))
+
+        summary = store.get_summary()
+
+        assert summary["total_records"] == len(store.get_data()) == 2500
+        assert summary["time_range"]["end"] == store.get_data()["timestamp"].iloc[-1].isoformat()
+        assert summary["axes"]["Fz"]["count"] == 2500
+
+    def test_append_creates_default_buffer(self):
+        store = SensorStore(make_live(10))
+
+        store.append(make_live(10, offset=10))
+
+        assert isinstance(store.live, SensorRingBuffer)
+        assert store.get_statistics("Fz")["count"] == 20
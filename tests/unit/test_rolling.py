@@ -0,0 +1,83 @@
+"""롤링 통계 커널 단위 테스트"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.sensor.pattern_detector import PatternDetector
+from src.sensor.rolling import infer_sample_rate, rolling_moments, rolling_std, window_samples
+from src.sensor.sensor_store import SensorStore
+
+
+class TestRollingMoments:
+    """rolling_moments / rolling_std 테스트"""
+
+    @pytest.mark.parametrize("window,min_periods", [(5, 2), (125, 62), (625, None)])
+    def test_matches_pandas(self, window, min_periods):
+        rng = np.random.default_rng(0)
+        values = rng.normal(-50, 10, 50_000)
+        values[1000:1100] = np.nan
+
+        means, variances = rolling_moments(values, window, min_periods=min_periods)
+        series = pd.Series(values).rolling(window, min_periods=min_periods)
+
+        np.testing.assert_allclose(means, series.mean().to_numpy(), rtol=1e-9, atol=1e-9)
+        np.testing.assert_allclose(variances, series.var().to_numpy(), rtol=1e-7, atol=1e-7)
+
+    def test_columns_independent(self):
+        """(n, k) 배열은 열마다 독립적으로 롤링 (모분산)"""
+        rng = np.random.default_rng(1)
+        values = rng.normal(0, 5, (2_000, 3)) + np.array([0.0, 100.0, -300.0])
+
+        result = rolling_std(values, 50, min_periods=25, ddof=0)
+        expected = pd.DataFrame(values).rolling(50, min_periods=25).std(ddof=0).to_numpy()
+
+        np.testing.assert_allclose(result, expected, rtol=1e-8, atol=1e-8)
+
+    def test_constant_signal_has_zero_std(self):
+        result = rolling_std(np.full(100, 1e6), 10)
+
+        assert np.all(np.isnan(result[:9]))
+        assert np.all(result[9:] == 0.0)
+
+    def test_invalid_window(self):
+        with pytest.raises(ValueError):
+            rolling_std(np.ones(10), 0)
+
+
+class TestSampleRate:
+    """샘플링 주기 추정 / 윈도우 크기"""
+
+    @pytest.mark.parametrize("freq,rate", [("1s", 1.0), ("8ms", 125.0), ("40ms", 25.0)])
+    def test_infer_sample_rate(self, freq, rate):
+        ts = pd.date_range("2026-01-20", periods=1_000, freq=freq)
+        ts_ns = ts.delete(range(100, 200)).to_numpy(dtype="datetime64[ns]").view("int64")
+
+        assert infer_sample_rate(ts_ns) == pytest.approx(rate)
+
+    def test_infer_sample_rate_default(self):
+        assert infer_sample_rate(np.array([5], dtype=np.int64), default=125.0) == 125.0
+        assert infer_sample_rate(np.array([5, 5], dtype=np.int64)) is None
+
+    def test_window_samples(self):
+        assert window_samples(5, 125.0) == 625
+        assert window_samples(5, 1.0) == 5
+        assert window_samples(0.5, 1.0) == 2
+
+    def test_vibration_detected_at_1hz(self):
+        """1Hz 저장 데이터에서도 window_s 초 윈도우로 진동 감지"""
+        rng = np.random.default_rng(2)
+        n = 3_600
+        df = pd.DataFrame({"timestamp": pd.date_range("2026-01-20", periods=n, freq="1s")})
+        fz = rng.normal(-50, 2, n)
+        fz[1_000:1_300] += 30.0 * (-1.0) ** np.arange(300)
+        df["Fz"] = fz
+
+        detector = PatternDetector(SensorStore(df))
+        patterns = detector.detect_vibration(axis="Fz")
+
+        window = window_samples(detector.vibration_window_seconds, 1.0)
+        assert detector._vibration_window_size(detector._timestamps_ns(df)) == window
+        assert len(patterns) == 1
+        start = df["timestamp"].iloc[1_000]
+        assert start <= pd.Timestamp(patterns[0].timestamp) <= start + pd.Timedelta(seconds=window)
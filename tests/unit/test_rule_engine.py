@@ -3,9 +3,13 @@ RuleEngine 단위 테스트
 
 테스트 대상:
 - infer_state: 상태 추론
+- infer_states_array: 배열 상태 추론 (infer_state와 동일 결과)
 - detect_collision: 충돌 패턴 감지
 - detect_overload: 과부하 패턴 감지
+- detect_vibration: 진동 패턴 감지 (롤링 표준편차)
+- detect_*_array: 배열 감지기 (리스트 래퍼와 동일 결과)
 - predict_error: 에러 예측 (frequency + trend)
+- compile_condition / compile_cause_rules: 원인 규칙 컴파일
 - YAML 로드 에러 처리
 """
 
@@ -16,7 +20,7 @@ from unittest.mock import patch, MagicMock
 import tempfile
 import yaml
 
-from src.ontology.rule_engine import RuleEngine, InferenceResult
+from src.ontology.rule_engine import RuleEngine, InferenceResult, compile_condition
 
 
 class TestInferState:
@@ -105,6 +109,43 @@ class TestInferState:
         assert states["Ty"] == "State_Warning"
 
 
+class TestInferStatesArray:
+    """배열 상태 추론 테스트"""
+
+    @pytest.fixture
+    def rule_engine(self):
+        """RuleEngine 인스턴스 생성"""
+        return RuleEngine()
+
+    @pytest.mark.parametrize("axis", ["Fx", "Fy", "Fz", "Tx", "Ty", "Tz", "Unknown"])
+    def test_matches_scalar_inference(self, rule_engine, axis):
+        """경계값/범위 밖/NaN 포함 모든 값에서 infer_state와 동일"""
+        import numpy as np
+
+        plan = rule_engine.compile_state_rules(axis)
+        boundaries = plan["lower"] + plan["upper"]
+        values = np.concatenate([
+            np.linspace(-1200, 1200, 4801),
+            np.array(boundaries, dtype=float),
+            [np.nan, np.inf, -np.inf],
+        ])
+
+        states = rule_engine.infer_states_array(axis, values)
+
+        expected = []
+        for value in values:
+            result = rule_engine.infer_state(axis, float(value))
+            expected.append(result.result_id if result else None)
+        assert states.tolist() == expected
+
+    def test_overlapping_boundary_first_match(self, rule_engine):
+        """겹치는 경계(-200, -20)는 먼저 나온 매핑"""
+        codes = rule_engine.infer_state_codes("Fz", [-200.0, -20.0])
+        plan = rule_engine.compile_state_rules("Fz")
+
+        assert [plan["labels"][c] for c in codes] == ["중부하", "유휴"]
+
+
 class TestDetectCollision:
     """충돌 패턴 감지 테스트"""
 
@@ -196,6 +237,177 @@ class TestDetectOverload:
         assert result is None
 
 
+class TestDetectVibration:
+    """진동 패턴 감지 테스트"""
+
+    @pytest.fixture
+    def rule_engine(self):
+        return RuleEngine()
+
+    @staticmethod
+    def reference_vibration(fz_values, timestamps_s, window_size, threshold, min_duration_s):
+        """윈도우별 np.std 참조 구현 → (start_idx, end_idx)"""
+        import numpy as np
+
+        start = None
+        for i in range(window_size, len(fz_values)):
+            if np.std(fz_values[i - window_size:i]) > threshold:
+                if start is None:
+                    start = i - window_size
+                if timestamps_s[i] - timestamps_s[start] >= min_duration_s:
+                    return start, i
+            else:
+                start = None
+        return None
+
+    @pytest.mark.parametrize("sample_rate", [1, 125])
+    def test_window_follows_sample_rate(self, rule_engine, sample_rate):
+        """1Hz / 125Hz 모두 window_s 초 윈도우로 감지"""
+        import numpy as np
+
+        rng = np.random.default_rng(0)
+        n = 300 * sample_rate
+        timestamps_s = list(np.arange(n) / sample_rate)
+        fz_values = rng.normal(-50, 1, n)
+        fz_values[40 * sample_rate:80 * sample_rate] += 20.0 * (-1.0) ** np.arange(40 * sample_rate)
+        fz_values = fz_values.tolist()
+
+        result = rule_engine.detect_vibration(fz_values, timestamps_s)
+
+        config = rule_engine.pattern_thresholds.get("vibration", {})
+        window_size = int(config.get("window_s", 5) * sample_rate)
+        threshold = np.std(fz_values) * config.get("amplitude_threshold", 2.0)
+        expected = self.reference_vibration(
+            fz_values, timestamps_s, window_size, threshold, config.get("min_duration_s", 10)
+        )
+        assert result is not None
+        assert result.result_id == "PAT_VIBRATION"
+        data_range = result.evidence["data_range"]
+        assert (data_range["start_idx"], data_range["end_idx"]) == expected
+
+    def test_jittered_timestamps_use_median_gap(self, rule_engine):
+        """불규칙 간격: 윈도우는 간격 중앙값 기준 (전체 길이/기간 비율 아님)"""
+        import numpy as np
+
+        rng = np.random.default_rng(5)
+        n = 3000
+        gaps = rng.choice([0.5, 1.0, 1.0, 3.0], n - 1)       # 중앙값 1초, 평균 약 1.4초
+        timestamps_s = np.concatenate([[0.0], np.cumsum(gaps)])
+        fz_values = rng.normal(-50, 1, n)
+        fz_values[1000:1200] += 20.0 * (-1.0) ** np.arange(200)
+
+        result = rule_engine.detect_vibration(fz_values.tolist(), timestamps_s.tolist())
+
+        config = rule_engine.pattern_thresholds.get("vibration", {})
+        window_s = config.get("window_s", 5)
+        window_size = int(window_s / np.median(gaps))
+        assert window_size != int(n * window_s / (timestamps_s[-1] - timestamps_s[0]))
+        threshold = np.std(fz_values) * config.get("amplitude_threshold", 2.0)
+        expected = self.reference_vibration(
+            fz_values, timestamps_s, window_size, threshold, config.get("min_duration_s", 10)
+        )
+        assert result is not None
+        data_range = result.evidence["data_range"]
+        assert (data_range["start_idx"], data_range["end_idx"]) == expected
+
+    def test_detect_vibration_flat_signal(self, rule_engine):
+        fz_values = [-50.0] * 100
+        timestamps_s = list(range(100))
+
+        assert rule_engine.detect_vibration(fz_values, timestamps_s) is None
+
+
+class TestArrayDetectors:
+    """배열 감지기 테스트"""
+
+    @pytest.fixture
+    def rule_engine(self):
+        return RuleEngine()
+
+    @staticmethod
+    def reference_overload(fz_values, timestamps_s, threshold, duration):
+        """샘플 루프 참조 구현 → (start_idx, end_idx, max_fz)"""
+        start = None
+        max_fz = 0
+        for i, (fz, ts) in enumerate(zip(fz_values, timestamps_s)):
+            if abs(fz) > threshold:
+                if start is None:
+                    start = i
+                    max_fz = abs(fz)
+                else:
+                    max_fz = max(max_fz, abs(fz))
+                if ts - timestamps_s[start] >= duration:
+                    return start, i, max_fz
+            else:
+                start = None
+        return None
+
+    @pytest.fixture
+    def signal(self):
+        """125Hz 10분 신호 (충돌 + 과부하 + 진동 구간)"""
+        import numpy as np
+
+        rng = np.random.default_rng(3)
+        n = 125 * 600
+        fz = rng.normal(-50, 5, n)
+        fz[10_000:10_050] = -700
+        fz[20_000:21_000] = -400 + rng.normal(0, 5, 1000)
+        fz[40_000:42_500] += 100 * (-1.0) ** np.arange(2500)
+        return fz, np.arange(n) * 8
+
+    @pytest.fixture
+    def drift_signal(self):
+        """1Hz 4시간 신호 (2시간 이후 점진적 하강)"""
+        import numpy as np
+
+        rng = np.random.default_rng(4)
+        n = 4 * 3600
+        fz = rng.normal(-50, 2, n)
+        fz[8000:] -= np.linspace(0, 40, n - 8000)
+        return fz, np.arange(n) * 1000
+
+    def test_overload_matches_reference(self, rule_engine, signal):
+        fz, ts_ms = signal
+        timestamps_s = (ts_ms / 1000).tolist()
+        config = rule_engine.pattern_thresholds.get("overload", {})
+        expected = self.reference_overload(
+            fz.tolist(), timestamps_s, config.get("force_threshold_N", 300), config.get("duration_s", 5)
+        )
+
+        result = rule_engine.detect_overload_array(fz, ts_ms / 1000)
+
+        data_range = result.evidence["data_range"]
+        assert (data_range["start_idx"], data_range["end_idx"]) == expected[:2]
+        assert result.evidence["features"]["max_Fz_N"] == round(expected[2], 1)
+
+    @pytest.mark.parametrize("detector, fixture", [
+        ("collision", "signal"),
+        ("overload", "signal"),
+        ("vibration", "signal"),
+        ("drift", "drift_signal"),
+    ])
+    def test_array_matches_list(self, rule_engine, request, detector, fixture):
+        """배열 입력과 리스트 입력의 근거(evidence)가 같음"""
+        fz, ts_ms = request.getfixturevalue(fixture)
+        timestamps = ts_ms if detector == "collision" else ts_ms / 1000
+
+        from_list = getattr(rule_engine, f"detect_{detector}")(fz.tolist(), timestamps.tolist())
+        from_array = getattr(rule_engine, f"detect_{detector}_array")(fz, timestamps)
+
+        assert from_list is not None
+        assert from_array.evidence == from_list.evidence
+        assert from_array.message == from_list.message
+
+    def test_full_inference_accepts_arrays(self, rule_engine, signal):
+        fz, ts_ms = signal
+
+        from_list = rule_engine.full_inference({"Fz": fz.tolist(), "timestamp_ms": ts_ms.tolist()})
+        from_array = rule_engine.full_inference({"Fz": fz, "timestamp_ms": ts_ms})
+
+        assert [p.evidence for p in from_array["patterns"]] == [p.evidence for p in from_list["patterns"]]
+        assert {"PAT_COLLISION", "PAT_OVERLOAD"} <= {p.result_id for p in from_array["patterns"]}
+
+
 class TestPredictError:
     """에러 예측 테스트"""
 
@@ -333,6 +545,63 @@ class TestInferCause:
         assert len(results) == 0
 
 
+class TestCompiledCauseRules:
+    """원인 규칙 컴파일 테스트"""
+
+    @pytest.mark.parametrize("condition, context, expected", [
+        ("product_weight >= 4.0", {"product_weight": 4.0}, True),
+        ("product_weight > 4.0", {"product_weight": 4.0}, False),
+        ("product_weight <= 4.0", {}, True),           # 키가 없으면 0과 비교
+        ("product_weight < 4.0", {"product_weight": "heavy"}, False),
+        ("workload == 'heavy'", {"workload": "heavy"}, True),
+        ("workload == 'heavy'", {}, False),
+    ])
+    def test_compile_condition(self, condition, context, expected):
+        assert compile_condition(condition)(context) is expected
+
+    @pytest.mark.parametrize("condition", [
+        "continuous_operation > 8h",
+        "product_weight",
+        "1 < product_weight < 5",
+    ])
+    def test_compile_condition_malformed(self, condition):
+        with pytest.raises(ValueError):
+            compile_condition(condition)
+
+    def test_malformed_conditions_reported_at_load(self):
+        """잘못된 조건은 로드 시 condition_errors에 기록되고 추론에는 적용되지 않음"""
+        rules = {
+            "state_rules": [],
+            "cause_rules": [
+                {"pattern": "PAT_OVERLOAD", "causes": [{
+                    "cause_id": "CAUSE_OVERLOAD",
+                    "base_confidence": 0.5,
+                    "context_boost": [
+                        {"condition": "product_weight > heavy", "boost": 0.3},
+                        {"condition": "product_weight > 4.0", "boost": 0.1},
+                    ],
+                }]},
+                {"pattern": "PAT_OVERLOAD", "causes": [{"cause_id": "CAUSE_POSITION_ERROR", "base_confidence": 0.4}]},
+            ],
+        }
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump(rules, f)
+            temp_path = Path(f.name)
+
+        try:
+            rule_engine = RuleEngine(inference_rules_path=temp_path)
+        finally:
+            temp_path.unlink()
+
+        assert len(rule_engine.condition_errors) == 1
+        assert "product_weight > heavy" in rule_engine.condition_errors[0]
+
+        results = rule_engine.infer_cause("PAT_OVERLOAD", {"product_weight": 5})
+        # 같은 패턴의 규칙 여러 개는 모두 적용
+        assert [r.result_id for r in results] == ["CAUSE_OVERLOAD", "CAUSE_POSITION_ERROR"]
+        assert results[0].confidence == pytest.approx(0.6)
+
+
 class TestYAMLLoadError:
     """YAML 로드 에러 처리 테스트"""
 
@@ -0,0 +1,97 @@
+"""런 길이 구간 분할 단위 테스트"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.sensor.pattern_detector import PatternDetector
+from src.sensor.segments import find_segments
+from src.sensor.sensor_store import SensorStore
+
+
+def reference_groups(indices, max_gap=1):
+    """연속 인덱스 그룹핑 참조 구현 (기존 파이썬 루프)"""
+    if not indices:
+        return []
+    groups = [[indices[0]]]
+    for idx in indices[1:]:
+        if idx - groups[-1][-1] <= max_gap:
+            groups[-1].append(idx)
+        else:
+            groups.append([idx])
+    return groups
+
+
+class TestFindSegments:
+    """find_segments 테스트"""
+
+    @pytest.mark.parametrize("max_gap", [1, 2, 5, 50])
+    def test_matches_reference_grouping(self, max_gap):
+        rng = np.random.default_rng(max_gap)
+        values = rng.normal(0, 1, 5000)
+        mask = values > 0.8
+
+        segments = find_segments(mask, max_gap=max_gap)
+        groups = reference_groups(np.flatnonzero(mask).tolist(), max_gap)
+
+        assert len(segments) == len(groups)
+        assert segments.starts.tolist() == [g[0] for g in groups]
+        assert segments.ends.tolist() == [g[-1] for g in groups]
+        np.testing.assert_array_equal(segments.reduce(values, "max"), [values[g].max() for g in groups])
+        np.testing.assert_array_equal(segments.reduce(values, "min"), [values[g].min() for g in groups])
+        np.testing.assert_allclose(segments.reduce(values, "mean"), [values[g].mean() for g in groups])
+        assert segments.argmin(values).tolist() == [g[int(np.argmin(values[g]))] for g in groups]
+        assert segments.argmax(values).tolist() == [g[int(np.argmax(values[g]))] for g in groups]
+
+    def test_empty_and_edges(self):
+        empty = find_segments(np.zeros(10, dtype=bool))
+        full = find_segments(np.ones(10, dtype=bool))
+
+        assert len(empty) == 0
+        assert empty.reduce(np.arange(10.0)).shape == (0,)
+        assert (full.starts.tolist(), full.ends.tolist()) == ([0], [9])
+
+    def test_column_length_splits_at_column_boundary(self):
+        """열 우선으로 펼친 2D 마스크는 열 경계에서 구간 분리"""
+        mask = np.array([[False, True], [True, True], [True, False]])  # (n=3, k=2)
+
+        segments = find_segments(mask.T.ravel(), max_gap=5, column_length=3)
+
+        assert segments.starts.tolist() == [1, 3]
+        assert segments.ends.tolist() == [2, 4]
+
+    def test_argmin_tie_takes_first(self):
+        values = np.array([0.0, -5.0, -5.0, 0.0, -3.0, -3.0])
+        segments = find_segments(values < 0)
+
+        assert segments.argmin(values).tolist() == [1, 4]
+
+    def test_unknown_reducer(self):
+        with pytest.raises(ValueError):
+            find_segments(np.ones(3, dtype=bool)).reduce(np.ones(3), "median")
+
+
+class TestDetectorSegments:
+    """PatternDetector 구간 감지"""
+
+    def test_overload_and_collision_segments(self):
+        n = 2000
+        df = pd.DataFrame({"timestamp": pd.date_range("2026-01-20", periods=n, freq="1s")})
+        for axis in ["Fx", "Fy", "Fz", "Tx", "Ty", "Tz"]:
+            df[axis] = 0.0
+        df["Fz"] = -50.0
+        df.loc[100:119, "Fz"] = -200.0          # 20초 과부하
+        df.loc[110, "Fz"] = -500.0              # 과부하 구간 내 충돌 피크
+        df.loc[500:502, "Fz"] = -180.0          # 최소 지속 시간 미달
+        detector = PatternDetector(SensorStore(df))
+
+        overloads = detector.detect_overload(axis="Fz", threshold=150, min_duration_s=5)
+        collisions = detector.detect_collision(axis="Fz", threshold=-350)
+
+        assert len(overloads) == 1
+        assert overloads[0].timestamp == df["timestamp"][100]
+        assert overloads[0].metrics["duration_s"] == 19.0
+        assert overloads[0].metrics["max_value"] == 500.0
+        assert overloads[0].metrics["mean_value"] == pytest.approx((19 * 200 + 500) / 20)
+        assert [p.timestamp for p in collisions] == [df["timestamp"][110]]
+        assert collisions[0].metrics["peak_value"] == -500.0
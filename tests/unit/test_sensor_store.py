@@ -0,0 +1,298 @@
+"""SensorStore 단위 테스트
+
+테스트 대상:
+- get_data: 정렬 타임스탬프 기반 범위 조회
+- get_window: 이벤트 스니펫 조회
+- get_anomalies: 임계값 이상치 조회
+- get_statistics: 누적합 기반 구간 통계
+- window_means: 누적합 기반 중심 시각별 윈도우 평균
+- get_context_at_many: 이진 탐색 기반 최근접 컨텍스트 일괄 조회
+- get_states / get_state_kpis: 샘플별 상태 라벨링과 KPI
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.sensor.range_stats import RangeStatistics, window_means
+from src.sensor.sensor_store import SensorStore
+from tests.unit.conftest import build_sensor_frame
+
+
+START = datetime(2026, 1, 20, 0, 0, 0)
+
+
+def make_frame(n: int = 600) -> pd.DataFrame:
+    """1Hz 합성 센서 데이터 + 컨텍스트 컬럼"""
+    df = build_sensor_frame(n, start=START, fz_std=10.0)
+    df["task_mode"] = "pick"
+    df["shift"] = ["A"] * (n // 2) + ["B"] * (n - n // 2)
+    return df
+
+
+@pytest.fixture
+def frame():
+    return make_frame()
+
+
+@pytest.fixture
+def store(frame):
+    return SensorStore(data=frame)
+
+
+class TestGetData:
+    """범위 조회 테스트"""
+
+    def test_full_range(self, store, frame):
+        """범위 미지정 시 전체 반환"""
+        assert len(store.get_data()) == len(frame)
+
+    def test_inclusive_bounds(self, store, frame):
+        """[start, end] 양끝 포함"""
+        start = START + timedelta(seconds=10)
+        end = START + timedelta(seconds=20)
+
+        df = store.get_data(start=start, end=end)
+        expected = frame[(frame["timestamp"] >= start) & (frame["timestamp"] <= end)]
+
+        assert len(df) == 11
+        assert df["timestamp"].tolist() == expected["timestamp"].tolist()
+
+    def test_between_samples(self, store):
+        """샘플 사이 경계값"""
+        start = START + timedelta(seconds=10.5)
+        end = START + timedelta(seconds=12.5)
+
+        df = store.get_data(start=start, end=end)
+
+        assert len(df) == 2
+
+    def test_out_of_range(self, store):
+        """데이터 범위 밖 조회"""
+        df = store.get_data(start=START - timedelta(days=2), end=START - timedelta(days=1))
+
+        assert df.empty
+
+    def test_axes_filter(self, store):
+        """축 필터"""
+        df = store.get_data(axes=["Fz", "Unknown"])
+
+        assert list(df.columns) == ["timestamp", "Fz"]
+
+    def test_unsorted_input_is_sorted(self, frame):
+        """정렬되지 않은 입력도 정렬 후 인덱싱"""
+        shuffled = frame.sample(frac=1.0, random_state=1)
+        store = SensorStore(data=shuffled)
+
+        df = store.get_data(end=START + timedelta(seconds=4))
+
+        assert len(df) == 5
+        assert df["timestamp"].is_monotonic_increasing
+
+    def test_axis_values_read_only_view(self, store):
+        """축 값은 읽기 전용 뷰"""
+        values = store.get_axis_values("Fz", end=START + timedelta(seconds=9))
+
+        assert len(values) == 10
+        assert not values.flags.writeable
+        assert np.shares_memory(values, store.data["Fz"].to_numpy())
+
+
+class TestWindowAndAnomalies:
+    """윈도우/이상치 조회 테스트"""
+
+    def test_get_window(self, store):
+        """±5초 윈도우"""
+        df = store.get_window(START + timedelta(seconds=100), window_seconds=5.0)
+
+        assert len(df) == 11
+
+    def test_get_anomalies_directions(self, store, frame):
+        """absolute/above/below 방향"""
+        above = store.get_anomalies("Fz", threshold=-40, direction="above")
+        below = store.get_anomalies("Fz", threshold=-60, direction="below")
+        absolute = store.get_anomalies("Fz", threshold=60)
+
+        assert len(above) == int((frame["Fz"] > -40).sum())
+        assert len(below) == int((frame["Fz"] < -60).sum())
+        assert len(absolute) == int((frame["Fz"].abs() > 60).sum())
+
+    def test_get_anomalies_in_range(self, store, frame):
+        """시간 범위 내 이상치"""
+        end = START + timedelta(seconds=99)
+        df = store.get_anomalies("Fz", threshold=55, end=end)
+
+        expected = frame[(frame["timestamp"] <= end) & (frame["Fz"].abs() > 55)]
+        assert df.index.tolist() == expected.index.tolist()
+
+    def test_get_anomalies_unknown_axis(self, store):
+        """알 수 없는 축"""
+        assert store.get_anomalies("Unknown", threshold=1).empty
+
+
+class TestRangeStatistics:
+    """누적합/블록 인덱스 구간 통계 테스트"""
+
+    @pytest.mark.parametrize("block_size", [1, 4, 7, 1024])
+    def test_matches_numpy(self, block_size):
+        """임의 구간 통계가 직접 계산과 일치"""
+        rng = np.random.default_rng(3)
+        values = rng.normal(-50, 10, 500)
+        stats = RangeStatistics({"Fz": values}, block_size=block_size)
+
+        for lo, hi in [(0, 500), (3, 4), (10, 11), (17, 250), (255, 499), (128, 384)]:
+            result = stats.query("Fz", lo, hi)
+            window = values[lo:hi]
+            assert result["count"] == hi - lo
+            assert result["mean"] == pytest.approx(window.mean())
+            assert result["min"] == window.min()
+            assert result["max"] == window.max()
+            if hi - lo > 1:
+                assert result["std"] == pytest.approx(window.std(ddof=1))
+            else:
+                assert np.isnan(result["std"])
+
+    def test_nan_values_skipped(self):
+        """NaN은 pandas처럼 무시"""
+        values = np.array([1.0, np.nan, 3.0, np.nan, 5.0, 7.0])
+        stats = RangeStatistics({"Fz": values}, block_size=2)
+
+        result = stats.query("Fz", 0, 6)
+        expected = pd.Series(values)
+
+        assert result["count"] == 4
+        assert result["mean"] == pytest.approx(expected.mean())
+        assert result["std"] == pytest.approx(expected.std())
+        assert result["min"] == 1.0
+        assert result["max"] == 7.0
+
+    def test_float32_axes_converted_on_first_query(self, frame):
+        """float32 축은 조회한 축만 float64로 변환"""
+        compact = frame.astype({axis: "float32" for axis in ["Fx", "Fy", "Fz", "Tx", "Ty", "Tz"]})
+        store = SensorStore(compact)
+
+        stats = store.get_statistics("Fz")
+
+        assert list(store._range_stats._indexes) == ["Fz"]
+        assert stats["mean"] == pytest.approx(compact["Fz"].astype("float64").mean(), abs=1e-4)
+
+    def test_store_statistics_match_pandas(self, store, frame):
+        """SensorStore.get_statistics가 pandas 계산과 일치"""
+        start = START + timedelta(seconds=37)
+        end = START + timedelta(seconds=411)
+
+        stats = store.get_statistics("Fz", start=start, end=end)
+        window = frame[(frame["timestamp"] >= start) & (frame["timestamp"] <= end)]["Fz"]
+
+        assert stats["count"] == len(window)
+        assert stats["mean"] == round(float(window.mean()), 4)
+        assert stats["std"] == pytest.approx(round(float(window.std()), 4), abs=1e-4)
+        assert stats["min"] == round(float(window.min()), 4)
+        assert stats["max"] == round(float(window.max()), 4)
+        assert stats["period"]["start"] == start.isoformat()
+        assert stats["period"]["end"] == end.isoformat()
+
+    def test_store_statistics_empty_range(self, store):
+        """빈 구간"""
+        stats = store.get_statistics("Fz", start=START - timedelta(days=1), end=START - timedelta(hours=1))
+
+        assert "error" in stats
+
+
+class TestWindowMeans:
+    """window_means 테스트"""
+
+    def test_inclusive_bounds_and_empty_window(self):
+        ts_ns = np.arange(10, dtype=np.int64) * 10
+        values = np.arange(10, dtype=np.float64)
+        keep = values != 5
+
+        means = window_means(ts_ns, values, keep, centers_ns=[50, 0, 500], half_window_ns=10)
+
+        # [40, 60] → 4, 6 (5 제외) / [-10, 10] → 0, 1 / 범위 밖 → default
+        np.testing.assert_allclose(means, [5.0, 0.5, 0.0])
+
+
+class TestContextAtMany:
+    """최근접 컨텍스트 일괄 조회 테스트"""
+
+    @staticmethod
+    def reference_context(frame, timestamp):
+        """기존 idxmin 방식 참조 구현"""
+        row = frame.loc[(frame["timestamp"] - timestamp).abs().idxmin()]
+        context = {"timestamp": row["timestamp"].isoformat()}
+        for col in ["task_mode", "shift"]:
+            context[col] = None if pd.isna(row[col]) else row[col]
+        return context
+
+    def test_matches_reference(self, store, frame):
+        """임의 시각(범위 밖 포함)에서 참조 구현과 동일"""
+        rng = np.random.default_rng(1)
+        offsets = rng.uniform(-30, len(frame) + 30, 200)
+        timestamps = [START + timedelta(seconds=float(o)) for o in offsets]
+
+        contexts = store.get_context_at_many(timestamps)
+
+        assert contexts == [self.reference_context(frame, ts) for ts in timestamps]
+
+    def test_tie_picks_earlier_sample(self, store):
+        """두 샘플 사이 정중앙이면 앞쪽 샘플"""
+        context = store.get_context_at(START + timedelta(seconds=10.5))
+
+        assert context["timestamp"] == (START + timedelta(seconds=10)).isoformat()
+
+    def test_preserves_input_order_and_missing(self, frame):
+        frame.loc[5, "task_mode"] = None
+        store = SensorStore(frame)
+
+        contexts = store.get_context_at_many([
+            START + timedelta(seconds=400), START + timedelta(seconds=5), START,
+        ])
+
+        assert [c["timestamp"] for c in contexts] == [
+            (START + timedelta(seconds=s)).isoformat() for s in (400, 5, 0)
+        ]
+        assert contexts[1]["task_mode"] is None
+        assert contexts[0]["shift"] == "B"
+
+    def test_empty_input(self, store):
+        assert store.get_context_at_many([]) == []
+
+
+class TestStateLabeling:
+    """샘플별 상태 라벨링 / KPI 테스트"""
+
+    @pytest.fixture
+    def labeled_store(self):
+        # Fz: 0~99초 정상(-50), 100~109초 과부하 경고(-300), 110~199초 정상(-50)
+        frame = make_frame(n=200)
+        frame["Fz"] = -50.0
+        frame.loc[100:109, "Fz"] = -300.0
+        return SensorStore(frame)
+
+    def test_states_match_rule_engine(self, labeled_store):
+        states = labeled_store.get_states("Fz")
+        engine = labeled_store._rule_engine
+
+        expected = [engine.infer_state("Fz", v).result_id for v in labeled_store.data["Fz"]]
+        assert states.tolist() == expected
+
+    def test_states_cached_and_sliced(self, labeled_store):
+        labeled_store.get_states("Fz")
+        cached = labeled_store._state_cache["Fz"]
+
+        states = labeled_store.get_states("Fz", START + timedelta(seconds=95), START + timedelta(seconds=104))
+
+        assert labeled_store._state_cache["Fz"] is cached
+        assert states.tolist() == ["State_Normal"] * 5 + ["State_Warning"] * 5
+
+    def test_state_kpis(self, labeled_store):
+        kpis = labeled_store.get_state_kpis("Fz")
+
+        assert kpis["samples"] == 200
+        assert kpis["normal_rate"] == 0.95
+        assert kpis["states"]["State_Warning"]["seconds"] == 10.0
+        assert kpis["states"]["State_Normal"]["seconds"] == 190.0
+        assert kpis["transitions"] == 2
@@ -0,0 +1,102 @@
+"""STFT 대역 에너지 / 스펙트럼 진동 감지 단위 테스트"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.sensor.pattern_detector import PatternDetector
+from src.sensor.sensor_store import SensorStore
+from src.sensor.spectral import band_energies
+from tests.unit.conftest import build_sensor_frame
+
+
+def make_frame(n: int, freq: str) -> pd.DataFrame:
+    """6축 백색 잡음 합성 데이터"""
+    return build_sensor_frame(n, freq=freq, noise_std=1.0, fz_std=1.0)
+
+
+def add_tone(df: pd.DataFrame, axis: str, start: int, stop: int, freq_hz: float, rate_hz: float) -> None:
+    t = np.arange(start, stop) / rate_hz
+    df.loc[start:stop - 1, axis] += 5.0 * np.sin(2 * np.pi * freq_hz * t)
+
+
+class TestBandEnergies:
+    """band_energies 테스트"""
+
+    def test_matches_per_frame_fft(self):
+        """대역 에너지가 프레임별 직접 FFT 계산과 같음"""
+        rng = np.random.default_rng(1)
+        values = rng.normal(0, 1, (4_096, 3))
+        bands = {"low": [1.0, 10.0], "high": [20.0, 60.0]}
+
+        result = band_energies(values, 125.0, bands, nperseg=256, overlap=0.5)
+
+        assert result.frame_starts[:3].tolist() == [0, 128, 256]
+        assert result.energies.shape == (3, 2, (4_096 - 256) // 128 + 1)
+        window = np.sin(np.pi * np.arange(256) / 256) ** 2      # 주기적 Hann
+        freqs = np.fft.rfftfreq(256, d=1 / 125.0)
+        for frame_idx in [0, 7, 30]:
+            start = result.frame_starts[frame_idx]
+            for axis in range(3):
+                frame = values[start:start + 256, axis]
+                power = np.abs(np.fft.rfft((frame - frame.mean()) * window) / window.sum()) ** 2
+                for b, (low, high) in enumerate(result.edges_hz):
+                    keep = (freqs >= low) & (freqs <= high)
+                    assert result.energies[axis, b, frame_idx] == pytest.approx(power[keep].sum(), rel=1e-9)
+
+    def test_bands_clipped_to_nyquist(self):
+        result = band_energies(np.zeros(1_000), 1.0, {"low": [0.05, 2.0], "high": [5.0, 20.0]})
+
+        assert result.bands == ["low"]
+        assert result.edges_hz == [(0.05, 0.5)]
+        assert result.energies.shape[:2] == (1, 1)
+
+    def test_invalid_band(self):
+        with pytest.raises(ValueError):
+            band_energies(np.zeros(100), 125.0, {"bad": [20.0, 10.0]})
+
+
+class TestSpectralVibration:
+    """PatternDetector.detect_spectral_vibration 테스트"""
+
+    def test_detects_tone_in_band_at_125hz(self):
+        """125Hz 데이터의 joint_wear 대역 성분을 축/대역/주파수와 함께 감지"""
+        df = make_frame(125 * 600, "8ms")
+        add_tone(df, "Tx", 125 * 200, 125 * 260, 12.0, 125.0)
+
+        patterns = PatternDetector(SensorStore(df)).detect_spectral_vibration()
+
+        assert len(patterns) == 1
+        pattern = patterns[0]
+        assert pattern.pattern_type.value == "vibration"
+        assert pattern.metrics["axis"] == "Tx"
+        assert pattern.metrics["band"] == "joint_wear"
+        assert pattern.metrics["peak_freq_hz"] == pytest.approx(12.0, abs=125 / 256)
+        assert 55 <= pattern.metrics["duration_s"] <= 65
+        assert abs(pd.Timestamp(pattern.timestamp) - df["timestamp"].iloc[125 * 200]) < pd.Timedelta(seconds=3)
+
+    def test_week_of_1hz_data_single_call(self):
+        """1Hz 1주일 데이터를 한 번에 처리, 나이퀴스트 이하 대역만 사용"""
+        df = make_frame(7 * 24 * 3600, "1s")
+        add_tone(df, "Ty", 200_000, 203_000, 0.2, 1.0)
+
+        patterns = PatternDetector(SensorStore(df)).detect_spectral_vibration(axes=["Fz", "Ty"])
+
+        assert [(p.metrics["axis"], p.metrics["band"]) for p in patterns] == [("Ty", "low_freq")]
+        assert patterns[0].metrics["peak_freq_hz"] == pytest.approx(0.2, abs=1 / 256)
+
+    def test_quiet_signal(self):
+        df = make_frame(125 * 120, "8ms")
+
+        assert PatternDetector(SensorStore(df)).detect_spectral_vibration() == []
+
+    def test_config_override(self):
+        df = make_frame(125 * 600, "8ms")
+        add_tone(df, "Fz", 125 * 200, 125 * 260, 12.0, 125.0)
+        config = dict(PatternDetector.DEFAULT_CONFIG)
+        config["vibration"] = {"spectral": {"bands": {"narrow": [30.0, 40.0]}}}
+
+        detector = PatternDetector(SensorStore(df), config=config)
+
+        assert detector.spectral_config["nperseg"] == 256
+        assert detector.detect_spectral_vibration() == []
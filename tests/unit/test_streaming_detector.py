@@ -0,0 +1,232 @@
+"""StreamingPatternDetector / 증분 감지 단위 테스트"""
+
+import json
+
+import numpy as np
+import pytest
+
+from src.sensor.detection_checkpoint import DetectionCheckpoint
+from src.sensor.pattern_detector import PatternDetector
+from src.sensor.sensor_store import SensorStore
+from src.sensor.streaming_detector import StreamingPatternDetector
+from tests.unit.conftest import build_sensor_frame
+
+
+def comparable(pattern):
+    """패턴 ID를 제외하고 실수 오차를 정리한 비교용 딕셔너리"""
+    data = pattern.to_dict()
+    data.pop("pattern_id")
+    data["confidence"] = round(data["confidence"], 9)
+    data["metrics"] = {
+        k: round(v, 6) if isinstance(v, float) else v for k, v in data["metrics"].items()
+    }
+    return data
+
+
+def sort_key(pattern):
+    return pattern.pattern_type.value, str(pattern.timestamp)
+
+
+@pytest.fixture(scope="module")
+def frame():
+    """25Hz 합성 데이터 (충돌/과부하/진동/드리프트 포함, 약 6.7시간, Fz 외 축은 0)"""
+    n = 600_000
+    df = build_sensor_frame(n, freq="40ms", seed=3, noise_std=0.0, fz_std=10.0)
+    rng = np.random.default_rng(4)
+    fz = df["Fz"].to_numpy().copy()
+    fz[rng.integers(0, n, 20)] = -600.0
+    fz[20_000:21_500] = -200.0                           # 60초 과부하
+    fz[100_000:110_000] += rng.normal(0, 60, 10_000)     # 진동
+    fz[300_000:] += 20.0                                 # 드리프트
+    df["Fz"] = fz
+    return df
+
+
+@pytest.fixture(scope="module")
+def batch_patterns(frame):
+    return PatternDetector(SensorStore(frame)).detect(axis="Fz")
+
+
+def new_stream(frame) -> StreamingPatternDetector:
+    detector = PatternDetector(SensorStore(frame.iloc[:10]))
+    return detector.stream(
+        "Fz",
+        reference_baseline=float(frame["Fz"].mean()),
+        reference_std=float(frame["Fz"].std()),
+    )
+
+
+class TestStreamingPatternDetector:
+    """스트리밍 감지 테스트"""
+
+    @pytest.mark.parametrize("chunk_size", [997, 50_000])
+    def test_matches_batch_detection(self, frame, batch_patterns, chunk_size):
+        """기준 통계가 같으면 청크 크기와 무관하게 배치 감지와 동일"""
+        stream = new_stream(frame)
+
+        patterns = []
+        for start in range(0, len(frame), chunk_size):
+            patterns.extend(stream.feed(frame.iloc[start:start + chunk_size]))
+        patterns.extend(stream.flush())
+
+        assert {p.pattern_type.value for p in batch_patterns} == {"collision", "overload", "drift", "vibration"}
+        assert [comparable(p) for p in sorted(patterns, key=sort_key)] == \
+            [comparable(p) for p in sorted(batch_patterns, key=sort_key)]
+
+    def test_cumulative_stats_independent_of_chunk_size(self, frame):
+        """기준 통계 없이도 누적 통계가 샘플 단위로 갱신되어 청크 크기와 무관"""
+        results = []
+        for chunk_size in (997, 40_000, 123_457):
+            stream = PatternDetector(SensorStore(frame.iloc[:10])).stream("Fz")
+            patterns = []
+            for start in range(0, len(frame), chunk_size):
+                patterns.extend(stream.feed(frame.iloc[start:start + chunk_size]))
+            patterns.extend(stream.flush())
+            results.append([comparable(p) for p in sorted(patterns, key=sort_key)])
+
+        assert any(p["pattern_type"] == "vibration" for p in results[0])
+        assert results[1] == results[0]
+        assert results[2] == results[0]
+
+    def test_state_roundtrip_through_json(self, frame, batch_patterns):
+        """청크 사이에 상태를 JSON으로 저장/복원해도 결과 동일"""
+        stream = new_stream(frame)
+        patterns = []
+        for i, start in enumerate(range(0, len(frame), 30_011)):
+            patterns.extend(stream.feed(frame.iloc[start:start + 30_011]))
+            if i % 3 == 0:
+                state = json.loads(json.dumps(stream.get_state()))
+                stream = new_stream(frame)
+                stream.load_state(state)
+        patterns.extend(stream.flush())
+
+        assert len(patterns) == len(batch_patterns)
+        assert [comparable(p) for p in sorted(patterns, key=sort_key)] == \
+            [comparable(p) for p in sorted(batch_patterns, key=sort_key)]
+
+    def test_overload_emitted_when_run_closes(self, frame):
+        """과부하는 구간이 끝나는 청크에서 방출"""
+        stream = new_stream(frame)
+
+        first = stream.feed(frame.iloc[:21_000])
+        second = stream.feed(frame.iloc[21_000:22_000])
+
+        assert all(p.pattern_type.value != "overload" for p in first)
+        overloads = [p for p in second if p.pattern_type.value == "overload"]
+        assert len(overloads) == 1
+        assert overloads[0].metrics["duration_s"] == pytest.approx(1499 * 0.04)
+
+    def test_bounded_buffer(self, frame):
+        """충돌 baseline 버퍼는 윈도우 크기 이내로 유지"""
+        stream = new_stream(frame)
+        for start in range(0, 200_000, 10_000):
+            stream.feed(frame.iloc[start:start + 10_000])
+
+        state = stream.get_state()
+        window_size = stream._vibration_window_size
+        assert len(state["collision"]["buffer_ts"]) <= 10_000 + 5 * 25 + 1
+        assert len(state["vibration"]["tail"]) == window_size - 1
+
+    def test_rejects_out_of_order_chunk(self, frame):
+        stream = new_stream(frame)
+        stream.feed(frame.iloc[100:200])
+
+        with pytest.raises(ValueError):
+            stream.feed(frame.iloc[:50])
+
+    def test_state_axis_mismatch(self, frame):
+        state = new_stream(frame).get_state()
+        other = StreamingPatternDetector(PatternDetector(SensorStore(frame.iloc[:10])), axis="Fx")
+
+        with pytest.raises(ValueError):
+            other.load_state(state)
+
+
+class TestIncrementalDetection:
+    """워터마크 기반 증분 감지 / 멱등 병합"""
+
+    @pytest.mark.parametrize("split", [250_000, 123_457])
+    def test_incremental_runs_match_single_pass(self, frame, tmp_path, split):
+        """두 번에 나눈 증분 감지 결과가 한 번에 스트리밍한 결과와 동일 (임의 분할 지점)"""
+        path = tmp_path / "checkpoint.json"
+
+        first = PatternDetector(SensorStore(frame.iloc[:split].copy()))
+        checkpoint = DetectionCheckpoint(path)
+        patterns = first.merge_patterns([], first.detect_incremental(checkpoint, chunk_size=40_000))
+        checkpoint.save()
+
+        second = PatternDetector(SensorStore(frame.copy()))
+        checkpoint = DetectionCheckpoint(path)
+        assert checkpoint.watermark("Fz") == frame["timestamp"].iloc[split - 1]
+        new = second.detect_incremental(checkpoint, chunk_size=40_000)
+        patterns = second.merge_patterns(patterns, new)
+
+        # 첫 실행의 전체 구간 기준 통계가 체크포인트로 이어짐
+        head = frame["Fz"].iloc[:split]
+        single = PatternDetector(SensorStore(frame.iloc[:10])).stream(
+            "Fz", reference_baseline=float(head.mean()), reference_std=float(head.std()),
+        )
+        expected = []
+        for start in range(0, len(frame), 40_000):
+            expected.extend(single.feed(frame.iloc[start:start + 40_000]))
+
+        # 방출 순서는 청크 경계에 따라 달라질 수 있으므로 정렬해 비교
+        assert [comparable(p) for p in sorted(patterns, key=sort_key)] == \
+            [comparable(p) for p in sorted(expected, key=sort_key)]
+        assert [p.pattern_id for p in patterns] == [f"PAT-{i:03d}" for i in range(1, len(patterns) + 1)]
+
+    def test_first_run_matches_batch_detection(self, frame, batch_patterns, tmp_path):
+        """체크포인트 없는 첫 실행은 배치 감지와 같고, 배치 결과에 병합해도 중복 없음"""
+        detector = PatternDetector(SensorStore(frame.copy()))
+        checkpoint = DetectionCheckpoint(tmp_path / "checkpoint.json")
+        patterns = detector.detect_incremental(checkpoint, chunk_size=40_000)
+
+        state = checkpoint.get_state("Fz")
+        assert state["reference_baseline"] == pytest.approx(frame["Fz"].mean())
+        assert state["reference_std"] == pytest.approx(frame["Fz"].std())
+        assert detector.merge_patterns(batch_patterns, patterns) == batch_patterns
+
+        # 마지막 드리프트 구간은 열린 상태로 체크포인트에 남음
+        stream = detector.stream("Fz")
+        stream.load_state(state)
+        patterns.extend(stream.flush())
+        assert [comparable(p) for p in sorted(patterns, key=sort_key)] == \
+            [comparable(p) for p in sorted(batch_patterns, key=sort_key)]
+
+    def test_multi_axis_drift_kept_per_axis(self, frame, tmp_path):
+        """같은 시각에 여러 축이 드리프트해도 축별 패턴이 병합에서 모두 유지됨"""
+        df = frame.copy()
+        df["Fx"] = df["Fz"]
+        detector = PatternDetector(SensorStore(df))
+        checkpoint = DetectionCheckpoint(tmp_path / "checkpoint.json")
+
+        patterns = []
+        for axis in ["Fz", "Fx"]:
+            new = detector.detect_incremental(checkpoint, axis=axis, chunk_size=40_000)
+            stream = detector.stream(axis)
+            stream.load_state(checkpoint.get_state(axis))
+            patterns = detector.merge_patterns(patterns, new + stream.flush())
+
+        drifts = [p for p in patterns if p.pattern_type.value == "drift"]
+        assert len(drifts) == 2
+        assert len({p.timestamp for p in drifts}) == 1
+        assert sorted(p.metrics["axis"] for p in drifts) == ["Fx", "Fz"]
+
+    def test_rerun_without_new_data_is_noop(self, frame, tmp_path):
+        detector = PatternDetector(SensorStore(frame.iloc[:100_000].copy()))
+        checkpoint = DetectionCheckpoint(tmp_path / "checkpoint.json")
+        patterns = detector.merge_patterns([], detector.detect_incremental(checkpoint))
+
+        assert detector.detect_incremental(checkpoint) == []
+        assert detector.merge_patterns(patterns, patterns) == patterns
+
+    def test_detector_watermarks_trail_open_segments(self, frame, tmp_path):
+        """열린 과부하 구간이 있으면 과부하 워터마크는 구간 시작에 머묾"""
+        detector = PatternDetector(SensorStore(frame.iloc[:20_500].copy()))
+        checkpoint = DetectionCheckpoint(tmp_path / "checkpoint.json")
+        detector.detect_incremental(checkpoint)
+        checkpoint.save()
+
+        reloaded = DetectionCheckpoint(tmp_path / "checkpoint.json")
+        assert reloaded.watermark("Fz", "overload") == frame["timestamp"].iloc[20_000]
+        assert reloaded.watermark("Fz") == frame["timestamp"].iloc[20_499]
@@ -0,0 +1,189 @@
+"""SensorTimeSeriesDB / SensorStore SQLite 백엔드 단위 테스트"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.sensor.patterns import DetectedPattern, PatternType
+from src.sensor.sensor_store import SensorStore
+from src.sensor.timeseries_db import SensorTimeSeriesDB
+from tests.unit.conftest import build_sensor_frame
+
+
+START = datetime(2026, 1, 20, 0, 0, 0)
+
+
+@pytest.fixture
+def db(tmp_path):
+    store = SensorTimeSeriesDB(tmp_path / "sensor_timeseries.db")
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def frame():
+    """1Hz 센서 데이터 (컨텍스트 컬럼 일부 포함)"""
+    n = 7200
+    df = build_sensor_frame(n, freq="1s", start=START)
+    df.loc[500, "Fz"] = -600.0
+    df["task_mode"] = np.where(np.arange(n) % 2 == 0, "idle", "pick")
+    df["payload_kg"] = 2.5
+    df["error_code"] = None
+    return df
+
+
+class TestSensorTimeSeriesDB:
+    """시계열 DB 테스트"""
+
+    def test_wal_mode_and_schema(self, db):
+        """WAL 모드와 테이블 생성"""
+        conn = db.connection
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert {"samples", "events", "rollup_60", "rollup_3600"} <= tables
+
+    def test_append_and_range_read(self, db, frame):
+        """적재 후 구간 조회가 원본 슬라이스와 일치"""
+        assert db.append(frame) == len(frame)
+        start, end = START + timedelta(minutes=10), START + timedelta(minutes=20)
+
+        result = db.get_data(start, end, axes=["Fz"])
+        expected = frame[(frame["timestamp"] >= start) & (frame["timestamp"] <= end)]
+
+        assert list(result.columns) == ["timestamp", "Fz"]
+        np.testing.assert_array_equal(result["timestamp"].to_numpy(), expected["timestamp"].to_numpy())
+        np.testing.assert_array_equal(result["Fz"].to_numpy(), expected["Fz"].to_numpy())
+
+    def test_range_read_uses_primary_key(self, db, frame):
+        """구간 조회는 ts PRIMARY KEY 범위 스캔"""
+        db.append(frame)
+        plan = db.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT Fz FROM samples WHERE ts >= ? AND ts <= ? ORDER BY ts", (0, 1)
+        ).fetchall()
+
+        assert any("INTEGER PRIMARY KEY" in row[-1] for row in plan)
+
+    def test_incremental_append_is_idempotent(self, db, frame):
+        """분할 적재/재적재 시 중복 없이 롤업까지 일치"""
+        db.append(frame.iloc[:3000])
+        db.append(frame.iloc[2500:])
+        db.append(frame.iloc[:100])
+
+        assert db.count() == len(frame)
+        rollup = db.get_rollup("Fz", seconds=60)
+        expected = frame.groupby(frame["timestamp"].dt.floor("60s"))["Fz"].agg(["count", "mean", "min", "max"])
+        np.testing.assert_array_equal(rollup["count"].to_numpy(), expected["count"].to_numpy())
+        np.testing.assert_allclose(rollup["mean"].to_numpy(), expected["mean"].to_numpy())
+        np.testing.assert_array_equal(rollup["max"].to_numpy(), expected["max"].to_numpy())
+
+    def test_statistics_match_pandas(self, db, frame):
+        """롤업 + 경계 원본 조합 통계가 pandas 결과와 일치"""
+        db.append(frame)
+        mem = SensorStore(frame.copy())
+        start = START + timedelta(minutes=3, seconds=17)
+        end = START + timedelta(minutes=97, seconds=41)
+
+        got = db.get_statistics("Fz", start, end)
+        want = mem.get_statistics("Fz", start, end)
+
+        assert got["count"] == want["count"]
+        assert got["period"] == want["period"]
+        for key in ("mean", "std", "min", "max"):
+            assert got[key] == pytest.approx(want[key], abs=1e-3)
+
+    def test_statistics_skip_null_values(self, db, frame):
+        """NULL 축 값은 평균/분산/min/max에서 제외, count는 행 수"""
+        frame["Fz"] = frame["Fz"].astype("float64")
+        frame.loc[200:1500, "Fz"] = np.nan                  # 완전 버킷 포함
+        frame.loc[frame.index[-30:], "Fz"] = np.nan         # 끝 부분 버킷
+        db.append(frame)
+        start = START + timedelta(minutes=3, seconds=17)
+        end = START + timedelta(minutes=97, seconds=41)
+        window = frame[(frame["timestamp"] >= start) & (frame["timestamp"] <= end)]
+
+        got = db.get_statistics("Fz", start, end)
+        tail = db.get_statistics("Fz", START + timedelta(seconds=len(frame) - 20))
+
+        assert got["count"] == len(window)
+        assert got["mean"] == pytest.approx(window["Fz"].mean(), abs=1e-3)
+        assert got["std"] == pytest.approx(window["Fz"].std(), abs=1e-3)
+        assert got["min"] == pytest.approx(window["Fz"].min(), abs=1e-3)
+        assert tail["count"] == 20
+        assert np.isnan(tail["mean"]) and np.isnan(tail["min"])
+
+    def test_statistics_stable_with_large_offset(self, db, frame):
+        """평균이 표준편차보다 훨씬 커도 분산 상쇄 오차 없음"""
+        frame["Fz"] = 1e6 + np.random.default_rng(1).normal(0, 0.05, len(frame))
+        db.append(frame)
+        start = START + timedelta(minutes=3, seconds=17)
+        window = frame[frame["timestamp"] >= start]
+
+        got = db.get_statistics("Fz", start)
+
+        assert got["std"] == pytest.approx(window["Fz"].std(), abs=1e-4)
+
+    def test_legacy_rollups_rebuilt(self, tmp_path, frame):
+        """이전 형식(sumsq) 롤업 테이블은 열 때 다시 계산"""
+        path = tmp_path / "legacy.db"
+        db = SensorTimeSeriesDB(path)
+        db.append(frame)
+        with db.connection as conn:
+            conn.execute("DROP TABLE rollup_60")
+            conn.execute("CREATE TABLE rollup_60 (bucket INTEGER PRIMARY KEY, count INTEGER NOT NULL, Fz_sumsq REAL)")
+        db.close()
+
+        reopened = SensorTimeSeriesDB(path)
+        rollup = reopened.get_rollup("Fz", seconds=60)
+        reopened.close()
+
+        assert int(rollup["count"].sum()) == len(frame)
+
+    def test_anomalies_and_context(self, db, frame):
+        db.append(frame)
+        mem = SensorStore(frame.copy())
+
+        anomalies = db.get_anomalies("Fz", 300)
+        context = SensorStore(backend=db).get_context_at(START + timedelta(seconds=500.4))
+
+        expected = mem.get_context_at(START + timedelta(seconds=500.4))
+
+        assert anomalies["Fz"].tolist() == [-600.0]
+        # DB 스키마는 모든 컨텍스트 컬럼을 가지므로 원본에 없는 컬럼은 None
+        assert {k: context[k] for k in expected} == expected
+        assert context["operator_id"] is None
+
+    def test_events_roundtrip(self, db):
+        pattern = DetectedPattern(
+            pattern_id="PAT-001",
+            pattern_type=PatternType.COLLISION,
+            timestamp=START + timedelta(hours=1),
+            duration_ms=500,
+            confidence=0.9,
+            metrics={"peak_value": -600.0},
+            related_error_codes=["C153"],
+        )
+        db.insert_events([pattern])
+        db.insert_events([pattern])
+
+        events = db.get_events(START, START + timedelta(hours=2), pattern_type="collision")
+
+        assert len(events) == 1
+        assert events[0].to_dict() == pattern.to_dict()
+        assert db.get_events(pattern_type="overload") == []
+
+
+class TestSensorStoreSQLite:
+    """SensorStore SQLite 백엔드"""
+
+    def test_live_append_visible_to_store(self, db, frame):
+        """새 샘플 적재가 즉시 SensorStore 조회에 반영"""
+        store = SensorStore(backend=db)
+        db.append(frame.iloc[:3600])
+        assert store.get_summary()["total_records"] == 3600
+
+        db.append(frame.iloc[3600:])
+
+        assert store.get_statistics("Fz")["count"] == len(frame)
+        assert store.get_axis_values("Fz", START + timedelta(seconds=7000)).shape == (200,)